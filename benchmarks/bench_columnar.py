@@ -0,0 +1,74 @@
+"""Row and columnar encodings of chart data and table rows.
+
+Builds a multi-series ``LineChart`` shaped like the pypi-downloads
+example (one row per week, one key per package) and a ``DataTable``, then
+times ``to_json`` + encode with and without ``columnar=True``, once raw
+and once gzipped so the payload sizes can be compared both ways.
+
+Usage:
+    python benchmarks/run.py -k columnar/
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import random
+from collections.abc import Callable
+
+from harness import benchmark
+
+from prefab_ui.app import PrefabApp
+from prefab_ui.components import DataTable, DataTableColumn
+from prefab_ui.components.charts import ChartSeries, LineChart
+
+
+def _chart(rows: int, series: int) -> PrefabApp:
+    rng = random.Random(42)
+    names = [f"package-{i}" for i in range(series)]
+    data = [
+        {"week": f"2025-W{i:05d}", **{name: rng.randint(0, 10**6) for name in names}}
+        for i in range(rows)
+    ]
+    return PrefabApp(
+        view=LineChart(
+            data=data,
+            series=[ChartSeries(data_key=name) for name in names],
+            x_axis="week",
+        )
+    )
+
+
+def _table(rows: int) -> PrefabApp:
+    rng = random.Random(42)
+    data = [
+        {
+            "name": f"user-{i}",
+            "email": f"user-{i}@example.com",
+            "role": rng.choice(["admin", "editor", "viewer"]),
+            "logins": rng.randint(0, 500),
+        }
+        for i in range(rows)
+    ]
+    columns = [DataTableColumn(key=key, header=key.title()) for key in data[0]]
+    return PrefabApp(view=DataTable(columns=columns, rows=data, paginated=True))
+
+
+def _register(label: str, build: Callable[[], PrefabApp]) -> None:
+    for form, columnar in (("rows", False), ("columnar", True)):
+        for suffix, compress in (("", False), ("_gzip", True)):
+
+            @benchmark(f"columnar/{label}_{form}{suffix}")
+            def _encode(columnar: bool = columnar, compress: bool = compress):
+                app = build()
+
+                def run() -> bytes:
+                    envelope = app.to_json(columnar=columnar)
+                    data = json.dumps(envelope, separators=(",", ":")).encode()
+                    return gzip.compress(data, compresslevel=6) if compress else data
+
+                return run
+
+
+_register("line_chart_10k_x_10", lambda: _chart(10_000, 10))
+_register("data_table_10k", lambda: _table(10_000))
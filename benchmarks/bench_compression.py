@@ -0,0 +1,49 @@
+"""Compressed page generation workloads.
+
+Compares gzip-compressing the full ``PrefabApp.html()`` page on every
+request against ``PrefabApp.html_bytes(encoding="gzip")``, which splices
+the once-compressed renderer head together with the per-request payload.
+
+Usage:
+    python benchmarks/run.py -k compression/
+"""
+
+from __future__ import annotations
+
+import gzip
+import os
+
+from harness import benchmark
+
+from prefab_ui.app import PrefabApp
+from prefab_ui.components import Column, Heading, Text
+
+# Approximate JSON payload sizes: a small card, a typical dashboard, a big table.
+_PAYLOAD_ROWS = {"5kb": 50, "100kb": 1_000, "1mb": 10_000}
+
+
+def _build_app(rows: int) -> PrefabApp:
+    data = [{"id": i, "name": f"item-{i}", "price": i * 1.25} for i in range(rows)]
+    view = Column(
+        children=[Heading(content="Items"), Text(content="{{ items | length }}")]
+    )
+    os.environ.pop("PREFAB_RENDERER_URL", None)
+    app = PrefabApp(view=view, state={"items": data})
+    app.html_bytes(encoding="gzip")  # warm the compressed head
+    return app
+
+
+def _register(label: str, rows: int) -> None:
+    @benchmark(f"compression/gzip_full_page_{label}")
+    def _full_page():
+        app = _build_app(rows)
+        return lambda: gzip.compress(app.html().encode("utf-8"), 6)
+
+    @benchmark(f"compression/html_bytes_gzip_{label}")
+    def _spliced():
+        app = _build_app(rows)
+        return lambda: app.html_bytes(encoding="gzip")
+
+
+for _label, _rows in _PAYLOAD_ROWS.items():
+    _register(_label, _rows)
@@ -0,0 +1,158 @@
+"""Server-driven ``DataTable`` queries (``source=``) on 1M rows.
+
+Builds a 1M-row user table as a list of dicts and as a DataFrame, then
+times the queries a browser sends: the first page, a deep page, sorts,
+searches, and a search plus sort.  Each is answered by scanning with
+``DataTableSource`` and from the indexes of a ``DataTableIndex``, whose
+build time and memory are measured along with the time to append and
+remove rows.  The size of one page's response can be compared with the
+payload of the same table sent inline with ``rows=``.  pandas is optional.
+
+Usage:
+    python benchmarks/run.py -k data_table/
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib.util
+import random
+from collections.abc import Callable
+from typing import Any
+
+from harness import benchmark
+
+from prefab_ui.app import PrefabApp
+from prefab_ui.components import (
+    DataTable,
+    DataTableColumn,
+    DataTableIndex,
+    DataTableSource,
+)
+
+COLUMNS = [
+    DataTableColumn(key="id", header="ID", sortable=True),
+    DataTableColumn(key="name", header="Name", sortable=True),
+    DataTableColumn(key="email", header="Email"),
+    DataTableColumn(key="team", header="Team", sortable=True),
+    DataTableColumn(key="score", header="Score", sortable=True),
+]
+
+FIRST = ["ada", "grace", "alan", "edsger", "barbara", "ken", "donald", "radia"]
+TEAMS = ["core", "infra", "data", "web", "mobile", "security"]
+
+
+def _rows(n: int) -> list[dict[str, Any]]:
+    rng = random.Random(42)
+    rows = []
+    for i in range(n):
+        first = rng.choice(FIRST)
+        rows.append(
+            {
+                "id": i,
+                "name": f"{first.title()} {rng.randrange(100_000):05d}",
+                "email": f"{first}.{i}@example.com",
+                "team": rng.choice(TEAMS),
+                "score": rng.random() if rng.random() > 0.01 else None,
+            }
+        )
+    return rows
+
+
+ROWS = 1_000_000
+PAGE_SIZE = 25
+
+QUERIES: dict[str, dict[str, Any]] = {
+    "first_page": {},
+    "deep_page": {"page": ROWS // PAGE_SIZE // 2},
+    "sort_name": {"sort": "name"},
+    "sort_score_desc": {"sort": "score", "direction": "desc"},
+    "search_word": {"search": "grace"},
+    "search_word_page_2": {"search": "grace", "page": 1},
+    "search_word_sort": {"search": "data", "sort": "name"},
+    "search_email": {"search": "ada.4242"},
+    "search_words_sort": {"search": "radia 0123", "sort": "score"},
+}
+
+
+@functools.cache
+def _sources() -> dict[str, Any]:
+    """The scanning sources and the index, built once and shared by workloads."""
+    rows = _rows(ROWS)
+    sources: dict[str, Any] = {"rows": DataTableSource(rows, columns=COLUMNS)}
+    if importlib.util.find_spec("pandas"):
+        import pandas as pd
+
+        sources["dataframe"] = DataTableSource(pd.DataFrame(rows), columns=COLUMNS)
+    sources["index"] = DataTableIndex(rows, columns=COLUMNS)
+    return sources
+
+
+# Paging through a search reuses the match the index cached for it; the
+# other queries clear that cache so each call searches from scratch.
+_PAGED = {"search_word_page_2"}
+
+
+def _register(query_name: str, query: dict[str, Any], source_name: str) -> None:
+    # Scanning searches take seconds on 1M rows, so time those once.
+    repeat = 3 if source_name == "index" else 1
+
+    @benchmark(f"data_table/{query_name}_{source_name}_1m", repeat=repeat)
+    def _query():
+        source = _sources()[source_name]
+        searches = getattr(source, "_searches", None)
+        if searches is None or query_name in _PAGED:
+            return lambda: source.query(page_size=PAGE_SIZE, **query)
+
+        def run() -> dict[str, Any]:
+            searches.clear()
+            return source.query(page_size=PAGE_SIZE, **query)
+
+        return run
+
+
+for _source_name in ("rows", "dataframe", "index"):
+    if _source_name == "dataframe" and not importlib.util.find_spec("pandas"):
+        continue
+    for _query_name, _query in QUERIES.items():
+        _register(_query_name, _query, _source_name)
+
+
+# Building the 1M-row index takes tens of seconds, and the harness builds
+# it three times (warm-up, timed, traced), so time the build on fewer rows.
+@benchmark("data_table/index_build_100k_rows", repeat=1)
+def _index_build():
+    rows = _rows(100_000)
+    return lambda: DataTableIndex(rows, columns=COLUMNS)
+
+
+def _append_remove(count: int) -> Callable[[], None]:
+    index = _sources()["index"]
+    added = _rows(count)
+
+    def run() -> None:
+        index.remove(index.append(added))
+
+    return run
+
+
+@benchmark("data_table/index_append_remove_1k_rows")
+def _index_update_1k():
+    return _append_remove(1_000)
+
+
+@benchmark("data_table/index_append_remove_1_row")
+def _index_update_1():
+    return _append_remove(1)
+
+
+@benchmark("data_table/inline_rows_to_json_bytes_1m", repeat=1)
+def _inline():
+    table = DataTable(columns=COLUMNS, rows=_rows(ROWS), paginated=True)
+    app = PrefabApp(view=table)
+
+    def run() -> bytes:
+        table.invalidate_json()  # time encoding the rows, not the cache
+        return app.to_json_bytes()
+
+    return run
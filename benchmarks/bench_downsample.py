@@ -0,0 +1,80 @@
+"""LTTB downsampling of chart data (``max_points=``).
+
+Times LTTB with NumPy on a 1M-point random walk held in arrays (the
+pure-Python fallback is ``chart/lttb_1m_points_pure_python`` in
+``suite.py``), then builds a two-series ``LineChart`` from rows and from
+a DataFrame and times serialization with and without ``max_points``.
+Needs NumPy; pandas is optional.
+
+Usage:
+    python benchmarks/run.py -k downsample/
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+from harness import benchmark
+
+from prefab_ui.app import PrefabApp
+from prefab_ui.components.charts import ChartSeries, LineChart
+from prefab_ui.components.charts.downsample import _lttb_numpy
+
+
+def _walk(points: int) -> tuple[Any, Any, Any]:
+    rng = np.random.default_rng(42)
+    x = np.arange(points, dtype=np.float64)
+    latency = np.cumsum(rng.normal(0, 1, points))
+    errors = rng.poisson(0.2, points).astype(np.float64)
+    return x, latency, errors
+
+
+@benchmark("downsample/lttb_numpy_1m_points", repeat=3)
+def _lttb_arrays():
+    x, latency, _ = _walk(1_000_000)
+    return lambda: _lttb_numpy(x, latency, 2_000)
+
+
+def _rows(points: int) -> list[dict[str, float]]:
+    x, latency, errors = _walk(points)
+    return [
+        {"t": t, "latency": v, "errors": e}
+        for t, v, e in zip(x.tolist(), latency.tolist(), errors.tolist(), strict=True)
+    ]
+
+
+def _dataframe(points: int) -> Any:
+    import pandas as pd
+
+    x, latency, errors = _walk(points)
+    return pd.DataFrame({"t": x, "latency": latency, "errors": errors})
+
+
+_SOURCES: dict[str, Callable[[int], Any]] = {"rows": _rows}
+if importlib.util.find_spec("pandas"):
+    _SOURCES["dataframe"] = _dataframe
+
+
+def _register(name: str, source: Callable[[int], Any]) -> None:
+    for suffix, max_points in (("", None), ("_to_2k", 2_000)):
+
+        @benchmark(f"downsample/line_chart_{name}_1m{suffix}", repeat=1)
+        def _encode(max_points: int | None = max_points):
+            series = [ChartSeries(data_key="latency"), ChartSeries(data_key="errors")]
+            chart = LineChart(
+                data=source(1_000_000), series=series, x_axis="t", max_points=max_points
+            )
+            app = PrefabApp(view=chart)
+
+            def run() -> bytes:
+                chart.invalidate_json()  # downsample again on every call
+                return app.to_json_bytes()
+
+            return run
+
+
+for _name, _source in _SOURCES.items():
+    _register(_name, _source)
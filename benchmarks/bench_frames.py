@@ -0,0 +1,85 @@
+"""Passing a DataFrame directly against ``df.to_dict("records")``.
+
+Builds a ``LineChart`` and a ``DataTable`` from a pandas DataFrame (and
+an Arrow table when pyarrow is installed) and times construction and
+serialization for each way of handing over the data.  Needs pandas;
+pyarrow is optional.
+
+Usage:
+    python benchmarks/run.py -k frames/
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from harness import benchmark
+
+from prefab_ui.app import PrefabApp
+from prefab_ui.components.charts import ChartSeries, LineChart
+
+
+def _frame(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    downloads = rng.integers(0, 10**6, rows).astype(float)
+    downloads[rng.random(rows) < 0.01] = np.nan
+    return pd.DataFrame(
+        {
+            "week": pd.date_range("2000-01-03", periods=rows, freq="min"),
+            "downloads": downloads,
+            "package": rng.choice(["fastmcp", "prefab-ui", "pydantic"], rows),
+        }
+    )
+
+
+def _records(df: pd.DataFrame) -> list[dict[str, Any]]:
+    week = df["week"].dt.strftime("%Y-%m-%dT%H:%M")
+    return df.assign(week=week).to_dict("records")
+
+
+def _arrow(df: pd.DataFrame) -> Any:
+    import pyarrow as pa
+
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+_SOURCES: dict[str, Callable[[pd.DataFrame], Any]] = {
+    "records": _records,
+    "dataframe": lambda df: df,
+}
+if importlib.util.find_spec("pyarrow"):
+    _SOURCES["pyarrow"] = _arrow
+
+
+def _chart(data: Any) -> LineChart:
+    return LineChart(
+        data=data, series=[ChartSeries(data_key="downloads")], x_axis="week"
+    )
+
+
+def _register(name: str, source: Callable[[pd.DataFrame], Any]) -> None:
+    # Building includes handing the data over, so the to_dict("records")
+    # conversion is timed along with the chart.
+    @benchmark(f"frames/build_line_chart_{name}_100k", repeat=3)
+    def _construct():
+        df = _frame(100_000)
+        return lambda: PrefabApp(view=_chart(source(df)))
+
+    @benchmark(f"frames/to_json_bytes_{name}_100k", repeat=3)
+    def _encode():
+        chart = _chart(source(_frame(100_000)))
+        app = PrefabApp(view=chart)
+
+        def run() -> bytes:
+            chart.invalidate_json()  # time encoding the data, not the cache
+            return app.to_json_bytes()
+
+        return run
+
+
+for _name, _source in _SOURCES.items():
+    _register(_name, _source)
@@ -0,0 +1,92 @@
+"""``Histogram`` binning time and memory on large inputs.
+
+Bins 10M normally distributed values three ways: from one NumPy array,
+from a generator of chunks with ``bin_range`` (single pass, one chunk in
+memory at a time), and with the ``"auto"`` bin rule.  Then feeds the same
+chunks to fixed-width and log-bucket ``HistogramSketch`` accumulators,
+merges eight of them, and charts the result.  The pure-Python fallback
+is timed on a smaller list.  The input array is built during setup, so
+the traced peak is what binning allocates.  Needs NumPy.
+
+Usage:
+    python benchmarks/run.py -k histogram/
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import numpy as np
+from harness import benchmark
+
+from prefab_ui import optional
+from prefab_ui.components import Histogram, HistogramSketch
+
+_VALUES = 10_000_000
+_CHUNK = 100_000
+_BINS = 30
+
+
+def _values() -> Any:
+    return np.random.default_rng(42).normal(size=_VALUES)
+
+
+def _chunks(values: Any) -> Iterator[Any]:
+    for start in range(0, len(values), _CHUNK):
+        yield values[start : start + _CHUNK]
+
+
+@benchmark("histogram/array_10m_values", repeat=3)
+def _array():
+    values = _values()
+    return lambda: Histogram(values=values, bins=_BINS).data
+
+
+@benchmark("histogram/chunks_bin_range_10m_values", repeat=3)
+def _chunked():
+    values = _values()
+    return lambda: Histogram(values=_chunks(values), bins=_BINS, bin_range=(-6, 6)).data
+
+
+@benchmark("histogram/auto_bins_10m_values", repeat=3)
+def _auto_bins():
+    values = _values()
+    return lambda: Histogram(values=values, bins="auto").data
+
+
+def _sketch(**layout: float) -> Callable[[], Any]:
+    values = _values()
+
+    def run() -> Any:
+        parts = [HistogramSketch(**layout) for _ in range(8)]
+        for i, chunk in enumerate(_chunks(values)):
+            parts[i % 8].add_many(chunk)
+        return Histogram(values=parts[0].merge(*parts[1:]), bins=_BINS).data
+
+    return run
+
+
+@benchmark("histogram/sketch_width_10m_values", repeat=3)
+def _sketch_width():
+    return _sketch(width=0.01)
+
+
+@benchmark("histogram/sketch_log_buckets_10m_values", repeat=3)
+def _sketch_log_buckets():
+    return _sketch(relative_accuracy=0.01)
+
+
+@benchmark("histogram/pure_python_1m_values", repeat=1)
+def _pure_python():
+    small = _values()[:1_000_000].tolist()
+
+    def run() -> Any:
+        original = optional.numpy
+        optional.numpy = lambda: None
+        try:
+            return Histogram(values=small, bins=_BINS).data
+        finally:
+            optional.numpy = original
+
+    return run
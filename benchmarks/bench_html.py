@@ -0,0 +1,66 @@
+"""HTML page generation workloads.
+
+Compares ``PrefabApp.html().encode()`` against the streaming
+``PrefabApp.iter_html()`` on an app with a large state payload: total
+time and peak traced memory for the whole page, and the time to the
+first chunk the stream yields.
+
+Usage:
+    python benchmarks/run.py -k html/
+"""
+
+from __future__ import annotations
+
+import os
+
+from harness import benchmark
+
+from prefab_ui.app import PrefabApp
+from prefab_ui.components import Column, DataTable, DataTableColumn, Heading
+
+
+def _build_app(rows: int) -> PrefabApp:
+    data = [
+        {"id": i, "name": f"user-{i}", "email": f"user{i}@example.com", "score": i % 97}
+        for i in range(rows)
+    ]
+    view = Column(
+        children=[
+            Heading(content="Users"),
+            DataTable(
+                columns=[
+                    DataTableColumn(key="name", header="Name"),
+                    DataTableColumn(key="email", header="Email"),
+                    DataTableColumn(key="score", header="Score"),
+                ],
+                rows="{{ users }}",
+            ),
+        ]
+    )
+    os.environ.pop("PREFAB_RENDERER_URL", None)
+    app = PrefabApp(view=view, state={"users": data})
+    app.html()  # warm the renderer cache
+    return app
+
+
+@benchmark("html/html_encode_50k_rows")
+def _html_encode():
+    app = _build_app(50_000)
+    return lambda: app.html().encode("utf-8")
+
+
+@benchmark("html/iter_html_50k_rows")
+def _iter_html():
+    app = _build_app(50_000)
+
+    def run() -> None:
+        for _chunk in app.iter_html():
+            pass
+
+    return run
+
+
+@benchmark("html/iter_html_first_chunk_50k_rows")
+def _iter_html_first_chunk():
+    app = _build_app(50_000)
+    return lambda: next(app.iter_html())
@@ -0,0 +1,171 @@
+"""Versioned polling workloads against a local stand-in tool server.
+
+Each tool implementation below answers a dashboard's worth of rows.  The
+``*_respond_up_to_date`` workloads time one response, and its payload,
+for a client that already has the latest rows.  The ``*_http`` workloads
+start an HTTP server on localhost that plays the part of an MCP server
+with one ``metrics`` tool, whose rows change after every 50 requests, and
+have 20 threads poll it as fast as it answers, like that many open
+dashboards, handling versions the way the renderer does for
+``CallTool(version_argument=...)``.
+
+The tool implementations:
+
+- full: returns the rows every time, as without versioning;
+- hashed: ``VersionedResult(rows).respond(version)`` on every request,
+  hashing the rows each time;
+- shared: one ``VersionedResult`` per revision of the rows, shared by all
+  requests, so each revision is hashed once;
+- revision: ``VersionedResult(load, version=revision)``, which builds
+  nothing for clients that are up to date.
+
+Clients and server share one process, so absolute times are high;
+compare the tools against each other.
+
+Usage:
+    python benchmarks/run.py -k polling/
+"""
+
+from __future__ import annotations
+
+import http.client
+import json
+import threading
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import pydantic_core
+from harness import benchmark
+
+from prefab_ui.polling import VersionedResult
+
+
+class _Store:
+    """The data behind the tool: rows that change every few requests."""
+
+    def __init__(self, rows: int, change_every: int) -> None:
+        self.size = rows
+        self.change_every = change_every
+        self.revision = 0
+        self.requests = 0
+        self.lock = threading.Lock()
+        self._shared: VersionedResult | None = None
+
+    def load(self) -> list[dict[str, Any]]:
+        """Build the rows, as a tool querying its data source would."""
+        r = self.revision
+        return [
+            {"host": f"web-{i}", "cpu": (i * 7 + r) % 100, "mem": (i * 13 + r) % 100}
+            for i in range(self.size)
+        ]
+
+    def served(self) -> None:
+        with self.lock:
+            self.requests += 1
+            if self.requests % self.change_every == 0:
+                self.revision += 1
+                self._shared = None
+
+    def shared(self) -> VersionedResult:
+        shared = self._shared
+        if shared is None:
+            shared = self._shared = VersionedResult(self.load())
+        return shared
+
+
+_TOOLS: dict[str, Callable[[_Store, str | None], Any]] = {
+    "full": lambda store, version: store.load(),
+    "hashed": lambda store, version: VersionedResult(store.load()).respond(version),
+    "shared": lambda store, version: store.shared().respond(version),
+    "revision": lambda store, version: VersionedResult(
+        store.load, version=store.revision
+    ).respond(version),
+}
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # Room for every client to connect at once; the default backlog of 5
+    # drops connections when the clients all start together.
+    request_queue_size = 64
+
+
+def _serve(store: _Store, tool: Callable[[_Store, str | None], Any]) -> Any:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body go out in separate writes; without this, Nagle's
+        # algorithm holds the body back until the client's delayed ACK.
+        disable_nagle_algorithm = True
+
+        def do_POST(self) -> None:
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            arguments = json.loads(body)["arguments"]
+            payload = pydantic_core.to_json(
+                {"structuredContent": tool(store, arguments.get("version"))}
+            )
+            store.served()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    server = _Server(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _poll(port: int, polls: int, versioned: bool) -> None:
+    """One dashboard: poll, send back the last version, unwrap results."""
+    connection = http.client.HTTPConnection("127.0.0.1", port)
+    version: str | None = None
+    for _ in range(polls):
+        arguments = {"version": version} if versioned and version else {}
+        connection.request("POST", "/", json.dumps({"arguments": arguments}))
+        result = json.loads(connection.getresponse().read())["structuredContent"]
+        if versioned and result.get("unchanged") is not True:
+            version = result["version"]
+    connection.close()
+
+
+_ROWS = 2_000
+
+
+def _load_test(name: str, clients: int, polls: int, change_every: int) -> None:
+    store = _Store(_ROWS, change_every)
+    server = _serve(store, _TOOLS[name])
+    port = server.server_address[1]
+    threads = [
+        threading.Thread(target=_poll, args=(port, polls, name != "full"))
+        for _ in range(clients)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    server.shutdown()
+    server.server_close()
+
+
+def _register(name: str) -> None:
+    @benchmark(f"polling/{name}_respond_up_to_date_2k_rows", repeat=20)
+    def _respond():
+        store = _Store(_ROWS, change_every=10**9)
+        tool = _TOOLS[name]
+        first = tool(store, None)
+        version = first.get("version") if isinstance(first, dict) else None
+        return lambda: pydantic_core.to_json(
+            {"structuredContent": tool(store, version)}
+        )
+
+    @benchmark(f"polling/{name}_http_20_clients_x_25_polls", repeat=3)
+    def _http():
+        return lambda: _load_test(name, clients=20, polls=25, change_every=50)
+
+
+for _name in _TOOLS:
+    _register(_name)
@@ -0,0 +1,55 @@
+"""Renderer asset loading workloads.
+
+Compares the per-call cost of ``get_renderer_head()`` with a cold cache
+(one full read + decode + head slice of the ~3 MB bundle per call, which
+is what every ``PrefabApp.html()`` used to pay) against the warm,
+process-wide cache.
+
+Usage:
+    python benchmarks/run.py -k renderer/
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable
+
+from harness import benchmark
+
+from prefab_ui.renderer import (
+    clear_renderer_cache,
+    get_renderer_csp,
+    get_renderer_head,
+    get_renderer_html,
+)
+
+
+def _bundled(fn: Callable[[], str]) -> Callable[[], str]:
+    """Load the bundled renderer rather than a CDN URL, and warm the cache."""
+    os.environ.pop("PREFAB_RENDERER_URL", None)
+    get_renderer_head()
+    return fn
+
+
+@benchmark("renderer/head_cold", repeat=50)
+def _head_cold():
+    def run() -> str:
+        clear_renderer_cache()
+        return get_renderer_head()
+
+    return _bundled(run)
+
+
+@benchmark("renderer/head_cached", repeat=50)
+def _head_cached():
+    return _bundled(get_renderer_head)
+
+
+@benchmark("renderer/html_cached", repeat=50)
+def _html_cached():
+    return _bundled(get_renderer_html)
+
+
+@benchmark("renderer/csp_cached", repeat=50)
+def _csp_cached():
+    return _bundled(get_renderer_csp)
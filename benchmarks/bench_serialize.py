@@ -0,0 +1,58 @@
+"""Component tree serialization workloads.
+
+Times ``Component.to_json()`` on deep trees (nested Cards) and wide trees
+(Tables with many rows) at increasing sizes.  With each node dumped
+exactly once, time should grow in step with the node count (three nodes
+per level of Cards, three per table row).
+
+Usage:
+    python benchmarks/run.py -k serialize/
+"""
+
+from __future__ import annotations
+
+from harness import benchmark
+
+from prefab_ui.components import (
+    Card,
+    CardContent,
+    Component,
+    Table,
+    TableBody,
+    TableCell,
+    TableRow,
+    Text,
+)
+
+
+def deep_cards(depth: int) -> Component:
+    node: Component = Text(content="leaf")
+    for i in range(depth):
+        node = Card(children=[CardContent(children=[node, Text(content=f"level {i}")])])
+    return node
+
+
+def wide_table(rows: int) -> Component:
+    body = TableBody(
+        children=[
+            TableRow(
+                children=[
+                    TableCell(content=f"row {i}"),
+                    TableCell(content="{{ value | currency }}"),
+                ]
+            )
+            for i in range(rows)
+        ]
+    )
+    return Table(children=[body])
+
+
+for _depth in (25, 50, 100):
+    benchmark(f"serialize/nested_cards_depth_{_depth}")(
+        lambda depth=_depth: deep_cards(depth).to_json
+    )
+
+for _rows, _label in ((1_000, "1k"), (10_000, "10k"), (100_000, "100k")):
+    benchmark(f"serialize/table_rows_{_label}", repeat=3)(
+        lambda rows=_rows: wide_table(rows).to_json
+    )
@@ -0,0 +1,103 @@
+"""Wire-format string table workloads on the example apps.
+
+Builds the page for ``examples/hitchhikers-guide`` and
+``examples/pypi-downloads`` (the latter with synthetic download rows in
+place of the ClickHouse query), extracts the envelope baked into the
+HTML, and encodes it with and without ``intern_strings``, raw and
+gzipped; compare the payload sizes.  The examples need ``fastapi``
+installed.
+
+Usage:
+    python benchmarks/run.py -k strings/
+"""
+
+from __future__ import annotations
+
+import datetime
+import gzip
+import importlib
+import json
+import random
+import sys
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from harness import benchmark
+
+from prefab_ui.wire import expand_strings, intern_strings
+
+EXAMPLES = Path(__file__).resolve().parent.parent / "examples"
+_DATA_START = 'type="application/json">'
+
+
+def _load(example: str, module: str) -> Any:
+    # Both examples have an ``api_server`` and a ``data`` module.
+    for name in ("api_server", "dashboard", "data", "query"):
+        sys.modules.pop(name, None)
+    sys.path.insert(0, str(EXAMPLES / example))
+    try:
+        return importlib.import_module(module)
+    finally:
+        sys.path.pop(0)
+
+
+def _envelope(html: str) -> dict[str, Any]:
+    start = html.index(_DATA_START) + len(_DATA_START)
+    return json.loads(html[start : html.index("</script>", start)])
+
+
+def _hitchhikers() -> dict[str, Any]:
+    server = _load("hitchhikers-guide", "api_server")
+    return _envelope(server.guide().body.decode())
+
+
+def _pypi(packages: int, weeks: int) -> dict[str, Any]:
+    server = _load("pypi-downloads", "api_server")
+    rng = random.Random(42)
+    start = datetime.date(2025, 1, 6)
+    days = [(start + datetime.timedelta(weeks=w)).isoformat() for w in range(weeks)]
+    dep_rows = [
+        {"week": day, "package": f"package-{p}", "downloads": rng.randint(1, 10**6)}
+        for day in days
+        for p in range(packages)
+    ]
+    total_rows = [{"week": day, "downloads": rng.randint(10**6, 10**7)} for day in days]
+    server._cache.update(
+        package_name="fastmcp", total_rows=total_rows, dep_rows=dep_rows
+    )
+    return _envelope(server.page().body.decode())
+
+
+def _encode(envelope: dict[str, Any], *, compress: bool) -> bytes:
+    data = json.dumps(envelope, separators=(",", ":"), ensure_ascii=False).encode()
+    return gzip.compress(data, compresslevel=6) if compress else data
+
+
+_EXAMPLES: dict[str, Callable[[], dict[str, Any]]] = {
+    "hitchhikers": _hitchhikers,
+    "pypi_20_deps_26_weeks": lambda: _pypi(packages=20, weeks=26),
+}
+
+
+def _register(example: str, load: Callable[[], dict[str, Any]]) -> None:
+    for suffix, compress in (("", False), ("_gzip", True)):
+
+        @benchmark(f"strings/plain{suffix}_{example}")
+        def _plain(compress: bool = compress):
+            envelope = load()
+            return lambda: _encode(envelope, compress=compress)
+
+        @benchmark(f"strings/interned{suffix}_{example}")
+        def _interned(compress: bool = compress):
+            envelope = load()
+            interned = intern_strings(envelope)
+            assert expand_strings(interned) == {
+                **envelope,
+                "version": interned["version"],
+            }
+            return lambda: _encode(intern_strings(envelope), compress=compress)
+
+
+for _example, _load_example in _EXAMPLES.items():
+    _register(_example, _load_example)
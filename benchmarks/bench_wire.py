@@ -0,0 +1,64 @@
+"""Wire-format encoding workloads.
+
+Compares the old ``json.dumps(app.to_json())`` path against
+``app.to_json_bytes()`` on apps with 10k–100k view nodes and a state
+payload of matching size.
+
+Usage:
+    python benchmarks/run.py -k wire/
+"""
+
+from __future__ import annotations
+
+import json
+
+from harness import benchmark
+
+from prefab_ui.app import PrefabApp
+from prefab_ui.components import Badge, Card, CardContent, Column, Row, Text
+
+
+def _build_app(nodes: int) -> PrefabApp:
+    # Each card contributes five nodes: Card, CardContent, Row, Text, Badge.
+    cards = []
+    for i in range(nodes // 5):
+        cards.append(
+            Card(
+                children=[
+                    CardContent(
+                        children=[
+                            Row(
+                                children=[
+                                    Text(content=f"{{{{ items.{i}.name }}}}"),
+                                    Badge(label=f"#{i}", variant="secondary"),
+                                ]
+                            )
+                        ]
+                    )
+                ]
+            )
+        )
+    state = {
+        "items": [
+            {"id": i, "name": f"item-{i}", "price": i * 0.5, "tags": ["a", "b"]}
+            for i in range(nodes)
+        ]
+    }
+    return PrefabApp(view=Column(children=cards), state=state)
+
+
+def _register(nodes: int, label: str) -> None:
+    repeat = 5 if nodes <= 10_000 else 1
+
+    @benchmark(f"wire/json_dumps_to_json_{label}_nodes", repeat=repeat)
+    def _json_dumps():
+        app = _build_app(nodes)
+        return lambda: json.dumps(app.to_json(), separators=(",", ":")).encode()
+
+    @benchmark(f"wire/to_json_bytes_{label}_nodes", repeat=repeat)
+    def _to_json_bytes():
+        return _build_app(nodes).to_json_bytes
+
+
+for _nodes, _label in ((10_000, "10k"), (100_000, "100k")):
+    _register(_nodes, _label)
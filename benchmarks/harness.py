@@ -0,0 +1,101 @@
+"""Minimal benchmark harness used by ``benchmarks/run.py``.
+
+A benchmark is a setup function registered with :func:`benchmark`.  Setup
+builds whatever fixed synthetic input the workload needs and returns the
+zero-argument callable to measure; only that callable is timed::
+
+    @benchmark("serialize/table_10k")
+    def _table():
+        table = build_table(10_000)
+        return table.to_json
+
+The callable's return value is used to report the payload size: ``bytes``
+and ``str`` are measured directly, anything else is JSON-encoded first.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import gc
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+import pydantic_core
+
+Setup = Callable[[], Callable[[], Any]]
+
+
+@dataclasses.dataclass(frozen=True)
+class Benchmark:
+    name: str
+    setup: Setup
+    repeat: int
+
+
+@dataclasses.dataclass(frozen=True)
+class Result:
+    name: str
+    wall_ms: float
+    """Best wall time over all repeats."""
+    median_ms: float
+    peak_kb: float
+    """Peak memory allocated during one call, as traced by tracemalloc."""
+    payload_bytes: int | None
+
+
+BENCHMARKS: list[Benchmark] = []
+
+
+def benchmark(name: str, *, repeat: int = 5) -> Callable[[Setup], Setup]:
+    """Register a benchmark setup function under ``name``."""
+
+    def register(setup: Setup) -> Setup:
+        BENCHMARKS.append(Benchmark(name=name, setup=setup, repeat=repeat))
+        return setup
+
+    return register
+
+
+def _payload_size(value: Any) -> int | None:
+    if value is None:
+        return None
+    if isinstance(value, bytes):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    try:
+        return len(pydantic_core.to_json(value))
+    except pydantic_core.PydanticSerializationError:
+        return None
+
+
+def run(bench: Benchmark, repeat: int | None = None) -> Result:
+    """Run one benchmark: warm up, time ``repeat`` calls, then trace memory."""
+    fn = bench.setup()
+    output = fn()
+
+    times: list[float] = []
+    gc.collect()
+    for _ in range(repeat or bench.repeat):
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1e3)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return Result(
+        name=bench.name,
+        wall_ms=min(times),
+        median_ms=statistics.median(times),
+        peak_kb=peak / 1024,
+        payload_bytes=_payload_size(output),
+    )
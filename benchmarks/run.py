@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Run the prefab_ui benchmark suite.
+
+Measures wall time, peak traced memory and payload size for each workload
+in ``benchmarks/suite.py`` and the ``benchmarks/bench_*.py`` modules.
+Results can be saved as JSON and compared against a saved baseline; a
+workload that gets slower or heavier than the threshold is flagged and the
+run exits non-zero.
+
+Usage:
+    python benchmarks/run.py                              # run and print
+    python benchmarks/run.py --save baseline.json         # record a baseline
+    python benchmarks/run.py --compare baseline.json      # flag regressions
+    python benchmarks/run.py -k serialize --repeat 10     # filter by name
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import importlib
+import json
+import platform
+import sys
+from pathlib import Path
+
+from harness import BENCHMARKS, Result, run
+
+import prefab_ui
+
+
+def _load_workloads() -> None:
+    """Import the modules whose ``@benchmark`` functions register workloads."""
+    here = Path(__file__).resolve().parent
+    for name in ["suite", *sorted(path.stem for path in here.glob("bench_*.py"))]:
+        importlib.import_module(name)
+
+
+def _format(result: Result, note: str = "") -> str:
+    payload = (
+        f"{result.payload_bytes / 1e3:10.1f} KB" if result.payload_bytes else " " * 13
+    )
+    return (
+        f"{result.name:<42} {result.wall_ms:10.2f} ms {result.peak_kb / 1e3:9.1f} MB"
+        f" {payload}  {note}"
+    ).rstrip()
+
+
+def _compare(result: Result, baseline: dict[str, float], threshold: float) -> str:
+    """Return a note describing how ``result`` differs from ``baseline``."""
+    notes: list[str] = []
+    for field, label in (("wall_ms", "time"), ("peak_kb", "memory")):
+        old = baseline.get(field)
+        if not old:
+            continue
+        ratio = getattr(result, field) / old
+        if ratio > 1 + threshold:
+            notes.append(f"REGRESSION {label} x{ratio:.2f}")
+        elif ratio < 1 - threshold:
+            notes.append(f"improved {label} x{ratio:.2f}")
+    old_payload = baseline.get("payload_bytes")
+    if old_payload is not None and result.payload_bytes != old_payload:
+        notes.append(f"payload {old_payload} -> {result.payload_bytes} bytes")
+    return ", ".join(notes)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", "--filter", default="", help="Substring of names")
+    parser.add_argument("--repeat", type=int, help="Override per-benchmark repeats")
+    parser.add_argument("--save", type=Path, help="Write results to this JSON file")
+    parser.add_argument("--compare", type=Path, help="Baseline JSON to compare with")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Relative slowdown/growth that counts as a regression",
+    )
+    parser.add_argument("--list", action="store_true", help="List workloads")
+    args = parser.parse_args()
+
+    _load_workloads()
+    selected = [b for b in BENCHMARKS if args.filter in b.name]
+    if args.list:
+        for bench in selected:
+            print(bench.name)
+        return 0
+
+    baseline: dict[str, dict[str, float]] = {}
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())["results"]
+
+    print(f"{'benchmark':<42} {'wall':>13} {'peak':>12} {'payload':>13}")
+    results: list[Result] = []
+    regressed = False
+    for bench in selected:
+        result = run(bench, args.repeat)
+        results.append(result)
+        note = ""
+        if bench.name in baseline:
+            note = _compare(result, baseline[bench.name], args.threshold)
+            regressed = regressed or "REGRESSION" in note
+        print(_format(result, note), flush=True)
+
+    if args.save:
+        document = {
+            "meta": {
+                "prefab_ui": prefab_ui.__version__,
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+            },
+            "results": {
+                r.name: {k: v for k, v in dataclasses.asdict(r).items() if k != "name"}
+                for r in results
+            },
+        }
+        args.save.write_text(json.dumps(document, indent=2) + "\n")
+        print(f"\nSaved {len(results)} results to {args.save}")
+
+    if regressed:
+        print("\nRegressions detected", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
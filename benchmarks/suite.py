@@ -0,0 +1,356 @@
+"""Fixed synthetic workloads for the prefab_ui hot paths.
+
+Every workload is deterministic (seeded data, fixed sizes) so results are
+comparable across runs and machines of the same class.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from typing import Any
+
+from harness import benchmark
+from pydantic import Field, create_model
+
+from prefab_ui import compile_view
+from prefab_ui.app import PrefabApp
+from prefab_ui.components import (
+    Badge,
+    Card,
+    CardContent,
+    CardHeader,
+    CardTitle,
+    Column,
+    DataTableColumn,
+    DataTableIndex,
+    DataTableSource,
+    Elif,
+    Else,
+    ForEach,
+    Form,
+    Histogram,
+    If,
+    Row,
+    Table,
+    TableBody,
+    TableCell,
+    TableRow,
+    Text,
+    defer,
+    insert,
+)
+from prefab_ui.components.base import _serialize_children
+from prefab_ui.components.charts import ChartSeries, LineChart
+from prefab_ui.components.charts.downsample import _lttb_python, lttb
+from prefab_ui.expr import evaluate
+from prefab_ui.polling import VersionedResult
+from prefab_ui.rx import Rx
+from prefab_ui.state import diff
+from prefab_ui.wire import dependencies
+
+# ── Fixtures ─────────────────────────────────────────────────────────
+
+
+def _dashboard(cards: int) -> Column:
+    with Column(gap=4) as view:
+        for i in range(cards):
+            with Card():
+                with CardHeader():
+                    CardTitle(f"Metric {i}")
+                with CardContent():
+                    with Row(gap=2):
+                        Text(f"{{{{ metrics.{i}.value | number:2 }}}}")
+                        Badge(label=f"{{{{ metrics.{i}.delta | percent }}}}")
+    return view
+
+
+def _table(rows: int) -> Table:
+    return Table(
+        children=[
+            TableBody(
+                children=[
+                    TableRow(
+                        children=[
+                            TableCell(content=f"row {i}"),
+                            TableCell(content="{{ $item.price | currency }}"),
+                        ]
+                    )
+                    for i in range(rows)
+                ]
+            )
+        ]
+    )
+
+
+def _app(cards: int, rows: int) -> PrefabApp:
+    state: dict[str, Any] = {
+        "metrics": [{"value": i * 1.5, "delta": i / 100} for i in range(cards)],
+        "rows": [
+            {"id": i, "name": f"item-{i}", "price": i * 0.25} for i in range(rows)
+        ],
+    }
+    return PrefabApp(view=_dashboard(cards), state=state)
+
+
+# ── Tree construction ────────────────────────────────────────────────
+
+
+@benchmark("construct/with_blocks_1k_cards")
+def _construct_with_blocks():
+    return lambda: _dashboard(1_000)
+
+
+@benchmark("construct/insert_defer_1k")
+def _construct_insert_defer():
+    def build() -> Column:
+        with defer():
+            parts = [Text(f"part {i}") for i in range(1_000)]
+        with Column() as col:
+            for part in parts:
+                insert(part)
+        return col
+
+    return build
+
+
+# ── Serialization ────────────────────────────────────────────────────
+
+
+@benchmark("serialize/component_to_json_table_10k")
+def _component_to_json():
+    return _table(10_000).to_json
+
+
+@benchmark("serialize/app_to_json")
+def _app_to_json():
+    return _app(500, 10_000).to_json
+
+
+@benchmark("serialize/app_to_json_bytes")
+def _app_to_json_bytes():
+    return _app(500, 10_000).to_json_bytes
+
+
+@benchmark("serialize/app_to_json_one_dirty_leaf")
+def _app_to_json_dirty_leaf():
+    app = _app(500, 10_000)
+    leaf = app.view.children[250].children[1].children[0].children[0]
+    counter = iter(range(10**9))
+
+    def run() -> dict[str, Any]:
+        leaf.content = f"edit {next(counter)}"
+        return app.to_json()
+
+    return run
+
+
+@benchmark("serialize/app_html")
+def _app_html():
+    app = _app(500, 10_000)
+    app.html()  # warm the renderer asset cache during setup
+    return app.html
+
+
+@benchmark("serialize/if_elif_chains_1k")
+def _if_elif_chains():
+    with defer():
+        children = []
+        for i in range(1_000):
+            children.append(If(f"{{{{ step == {i} }}}}", children=[Text("a")]))
+            children.append(Elif(f"{{{{ step == {i + 1} }}}}", children=[Text("b")]))
+            children.append(Elif(f"{{{{ step == {i + 2} }}}}", children=[Text("c")]))
+            children.append(Else(children=[Text("d")]))
+    return lambda: _serialize_children(children)
+
+
+# ── Compiled views ───────────────────────────────────────────────────
+
+
+def _metrics(cards: int) -> dict[str, Any]:
+    return {"metrics": [{"value": i * 1.5, "delta": i / 100} for i in range(cards)]}
+
+
+@benchmark("compiled/rebuild_per_request_500_cards")
+def _rebuild_per_request():
+    state = _metrics(500)
+    return lambda: PrefabApp(view=_dashboard(500), state=state).to_json_bytes()
+
+
+@benchmark("compiled/bind_state_500_cards")
+def _compiled_bind():
+    compiled = compile_view(lambda: _dashboard(500))
+    state = _metrics(500)
+    return lambda: compiled.to_json_bytes(state)
+
+
+@benchmark("compiled/html_gzip_500_cards")
+def _compiled_html_gzip():
+    compiled = compile_view(lambda: _dashboard(500))
+    state = _metrics(500)
+    return lambda: compiled.html_bytes(state, encoding="gzip")
+
+
+# ── Expressions ──────────────────────────────────────────────────────
+
+
+def _rx_chain(terms: int) -> Rx:
+    expr = Rx("v0")
+    for i in range(1, terms):
+        expr = expr + Rx(f"v{i}") * i if i % 2 else expr - Rx(f"v{i}")
+    return (expr > 0).then(expr.currency(), "n/a")
+
+
+@benchmark("rx/compile_chain_200")
+def _rx_compile_200():
+    expr = _rx_chain(200)
+    return lambda: str(expr)
+
+
+@benchmark("rx/build_and_compile_chain_1k")
+def _rx_build_compile_1k():
+    return lambda: str(_rx_chain(1_000))
+
+
+@benchmark("expr/evaluate_template_10k_rows")
+def _expr_evaluate_rows():
+    rows = [{"price": i * 0.25, "qty": i % 7} for i in range(10_000)]
+    source = "$item.qty > 0 ? ($item.price * $item.qty | currency) : 'n/a'"
+
+    def run() -> list[Any]:
+        return [evaluate(source, {"$item": row}) for row in rows]
+
+    return run
+
+
+# ── Wire transforms ──────────────────────────────────────────────────
+
+
+@benchmark("wire/dependencies_500_cards_foreach")
+def _wire_dependencies():
+    with Column() as view:
+        _dashboard(500)
+        with ForEach("rows", let={"label": "{{ $item.name | upper }}"}):
+            Text("{{ label }}: {{ $item.price | currency }}")
+    envelope = PrefabApp(view=view, state=_app(500, 1_000).state).to_json()
+    return lambda: dependencies(envelope)
+
+
+def _line_chart(points: int) -> PrefabApp:
+    rng = random.Random(42)
+    data = [
+        {"week": i, "downloads": rng.randint(0, 10**6), "stars": rng.random()}
+        for i in range(points)
+    ]
+    series = [ChartSeries(data_key="downloads"), ChartSeries(data_key="stars")]
+    return PrefabApp(view=LineChart(data=data, series=series, x_axis="week"))
+
+
+@benchmark("wire/to_json_line_chart_10k_rows")
+def _wire_rows():
+    app = _line_chart(10_000)
+    return lambda: json.dumps(app.to_json())
+
+
+@benchmark("wire/to_json_line_chart_10k_columnar")
+def _wire_columnar():
+    app = _line_chart(10_000)
+    return lambda: json.dumps(app.to_json(columnar=True))
+
+
+# ── Components with Python-side work ─────────────────────────────────
+
+
+@benchmark("histogram/bin_1m_values", repeat=1)
+def _histogram():
+    rng = random.Random(42)
+    values = [rng.gauss(0, 1) for _ in range(1_000_000)]
+    return lambda: Histogram(values=values, bins=30).data
+
+
+def _walk(points: int) -> tuple[list[float], list[float]]:
+    rng = random.Random(42)
+    x = [float(i) for i in range(points)]
+    y = [0.0] * points
+    for i in range(1, points):
+        y[i] = y[i - 1] + rng.gauss(0, 1)
+    return x, y
+
+
+@benchmark("chart/lttb_1m_points", repeat=1)
+def _lttb():
+    x, y = _walk(1_000_000)
+    return lambda: lttb(x, y, 2_000)
+
+
+@benchmark("chart/lttb_1m_points_pure_python", repeat=1)
+def _lttb_pure_python():
+    x, y = _walk(1_000_000)
+    return lambda: _lttb_python(x, y, 2_000)
+
+
+@benchmark("data_table/source_sort_page_1m_rows", repeat=1)
+def _data_table_source():
+    rng = random.Random(0)
+    rows = [{"id": i, "score": rng.random()} for i in range(1_000_000)]
+    source = DataTableSource(
+        rows, columns=[DataTableColumn(key="score", header="Score", sortable=True)]
+    )
+    return lambda: source.query(page=3, page_size=25, sort="score", direction="desc")
+
+
+@benchmark("data_table/index_sort_page_1m_rows", repeat=1)
+def _data_table_index():
+    rng = random.Random(0)
+    rows = [{"id": i, "score": rng.random()} for i in range(1_000_000)]
+    index = DataTableIndex(
+        rows, columns=[DataTableColumn(key="score", header="Score", sortable=True)]
+    )
+    return lambda: index.query(page=3, page_size=25, sort="score", direction="desc")
+
+
+@benchmark("state/diff_100k_todos_3_edits")
+def _state_diff():
+    old = [{"id": i, "title": f"todo {i}", "done": False} for i in range(100_000)]
+    new = [dict(todo) for todo in old]
+    new[50_000]["done"] = True
+    new.insert(10, {"id": -1, "title": "new", "done": False})
+    new.append(new.pop(0))
+    return lambda: diff(old, new)
+
+
+@benchmark("state/diff_100k_todos_5k_swaps_20k_inserts", repeat=1)
+def _state_diff_many():
+    rng = random.Random(0)
+    old = [{"id": i, "title": f"todo {i}", "done": False} for i in range(100_000)]
+    new = [dict(todo) for todo in old]
+    for _ in range(5_000):
+        a, b = rng.randrange(100_000), rng.randrange(100_000)
+        new[a], new[b] = new[b], new[a]
+    for i in range(20_000):
+        new.insert(rng.randrange(len(new) + 1), {"id": -1 - i, "title": "new"})
+    return lambda: diff(old, new)
+
+
+@benchmark("polling/version_unchanged_10k_rows")
+def _polling_version():
+    rows = [{"host": f"web-{i}", "cpu": i % 100} for i in range(10_000)]
+    version = VersionedResult(rows).version
+    return lambda: VersionedResult(rows).respond(version)
+
+
+@benchmark("form/from_model_200_fields")
+def _form_from_model():
+    fields: dict[str, Any] = {}
+    for i in range(200):
+        kind = i % 4
+        if kind == 0:
+            fields[f"name_{i}"] = (str, Field(title=f"Name {i}", max_length=80))
+        elif kind == 1:
+            fields[f"count_{i}"] = (int, Field(ge=0, le=1_000))
+        elif kind == 2:
+            fields[f"enabled_{i}"] = (bool, False)
+        else:
+            fields[f"email_{i}"] = (str, Field(description="Contact email"))
+    model = create_model("WideModel", **fields)
+    return lambda: Form.from_model(model)
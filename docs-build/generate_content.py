@@ -12,11 +12,8 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
-# Ensure the source tree and local modules are importable
+# Ensure the source tree is importable
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
-sys.path.insert(0, str(Path(__file__).resolve().parent))
-
-from html_renderer import render_json
 
 from prefab_ui.components import (
     H1,
@@ -59,6 +56,7 @@ from prefab_ui.components import (
     Switch,
     Textarea,
 )
+from prefab_ui.prerender import render_json
 
 fragments: list[str] = []
 
@@ -0,0 +1,125 @@
+import { describe, it, expect, vi, beforeEach } from "vitest";
+import type { App } from "@modelcontextprotocol/ext-apps";
+import { createMockApp } from "./testing/mock-app";
+import { createStateStore } from "./testing/state-store";
+import { loadActionResult, type ActionSpec } from "./actions";
+
+const QUERY = {
+  page: 2,
+  page_size: 25,
+  sort: "name",
+  direction: "desc",
+  search: "{{ secret }}",
+};
+
+describe("loadActionResult", () => {
+  let fetchSpy: ReturnType<typeof vi.fn>;
+
+  beforeEach(() => {
+    vi.clearAllMocks();
+    fetchSpy = vi.fn().mockResolvedValue({
+      ok: true,
+      status: 200,
+      statusText: "OK",
+      headers: new Map([["content-type", "application/json"]]),
+      json: () => Promise.resolve({ rows: [{ name: "Ada" }], total: 1 }),
+    });
+    globalThis.fetch = fetchSpy as typeof globalThis.fetch;
+  });
+
+  it("sends the query as tool arguments", async () => {
+    const app = createMockApp();
+    app.callServerTool.mockResolvedValueOnce({
+      content: [],
+      structuredContent: { rows: [{ name: "Ada" }], total: 1 },
+    });
+    const state = createStateStore({ secret: "leaked" });
+    const action: ActionSpec = {
+      action: "toolCall",
+      tool: "list_users",
+      arguments: {},
+    };
+
+    const result = await loadActionResult(
+      action,
+      app as unknown as App,
+      state,
+      QUERY,
+    );
+
+    expect(result).toEqual({ rows: [{ name: "Ada" }], total: 1 });
+    expect(app.callServerTool).toHaveBeenCalledWith({
+      name: "list_users",
+      arguments: QUERY,
+    });
+  });
+
+  it("keeps explicit tool arguments", async () => {
+    const app = createMockApp();
+    const state = createStateStore({ team: "core" });
+    const action: ActionSpec = {
+      action: "toolCall",
+      tool: "list_users",
+      arguments: { team: "{{ team }}", offset: "{{ $event.page * 25 }}" },
+    };
+
+    await loadActionResult(action, app as unknown as App, state, QUERY);
+
+    expect(app.callServerTool).toHaveBeenCalledWith({
+      name: "list_users",
+      arguments: { team: "core", offset: 50 },
+    });
+  });
+
+  it("sends the query as URL parameters for GET", async () => {
+    const state = createStateStore({ secret: "leaked" });
+    const action: ActionSpec = { action: "fetch", url: "/api/users?team=core" };
+
+    const result = await loadActionResult(action, null, state, {
+      ...QUERY,
+      sort: null,
+    });
+
+    expect(result).toEqual({ rows: [{ name: "Ada" }], total: 1 });
+    expect(fetchSpy).toHaveBeenCalledWith(
+      "/api/users?team=core&page=2&page_size=25&direction=desc&search=%7B%7B+secret+%7D%7D",
+      { method: "GET", headers: {} },
+    );
+  });
+
+  it("sends the query as a JSON body for POST", async () => {
+    const state = createStateStore();
+    const action: ActionSpec = {
+      action: "fetch",
+      url: "/api/users",
+      method: "POST",
+    };
+
+    await loadActionResult(action, null, state, QUERY);
+
+    expect(fetchSpy).toHaveBeenCalledWith("/api/users", {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify(QUERY),
+    });
+  });
+
+  it("rejects when the action fails", async () => {
+    const app = createMockApp();
+    app.callServerTool.mockResolvedValueOnce({
+      isError: true,
+      content: [{ type: "text", text: "boom" }],
+    });
+    const state = createStateStore();
+    const action: ActionSpec = {
+      action: "toolCall",
+      tool: "list_users",
+      onError: { action: "setState", key: "failed", value: "{{ $error }}" },
+    };
+
+    await expect(
+      loadActionResult(action, app as unknown as App, state, QUERY),
+    ).rejects.toThrow("toolCall failed");
+    expect(state.get("failed")).toBe("boom");
+  });
+});
@@ -296,4 +296,75 @@ describe("executeAction", () => {
       expect(state.get("tasks")).toEqual(["a", "c"]);
     });
   });
+
+  describe("patchState", () => {
+    it("applies every operation in one update", async () => {
+      const state = createStateStore({
+        todos: [
+          { id: 1, title: "a", done: false },
+          { id: 2, title: "b", done: false },
+        ],
+      });
+      const set = vi.spyOn(state, "set");
+      const action: ActionSpec = {
+        action: "patchState",
+        key: "todos",
+        patch: [
+          { op: "replace", path: "/0/done", value: true },
+          { op: "add", path: "/1", value: { id: 3, title: "c", done: false } },
+          { op: "move", from: "/2", path: "/0" },
+        ],
+      };
+
+      await executeAction(action, null, state);
+
+      expect(set).toHaveBeenCalledTimes(1);
+      expect(state.get("todos")).toEqual([
+        { id: 2, title: "b", done: false },
+        { id: 1, title: "a", done: true },
+        { id: 3, title: "c", done: false },
+      ]);
+    });
+
+    it("applies a patch from $result", async () => {
+      const state = createStateStore({ profile: { name: "Ada" } });
+      const action: ActionSpec = {
+        action: "patchState",
+        key: "profile",
+        patch: "{{ $result }}",
+      };
+
+      await executeAction(
+        action,
+        null,
+        state,
+        undefined,
+        0,
+        undefined,
+        undefined,
+        undefined,
+        [{ op: "add", path: "/title", value: "Countess" }],
+      );
+
+      expect(state.get("profile")).toEqual({ name: "Ada", title: "Countess" });
+    });
+
+    it("leaves state alone and fails when an operation fails", async () => {
+      const todos = [{ id: 1 }];
+      const state = createStateStore({ todos });
+      const action: ActionSpec = {
+        action: "patchState",
+        key: "todos",
+        patch: [
+          { op: "remove", path: "/0" },
+          { op: "remove", path: "/0" },
+        ],
+      };
+
+      const ok = await executeAction(action, null, state);
+
+      expect(ok).toBe(false);
+      expect(state.get("todos")).toBe(todos);
+    });
+  });
 });
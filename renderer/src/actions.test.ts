@@ -182,6 +182,116 @@ describe("executeAction", () => {
       expect(state.get("users")).toEqual([{ name: "Alice" }]);
     });
 
+    it("applies the result as a patch when patchState is set", async () => {
+      app.callServerTool.mockResolvedValueOnce({
+        structuredContent: {
+          result: [{ op: "replace", path: "/1/done", value: true }],
+        },
+        _meta: { fastmcp: { wrap_result: true } },
+      });
+      const state = createStateStore({
+        todos: [
+          { id: 1, done: false },
+          { id: 2, done: false },
+        ],
+      });
+      const action: ActionSpec = {
+        action: "toolCall",
+        tool: "complete",
+        patchState: "todos",
+      };
+
+      const ok = await executeAction(action, appAsApp, state);
+
+      expect(ok).toBe(true);
+      expect(state.get("todos")).toEqual([
+        { id: 1, done: false },
+        { id: 2, done: true },
+      ]);
+    });
+
+    it("fails without touching state when the patch doesn't apply", async () => {
+      app.callServerTool.mockResolvedValueOnce({
+        structuredContent: {
+          result: [{ op: "remove", path: "/5" }],
+        },
+        _meta: { fastmcp: { wrap_result: true } },
+      });
+      const todos = [{ id: 1 }];
+      const state = createStateStore({ todos });
+      const action: ActionSpec = {
+        action: "toolCall",
+        tool: "complete",
+        patchState: "todos",
+        onError: { action: "setState", key: "error", value: "{{ $error }}" },
+      };
+
+      const ok = await executeAction(action, appAsApp, state);
+
+      expect(ok).toBe(false);
+      expect(state.get("todos")).toBe(todos);
+      expect(state.get("error")).toContain("/5");
+    });
+
+    it("sends the last version and skips onSuccess when unchanged", async () => {
+      app.callServerTool
+        .mockResolvedValueOnce({
+          structuredContent: { version: "v1", data: { cpu: 0.5 } },
+        })
+        .mockResolvedValueOnce({ structuredContent: { unchanged: true } })
+        .mockResolvedValueOnce({
+          structuredContent: { version: "v2", data: { cpu: 0.7 } },
+        });
+      const state = createStateStore({ updates: 0 });
+      const action: ActionSpec = {
+        action: "toolCall",
+        tool: "metrics",
+        arguments: { host: "a" },
+        versionArgument: "since",
+        onSuccess: [
+          { action: "setState", key: "metrics", value: "{{ $result }}" },
+          { action: "setState", key: "updates", value: "{{ updates + 1 }}" },
+        ],
+      };
+
+      await executeAction(action, appAsApp, state);
+      expect(await executeAction(action, appAsApp, state)).toBe(true);
+      expect(state.get("metrics")).toEqual({ cpu: 0.5 });
+      expect(state.get("updates")).toBe(1);
+      await executeAction(action, appAsApp, state);
+
+      const sent = app.callServerTool.mock.calls.map(([call]) => call);
+      expect(sent).toEqual([
+        { name: "metrics", arguments: { host: "a" } },
+        { name: "metrics", arguments: { host: "a", since: "v1" } },
+        { name: "metrics", arguments: { host: "a", since: "v1" } },
+      ]);
+      expect(state.get("metrics")).toEqual({ cpu: 0.7 });
+      expect(state.get("updates")).toBe(2);
+    });
+
+    it("sends no version after the arguments change", async () => {
+      app.callServerTool.mockResolvedValue({
+        structuredContent: { version: "v1", data: [] },
+      });
+      const state = createStateStore({ host: "a" });
+      const action: ActionSpec = {
+        action: "toolCall",
+        tool: "metrics",
+        arguments: { host: "{{ host }}" },
+        versionArgument: "since",
+      };
+
+      await executeAction(action, appAsApp, state);
+      state.set("host", "b");
+      await executeAction(action, appAsApp, state);
+
+      expect(app.callServerTool).toHaveBeenLastCalledWith({
+        name: "metrics",
+        arguments: { host: "b" },
+      });
+    });
+
     it("parses JSON text content as $result", async () => {
       app.callServerTool.mockResolvedValueOnce({
         content: [
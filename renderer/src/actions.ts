@@ -24,7 +24,7 @@
 
 import type { App } from "@modelcontextprotocol/ext-apps";
 import { toast } from "sonner";
-import type { StateStore } from "./state";
+import { applyPatch, type PatchOperation, type StateStore } from "./state";
 import type { OverlayCloseFn } from "./overlay-context";
 import { interpolateProps } from "./interpolation";
 import { validateAction } from "./validation";
@@ -53,6 +53,15 @@ export function clearAllIntervals(): void {
   activeIntervals.clear();
 }
 
+/**
+ * The last result version each versioned toolCall spec received, and the
+ * tool and arguments it was for (see `versionArgument`).
+ */
+const lastVersions = new WeakMap<
+  ActionSpec,
+  { request: string; version: string }
+>();
+
 /**
  * Extract a human-readable error message from a failed action result.
  *
@@ -114,6 +123,7 @@ export async function executeAction(
   scope?: Record<string, unknown>,
   overlayClose?: OverlayCloseFn,
   result?: unknown,
+  onResult?: (result: unknown) => void,
 ): Promise<boolean> {
   if (depth > MAX_DEPTH) {
     console.warn("[Prefab] Action callback depth limit exceeded");
@@ -151,9 +161,17 @@ export async function executeAction(
       case "toolCall": {
         const name = resolved.tool as string;
         const args = (resolved.arguments ?? {}) as Record<string, string>;
+        // A versioned call sends the version of the last result it got
+        // for the same request, so an up-to-date tool can skip the data.
+        const versionArg = resolved.versionArgument as string | undefined;
+        const request = versionArg ? JSON.stringify([name, args]) : "";
+        const seen = versionArg ? lastVersions.get(action) : undefined;
         const toolResult = await app?.callServerTool({
           name,
-          arguments: args,
+          arguments:
+            versionArg && seen?.request === request
+              ? { ...args, [versionArg]: seen.version }
+              : args,
         });
         if (toolResult?.isError) {
           success = false;
@@ -179,6 +197,29 @@ export async function executeAction(
             ? extractToolResultData(toolResult)
             : undefined;
         }
+        if (
+          versionArg &&
+          resultData != null &&
+          typeof resultData === "object"
+        ) {
+          const envelope = resultData as Record<string, unknown>;
+          // Nothing changed since the version we sent: not an error, but
+          // there's no new $result for onSuccess.
+          if (envelope.unchanged === true) return true;
+          if (typeof envelope.version === "string") {
+            lastVersions.set(action, { request, version: envelope.version });
+            resultData = envelope.data;
+          }
+        }
+        // A tool flagged by ResolvedTool.patch_state returns a patch for
+        // that state key rather than a value.
+        const patchKey = resolved.patchState as string | undefined;
+        if (patchKey) {
+          state.set(
+            patchKey,
+            applyPatch(state.get(patchKey), resultData as PatchOperation[]),
+          );
+        }
         break;
       }
       case "sendMessage": {
@@ -273,6 +314,16 @@ export async function executeAction(
         );
         break;
       }
+      case "patchState": {
+        // Every operation applies to a copy first, so state changes in
+        // one update or, if any operation fails, not at all.
+        const key = resolved.key as string;
+        state.set(
+          key,
+          applyPatch(state.get(key), resolved.patch as PatchOperation[]),
+        );
+        break;
+      }
       case "showToast": {
         const message = resolved.message as string;
         const opts = {
@@ -477,6 +528,8 @@ export async function executeAction(
     errorMessage = e instanceof Error ? e.message : String(e);
   }
 
+  if (success) onResult?.(resultData);
+
   // Dispatch lifecycle callbacks: $result to onSuccess, $error to onError
   if (success && resolved.onSuccess) {
     await executeActions(
@@ -540,3 +593,76 @@ export async function executeActions(
     if (!ok) break;
   }
 }
+
+/**
+ * Give a data-loading action the request it should send.
+ *
+ * Actions that already say what to send are left alone. Otherwise a
+ * toolCall gets `$event` as its arguments, a GET fetch gets it as URL
+ * parameters, and any other fetch gets it as a JSON body. Parameters are
+ * percent-encoded, so user input can't inject `{{ }}` templates.
+ */
+function withRequest(
+  action: ActionSpec,
+  event: Record<string, unknown>,
+): ActionSpec {
+  if (action.action === "toolCall") {
+    const args = action.arguments as Record<string, unknown> | undefined;
+    if (args == null || Object.keys(args).length === 0) {
+      return { ...action, arguments: "{{ $event }}" };
+    }
+  } else if (action.action === "fetch") {
+    const method = (action.method as string | undefined) ?? "GET";
+    const url = action.url as string;
+    if (method === "GET" && !url.includes("$event")) {
+      const params = new URLSearchParams();
+      for (const [key, value] of Object.entries(event)) {
+        if (value != null) params.set(key, String(value));
+      }
+      const separator = url.includes("?") ? "&" : "?";
+      return { ...action, url: `${url}${separator}${params}` };
+    }
+    if (method !== "GET" && action.body == null) {
+      return { ...action, body: "{{ $event }}" };
+    }
+  }
+  return action;
+}
+
+/**
+ * Run a data-loading action chain and resolve with its `$result`.
+ *
+ * Components that load their own data (DataTable `source`) call this
+ * instead of routing a response through state. `event` is available as
+ * `$event` and is sent as the request (see `withRequest`). The promise
+ * rejects when an action fails, after its onError callbacks have run.
+ */
+export async function loadActionResult(
+  actions: ActionSpec | ActionSpec[],
+  app: App | null,
+  state: StateStore,
+  event: Record<string, unknown>,
+  scope?: Record<string, unknown>,
+  overlayClose?: OverlayCloseFn,
+): Promise<unknown> {
+  const list = Array.isArray(actions) ? actions : [actions];
+  let loaded: unknown;
+  for (const action of list) {
+    const ok = await executeAction(
+      withRequest(action, event),
+      app,
+      state,
+      event,
+      0,
+      undefined,
+      scope,
+      overlayClose,
+      undefined,
+      (result) => {
+        loaded = result;
+      },
+    );
+    if (!ok) throw new Error(`${action.action} failed`);
+  }
+  return loaded;
+}
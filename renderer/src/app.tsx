@@ -35,9 +35,11 @@ import { useStateStore } from "./state";
 import { earlyBridge } from "./early-bridge";
 import { clearAllIntervals } from "./actions";
 import { resolveTheme, buildThemeCss } from "./themes";
+import { expandStrings } from "./wire-strings";
+import { registerExpressions } from "./expression";
 
 /** Protocol versions this renderer understands. */
-const SUPPORTED_VERSIONS = new Set(["0.2"]);
+const SUPPORTED_VERSIONS = new Set(["0.2", "0.3"]);
 
 /** Read baked-in data from the HTML (standalone mode). */
 function readInitialData(): {
@@ -48,7 +50,10 @@ function readInitialData(): {
   const el = document.getElementById("prefab:initial-data");
   if (!el?.textContent) return null;
   try {
-    const data = JSON.parse(el.textContent) as Record<string, unknown>;
+    const data = expandStrings(
+      JSON.parse(el.textContent) as Record<string, unknown>,
+    );
+    registerExpressions(data.expressions);
 
     // Apply theme overrides (string name or custom object)
     if (data.theme) {
@@ -123,8 +128,10 @@ export function App() {
 
   const handleToolResult = useCallback(
     (result: { structuredContent?: Record<string, unknown> }) => {
-      const structured = result.structuredContent;
-      if (!structured) return;
+      if (!result.structuredContent) return;
+      // 0.3 payloads may carry a string table; resolve it up front.
+      const structured = expandStrings(result.structuredContent);
+      registerExpressions(structured.expressions);
 
       // Check protocol version (warn but don't block rendering)
       const version = structured.version as string | undefined;
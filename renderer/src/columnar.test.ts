@@ -0,0 +1,42 @@
+import { describe, it, expect } from "vitest";
+import { toRows } from "./columnar";
+
+const ROWS = [
+  { month: "Jan", desktop: 186 },
+  { month: "Feb", desktop: 305 },
+];
+
+describe("toRows", () => {
+  it("passes row lists through", () => {
+    expect(toRows(ROWS)).toBe(ROWS);
+  });
+
+  it("expands one array per column", () => {
+    expect(toRows({ month: ["Jan", "Feb"], desktop: [186, 305] })).toEqual(
+      ROWS,
+    );
+  });
+
+  it("expands columns plus values", () => {
+    expect(
+      toRows({
+        columns: ["month", "desktop"],
+        values: [
+          ["Jan", 186],
+          ["Feb", 305],
+        ],
+      }),
+    ).toEqual(ROWS);
+  });
+
+  it("handles empty tables", () => {
+    expect(toRows({})).toEqual([]);
+    expect(toRows({ columns: ["a"], values: [] })).toEqual([]);
+  });
+
+  it("rejects anything else", () => {
+    expect(toRows("{{ rows }}")).toBeNull();
+    expect(toRows({ a: 1 })).toBeNull();
+    expect(toRows(null)).toBeNull();
+  });
+});
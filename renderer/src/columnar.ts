@@ -0,0 +1,59 @@
+/**
+ * Columnar chart data and table rows.
+ *
+ * Chart `data` and DataTable `rows` may arrive column by column instead of
+ * as a list of row objects (see `prefab_ui.columnar`):
+ *
+ *   { "month": ["Jan", "Feb"], "desktop": [186, 305] }
+ *   { "columns": ["month", "desktop"], "values": [["Jan", 186], ["Feb", 305]] }
+ *
+ * Components call `toRows` once and work with row objects from there on.
+ */
+
+export type Row = Record<string, unknown>;
+
+function isColumnsValues(
+  data: Record<string, unknown>,
+): data is { columns: string[]; values: unknown[][] } {
+  const keys = Object.keys(data);
+  return (
+    keys.length === 2 &&
+    Array.isArray(data.columns) &&
+    Array.isArray(data.values) &&
+    data.columns.every((name) => typeof name === "string") &&
+    data.values.every((row) => Array.isArray(row))
+  );
+}
+
+/**
+ * Normalize row data to a list of row objects. Returns null for anything
+ * that isn't row data, such as an unresolved `{{ }}` string.
+ */
+export function toRows(data: unknown): Row[] | null {
+  if (Array.isArray(data)) return data as Row[];
+  if (data === null || typeof data !== "object") return null;
+  const table = data as Record<string, unknown>;
+
+  if (isColumnsValues(table)) {
+    const { columns, values } = table;
+    return values.map((cells) => {
+      const row: Row = {};
+      for (let c = 0; c < columns.length; c++) row[columns[c]] = cells[c];
+      return row;
+    });
+  }
+
+  const keys = Object.keys(table);
+  const columns = keys.map((key) => table[key]);
+  if (!columns.every((column) => Array.isArray(column))) return null;
+  const length = keys.length ? (columns[0] as unknown[]).length : 0;
+  const rows: Row[] = new Array(length);
+  for (let r = 0; r < length; r++) {
+    const row: Row = {};
+    for (let c = 0; c < keys.length; c++) {
+      row[keys[c]] = (columns[c] as unknown[])[r];
+    }
+    rows[r] = row;
+  }
+  return rows;
+}
@@ -42,6 +42,7 @@ import type {
   RadialChartWire,
   ScatterChartWire,
 } from "@/schemas/chart";
+import { toRows } from "@/columnar";
 
 const compactFormatter = (value: number) =>
   new Intl.NumberFormat("en", {
@@ -108,7 +109,8 @@ export function PrefabBarChart({
   yAxisFormat = "auto",
   className,
 }: BarChartWire & { className?: string }) {
-  if (typeof data === "string") return null;
+  const rows = toRows(data);
+  if (!rows) return null;
   const config = buildConfig(series);
 
   return (
@@ -117,7 +119,7 @@ export function PrefabBarChart({
       className={className}
       style={{ height, aspectRatio: "auto" }}
     >
-      <BarChart data={data} layout={horizontal ? "vertical" : "horizontal"}>
+      <BarChart data={rows} layout={horizontal ? "vertical" : "horizontal"}>
         {showGrid && (
           <CartesianGrid vertical={horizontal} horizontal={!horizontal} />
         )}
@@ -188,7 +190,8 @@ export function PrefabLineChart({
   yAxisFormat = "auto",
   className,
 }: LineChartWire & { className?: string }) {
-  if (typeof data === "string") return null;
+  const rows = toRows(data);
+  if (!rows) return null;
   const config = buildConfig(series);
 
   return (
@@ -197,7 +200,7 @@ export function PrefabLineChart({
       className={className}
       style={{ height, aspectRatio: "auto" }}
     >
-      <LineChart data={data}>
+      <LineChart data={rows}>
         {showGrid && <CartesianGrid vertical={false} />}
         {xAxis && (
           <XAxis
@@ -251,7 +254,8 @@ export function PrefabAreaChart({
   yAxisFormat = "auto",
   className,
 }: AreaChartWire & { className?: string }) {
-  if (typeof data === "string") return null;
+  const rows = toRows(data);
+  if (!rows) return null;
   const config = buildConfig(series);
 
   return (
@@ -260,7 +264,7 @@ export function PrefabAreaChart({
       className={className}
       style={{ height, aspectRatio: "auto" }}
     >
-      <AreaChart data={data}>
+      <AreaChart data={rows}>
         {showGrid && <CartesianGrid vertical={false} />}
         {xAxis && (
           <XAxis
@@ -313,11 +317,12 @@ export function PrefabPieChart({
   showTooltip = true,
   className,
 }: PieChartWire & { className?: string }) {
-  if (typeof data === "string") return null;
-  const config = buildPieConfig(data, nameKey);
+  const rows = toRows(data);
+  if (!rows) return null;
+  const config = buildPieConfig(rows, nameKey);
 
   // Inject fill colors into data so Recharts renders them
-  const coloredData = data.map((d, i) => ({
+  const coloredData = rows.map((d, i) => ({
     ...d,
     fill: CHART_COLORS[i % CHART_COLORS.length],
   }));
@@ -404,7 +409,8 @@ export function PrefabRadarChart({
   showGrid = true,
   className,
 }: RadarChartWire & { className?: string }) {
-  if (typeof data === "string") return null;
+  const rows = toRows(data);
+  if (!rows) return null;
   const config = buildConfig(series);
 
   return (
@@ -413,7 +419,7 @@ export function PrefabRadarChart({
       className={className}
       style={{ height, aspectRatio: "auto" }}
     >
-      <RadarChart data={data}>
+      <RadarChart data={rows}>
         {showGrid && <PolarGrid />}
         {axisKey && <PolarAngleAxis dataKey={axisKey} />}
         {showTooltip && <ChartTooltip content={<ChartTooltipContent />} />}
@@ -448,10 +454,11 @@ export function PrefabRadialChart({
   showTooltip = true,
   className,
 }: RadialChartWire & { className?: string }) {
-  if (typeof data === "string") return null;
-  const config = buildPieConfig(data, nameKey);
+  const rows = toRows(data);
+  if (!rows) return null;
+  const config = buildPieConfig(rows, nameKey);
 
-  const coloredData = data.map((d, i) => ({
+  const coloredData = rows.map((d, i) => ({
     ...d,
     fill: CHART_COLORS[i % CHART_COLORS.length],
   }));
@@ -494,7 +501,8 @@ export function PrefabScatterChart({
   showGrid = true,
   className,
 }: ScatterChartWire & { className?: string }) {
-  if (typeof data === "string") return null;
+  const rows = toRows(data);
+  if (!rows) return null;
   const config = buildConfig(series);
 
   return (
@@ -532,8 +540,8 @@ export function PrefabScatterChart({
           // only one series (single-series mode).
           const seriesData =
             series.length === 1
-              ? data
-              : data.filter(
+              ? rows
+              : rows.filter(
                   (d) => (d as Record<string, unknown>)._series === s.dataKey,
                 );
           return (
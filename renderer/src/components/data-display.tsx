@@ -3,9 +3,13 @@
  *
  * Renders a flat columns + rows API with optional sorting, filtering,
  * and pagination using shadcn Table primitives.
+ *
+ * With a `source` action the table holds one page at a time: each page,
+ * sort or search change sends a DataTableQuery through the action, and
+ * the `{rows, total}` it returns replaces the page.
  */
 
-import { useState, useMemo } from "react";
+import { useState, useMemo, useEffect, useRef } from "react";
 import {
   useReactTable,
   getCoreRowModel,
@@ -14,6 +18,7 @@ import {
   getPaginationRowModel,
   flexRender,
   type ColumnDef,
+  type PaginationState,
   type SortingState,
 } from "@tanstack/react-table";
 import {
@@ -27,6 +32,7 @@ import {
 } from "@/ui/table";
 import { Input } from "@/ui/input";
 import { Button } from "@/ui/button";
+import { toRows, type Row } from "@/columnar";
 
 interface DataTableColumnSpec {
   key: string;
@@ -34,9 +40,25 @@ interface DataTableColumnSpec {
   sortable?: boolean;
 }
 
+/** What a `source` table asks for, sent to its action as `$event`. */
+export interface DataTableQuery {
+  page: number;
+  page_size: number;
+  sort: string | null;
+  direction: "asc" | "desc" | null;
+  search: string;
+}
+
+/** A `source` action, bound by bindActions to resolve with its result. */
+type DataTableSource = (query: DataTableQuery) => Promise<unknown>;
+
+/** Typing pause before a `source` table sends a new search. */
+const SEARCH_DEBOUNCE_MS = 300;
+
 interface DataTableProps {
   columns: DataTableColumnSpec[];
-  rows: Record<string, unknown>[];
+  rows?: Row[] | Record<string, unknown[]>;
+  source?: DataTableSource;
   searchable?: boolean;
   paginated?: boolean;
   pageSize?: number;
@@ -44,17 +66,89 @@ interface DataTableProps {
   className?: string;
 }
 
+/** `value`, once it has stopped changing for `delay` ms. */
+function useDebounced<T>(value: T, delay: number): T {
+  const [settled, setSettled] = useState(value);
+  useEffect(() => {
+    if (delay <= 0) {
+      setSettled(value);
+      return;
+    }
+    const timer = setTimeout(() => setSettled(value), delay);
+    return () => clearTimeout(timer);
+  }, [value, delay]);
+  return settled;
+}
+
+/**
+ * Load the page `query` describes from `source`. A response that arrives
+ * after a newer query was sent is dropped, so a slow request can't
+ * overwrite a faster, later one.
+ */
+function useSourcePage(
+  source: DataTableSource | undefined,
+  query: DataTableQuery,
+): { rows: Row[]; total: number } {
+  const [page, setPage] = useState<{ rows: Row[]; total: number }>({
+    rows: [],
+    total: 0,
+  });
+  // bindActions makes a new function on every render; only a new query
+  // should trigger a request.
+  const sourceRef = useRef(source);
+  sourceRef.current = source;
+  const latest = useRef(0);
+  const key = JSON.stringify(query);
+
+  useEffect(() => {
+    const load = sourceRef.current;
+    if (!load) return;
+    const request = ++latest.current;
+    load(JSON.parse(key) as DataTableQuery).then(
+      (result) => {
+        if (request !== latest.current) return;
+        const response = (result ?? {}) as { rows?: unknown; total?: unknown };
+        const rows = toRows(response.rows) ?? [];
+        const total =
+          typeof response.total === "number" ? response.total : rows.length;
+        setPage({ rows, total });
+      },
+      (error: unknown) => {
+        console.warn("[Prefab] DataTable source failed:", error);
+      },
+    );
+  }, [key]);
+
+  return page;
+}
+
 export function PrefabDataTable({
   columns: columnSpecs,
-  rows,
+  rows = [],
+  source,
   searchable = false,
   paginated = false,
   pageSize = 10,
   caption,
   className,
 }: DataTableProps) {
+  const remote = source != null;
   const [sorting, setSorting] = useState<SortingState>([]);
   const [globalFilter, setGlobalFilter] = useState("");
+  const [pagination, setPagination] = useState<PaginationState>({
+    pageIndex: 0,
+    pageSize,
+  });
+  const search = useDebounced(globalFilter, remote ? SEARCH_DEBOUNCE_MS : 0);
+  const sourcePage = useSourcePage(source, {
+    page: pagination.pageIndex,
+    page_size: pageSize,
+    sort: sorting[0]?.id ?? null,
+    direction: sorting[0] ? (sorting[0].desc ? "desc" : "asc") : null,
+    search,
+  });
+  const localRows = useMemo(() => toRows(rows) ?? [], [rows]);
+  const data = remote ? sourcePage.rows : localRows;
 
   // Build @tanstack/react-table column defs from our flat spec
   const columns = useMemo<ColumnDef<Record<string, unknown>>[]>(
@@ -91,18 +185,43 @@ export function PrefabDataTable({
     [columnSpecs],
   );
 
-  const table = useReactTable({
-    data: rows,
-    columns,
-    state: { sorting, globalFilter },
-    onSortingChange: setSorting,
-    onGlobalFilterChange: setGlobalFilter,
-    getCoreRowModel: getCoreRowModel(),
-    getSortedRowModel: getSortedRowModel(),
-    getFilteredRowModel: searchable ? getFilteredRowModel() : undefined,
-    getPaginationRowModel: paginated ? getPaginationRowModel() : undefined,
-    initialState: paginated ? { pagination: { pageSize } } : undefined,
-  });
+  const table = useReactTable(
+    remote
+      ? {
+          // The server sorts, filters and slices; the table shows one page.
+          data,
+          columns,
+          state: { sorting, globalFilter, pagination },
+          onSortingChange: (updater) => {
+            setSorting(updater);
+            setPagination((p) => ({ ...p, pageIndex: 0 }));
+          },
+          onGlobalFilterChange: (value: string) => {
+            setGlobalFilter(value);
+            setPagination((p) => ({ ...p, pageIndex: 0 }));
+          },
+          onPaginationChange: setPagination,
+          manualSorting: true,
+          manualFiltering: true,
+          manualPagination: true,
+          rowCount: sourcePage.total,
+          getCoreRowModel: getCoreRowModel(),
+        }
+      : {
+          data,
+          columns,
+          state: { sorting, globalFilter },
+          onSortingChange: setSorting,
+          onGlobalFilterChange: setGlobalFilter,
+          getCoreRowModel: getCoreRowModel(),
+          getSortedRowModel: getSortedRowModel(),
+          getFilteredRowModel: searchable ? getFilteredRowModel() : undefined,
+          getPaginationRowModel: paginated
+            ? getPaginationRowModel()
+            : undefined,
+          initialState: paginated ? { pagination: { pageSize } } : undefined,
+        },
+  );
 
   return (
     <div className={className}>
@@ -111,7 +230,7 @@ export function PrefabDataTable({
           <Input
             placeholder="Filter..."
             value={globalFilter}
-            onChange={(e) => setGlobalFilter(e.target.value)}
+            onChange={(e) => table.setGlobalFilter(e.target.value)}
             className="max-w-sm"
           />
         </div>
@@ -0,0 +1,45 @@
+/**
+ * Conformance corpus shared with the Python expression engine
+ * (prefab_ui.expr). Both implementations evaluate every case in
+ * schemas/expressions.json and must agree on the result.
+ */
+
+import { describe, expect, it } from "vitest";
+import fs from "fs";
+import path from "path";
+import { evaluate } from "./expression.ts";
+
+interface ConformanceCase {
+  group: string;
+  expr: string;
+  ctx?: Record<string, unknown>;
+  expected?: unknown;
+  undefined?: boolean;
+  error?: boolean;
+}
+
+const CORPUS_PATH = path.resolve(__dirname, "../../schemas/expressions.json");
+const { cases } = JSON.parse(fs.readFileSync(CORPUS_PATH, "utf-8")) as {
+  cases: ConformanceCase[];
+};
+
+const groups = [...new Set(cases.map((c) => c.group))];
+
+describe("expression conformance corpus", () => {
+  for (const group of groups) {
+    describe(group, () => {
+      for (const c of cases.filter((c) => c.group === group)) {
+        it(`${c.expr} ${JSON.stringify(c.ctx ?? {})}`, () => {
+          const run = () => evaluate(c.expr, c.ctx ?? {});
+          if (c.error) {
+            expect(run).toThrow();
+          } else if (c.undefined) {
+            expect(run()).toBeUndefined();
+          } else {
+            expect(run()).toEqual(c.expected);
+          }
+        });
+      }
+    });
+  }
+});
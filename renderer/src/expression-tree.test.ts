@@ -0,0 +1,43 @@
+import { describe, it, expect, afterEach } from "vitest";
+import { evaluate, evaluateTree, registerExpressions } from "./expression";
+
+describe("evaluateTree", () => {
+  const ctx = {
+    user: { name: "ada" },
+    items: [1, 2, 3],
+    price: 2.5,
+    qty: 4,
+    missing: null,
+  };
+
+  it.each([
+    [42, 42],
+    [[".", "user", "name"], "ada"],
+    [[".", "items", "length"], 3],
+    [["*", [".", "price"], [".", "qty"]], 10],
+    [["+", "a", 1], "a1"],
+    [["!", [".", "missing"]], true],
+    [["-", [".", "qty"]], -4],
+    [["?", [">", [".", "qty"], 3], "many", "few"], "many"],
+    [["|", [".", "user", "name"], "upper"], "ADA"],
+    [["??", [".", "missing"], "anon"], "anon"],
+  ])("evaluates %j", (tree, expected) => {
+    expect(evaluateTree(tree, ctx)).toEqual(expected);
+  });
+});
+
+describe("registerExpressions", () => {
+  afterEach(() => registerExpressions(undefined));
+
+  it("uses registered trees instead of parsing", () => {
+    registerExpressions({ "a b": [".", "value"] });
+    // "a b" is not valid syntax, so only the registered tree can answer.
+    expect(evaluate("a b", { value: 7 })).toBe(7);
+  });
+
+  it("replaces the previous table", () => {
+    registerExpressions({ "a b": 1 });
+    registerExpressions({});
+    expect(() => evaluate("a b", {})).toThrow();
+  });
+});
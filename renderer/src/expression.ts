@@ -185,6 +185,60 @@ const pipes: Record<string, PipeFn> = {
   },
 };
 
+// ── Operators ──────────────────────────────────────────────────────────
+
+/** Apply a binary operator. Shared by the parser and pre-parsed trees. */
+function applyBinary(op: string, left: unknown, right: unknown): unknown {
+  switch (op) {
+    case "||":
+      return left || right;
+    case "&&":
+      return left && right;
+    case "==":
+      return left == right;
+    case "!=":
+      return left != right;
+    case ">":
+      return (left as number) > (right as number);
+    case ">=":
+      return (left as number) >= (right as number);
+    case "<":
+      return (left as number) < (right as number);
+    case "<=":
+      return (left as number) <= (right as number);
+    case "+":
+      // String concatenation if either side is a string
+      if (typeof left === "string" || typeof right === "string") {
+        return String(left) + String(right);
+      }
+      return Number(left) + Number(right);
+    case "-":
+      return Number(left) - Number(right);
+    case "*":
+      return Number(left) * Number(right);
+    case "/":
+      return Number(left) / Number(right);
+  }
+  throw new Error(`Unknown operator: ${op}`);
+}
+
+/** Resolve a dot-path identifier (already split) from context. */
+function resolvePath(parts: string[], ctx: Record<string, unknown>): unknown {
+  let current: unknown = ctx;
+  for (const part of parts) {
+    if (current == null) return undefined;
+    if (
+      part === "length" &&
+      (Array.isArray(current) || typeof current === "string")
+    ) {
+      return (current as string | unknown[]).length;
+    }
+    if (typeof current !== "object") return undefined;
+    current = (current as Record<string, unknown>)[part];
+  }
+  return current;
+}
+
 // ── Tokenizer ──────────────────────────────────────────────────────────
 
 type TokenType =
@@ -442,7 +496,7 @@ class Parser {
     while (this.peek().type === "op" && this.peek().value === "||") {
       this.advance();
       const right = this.parseAnd();
-      left = left || right;
+      left = applyBinary("||", left, right);
     }
     return left;
   }
@@ -453,7 +507,7 @@ class Parser {
     while (this.peek().type === "op" && this.peek().value === "&&") {
       this.advance();
       const right = this.parseNot();
-      left = left && right;
+      left = applyBinary("&&", left, right);
     }
     return left;
   }
@@ -478,20 +532,7 @@ class Parser {
     ) {
       this.advance();
       const right = this.parseAdd();
-      switch (tok.value) {
-        case "==":
-          return left == right;
-        case "!=":
-          return left != right;
-        case ">":
-          return (left as number) > (right as number);
-        case ">=":
-          return (left as number) >= (right as number);
-        case "<":
-          return (left as number) < (right as number);
-        case "<=":
-          return (left as number) <= (right as number);
-      }
+      return applyBinary(tok.value, left, right);
     }
 
     return left;
@@ -507,16 +548,7 @@ class Parser {
     ) {
       const op = this.advance().value;
       const right = this.parseMul();
-      if (op === "+") {
-        // String concatenation if either side is a string
-        if (typeof left === "string" || typeof right === "string") {
-          left = String(left) + String(right);
-        } else {
-          left = Number(left) + Number(right);
-        }
-      } else {
-        left = Number(left) - Number(right);
-      }
+      left = applyBinary(op, left, right);
     }
 
     return left;
@@ -532,11 +564,7 @@ class Parser {
     ) {
       const op = this.advance().value;
       const right = this.parseUnary();
-      if (op === "*") {
-        left = Number(left) * Number(right);
-      } else {
-        left = Number(left) / Number(right);
-      }
+      left = applyBinary(op, left, right);
     }
 
     return left;
@@ -586,29 +614,79 @@ class Parser {
 
     if (tok.type === "ident") {
       this.advance();
-      return this.resolve(tok.value);
+      return resolvePath(tok.value.split("."), this.ctx);
     }
 
     throw new Error(`Unexpected token: ${tok.type} '${tok.value}'`);
   }
+}
 
-  /** Resolve a dot-path identifier from context. */
-  private resolve(path: string): unknown {
-    const parts = path.split(".");
-    let current: unknown = this.ctx;
-    for (const part of parts) {
-      if (current == null) return undefined;
-      if (
-        part === "length" &&
-        (Array.isArray(current) || typeof current === "string")
-      ) {
-        return (current as string | unknown[]).length;
-      }
-      if (typeof current !== "object") return undefined;
-      current = (current as Record<string, unknown>)[part];
+// ── Pre-parsed expressions ─────────────────────────────────────────────
+
+/**
+ * Syntax tree shipped by the server in an envelope's `expressions` table
+ * (see `prefab_ui.wire.expressions`). Arrays are operator nodes, with
+ * precedence already resolved; anything else is a literal.
+ */
+export type ExpressionTree =
+  | string
+  | number
+  | boolean
+  | null
+  | ExpressionTree[];
+
+const preparsed = new Map<string, ExpressionTree>();
+
+/**
+ * Replace the pre-parsed expression table. `evaluate` uses these trees for
+ * matching expression text instead of tokenizing and parsing it.
+ */
+export function registerExpressions(table: unknown): void {
+  preparsed.clear();
+  if (table == null || typeof table !== "object" || Array.isArray(table)) {
+    return;
+  }
+  for (const [source, tree] of Object.entries(table)) {
+    preparsed.set(source, tree as ExpressionTree);
+  }
+}
+
+/**
+ * Evaluate a pre-parsed tree. Mirrors the parser exactly, including
+ * evaluating both ternary branches and both sides of `&&`/`||`.
+ */
+export function evaluateTree(
+  node: ExpressionTree,
+  ctx: Record<string, unknown>,
+): unknown {
+  if (!Array.isArray(node)) return node;
+  const op = node[0] as string;
+  switch (op) {
+    case ".":
+      return resolvePath(node.slice(1) as string[], ctx);
+    case "!":
+      return !evaluateTree(node[1], ctx);
+    case "?": {
+      const condition = evaluateTree(node[1], ctx);
+      const consequent = evaluateTree(node[2], ctx);
+      const alternate = evaluateTree(node[3], ctx);
+      return condition ? consequent : alternate;
+    }
+    case "|": {
+      const value = evaluateTree(node[1], ctx);
+      const fn = pipes[node[2] as string];
+      return fn ? fn(value, node[3] as string | undefined) : value;
     }
-    return current;
+    case "??": {
+      const value = evaluateTree(node[1], ctx);
+      return value == null ? node[2] : value;
+    }
+  }
+  if (node.length === 2) {
+    const value = Number(evaluateTree(node[1], ctx));
+    return op === "-" ? -value : +value;
   }
+  return applyBinary(op, evaluateTree(node[1], ctx), evaluateTree(node[2], ctx));
 }
 
 // ── Public API ─────────────────────────────────────────────────────────
@@ -619,6 +697,8 @@ class Parser {
  * Throws on parse/evaluation errors.
  */
 export function evaluate(expr: string, ctx: Record<string, unknown>): unknown {
+  const tree = preparsed.get(expr);
+  if (tree !== undefined) return evaluateTree(tree, ctx);
   const tokens = tokenize(expr);
   const parser = new Parser(tokens, ctx);
   const result = parser.parseExpr();
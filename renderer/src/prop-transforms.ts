@@ -8,12 +8,25 @@
  */
 
 import type { App } from "@modelcontextprotocol/ext-apps";
-import { executeActions, type ActionSpec } from "./actions";
+import {
+  executeActions,
+  loadActionResult,
+  type ActionSpec,
+} from "./actions";
 import type { StateStore } from "./state";
 import type { OverlayCloseFn } from "./overlay-context";
 
-/** Props that carry action specs (serialized from Python Action types). */
-export const ACTION_PROPS = new Set(["onClick", "onChange", "onSubmit"]);
+/**
+ * Props that carry action specs (serialized from Python Action types).
+ * `source` is DataTable's data-loading action: it's bound to a function
+ * that resolves with the action's result rather than to an event handler.
+ */
+export const ACTION_PROPS = new Set([
+  "onClick",
+  "onChange",
+  "onSubmit",
+  "source",
+]);
 
 /**
  * Types whose children represent data items rather than nested components.
@@ -52,6 +65,11 @@ export function bindActions(
     if (typeof spec === "function") continue;
 
     const actionSpec = spec as ActionSpec | ActionSpec[];
+    if (propName === "source") {
+      bound[propName] = (query: Record<string, unknown>) =>
+        loadActionResult(actionSpec, app, state, query, scope, overlayClose);
+      continue;
+    }
     bound[propName] = async (event?: unknown) => {
       // For form submits, collect all named input values into state
       // before dispatching actions. This ensures template interpolation
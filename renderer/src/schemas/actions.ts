@@ -26,6 +26,10 @@ export const toolCallSchema = z.object({
   action: z.literal("toolCall"),
   tool: z.string(),
   arguments: z.record(z.string(), z.unknown()).optional(),
+  // State key the tool's result is a JSON Patch for (ResolvedTool.patch_state).
+  patchState: z.string().optional(),
+  // Argument that carries the last received result version (VersionedResult).
+  versionArgument: z.string().optional(),
   ...actionCallbacks,
 });
 
@@ -82,6 +86,21 @@ export const popStateSchema = z.object({
   ...actionCallbacks,
 });
 
+/** One JSON Patch (RFC 6902) operation, as emitted by prefab_ui.state.diff. */
+export const patchOperationSchema = z.object({
+  op: z.enum(["add", "remove", "replace", "move"]),
+  path: z.string(),
+  from: z.string().optional(),
+  value: z.unknown().optional(),
+});
+
+export const patchStateSchema = z.object({
+  action: z.literal("patchState"),
+  key: z.string(),
+  patch: z.array(patchOperationSchema),
+  ...actionCallbacks,
+});
+
 export const showToastSchema = z.object({
   action: z.literal("showToast"),
   message: z.string(),
@@ -140,6 +159,7 @@ export const actionSchema = z.discriminatedUnion("action", [
   toggleStateSchema,
   appendStateSchema,
   popStateSchema,
+  patchStateSchema,
   showToastSchema,
   closeOverlaySchema,
   openFilePickerSchema,
@@ -161,6 +181,7 @@ export const HANDLED_ACTIONS = new Set([
   "toggleState",
   "appendState",
   "popState",
+  "patchState",
   "showToast",
   "closeOverlay",
   "openFilePicker",
@@ -182,6 +203,7 @@ export const ACTION_SCHEMA_REGISTRY: Record<string, z.ZodType> = {
   toggleState: toggleStateSchema,
   appendState: appendStateSchema,
   popState: popStateSchema,
+  patchState: patchStateSchema,
   showToast: showToastSchema,
   closeOverlay: closeOverlaySchema,
   openFilePicker: openFilePickerSchema,
@@ -198,6 +220,8 @@ export type SetStateWire = z.infer<typeof setStateSchema>;
 export type ToggleStateWire = z.infer<typeof toggleStateSchema>;
 export type AppendStateWire = z.infer<typeof appendStateSchema>;
 export type PopStateWire = z.infer<typeof popStateSchema>;
+export type PatchOperationWire = z.infer<typeof patchOperationSchema>;
+export type PatchStateWire = z.infer<typeof patchStateSchema>;
 export type ShowToastWire = z.infer<typeof showToastSchema>;
 export type CloseOverlayWire = z.infer<typeof closeOverlaySchema>;
 export type OpenFilePickerWire = z.infer<typeof openFilePickerSchema>;
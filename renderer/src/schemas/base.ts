@@ -25,5 +25,15 @@ export const containerBase = componentBase.extend({
   children: z.array(anyComponentSchema).optional(),
 });
 
+/**
+ * Chart data and table rows: a list of row objects, the same table column
+ * by column (see `columnar.ts`), or an unresolved `{{ }}` reference.
+ */
+export const rowDataSchema = z.union([
+  z.array(z.record(z.string(), z.unknown())),
+  z.record(z.string(), z.array(z.unknown())),
+  z.string(),
+]);
+
 export type ComponentBaseWire = z.infer<typeof componentBase>;
 export type ContainerBaseWire = z.infer<typeof containerBase>;
@@ -1,5 +1,5 @@
 import { z } from "zod";
-import { componentBase } from "./base.ts";
+import { componentBase, rowDataSchema } from "./base.ts";
 
 const chartSeriesSchema = z.object({
   dataKey: z.string(),
@@ -8,9 +8,7 @@ const chartSeriesSchema = z.object({
 });
 
 const cartesianBase = componentBase.extend({
-  data: z
-    .union([z.array(z.record(z.string(), z.unknown())), z.string()])
-    .optional(),
+  data: rowDataSchema.optional(),
   series: z.array(chartSeriesSchema),
   xAxis: z.string().optional(),
   height: z.number().int().optional(),
@@ -43,9 +41,7 @@ export const areaChartSchema = cartesianBase.extend({
 
 export const pieChartSchema = componentBase.extend({
   type: z.literal("PieChart"),
-  data: z
-    .union([z.array(z.record(z.string(), z.unknown())), z.string()])
-    .optional(),
+  data: rowDataSchema.optional(),
   dataKey: z.string(),
   nameKey: z.string(),
   height: z.number().int().optional(),
@@ -58,9 +54,7 @@ export const pieChartSchema = componentBase.extend({
 
 export const radarChartSchema = componentBase.extend({
   type: z.literal("RadarChart"),
-  data: z
-    .union([z.array(z.record(z.string(), z.unknown())), z.string()])
-    .optional(),
+  data: rowDataSchema.optional(),
   series: z.array(chartSeriesSchema),
   axisKey: z.string().optional(),
   height: z.number().int().optional(),
@@ -73,9 +67,7 @@ export const radarChartSchema = componentBase.extend({
 
 export const radialChartSchema = componentBase.extend({
   type: z.literal("RadialChart"),
-  data: z
-    .union([z.array(z.record(z.string(), z.unknown())), z.string()])
-    .optional(),
+  data: rowDataSchema.optional(),
   dataKey: z.string(),
   nameKey: z.string(),
   height: z.number().int().optional(),
@@ -88,9 +80,7 @@ export const radialChartSchema = componentBase.extend({
 
 export const scatterChartSchema = componentBase.extend({
   type: z.literal("ScatterChart"),
-  data: z
-    .union([z.array(z.record(z.string(), z.unknown())), z.string()])
-    .optional(),
+  data: rowDataSchema.optional(),
   series: z.array(chartSeriesSchema),
   xAxis: z.string(),
   yAxis: z.string(),
@@ -1,5 +1,6 @@
 import { z } from "zod";
-import { componentBase } from "./base.ts";
+import { componentBase, rowDataSchema } from "./base.ts";
+import { actionOrList } from "./actions.ts";
 
 const dataTableColumnSchema = z.object({
   key: z.string(),
@@ -10,9 +11,8 @@ const dataTableColumnSchema = z.object({
 export const dataTableSchema = componentBase.extend({
   type: z.literal("DataTable"),
   columns: z.array(dataTableColumnSchema),
-  rows: z
-    .union([z.array(z.record(z.string(), z.unknown())), z.string()])
-    .optional(),
+  rows: rowDataSchema.optional(),
+  source: actionOrList.optional(),
   searchable: z.boolean().optional(),
   paginated: z.boolean().optional(),
   pageSize: z.number().int().optional(),
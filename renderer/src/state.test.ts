@@ -1,6 +1,6 @@
 import { describe, it, expect, vi } from "vitest";
 import { createStateStore } from "./testing/state-store";
-import { getByPath, setByPath } from "./state";
+import { applyPatch, getByPath, setByPath } from "./state";
 
 describe("createStateStore", () => {
   it("starts empty by default", () => {
@@ -205,3 +205,53 @@ describe("setByPath", () => {
     warn.mockRestore();
   });
 });
+
+describe("applyPatch", () => {
+  const todos = () => [
+    { id: 1, tags: ["a"] },
+    { id: 2, tags: [] },
+    { id: 3, tags: ["b"] },
+  ];
+
+  it("adds, removes, replaces and moves", () => {
+    const result = applyPatch(todos(), [
+      { op: "remove", path: "/1" },
+      { op: "add", path: "/-", value: { id: 4, tags: [] } },
+      { op: "replace", path: "/0/tags/0", value: "z" },
+      { op: "move", from: "/2", path: "/0" },
+    ]);
+    expect(result).toEqual([
+      { id: 4, tags: [] },
+      { id: 1, tags: ["z"] },
+      { id: 3, tags: ["b"] },
+    ]);
+  });
+
+  it("copies only what it edits", () => {
+    const before = todos();
+    const result = applyPatch(before, [
+      { op: "add", path: "/0/tags/1", value: "c" },
+    ]) as typeof before;
+    expect(before[0].tags).toEqual(["a"]);
+    expect(result[0]).not.toBe(before[0]);
+    expect(result[1]).toBe(before[1]);
+  });
+
+  it("unescapes ~0 and ~1 in keys", () => {
+    expect(
+      applyPatch({}, [{ op: "add", path: "/a~1b~0", value: 1 }]),
+    ).toEqual({ "a/b~": 1 });
+  });
+
+  it("replaces the whole value at an empty path", () => {
+    expect(applyPatch([1], [{ op: "replace", path: "", value: [2] }])).toEqual(
+      [2],
+    );
+  });
+
+  it("throws on a missing path or unknown operation", () => {
+    expect(() => applyPatch([], [{ op: "remove", path: "/0" }])).toThrow();
+    expect(() => applyPatch({}, [{ op: "replace", path: "/x" }])).toThrow();
+    expect(() => applyPatch({}, [{ op: "copy", path: "/x" }])).toThrow();
+  });
+});
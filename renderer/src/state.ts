@@ -111,6 +111,174 @@ export function setByPath(
   };
 }
 
+// ── JSON Patch ───────────────────────────────────────────────────────
+
+/** One JSON Patch (RFC 6902) operation, as emitted by prefab_ui.state.diff. */
+export interface PatchOperation {
+  op: string;
+  path: string;
+  from?: string;
+  value?: unknown;
+}
+
+type Container = Record<string, unknown> | unknown[];
+
+/** Split a JSON Pointer into keys, prefixed with the root holder's 0. */
+function pointerTokens(pointer: unknown): string[] {
+  if (
+    typeof pointer !== "string" ||
+    (pointer !== "" && !pointer.startsWith("/"))
+  ) {
+    throw new Error(`Invalid patch path: ${String(pointer)}`);
+  }
+  const names = pointer === "" ? [] : pointer.split("/").slice(1);
+  return [
+    "0",
+    ...names.map((name) => name.replace(/~1/g, "/").replace(/~0/g, "~")),
+  ];
+}
+
+/** The JSON Pointer for `tokens`, without the root holder's 0. */
+function pointerOf(tokens: string[]): string {
+  return tokens
+    .slice(1)
+    .map((name) => `/${name.replace(/~/g, "~0").replace(/\//g, "~1")}`)
+    .join("");
+}
+
+function isContainer(value: unknown): value is Container {
+  return typeof value === "object" && value !== null;
+}
+
+/** The key or index `name` stands for in `container`. */
+function childKey(
+  container: Container,
+  name: string,
+  pointer: string,
+  end = false,
+): string | number {
+  if (!Array.isArray(container)) {
+    if (!end && !Object.prototype.hasOwnProperty.call(container, name)) {
+      throw new Error(`No "${pointer}" in the patched value`);
+    }
+    return name;
+  }
+  if (end && name === "-") return container.length;
+  const length = container.length + (end ? 1 : 0);
+  if (isIndex(name) && Number(name) < length) return Number(name);
+  throw new Error(`No "${pointer}" in the patched value`);
+}
+
+/**
+ * Apply JSON Patch operations to `value` and return the result.
+ *
+ * Mirrors `prefab_ui.state.apply_patch`: supports add, remove, replace
+ * and move. `value` is not modified — each object or array on the way to
+ * an edit is copied once per patch, so the result can go to React as a
+ * single state update. Throws if an operation is unknown or its path
+ * doesn't exist, in which case nothing has been applied.
+ */
+export function applyPatch(value: unknown, patch: PatchOperation[]): unknown {
+  const root: unknown[] = [value];
+  // Containers copied for this patch, which are safe to edit in place.
+  const copies = new Set<unknown>([root]);
+
+  const get = (tokens: string[]): unknown => {
+    let current: unknown = root;
+    for (let n = 0; n < tokens.length; n++) {
+      const pointer = pointerOf(tokens.slice(0, n + 1));
+      if (!isContainer(current)) {
+        throw new Error(`No "${pointer}" in the patched value`);
+      }
+      const at = childKey(current, tokens[n], pointer);
+      current = (current as Record<string | number, unknown>)[at];
+    }
+    return current;
+  };
+
+  const parent = (tokens: string[]): Container => {
+    let holder: Container = root;
+    for (let n = 0; n < tokens.length - 1; n++) {
+      const pointer = pointerOf(tokens.slice(0, n + 1));
+      const at = childKey(holder, tokens[n], pointer);
+      let child = (holder as Record<string | number, unknown>)[at];
+      if (!isContainer(child)) {
+        throw new Error(`"${pointer}" holds no items`);
+      }
+      if (!copies.has(child)) {
+        child = Array.isArray(child) ? [...child] : { ...child };
+        copies.add(child);
+        (holder as Record<string | number, unknown>)[at] = child;
+      }
+      holder = child as Container;
+    }
+    return holder;
+  };
+
+  const add = (tokens: string[], item: unknown): void => {
+    const holder = parent(tokens);
+    const at = childKey(
+      holder,
+      tokens[tokens.length - 1],
+      pointerOf(tokens),
+      true,
+    );
+    if (holder === root || !Array.isArray(holder)) {
+      (holder as Record<string | number, unknown>)[at] = item;
+    } else {
+      holder.splice(at as number, 0, item);
+    }
+  };
+
+  const remove = (tokens: string[]): void => {
+    if (tokens.length === 1) {
+      throw new Error("Can't remove the whole patched value");
+    }
+    const holder = parent(tokens);
+    const at = childKey(holder, tokens[tokens.length - 1], pointerOf(tokens));
+    if (Array.isArray(holder)) holder.splice(at as number, 1);
+    else delete holder[at];
+  };
+
+  for (const operation of patch) {
+    const tokens = pointerTokens(operation.path);
+    switch (operation.op) {
+      case "add":
+        add(tokens, operation.value);
+        break;
+      case "remove":
+        remove(tokens);
+        break;
+      case "replace": {
+        const holder = parent(tokens);
+        const at = childKey(
+          holder,
+          tokens[tokens.length - 1],
+          operation.path,
+        );
+        (holder as Record<string | number, unknown>)[at] = operation.value;
+        break;
+      }
+      case "move": {
+        const source = pointerTokens(operation.from);
+        if (
+          tokens.length > source.length &&
+          source.every((name, i) => tokens[i] === name)
+        ) {
+          throw new Error(`Can't move "${operation.from}" into itself`);
+        }
+        const moved = get(source);
+        remove(source);
+        add(tokens, moved);
+        break;
+      }
+      default:
+        throw new Error(`Unknown patch operation: ${String(operation.op)}`);
+    }
+  }
+  return root[0];
+}
+
 // ── React state store ────────────────────────────────────────────────
 
 /**
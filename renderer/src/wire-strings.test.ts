@@ -0,0 +1,38 @@
+import { describe, it, expect } from "vitest";
+import { expandStrings } from "./wire-strings";
+
+describe("expandStrings", () => {
+  it("resolves references in view, defs and state", () => {
+    const envelope = {
+      version: "0.3",
+      strings: ["flex items-center gap-2", "{{ $item.price | currency }}"],
+      view: {
+        type: "Row",
+        cssClass: { $str: 0 },
+        children: [{ type: "Text", content: { $str: 1 } }],
+      },
+      defs: { row: { type: "Div", cssClass: { $str: 0 } } },
+      state: { classes: [{ $str: 0 }] },
+    };
+    expect(expandStrings(envelope)).toEqual({
+      version: "0.3",
+      view: {
+        type: "Row",
+        cssClass: "flex items-center gap-2",
+        children: [{ type: "Text", content: "{{ $item.price | currency }}" }],
+      },
+      defs: { row: { type: "Div", cssClass: "flex items-center gap-2" } },
+      state: { classes: ["flex items-center gap-2"] },
+    });
+  });
+
+  it("leaves envelopes without a table alone", () => {
+    const envelope = { version: "0.2", view: { type: "Text", content: "x" } };
+    expect(expandStrings(envelope)).toBe(envelope);
+  });
+
+  it("rejects references outside the table", () => {
+    const envelope = { strings: ["a"], view: { type: "Text", content: { $str: 3 } } };
+    expect(() => expandStrings(envelope)).toThrow(/Invalid string reference/);
+  });
+});
@@ -0,0 +1,61 @@
+/**
+ * String-table expansion for protocol 0.3 payloads.
+ *
+ * `PrefabApp.to_json(intern_strings=True)` moves strings that repeat across
+ * the payload into a top-level `strings` list and replaces each occurrence
+ * with `{"$str": <index>}`. Expanding the envelope once on receipt means
+ * nothing downstream (renderer, state store, actions) ever sees a
+ * reference.
+ */
+
+type Json = unknown;
+
+function isRef(value: Record<string, unknown>): boolean {
+  const keys = Object.keys(value);
+  return keys.length === 1 && keys[0] === "$str";
+}
+
+function expand(value: Json, table: string[]): Json {
+  if (Array.isArray(value)) {
+    return value.map((item) => expand(item, table));
+  }
+  if (value !== null && typeof value === "object") {
+    const obj = value as Record<string, unknown>;
+    if (isRef(obj)) {
+      const index = obj.$str;
+      if (
+        typeof index !== "number" ||
+        !Number.isInteger(index) ||
+        index < 0 ||
+        index >= table.length
+      ) {
+        throw new Error(`[Prefab] Invalid string reference: ${String(index)}`);
+      }
+      return table[index];
+    }
+    const out: Record<string, unknown> = {};
+    for (const [key, item] of Object.entries(obj)) {
+      out[key] = expand(item, table);
+    }
+    return out;
+  }
+  return value;
+}
+
+/**
+ * Resolve `{"$str": n}` references in `view`, `defs` and `state`.
+ * Envelopes without a `strings` table are returned unchanged.
+ */
+export function expandStrings(
+  envelope: Record<string, unknown>,
+): Record<string, unknown> {
+  const table = envelope.strings;
+  if (!Array.isArray(table)) return envelope;
+  const { strings: _strings, ...rest } = envelope;
+  for (const key of ["view", "defs", "state"]) {
+    if (key in rest) {
+      rest[key] = expand(rest[key], table as string[]);
+    }
+  }
+  return rest;
+}
@@ -31,7 +31,13 @@ from prefab_ui.actions.mcp import (
     UpdateContext,
 )
 from prefab_ui.actions.navigation import OpenLink
-from prefab_ui.actions.state import AppendState, PopState, SetState, ToggleState
+from prefab_ui.actions.state import (
+    AppendState,
+    PatchState,
+    PopState,
+    SetState,
+    ToggleState,
+)
 from prefab_ui.actions.timing import SetInterval
 from prefab_ui.actions.ui import CloseOverlay, ShowToast
 from prefab_ui.components import __all__ as component_names
@@ -204,6 +210,7 @@ def discover_actions() -> dict[str, type[Action]]:
         ToggleState,
         AppendState,
         PopState,
+        PatchState,
         ShowToast,
         CloseOverlay,
         OpenFilePicker,
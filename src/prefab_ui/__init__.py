@@ -23,15 +23,27 @@ Submodules:
 - ``prefab_ui.response`` — UIResponse
 - ``prefab_ui.define`` — Define (reusable component definitions)
 - ``prefab_ui.use`` — Use (component instantiation)
+- ``prefab_ui.compiled`` — compile_view / CompiledView (build once, bind state)
 """
 
 from __future__ import annotations
 
 import importlib.metadata
 
+from prefab_ui.compiled import CompiledView, compile_view
 from prefab_ui.themes import Theme, blue, green, orange, red, rose, violet
 
-__all__ = ["Theme", "blue", "green", "orange", "red", "rose", "violet"]
+__all__ = [
+    "CompiledView",
+    "Theme",
+    "blue",
+    "compile_view",
+    "green",
+    "orange",
+    "red",
+    "rose",
+    "violet",
+]
 
 try:
     __version__ = importlib.metadata.version("prefab-ui")
@@ -31,7 +31,13 @@ from prefab_ui.actions.base import Action
 from prefab_ui.actions.fetch import Fetch
 from prefab_ui.actions.file import FileUpload, OpenFilePicker
 from prefab_ui.actions.navigation import OpenLink
-from prefab_ui.actions.state import AppendState, PopState, SetState, ToggleState
+from prefab_ui.actions.state import (
+    AppendState,
+    PatchState,
+    PopState,
+    SetState,
+    ToggleState,
+)
 from prefab_ui.actions.timing import SetInterval
 from prefab_ui.actions.ui import CloseOverlay, ShowToast
 
@@ -43,6 +49,7 @@ __all__ = [
     "FileUpload",
     "OpenFilePicker",
     "OpenLink",
+    "PatchState",
     "PopState",
     "SetInterval",
     "SetState",
@@ -19,12 +19,13 @@ from __future__ import annotations
 
 from typing import Any
 
-from pydantic import BaseModel, Field, SerializeAsAny, model_serializer
+from pydantic import ConfigDict, Field, SerializeAsAny, model_serializer
 
 from prefab_ui.rx import _coerce_rx
+from prefab_ui.tracking import TrackedModel
 
 
-class Action(BaseModel):
+class Action(TrackedModel):
     """Base for all action types — provides lifecycle callbacks.
 
     Subclasses add an ``action`` literal discriminator and their own fields.
@@ -36,7 +37,7 @@ class Action(BaseModel):
     declared base type (Action), which would strip subclass fields.
     """
 
-    model_config = {"populate_by_name": True}
+    model_config = ConfigDict(populate_by_name=True)
 
     @model_serializer(mode="wrap")
     def _serialize_rx(self, handler: Any) -> dict[str, Any]:
@@ -17,6 +17,7 @@ from pydantic import Field, PrivateAttr, model_serializer
 
 from prefab_ui.actions.base import Action
 from prefab_ui.app import get_tool_resolver
+from prefab_ui.components.base import mark_json_volatile
 from prefab_ui.rx import RxStr, _coerce_rx
 
 
@@ -29,7 +30,13 @@ class CallTool(Action):
 
     The resolver may return a plain name string or a :class:`ResolvedTool`
     carrying the name plus flags (e.g. ``unwrap_result``) that the
-    renderer can act on.
+    renderer can act on.  With ``patch_state``, the tool's result is a
+    patch that the renderer applies to that state key.
+
+    With ``version_argument``, the renderer sends the version of the last
+    result it received as that argument, and a tool returning
+    :class:`~prefab_ui.polling.VersionedResult` responses answers "unchanged"
+    instead of resending the data.  ``on_success`` then doesn't run.
 
     The tool's return value is available as ``$result`` in ``on_success``
     callbacks.
@@ -41,6 +48,14 @@ class CallTool(Action):
         default_factory=dict,
         description="Arguments to pass. Supports {{ key }} interpolation.",
     )
+    version_argument: str | None = Field(
+        default=None,
+        alias="versionArgument",
+        description=(
+            "Argument to send the last received result version as. The tool "
+            "returns VersionedResult responses; unchanged ones skip on_success."
+        ),
+    )
     _tool_ref: Callable[..., Any] | None = PrivateAttr(default=None)
 
     def __init__(self, tool: str | Callable[..., Any], **kwargs: Any) -> None:
@@ -56,12 +71,16 @@ class CallTool(Action):
     def _serialize_with_resolver(self, handler: Any) -> dict[str, Any]:
         data: dict[str, Any] = _coerce_rx(handler(self))  # type: ignore[assignment]
         if self._tool_ref is not None:
+            # The name depends on the active resolver, not on our fields.
+            mark_json_volatile()
             resolver = get_tool_resolver()
             if resolver is not None:
                 resolved = resolver(self._tool_ref)
                 data["tool"] = resolved.name
                 if resolved.unwrap_result:
                     data["unwrapResult"] = True
+                if resolved.patch_state is not None:
+                    data["patchState"] = resolved.patch_state
         return {k: v for k, v in data.items() if v is not None}
 
 
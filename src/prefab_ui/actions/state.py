@@ -143,3 +143,34 @@ class PopState(Action):
         kwargs["key"] = _resolve_key(key)
         kwargs["index"] = str(index) if isinstance(index, Rx) else index
         super().__init__(**kwargs)
+
+
+class PatchState(Action):
+    """Apply JSON Patch operations to a state value, in one update.
+
+    Paths in the patch are relative to the value at ``key``, as produced
+    by :func:`prefab_ui.state.diff` from the old and new versions of that
+    value.  The operations apply together: if any fails, state is left
+    as it was and the action fails.  Pass ``RESULT`` to apply a patch a
+    tool returned::
+
+        CallTool("complete", on_success=PatchState("todos", RESULT))
+    """
+
+    action: Literal["patchState"] = "patchState"
+    key: str = Field(description="State key or dot-path to the value to patch")
+    patch: list[dict[str, Any]] | str = Field(
+        description="JSON Patch operations, or a template string like '{{ $result }}'."
+    )
+
+    @field_validator("key")
+    @classmethod
+    def _validate_key(cls, v: str) -> str:
+        return _validate_path(v)
+
+    def __init__(
+        self, key: _KeyLike, patch: list[dict[str, Any]] | str | Rx, **kwargs: Any
+    ) -> None:
+        kwargs["key"] = _resolve_key(key)
+        kwargs["patch"] = str(patch) if isinstance(patch, Rx) else patch
+        super().__init__(**kwargs)
@@ -15,25 +15,49 @@ Usage::
 
     html = app.html()      # complete self-contained page
     csp = app.csp()        # CSP domains for sandboxed delivery
+
+    for chunk in app.iter_html():   # same page as UTF-8 byte chunks
+        response.write(chunk)
 """
 
 from __future__ import annotations
 
 import dataclasses
-import json
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from contextvars import ContextVar
-from typing import Any
+from typing import IO, Any, Literal
 
 import pydantic_core
 from pydantic import BaseModel, Field, model_validator
 
-from prefab_ui.renderer import _get_origin, get_renderer_csp, get_renderer_head
+from prefab_ui.frames import json_fallback
+from prefab_ui.prerender import prerender as prerender_view
+from prefab_ui.renderer import (
+    _get_origin,
+    get_renderer_csp,
+    get_renderer_head,
+    get_renderer_head_bytes,
+    get_renderer_head_compressed,
+)
+from prefab_ui.renderer.assets import DEFAULT_PREFIX, get_hashed_head
+from prefab_ui.renderer.compression import (
+    ContentEncoding,
+    StaticSegment,
+    splice_compressed,
+)
 from prefab_ui.rx import _BoundStateProxy
 from prefab_ui.themes import Theme
+from prefab_ui.wire import columnar as columnar_envelope
+from prefab_ui.wire import dependencies as dependency_table
+from prefab_ui.wire import intern_strings as intern_envelope_strings
+from prefab_ui.wire import optimize as optimize_envelope
+from prefab_ui.wire import parse_expressions as parse_envelope_expressions
 
 PROTOCOL_VERSION = "0.2"
 
+AssetMode = Literal["inline", "hashed"]
+
 # ── Initial State ─────────────────────────────────────────────────────
 
 _initial_state: ContextVar[dict[str, Any] | None] = ContextVar(
@@ -54,6 +78,10 @@ class ResolvedTool:
 
     name: str
     unwrap_result: bool = False
+    patch_state: str | None = None
+    """State key the tool's result patches.  The tool returns JSON Patch
+    operations (see :func:`prefab_ui.state.diff`), and the renderer applies
+    them to this key, as ``PatchState`` would, before ``on_success`` runs."""
 
 
 _tool_resolver: ContextVar[Callable[[Any], ResolvedTool] | None] = ContextVar(
@@ -102,19 +130,133 @@ def clear_initial_state() -> None:
     _initial_state.set(None)
 
 
-_PAGE_TEMPLATE = """\
+_PAGE_HEADER = """\
 <!doctype html>
 <html lang="en">
 <head>
   <title>{title}</title>
-{head}
+"""
+
+_PAGE_ROOT_OPEN = """
 </head>
 <body>
-  <div id="root" style="max-width:64rem;margin:0 auto;padding:2rem"></div>
-  <script id="prefab:initial-data" type="application/json">{data}</script>
+  <div id="root" style="max-width:64rem;margin:0 auto;padding:2rem">"""
+
+_PAGE_ROOT_CLOSE = """</div>
+  <script id="prefab:initial-data" type="application/json">"""
+
+_PAGE_BODY = _PAGE_ROOT_OPEN + _PAGE_ROOT_CLOSE
+
+_PAGE_FOOTER = """</script>
 </body>
 </html>"""
 
+_PAGE_TEMPLATE = (
+    _PAGE_HEADER
+    + "{head}"
+    + _PAGE_ROOT_OPEN
+    + "{markup}"
+    + _PAGE_ROOT_CLOSE
+    + "{data}"
+    + _PAGE_FOOTER
+)
+
+_PAGE_BODY_BYTES = _PAGE_BODY.encode("utf-8")
+_PAGE_ROOT_OPEN_BYTES = _PAGE_ROOT_OPEN.encode("utf-8")
+_PAGE_ROOT_CLOSE_BYTES = _PAGE_ROOT_CLOSE.encode("utf-8")
+_PAGE_FOOTER_BYTES = _PAGE_FOOTER.encode("utf-8")
+
+_STREAM_CHUNK_SIZE = 64 * 1024
+# Containers nested deeper than this are encoded in one encoder call.
+_STREAM_SPLIT_DEPTH = 6
+# Long lists are encoded this many items at a time.
+_STREAM_LIST_BATCH = 256
+
+
+def _iter_json_fragments(value: Any, depth: int = 0) -> Iterator[bytes]:
+    """Yield compact JSON for ``value`` as a series of UTF-8 fragments.
+
+    The outer containers are walked here so no single fragment holds the
+    whole document, while subtrees and batches of list items go through
+    pydantic-core's encoder.  Every string token (keys included) lands
+    whole inside one fragment.  Joining the fragments matches
+    ``pydantic_core.to_json(value)``.
+    """
+    if depth < _STREAM_SPLIT_DEPTH:
+        if type(value) is dict and value and all(type(k) is str for k in value):
+            sep = b"{"
+            for key, item in value.items():
+                yield sep + pydantic_core.to_json(key) + b":"
+                yield from _iter_json_fragments(item, depth + 1)
+                sep = b","
+            yield b"}"
+            return
+        if type(value) is list and value:
+            sep = b"["
+            if len(value) <= _STREAM_LIST_BATCH:
+                for item in value:
+                    yield sep
+                    yield from _iter_json_fragments(item, depth + 1)
+                    sep = b","
+            else:
+                for start in range(0, len(value), _STREAM_LIST_BATCH):
+                    batch = value[start : start + _STREAM_LIST_BATCH]
+                    yield (
+                        sep + pydantic_core.to_json(batch, fallback=json_fallback)[1:-1]
+                    )
+                    sep = b","
+            yield b"]"
+            return
+    yield pydantic_core.to_json(value, fallback=json_fallback)
+
+
+def _iter_script_json(data: Any, chunk_size: int) -> Iterator[bytes]:
+    """Encode ``data`` as JSON safe to embed in a ``<script>`` tag.
+
+    Yields chunks of roughly ``chunk_size`` bytes.  ``<`` and ``/`` only
+    ever appear inside string tokens, which are never split across
+    fragments, so escaping ``</`` per fragment is equivalent to escaping
+    the joined document.
+    """
+    buffer: list[bytes] = []
+    size = 0
+    for fragment in _iter_json_fragments(data):
+        if b"</" in fragment:
+            fragment = fragment.replace(b"</", rb"<\/")
+        buffer.append(fragment)
+        size += len(fragment)
+        if size >= chunk_size:
+            yield b"".join(buffer)
+            buffer.clear()
+            size = 0
+    if buffer:
+        yield b"".join(buffer)
+
+
+def _check_state_keys(state: dict[str, Any]) -> None:
+    for key in state:
+        if key.startswith("$"):
+            raise ValueError(f"State key {key!r} uses reserved prefix '$'")
+
+
+def _check_asset_mode(assets: str) -> None:
+    if assets not in ("inline", "hashed"):
+        raise ValueError(f"Unknown assets mode {assets!r}: use 'inline' or 'hashed'")
+
+
+def _renderer_head(assets: AssetMode, assets_prefix: str) -> str:
+    _check_asset_mode(assets)
+    if assets == "hashed":
+        return get_hashed_head(assets_prefix)
+    return get_renderer_head()
+
+
+def _renderer_head_bytes(assets: AssetMode, assets_prefix: str) -> bytes:
+    _check_asset_mode(assets)
+    if assets == "hashed":
+        return get_hashed_head(assets_prefix).encode("utf-8")
+    return get_renderer_head_bytes()
+
 
 class PrefabApp(BaseModel):
     """A complete Prefab application.
@@ -165,15 +307,62 @@ class PrefabApp(BaseModel):
                 self.state = {**accumulated, **self.state}
 
         if self.state is not None:
-            for key in self.state:
-                if key.startswith("$"):
-                    raise ValueError(f"State key {key!r} uses reserved prefix '$'")
+            _check_state_keys(self.state)
         return self
 
+    @contextmanager
+    def _resolving(
+        self, tool_resolver: Callable[[Any], ResolvedTool] | None
+    ) -> Iterator[None]:
+        """Scope ``tool_resolver`` to the serialization inside the block."""
+        token = _tool_resolver.set(tool_resolver) if tool_resolver is not None else None
+        try:
+            yield
+        finally:
+            if token is not None:
+                _tool_resolver.reset(token)
+
+    def _wire_envelope(
+        self,
+        tool_resolver: Callable[[Any], ResolvedTool] | None,
+        *,
+        shared: bool = False,
+    ) -> dict[str, Any]:
+        """Build the wire-format envelope, leaving ``state`` as-is.
+
+        The view, defs and theme are serialized; ``state`` is the original
+        object so byte encoders can write it without an intermediate copy.
+        Unchanged view and defs subtrees come from the component cache and
+        are copied, unless ``shared`` says the caller only reads them.
+        """
+        with self._resolving(tool_resolver):
+            result: dict[str, Any] = {"version": PROTOCOL_VERSION}
+
+            if self.view is not None:
+                result["view"] = self.view._cached_json(copy=not shared)
+
+            if self.defs:
+                result["defs"] = {
+                    d.name: d._cached_json(copy=not shared) for d in self.defs
+                }
+
+            if self.state is not None:
+                result["state"] = self.state
+
+            if self.theme is not None:
+                result["theme"] = self.theme.to_json()
+
+            return result
+
     def to_json(
         self,
         *,
         tool_resolver: Callable[[Any], ResolvedTool] | None = None,
+        optimize: bool = False,
+        dependencies: bool = False,
+        intern_strings: bool = False,
+        parse_expressions: bool = False,
+        columnar: bool = False,
     ) -> dict[str, Any]:
         """Produce the Prefab wire format.
 
@@ -186,65 +375,285 @@ class PrefabApp(BaseModel):
             Resolves callable tool references to ``ResolvedTool`` instances
             during serialization.  Scoped to this call — safe for
             concurrent use with different resolvers.
+        optimize:
+            Inline state that no action or control can change into the
+            view's expressions, fold constant operators and collapse
+            conditions with a known outcome (see
+            :mod:`prefab_ui.wire.optimize`).  The page renders the same,
+            from a smaller payload with less work per render.
+        dependencies:
+            Add a ``dependencies`` table listing, for each node that reads
+            state, the state paths it reads (see
+            :mod:`prefab_ui.wire.dependencies`), so a state change only
+            needs to re-evaluate the nodes it touches.
+        intern_strings:
+            Move strings that repeat across the payload (class lists,
+            templates, keys) into a top-level ``strings`` table and refer
+            to them by index (see :mod:`prefab_ui.wire.strings`).  The
+            envelope is then marked with protocol version ``0.3``.
+        parse_expressions:
+            Parse every ``{{ }}`` expression on the server and add their
+            syntax trees as an ``expressions`` table (see
+            :mod:`prefab_ui.wire.expressions`), so the renderer evaluates
+            them without parsing.  Also marks the envelope ``0.3``.
+        columnar:
+            Send inline chart ``data`` and ``DataTable`` rows column by
+            column, so each key is written once instead of once per row
+            (see :mod:`prefab_ui.wire.columnar`).  Also marks the envelope
+            ``0.3``.
         """
-        token = _tool_resolver.set(tool_resolver) if tool_resolver is not None else None
-        try:
-            result: dict[str, Any] = {"version": PROTOCOL_VERSION}
+        result = self._wire_envelope(tool_resolver)
+        if "state" in result:
+            result["state"] = pydantic_core.to_jsonable_python(
+                result["state"], fallback=json_fallback
+            )
+        if optimize:
+            result = optimize_envelope(result)
+        if columnar:
+            result = columnar_envelope(result)
+        if dependencies and ("view" in result or "defs" in result):
+            result["dependencies"] = dependency_table(result)
+        if parse_expressions:
+            result = parse_envelope_expressions(result)
+        if intern_strings:
+            result = intern_envelope_strings(result)
+        return result
+
+    def to_json_bytes(
+        self,
+        *,
+        tool_resolver: Callable[[Any], ResolvedTool] | None = None,
+        escape_html: bool = False,
+    ) -> bytes:
+        """Produce the Prefab wire format as compact UTF-8 JSON.
+
+        Equivalent to encoding :meth:`to_json`, but ``state`` is written
+        straight from the original Python objects by pydantic-core's
+        encoder instead of first being copied into a JSON-compatible tree
+        and then re-encoded.  Use this when the envelope is going straight
+        onto the wire (HTTP bodies, MCP tool results).
+
+        The encoded view and defs are memoized on the components, so only
+        subtrees that changed since the last call are re-encoded.
+
+        With ``escape_html=True``, every ``</`` is written as ``<\\/`` so
+        the JSON can be embedded in an HTML ``<script>`` tag.
+        """
+        with self._resolving(tool_resolver):
+            parts = [b'{"version":', pydantic_core.to_json(PROTOCOL_VERSION)]
 
             if self.view is not None:
-                result["view"] = self.view.to_json()
+                parts += (b',"view":', self.view._cached_json_bytes())
 
             if self.defs:
-                result["defs"] = {d.name: d.to_json() for d in self.defs}
+                defs = {d.name: d for d in self.defs}
+                parts.append(b',"defs":{')
+                parts.append(
+                    b",".join(
+                        pydantic_core.to_json(name) + b":" + d._cached_json_bytes()
+                        for name, d in defs.items()
+                    )
+                )
+                parts.append(b"}")
 
             if self.state is not None:
-                result["state"] = pydantic_core.to_jsonable_python(self.state)
+                parts += (
+                    b',"state":',
+                    pydantic_core.to_json(self.state, fallback=json_fallback),
+                )
 
             if self.theme is not None:
-                result["theme"] = self.theme.to_json()
+                parts += (b',"theme":', pydantic_core.to_json(self.theme.to_json()))
 
-            return result
-        finally:
-            if token is not None:
-                _tool_resolver.reset(token)
+            parts.append(b"}")
+        data = b"".join(parts)
+        if escape_html:
+            data = data.replace(b"</", rb"<\/")
+        return data
+
+    def _prerendered_markup(
+        self, tool_resolver: Callable[[Any], ResolvedTool] | None
+    ) -> str:
+        """Render the view to static HTML against the initial state."""
+        envelope = self._wire_envelope(tool_resolver, shared=True)
+        if "view" not in envelope:
+            return ""
+        state = (
+            pydantic_core.to_jsonable_python(self.state, fallback=json_fallback)
+            if self.state is not None
+            else None
+        )
+        return prerender_view(envelope["view"], state, envelope.get("defs"))
+
+    def _extra_head_parts(self) -> list[str]:
+        """Return ``<head>`` tags for user stylesheets and scripts."""
+        parts: list[str] = []
+
+        if self.stylesheets:
+            for entry in self.stylesheets:
+                if "{" in entry:
+                    parts.append(f"  <style>{entry}</style>")
+                else:
+                    parts.append(f'  <link rel="stylesheet" href="{entry}">')
+
+        if self.scripts:
+            for url in self.scripts:
+                parts.append(f'  <script src="{url}"></script>')
+
+        return parts
 
     def html(
         self,
         *,
         tool_resolver: Callable[[Any], ResolvedTool] | None = None,
+        assets: AssetMode = "inline",
+        assets_prefix: str = DEFAULT_PREFIX,
+        prerender: bool = False,
     ) -> str:
         """Produce a complete, self-contained HTML page.
 
         The page includes the Prefab renderer (JS/CSS), any user-specified
         stylesheets and scripts, and the application data baked in as a
         JSON ``<script>`` tag.
-        """
-        head_parts = [get_renderer_head()]
 
-        if self.stylesheets:
-            for entry in self.stylesheets:
-                if "{" in entry:
-                    head_parts.append(f"  <style>{entry}</style>")
-                else:
-                    head_parts.append(f'  <link rel="stylesheet" href="{entry}">')
+        With ``assets="hashed"`` the renderer is not inlined; the page
+        instead references the content-hashed files from
+        :mod:`prefab_ui.renderer.assets`, which the server must mount at
+        ``assets_prefix``.
 
-        if self.scripts:
-            for url in self.scripts:
-                head_parts.append(f'  <script src="{url}"></script>')
+        With ``prerender=True`` the view is rendered to static HTML against
+        the initial ``state`` (see :mod:`prefab_ui.prerender`) and placed
+        inside ``<div id="root">``, so the page paints before the renderer
+        has loaded.  The renderer replaces the markup when it mounts.
+        """
+        head_parts = [
+            _renderer_head(assets, assets_prefix),
+            *self._extra_head_parts(),
+        ]
 
-        data_json = json.dumps(
-            self.to_json(tool_resolver=tool_resolver),
-            separators=(",", ":"),
-        )
-        # Escape </ to prevent premature closing of the script tag
-        safe_json = data_json.replace("</", r"<\/")
+        safe_json = self.to_json_bytes(
+            tool_resolver=tool_resolver, escape_html=True
+        ).decode("utf-8")
 
         return _PAGE_TEMPLATE.format(
             title=self.title,
             head="\n".join(head_parts),
+            markup=self._prerendered_markup(tool_resolver) if prerender else "",
             data=safe_json,
         )
 
+    def iter_html(
+        self,
+        *,
+        tool_resolver: Callable[[Any], ResolvedTool] | None = None,
+        chunk_size: int = _STREAM_CHUNK_SIZE,
+        assets: AssetMode = "inline",
+        assets_prefix: str = DEFAULT_PREFIX,
+        prerender: bool = False,
+    ) -> Iterator[bytes]:
+        """Produce the page from :meth:`html` as a stream of UTF-8 chunks.
+
+        Yields the pre-encoded renderer head as-is, then the application
+        data straight out of the encoder in chunks of roughly
+        ``chunk_size`` bytes, then the closing tags.  Joining the chunks
+        gives exactly ``html().encode("utf-8")`` without ever holding a
+        second copy of the page, so servers can stream the response::
+
+            return StreamingResponse(app.iter_html(), media_type="text/html")
+        """
+        head = _renderer_head_bytes(assets, assets_prefix)
+        yield _PAGE_HEADER.format(title=self.title).encode("utf-8")
+        yield head
+        yield from self._iter_html_tail(tool_resolver, chunk_size, prerender)
+
+    def _iter_html_tail(
+        self,
+        tool_resolver: Callable[[Any], ResolvedTool] | None,
+        chunk_size: int,
+        prerender: bool = False,
+    ) -> Iterator[bytes]:
+        """Yield everything after the renderer head as UTF-8 chunks."""
+        extra = self._extra_head_parts()
+        if extra:
+            yield ("\n" + "\n".join(extra)).encode("utf-8")
+        if prerender:
+            yield _PAGE_ROOT_OPEN_BYTES
+            yield self._prerendered_markup(tool_resolver).encode("utf-8")
+            yield _PAGE_ROOT_CLOSE_BYTES
+        else:
+            yield _PAGE_BODY_BYTES
+        yield from _iter_script_json(
+            self._wire_envelope(tool_resolver, shared=True), chunk_size
+        )
+        yield _PAGE_FOOTER_BYTES
+
+    def html_bytes(
+        self,
+        *,
+        encoding: ContentEncoding | None = None,
+        tool_resolver: Callable[[Any], ResolvedTool] | None = None,
+        level: int = 6,
+        assets: AssetMode = "inline",
+        assets_prefix: str = DEFAULT_PREFIX,
+        prerender: bool = False,
+    ) -> bytes:
+        """Produce the page from :meth:`html` as UTF-8, optionally compressed.
+
+        With ``encoding="gzip"`` or ``encoding="deflate"`` the result is
+        ready to send with the matching ``Content-Encoding`` header.  The
+        renderer head is compressed once per process and spliced in, so
+        only the title, stylesheets, scripts and JSON payload are
+        compressed per call (at ``level``).
+        """
+        if encoding is None:
+            return b"".join(
+                self.iter_html(
+                    tool_resolver=tool_resolver,
+                    assets=assets,
+                    assets_prefix=assets_prefix,
+                    prerender=prerender,
+                )
+            )
+        head: StaticSegment | bytes
+        if assets == "inline":
+            head = get_renderer_head_compressed()
+        else:
+            head = _renderer_head_bytes(assets, assets_prefix)
+        return splice_compressed(
+            [
+                _PAGE_HEADER.format(title=self.title).encode("utf-8"),
+                head,
+                self._iter_html_tail(tool_resolver, _STREAM_CHUNK_SIZE, prerender),
+            ],
+            encoding,
+            level,
+        )
+
+    def write_html(
+        self,
+        fp: IO[bytes],
+        *,
+        tool_resolver: Callable[[Any], ResolvedTool] | None = None,
+        assets: AssetMode = "inline",
+        assets_prefix: str = DEFAULT_PREFIX,
+        prerender: bool = False,
+    ) -> int:
+        """Write the page from :meth:`iter_html` to a binary file object.
+
+        Returns the number of bytes written.
+        """
+        written = 0
+        chunks = self.iter_html(
+            tool_resolver=tool_resolver,
+            assets=assets,
+            assets_prefix=assets_prefix,
+            prerender=prerender,
+        )
+        for chunk in chunks:
+            fp.write(chunk)
+            written += len(chunk)
+        return written
+
     def csp(self) -> dict[str, list[str]]:
         """Compute CSP domains from the app's asset configuration.
 
@@ -120,19 +120,21 @@ def _load_prefab_app(target: str) -> PrefabApp:
     raise SystemExit(1)
 
 
-def _make_html_handler(html_ref: list[str]) -> type:
+def _make_html_handler(html_ref: list[bytes]) -> type:
     """Create an HTTP request handler that serves HTML from a mutable ref.
 
-    ``html_ref`` is a single-element list so the reload watcher can swap
-    the content between requests.
+    ``html_ref`` is a single-element list holding the encoded page, so the
+    reload watcher can swap the content between requests.
     """
 
     class Handler(BaseHTTPRequestHandler):
         def do_GET(self) -> None:
+            body = html_ref[0]
             self.send_response(200)
             self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
             self.end_headers()
-            self.wfile.write(html_ref[0].encode("utf-8"))
+            self.wfile.write(body)
 
         def log_message(self, format: str, *args: object) -> None:
             pass
@@ -142,7 +144,7 @@ def _make_html_handler(html_ref: list[str]) -> type:
 
 def _watch_and_reload(
     target: str,
-    html_ref: list[str],
+    html_ref: list[bytes],
     stop: threading.Event,
 ) -> None:
     """Poll the target file for changes and regenerate HTML on save."""
@@ -177,7 +179,7 @@ def _watch_and_reload(
         )
         try:
             prefab_app = _load_prefab_app(target)
-            html_ref[0] = prefab_app.html()
+            html_ref[0] = b"".join(prefab_app.iter_html())
             console.print("[bold green]✓[/bold green] Reloaded — refresh your browser")
         except Exception as exc:
             console.print(f"[bold red]✗[/bold red] Reload failed: {exc}")
@@ -217,7 +219,7 @@ def serve(
         prefab serve app.py --port 8000
     """
     prefab_app = _load_prefab_app(target)
-    html_ref = [prefab_app.html()]
+    html_ref = [b"".join(prefab_app.iter_html())]
 
     actual_port = _find_free_port(port)
     if actual_port != port:
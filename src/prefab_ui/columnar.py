@@ -0,0 +1,94 @@
+"""Columnar form for chart data and table rows.
+
+Chart ``data`` and ``DataTable.rows`` are lists of row objects, so every
+key is written out again on every row.  Those fields also accept the same
+table column by column, in either of two shapes::
+
+    # One array per column
+    {"month": ["Jan", "Feb"], "desktop": [186, 305]}
+
+    # Column names plus one array per row
+    {"columns": ["month", "desktop"], "values": [["Jan", 186], ["Feb", 305]]}
+
+An object whose only keys are ``columns`` (a list of strings) and
+``values`` (a list of lists) is read as the second shape.  The renderer
+turns either back into row objects before drawing.
+:func:`prefab_ui.wire.columnar` rewrites inline rows into the first shape
+when serializing.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from operator import itemgetter
+from typing import Annotated, Any
+
+from pydantic import AfterValidator
+
+from prefab_ui.frames import Frame
+
+
+def is_columns_values(data: Mapping[str, Any]) -> bool:
+    """Whether ``data`` is the ``{"columns": ..., "values": ...}`` shape."""
+    return (
+        data.keys() == {"columns", "values"}
+        and isinstance(data["columns"], list)
+        and isinstance(data["values"], list)
+        and all(isinstance(name, str) for name in data["columns"])
+        and all(isinstance(row, list) for row in data["values"])
+    )
+
+
+def _check_columns(data: dict[str, list[Any]]) -> dict[str, list[Any]]:
+    if is_columns_values(data):
+        width = len(data["columns"])
+        if len(set(data["columns"])) != width:
+            raise ValueError("Column names must be unique")
+        if any(len(row) != width for row in data["values"]):
+            raise ValueError(f"Every row of 'values' must have {width} items")
+    elif len({len(column) for column in data.values()}) > 1:
+        raise ValueError("Every column must have the same length")
+    return data
+
+
+Columns = Annotated[dict[str, list[Any]], AfterValidator(_check_columns)]
+"""A table given column by column (see the module docstring)."""
+
+RowData = list[dict[str, Any]] | Columns | Frame
+"""Rows as a list of objects, the same table in columnar form, or a
+DataFrame, record array or Arrow table (see :mod:`prefab_ui.frames`)."""
+
+
+def to_columns(rows: Sequence[Mapping[str, Any]]) -> dict[str, list[Any]] | None:
+    """Transpose ``rows`` into one array per column.
+
+    Returns None when there are no columns, or when the rows don't all
+    have the same keys, since the columnar form can't tell a missing key
+    from a null value.
+    """
+    if not rows or not rows[0]:
+        return None
+    keys = list(rows[0])
+    first = rows[0].keys()
+    if any(row.keys() != first for row in rows):
+        return None
+    if len(keys) == 1:
+        key = keys[0]
+        return {key: [row[key] for row in rows]}
+    # itemgetter pulls each row's values in one C call, and zip(*)
+    # transposes the resulting tuples without a Python-level loop per cell.
+    columns = zip(*map(itemgetter(*keys), rows), strict=True)
+    return {key: list(column) for key, column in zip(keys, columns, strict=True)}
+
+
+def to_rows(data: Mapping[str, Any]) -> list[dict[str, Any]]:
+    """Turn either columnar shape back into a list of row objects."""
+    if is_columns_values(data):
+        names = data["columns"]
+        return [dict(zip(names, row, strict=True)) for row in data["values"]]
+    if not data:
+        return []
+    keys = list(data)
+    return [
+        dict(zip(keys, row, strict=True)) for row in zip(*data.values(), strict=True)
+    ]
@@ -0,0 +1,210 @@
+"""CompiledView — build and serialize a view once, bind state per request.
+
+Most Prefab views don't depend on the request: they reference state
+through ``{{ key }}`` templates, and the per-request data lives in
+``state``.  :func:`compile_view` runs a builder once, encodes the view
+and defs, and keeps the bytes.  Each request then only encodes its state
+and splices it into the pre-encoded envelope or HTML page::
+
+    from prefab_ui import compile_view
+    from prefab_ui.components import Column, DataTable, Heading
+
+    @compile_view
+    def dashboard():
+        with Column() as view:
+            Heading("Orders")
+            DataTable(rows="{{ orders }}", columns=[...])
+        return view
+
+    @mcp.tool()
+    def orders() -> dict:
+        return dashboard.to_json(state={"orders": fetch_orders()})
+
+Changes made to the components after compiling are not picked up;
+compile again to get a new view.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+import pydantic_core
+
+from prefab_ui.app import (
+    _PAGE_BODY_BYTES,
+    _PAGE_FOOTER_BYTES,
+    _PAGE_HEADER,
+    AssetMode,
+    PrefabApp,
+    ResolvedTool,
+    _check_asset_mode,
+    _check_state_keys,
+    _renderer_head_bytes,
+)
+from prefab_ui.frames import json_fallback
+from prefab_ui.renderer import get_renderer_head_compressed
+from prefab_ui.renderer.assets import DEFAULT_PREFIX
+from prefab_ui.renderer.compression import (
+    ContentEncoding,
+    StaticSegment,
+    compress_static,
+    splice_compressed,
+)
+
+
+def _escape_script(data: bytes) -> bytes:
+    return data.replace(b"</", rb"<\/") if b"</" in data else data
+
+
+class CompiledView:
+    """A :class:`~prefab_ui.app.PrefabApp` serialized once, ready to bind state.
+
+    The version, view and defs are encoded at construction time, together
+    with the static parts of the HTML page.  The per-request methods take
+    a ``state`` dict, which is merged over the app's own state, and encode
+    only that.
+
+    Args:
+        app: The app to compile.  Its ``state`` becomes the default state.
+        tool_resolver: Resolves callable tool references while the view
+            is serialized.  Tools are resolved once, at compile time.
+    """
+
+    def __init__(
+        self,
+        app: PrefabApp,
+        *,
+        tool_resolver: Callable[[Any], ResolvedTool] | None = None,
+    ) -> None:
+        envelope = app._wire_envelope(tool_resolver)
+        self._default_state: dict[str, Any] | None = envelope.pop("state", None)
+        self._theme: dict[str, Any] | None = envelope.pop("theme", None)
+        self._envelope = envelope
+
+        # '{"version":…,"view":…,"defs":{…}' — the closing brace comes after
+        # the state and theme.
+        self._json_head = pydantic_core.to_json(envelope)[:-1]
+        self._json_tail = b"}"
+        if self._theme is not None:
+            self._json_tail = b',"theme":' + pydantic_core.to_json(self._theme) + b"}"
+
+        extra = app._extra_head_parts()
+        self._page_header = _PAGE_HEADER.format(title=app.title).encode("utf-8")
+        self._page_middle = (
+            (("\n" + "\n".join(extra)).encode("utf-8") if extra else b"")
+            + _PAGE_BODY_BYTES
+            + _escape_script(self._json_head)
+        )
+        self._page_tail = _escape_script(self._json_tail) + _PAGE_FOOTER_BYTES
+        self._compressed_middle: StaticSegment | None = None
+
+    def _bind(self, state: dict[str, Any] | None) -> dict[str, Any] | None:
+        if state is None:
+            return self._default_state
+        _check_state_keys(state)
+        if self._default_state:
+            return {**self._default_state, **state}
+        return state
+
+    def _state_bytes(self, state: dict[str, Any] | None) -> bytes:
+        bound = self._bind(state)
+        if bound is None:
+            return b""
+        return b',"state":' + pydantic_core.to_json(bound, fallback=json_fallback)
+
+    def to_json(self, state: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Produce the wire-format envelope for ``state``.
+
+        Matches ``PrefabApp.to_json()``; the view and defs are shared
+        between calls, so treat them as read-only.
+        """
+        result = dict(self._envelope)
+        bound = self._bind(state)
+        if bound is not None:
+            result["state"] = pydantic_core.to_jsonable_python(
+                bound, fallback=json_fallback
+            )
+        if self._theme is not None:
+            result["theme"] = self._theme
+        return result
+
+    def to_json_bytes(
+        self, state: dict[str, Any] | None = None, *, escape_html: bool = False
+    ) -> bytes:
+        """Produce the wire-format envelope for ``state`` as compact UTF-8 JSON.
+
+        Only ``state`` is encoded; it is spliced between the pre-encoded
+        view and theme.  See ``PrefabApp.to_json_bytes()`` for
+        ``escape_html``.
+        """
+        data = self._json_head + self._state_bytes(state) + self._json_tail
+        return _escape_script(data) if escape_html else data
+
+    def html(
+        self,
+        state: dict[str, Any] | None = None,
+        *,
+        assets: AssetMode = "inline",
+        assets_prefix: str = DEFAULT_PREFIX,
+    ) -> str:
+        """Produce the HTML page from ``PrefabApp.html()`` for ``state``."""
+        return self.html_bytes(
+            state, assets=assets, assets_prefix=assets_prefix
+        ).decode("utf-8")
+
+    def html_bytes(
+        self,
+        state: dict[str, Any] | None = None,
+        *,
+        encoding: ContentEncoding | None = None,
+        level: int = 6,
+        assets: AssetMode = "inline",
+        assets_prefix: str = DEFAULT_PREFIX,
+    ) -> bytes:
+        """Produce the HTML page for ``state`` as UTF-8, optionally compressed.
+
+        With ``encoding="gzip"`` or ``encoding="deflate"``, everything but
+        the state is compressed once and spliced in, so each call only
+        compresses the state (at ``level``).
+        """
+        _check_asset_mode(assets)
+        tail = _escape_script(self._state_bytes(state)) + self._page_tail
+        if encoding is None:
+            return b"".join(
+                [
+                    self._page_header,
+                    _renderer_head_bytes(assets, assets_prefix),
+                    self._page_middle,
+                    tail,
+                ]
+            )
+
+        head: StaticSegment | bytes
+        if assets == "inline":
+            head = get_renderer_head_compressed()
+        else:
+            head = _renderer_head_bytes(assets, assets_prefix)
+        if self._compressed_middle is None:
+            self._compressed_middle = compress_static(self._page_middle)
+        return splice_compressed(
+            [self._page_header, head, self._compressed_middle, tail], encoding, level
+        )
+
+
+def compile_view(
+    builder: Callable[[], Any],
+    *,
+    tool_resolver: Callable[[Any], ResolvedTool] | None = None,
+) -> CompiledView:
+    """Run ``builder`` once and compile its result into a :class:`CompiledView`.
+
+    ``builder`` returns either a root component or a complete
+    :class:`~prefab_ui.app.PrefabApp` (to set ``defs``, ``theme``,
+    ``title`` and so on).  State declared with ``set_initial_state``
+    while building becomes the default state.  Also usable as a
+    decorator.
+    """
+    built = builder()
+    app = built if isinstance(built, PrefabApp) else PrefabApp(view=built)
+    return CompiledView(app, tool_resolver=tool_resolver)
@@ -44,7 +44,12 @@ from prefab_ui.components.column import Column
 from prefab_ui.components.container import Container
 from prefab_ui.components.control_flow import Elif, Else, ForEach, If
 from prefab_ui.components.dashboard import Dashboard, DashboardItem
-from prefab_ui.components.data_table import DataTable, DataTableColumn
+from prefab_ui.components.data_table import (
+    DataTable,
+    DataTableColumn,
+    DataTableIndex,
+    DataTableSource,
+)
 from prefab_ui.components.date_picker import DatePicker
 from prefab_ui.components.dialog import Dialog
 from prefab_ui.components.div import Div, Span
@@ -63,7 +68,7 @@ from prefab_ui.components.field import (
 from prefab_ui.components.form import Form
 from prefab_ui.components.grid import Grid, GridItem
 from prefab_ui.components.heading import Heading
-from prefab_ui.components.histogram import Histogram
+from prefab_ui.components.histogram import Histogram, HistogramSketch
 from prefab_ui.components.hover_card import HoverCard
 from prefab_ui.components.icon import Icon
 from prefab_ui.components.image import Image
@@ -163,6 +168,8 @@ __all__ = [
     "DashboardItem",
     "DataTable",
     "DataTableColumn",
+    "DataTableIndex",
+    "DataTableSource",
     "DatePicker",
     "Dialog",
     "Div",
@@ -181,6 +188,7 @@ __all__ = [
     "GridItem",
     "Heading",
     "Histogram",
+    "HistogramSketch",
     "HoverCard",
     "Icon",
     "If",
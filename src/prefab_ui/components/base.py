@@ -3,12 +3,19 @@
 from __future__ import annotations
 
 import contextlib
+import dataclasses
+import enum
+import functools
 import re
-from collections.abc import Generator
+import types
+import typing
+import weakref
+from collections.abc import Callable, Generator
 from contextlib import contextmanager
 from contextvars import ContextVar
-from typing import Annotated, Any, ClassVar, Literal
+from typing import Annotated, Any, ClassVar, Literal, get_args, get_origin
 
+import pydantic_core
 from pydantic import (
     BaseModel,
     BeforeValidator,
@@ -19,7 +26,9 @@ from pydantic import (
 from typing_extensions import Self
 
 from prefab_ui.css import Responsive
+from prefab_ui.frames import Frame, is_frame
 from prefab_ui.rx import Rx, _coerce_rx, _generate_key
+from prefab_ui.tracking import track_models, tracked_fields
 
 _component_stack: ContextVar[list[ContainerComponent] | None] = ContextVar(
     "_component_stack", default=None
@@ -197,6 +206,162 @@ def _coerce_css_class(v: Any) -> str | None:
     return str(v)
 
 
+# ── Serialization plans ────────────────────────────────────────────────
+
+_RX_FREE_TYPES = (str, int, float, bool, type(None), enum.Enum, Rx)
+_UNION_TYPES = (typing.Union, types.UnionType)
+
+
+def _may_hold_rx(annotation: Any) -> bool:
+    """Return whether a field's dumped value can still contain raw ``Rx``.
+
+    Fields typed ``str``/``RxStr``/``Literal``/numbers, or as components
+    and actions (which coerce themselves), never do.  ``Any``, ``object``
+    and unrecognised types might, so callers must coerce them.
+    """
+    origin = get_origin(annotation)
+    if origin is Literal:
+        return False
+    if origin is Annotated:
+        return _may_hold_rx(get_args(annotation)[0])
+    if origin in _UNION_TYPES or origin in (list, tuple, dict, set, frozenset):
+        return any(
+            arg is not Ellipsis and _may_hold_rx(arg) for arg in get_args(annotation)
+        )
+    if isinstance(annotation, type):
+        if issubclass(annotation, _RX_FREE_TYPES):
+            return False
+        # Imported lazily: actions import components for typing.
+        from prefab_ui.actions.base import Action
+
+        return not issubclass(annotation, (Component, Action))
+    return True
+
+
+def _may_hold_frame(annotation: Any) -> bool:
+    """Return whether a field accepts a DataFrame-like :data:`Frame`."""
+    if annotation is Frame:
+        return True
+    if get_origin(annotation) in _UNION_TYPES:
+        return any(_may_hold_frame(arg) for arg in get_args(annotation))
+    return False
+
+
+# ── Serialization cache ────────────────────────────────────────────
+
+
+@dataclasses.dataclass
+class JsonCacheStats:
+    """Hit/miss counters for memoized subtree serialization."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of cached lookups served from cache (0.0 when unused)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+_json_cache_stats = JsonCacheStats()
+_json_volatile_marks = 0
+# Set while a cache entry is being built, so children embed their own
+# cached dicts instead of copies.
+_json_shared: ContextVar[bool] = ContextVar("_json_shared", default=False)
+
+
+def json_cache_stats() -> JsonCacheStats:
+    """Return a snapshot of the serialization cache counters."""
+    return dataclasses.replace(_json_cache_stats)
+
+
+def reset_json_cache_stats() -> None:
+    """Reset the serialization cache counters to zero."""
+    _json_cache_stats.hits = 0
+    _json_cache_stats.misses = 0
+
+
+def mark_json_volatile() -> None:
+    """Flag the component being serialized as not cacheable.
+
+    Serializers whose output depends on the calling context rather than
+    on model fields (e.g. ``CallTool`` consulting the tool resolver) call
+    this so neither the component nor its ancestors keep a cached result.
+    """
+    global _json_volatile_marks
+    _json_volatile_marks += 1
+
+
+def _copy_json(value: Any) -> Any:
+    """Copy the dicts and lists of a JSON tree, sharing the scalars."""
+    if type(value) is dict:
+        return {k: _copy_json(v) for k, v in value.items()}
+    if type(value) is list:
+        return [_copy_json(v) for v in value]
+    return value
+
+
+def _child_json(child: Component) -> dict[str, Any]:
+    """A child's JSON for embedding in its parent's.
+
+    Cached entries embed each other; anything handed to a caller of
+    ``to_json()`` gets a copy, so editing it can't corrupt the cache.
+    """
+    return child._cached_json(copy=not _json_shared.get())
+
+
+def _json_entry(component: Component) -> dict[str, Any] | None:
+    """The component's cached JSON, or ``None`` when it has none."""
+    return getattr(component, "_json_cache", None)
+
+
+def _mutating(method: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(method)
+    def wrapper(self: _ChildList, *args: Any, **kwargs: Any) -> Any:
+        result = method(self, *args, **kwargs)
+        if self._owners:
+            self._invalidate_owners()
+        return result
+
+    return wrapper
+
+
+class _ChildList(list[Any]):
+    """``children`` list that drops its owners' cached JSON when mutated."""
+
+    # Set per instance once an owner caches its JSON; the class default
+    # keeps construction at plain-list speed.
+    _owners: tuple[weakref.ref[Component], ...] = ()
+
+    def _add_owner(self, owner: Component) -> None:
+        if not any(ref() is owner for ref in self._owners):
+            self._owners = (*self._owners, weakref.ref(owner))
+
+    def _invalidate_owners(self) -> None:
+        for ref in self._owners:
+            owner = ref()
+            if owner is not None:
+                owner.invalidate_json()
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        # Copies and pickles are plain lists; they are re-tracked on use.
+        return (list, (list(self),))
+
+    append = _mutating(list.append)
+    extend = _mutating(list.extend)
+    insert = _mutating(list.insert)
+    remove = _mutating(list.remove)
+    pop = _mutating(list.pop)
+    clear = _mutating(list.clear)
+    sort = _mutating(list.sort)
+    reverse = _mutating(list.reverse)
+    __setitem__ = _mutating(list.__setitem__)
+    __delitem__ = _mutating(list.__delitem__)
+    __iadd__ = _mutating(list.__iadd__)
+    __imul__ = _mutating(list.__imul__)
+
+
 _VALID_STATE_KEY = re.compile(r"^[a-zA-Z_$][a-zA-Z0-9_.$]*$")
 
 
@@ -247,15 +412,41 @@ class Component(BaseModel):
     Components serialize to JSON via ``to_json()`` for the React renderer.
     When created inside a ``ContainerComponent`` context manager, they
     automatically append themselves to the parent's children list.
+
+    Serialized subtrees are memoized: assigning a field, including a field
+    of an action, chart series or column it holds, or mutating a
+    ``children`` list drops the cached JSON of that component and its
+    ancestors, so re-serializing a mostly static tree only re-dumps the
+    changed paths.  Values mutated in place (e.g. appending to a chart's
+    ``data``) are not seen; call :meth:`invalidate_json` after doing so.
     """
 
     model_config = {"populate_by_name": True, "arbitrary_types_allowed": True}
 
+    # Per-instance cache state.  Slots stay out of ``__dict__``, so pydantic
+    # never dumps, compares or copies them, and copies and pickles start
+    # without a cache.
+    __slots__ = ("_json_bytes", "_json_cache", "_json_parents")
+
     _auto_name: ClassVar[str | None] = None
     """Subclasses set this to a prefix string (e.g. ``"slider"``) to opt in
     to automatic name generation.  When set, components without an explicit
     ``name`` receive a deterministic sequential key like ``slider-1``."""
 
+    _json_exclude: ClassVar[set[str] | None] = None
+    """Fields ``to_json()`` leaves out of ``model_dump`` because the class
+    serializes them itself (e.g. ``children``)."""
+
+    _rx_keys: ClassVar[tuple[str, ...]] = ()
+    """Dumped keys (names and aliases) whose values may still hold raw
+    ``Rx`` objects.  Computed per class so ``_serialize_rx`` only walks
+    fields that can actually need coercion."""
+
+    _frame_keys: ClassVar[dict[str, str]] = {}
+    """Dumped keys of fields that accept a DataFrame-like ``Frame``, mapped
+    to the field name.  A frame serializes to plain columns, so
+    ``_serialize_rx`` doesn't walk them."""
+
     id: str | None = Field(
         default=None,
         description="HTML id attribute for CSS targeting. Applied to the outermost element.",
@@ -280,10 +471,36 @@ class Component(BaseModel):
                 data["name"] = name.key
         return data
 
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        keys: list[str] = []
+        frame_keys: dict[str, str] = {}
+        for name, field in cls.model_fields.items():
+            if _may_hold_rx(field.annotation):
+                keys.append(name)
+                if field.alias and field.alias != name:
+                    keys.append(field.alias)
+            if _may_hold_frame(field.annotation):
+                frame_keys[name] = name
+                if field.alias:
+                    frame_keys[field.alias] = name
+        cls._rx_keys = tuple(keys)
+        cls._frame_keys = frame_keys
+
     @model_serializer(mode="wrap")
     def _serialize_rx(self, handler: Any) -> dict[str, Any]:
         """Resolve any Rx values to ``{{ }}`` strings at serialization time."""
-        return _coerce_rx(handler(self))  # type: ignore[return-value]
+        data = handler(self)
+        for key in self._rx_keys:
+            value = data.get(key)
+            if value is None:
+                continue
+            field = self._frame_keys.get(key)
+            if field is not None and is_frame(getattr(self, field)):
+                continue
+            data[key] = _coerce_rx(value)
+        return data
 
     def model_post_init(self, __context: Any) -> None:
         # Auto-generate name and validate for stateful components
@@ -301,13 +518,87 @@ class Component(BaseModel):
         if stack:
             stack[-1].children.append(self)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_") and (
+            getattr(self, "_json_parents", None) or _json_entry(self) is not None
+        ):
+            self.invalidate_json()
+
     def to_json(self) -> dict[str, Any]:
         """Serialize to JSON format for the React renderer.
 
         Produces ``{"type": "ClassName", ...props}`` with ``None`` values
-        excluded. Children are serialized recursively.
+        excluded. Children are serialized recursively, reusing the cached
+        JSON of unchanged subtrees; the result is a fresh copy either way.
         """
-        return self.model_dump(by_alias=True, exclude_none=True)
+        return self.__pydantic_serializer__.to_python(
+            self, by_alias=True, exclude_none=True, exclude=self._json_exclude
+        )
+
+    def invalidate_json(self) -> None:
+        """Drop the cached JSON of this component and all its ancestors."""
+        pending: list[Component] = [self]
+        seen: set[int] = set()
+        while pending:
+            node = pending.pop()
+            if id(node) in seen:
+                continue
+            seen.add(id(node))
+            object.__setattr__(node, "_json_cache", None)
+            object.__setattr__(node, "_json_bytes", None)
+            for ref in getattr(node, "_json_parents", ()):
+                parent = ref()
+                if parent is not None:
+                    pending.append(parent)
+
+    def _cached_json(self, *, copy: bool = False) -> dict[str, Any]:
+        """Return :meth:`to_json`, reusing the cached result while unchanged.
+
+        The result is the cache entry itself unless ``copy`` is set.
+        """
+        if copy:
+            return _copy_json(self._cached_json())
+        cached = _json_entry(self)
+        if cached is not None:
+            _json_cache_stats.hits += 1
+            return cached
+        _json_cache_stats.misses += 1
+        marks = _json_volatile_marks
+        token = _json_shared.set(True)
+        try:
+            data = self.to_json()
+        finally:
+            _json_shared.reset(token)
+        if _json_volatile_marks == marks:
+            self._track_json_children()
+            for name in tracked_fields(type(self)):
+                track_models(self, self.__dict__.get(name))
+            object.__setattr__(self, "_json_cache", data)
+        return data
+
+    def _cached_json_bytes(self) -> bytes:
+        """Return :meth:`to_json` encoded as compact UTF-8 JSON, memoized."""
+        encoded = getattr(self, "_json_bytes", None)
+        if encoded is not None:
+            _json_cache_stats.hits += 1
+            return encoded
+        data = self._cached_json()
+        encoded = pydantic_core.to_json(data)
+        if _json_entry(self) is data:
+            object.__setattr__(self, "_json_bytes", encoded)
+        return encoded
+
+    def _add_json_parent(self, parent: Component) -> None:
+        parents = getattr(self, "_json_parents", None)
+        if parents is None:
+            parents = []
+            object.__setattr__(self, "_json_parents", parents)
+        if not any(ref() is parent for ref in parents):
+            parents.append(weakref.ref(parent))
+
+    def _track_json_children(self) -> None:
+        """Link children so their changes invalidate this component."""
 
 
 class ContainerComponent(Component):
@@ -320,6 +611,8 @@ class ContainerComponent(Component):
             Text("world")
     """
 
+    _json_exclude: ClassVar[set[str] | None] = {"children"}
+
     children: list[Component] = Field(default_factory=list)
     let: dict[str, Any] | None = Field(
         default=None,
@@ -336,8 +629,28 @@ class ContainerComponent(Component):
             for child in self.children:
                 with contextlib.suppress(ValueError):
                     parent_children.remove(child)
+        self.__dict__["children"] = _ChildList(self.children)
         super().model_post_init(__context)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "children" and type(value) is list:
+            value = _ChildList(value)
+        super().__setattr__(name, value)
+
+    def _track_json_children(self) -> None:
+        children = self.children
+        if type(children) is not _ChildList:
+            # Plain lists come from model_copy(update=...), copies and pickles.
+            children = _ChildList(children)
+            self.__dict__["children"] = children
+        children._add_owner(self)
+        for child in children:
+            child._add_json_parent(self)
+            if _json_entry(child) is None:
+                # Embedded without its own cache entry (If/Elif/Else, or a
+                # to_json() override calling children directly).
+                child._track_json_children()
+
     def __enter__(self) -> Self:
         stack = _component_stack.get() or []
         _component_stack.set([*stack, self])
@@ -348,10 +661,9 @@ class ContainerComponent(Component):
         _component_stack.set(stack[:-1])
 
     def to_json(self) -> dict[str, Any]:
+        # children are excluded from model_dump (see _json_exclude) so each
+        # subtree is dumped exactly once, here, with If/Elif/Else grouping.
         d = super().to_json()
-        # model_dump includes children=[] (not None), so always replace with
-        # recursive serialization or remove the key when empty.
-        d.pop("children", None)
         if self.children:
             d["children"] = _serialize_children(self.children)
         return d
@@ -406,7 +718,7 @@ def _serialize_children(children: list[Component]) -> list[dict[str, Any]]:
             )
 
         else:
-            result.append(child.to_json())
+            result.append(_child_json(child))
             i += 1
 
     return result
@@ -23,16 +23,30 @@ from __future__ import annotations
 
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field
-
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    SerializerFunctionWrapHandler,
+    field_serializer,
+)
+
+from prefab_ui.columnar import RowData
 from prefab_ui.components.base import Component
+from prefab_ui.components.charts.downsample import downsample as _downsample
 from prefab_ui.rx import RxStr
+from prefab_ui.tracking import TrackedModel
+
+_MAX_POINTS_DESCRIPTION = (
+    "Downsample each series to at most this many points (Largest-Triangle-"
+    "Three-Buckets) when serializing. Python-only; not sent to the renderer"
+)
 
 
-class ChartSeries(BaseModel):
+class ChartSeries(TrackedModel):
     """Series definition for cartesian charts (Bar, Line, Area)."""
 
-    model_config = {"populate_by_name": True}
+    model_config = ConfigDict(populate_by_name=True)
 
     data_key: str = Field(alias="dataKey", description="Data field to plot")
     label: str | None = Field(
@@ -41,6 +55,13 @@ class ChartSeries(BaseModel):
     color: str | None = Field(default=None, description="CSS color override")
 
 
+def _downsampled(chart: BarChart | LineChart | AreaChart, data: Any) -> Any:
+    if chart.max_points is None:
+        return data
+    keys = [series.data_key for series in chart.series]
+    return _downsample(data, keys, chart.x_axis, chart.max_points)
+
+
 class BarChart(Component):
     """Bar chart with one or more series.
 
@@ -55,8 +76,8 @@ class BarChart(Component):
     """
 
     type: Literal["BarChart"] = "BarChart"
-    data: list[dict[str, Any]] | RxStr = Field(
-        description="Row data or {{ interpolation }} reference"
+    data: RowData | RxStr = Field(
+        description="Row data (rows or columns) or {{ interpolation }} reference"
     )
     series: list[ChartSeries] = Field(description="Series to render as bars")
     x_axis: str | None = Field(
@@ -87,6 +108,13 @@ class BarChart(Component):
         alias="yAxisFormat",
         description="Y-axis tick format: 'compact' shows 60K instead of 60000",
     )
+    max_points: int | None = Field(
+        default=None, ge=3, exclude=True, description=_MAX_POINTS_DESCRIPTION
+    )
+
+    @field_serializer("data", mode="wrap")
+    def _serialize_data(self, data: Any, handler: SerializerFunctionWrapHandler) -> Any:
+        return handler(_downsampled(self, data))
 
 
 class LineChart(Component):
@@ -102,8 +130,8 @@ class LineChart(Component):
     """
 
     type: Literal["LineChart"] = "LineChart"
-    data: list[dict[str, Any]] | RxStr = Field(
-        description="Row data or {{ interpolation }} reference"
+    data: RowData | RxStr = Field(
+        description="Row data (rows or columns) or {{ interpolation }} reference"
     )
     series: list[ChartSeries] = Field(description="Series to render as lines")
     x_axis: str | None = Field(
@@ -133,6 +161,13 @@ class LineChart(Component):
         alias="yAxisFormat",
         description="Y-axis tick format: 'compact' shows 60K instead of 60000",
     )
+    max_points: int | None = Field(
+        default=None, ge=3, exclude=True, description=_MAX_POINTS_DESCRIPTION
+    )
+
+    @field_serializer("data", mode="wrap")
+    def _serialize_data(self, data: Any, handler: SerializerFunctionWrapHandler) -> Any:
+        return handler(_downsampled(self, data))
 
 
 class AreaChart(Component):
@@ -149,8 +184,8 @@ class AreaChart(Component):
     """
 
     type: Literal["AreaChart"] = "AreaChart"
-    data: list[dict[str, Any]] | RxStr = Field(
-        description="Row data or {{ interpolation }} reference"
+    data: RowData | RxStr = Field(
+        description="Row data (rows or columns) or {{ interpolation }} reference"
     )
     series: list[ChartSeries] = Field(description="Series to render as areas")
     x_axis: str | None = Field(
@@ -181,6 +216,13 @@ class AreaChart(Component):
         alias="yAxisFormat",
         description="Y-axis tick format: 'compact' shows 60K instead of 60000",
     )
+    max_points: int | None = Field(
+        default=None, ge=3, exclude=True, description=_MAX_POINTS_DESCRIPTION
+    )
+
+    @field_serializer("data", mode="wrap")
+    def _serialize_data(self, data: Any, handler: SerializerFunctionWrapHandler) -> Any:
+        return handler(_downsampled(self, data))
 
 
 class PieChart(Component):
@@ -200,8 +242,8 @@ class PieChart(Component):
     """
 
     type: Literal["PieChart"] = "PieChart"
-    data: list[dict[str, Any]] | RxStr = Field(
-        description="Row data or {{ interpolation }} reference"
+    data: RowData | RxStr = Field(
+        description="Row data (rows or columns) or {{ interpolation }} reference"
     )
     data_key: str = Field(alias="dataKey", description="Numeric value field")
     name_key: str = Field(alias="nameKey", description="Label field")
@@ -244,8 +286,8 @@ class ScatterChart(Component):
     """
 
     type: Literal["ScatterChart"] = "ScatterChart"
-    data: list[dict[str, Any]] | RxStr = Field(
-        description="Row data or {{ interpolation }} reference"
+    data: RowData | RxStr = Field(
+        description="Row data (rows or columns) or {{ interpolation }} reference"
     )
     series: list[ChartSeries] = Field(description="Series to render as scatter groups")
     x_axis: str = Field(alias="xAxis", description="Data key for x-axis values")
@@ -283,8 +325,8 @@ class RadarChart(Component):
     """
 
     type: Literal["RadarChart"] = "RadarChart"
-    data: list[dict[str, Any]] | RxStr = Field(
-        description="Row data or {{ interpolation }} reference"
+    data: RowData | RxStr = Field(
+        description="Row data (rows or columns) or {{ interpolation }} reference"
     )
     series: list[ChartSeries] = Field(description="Series to render as radar areas")
     axis_key: str | None = Field(
@@ -324,8 +366,8 @@ class RadialChart(Component):
     """
 
     type: Literal["RadialChart"] = "RadialChart"
-    data: list[dict[str, Any]] | RxStr = Field(
-        description="Row data or {{ interpolation }} reference"
+    data: RowData | RxStr = Field(
+        description="Row data (rows or columns) or {{ interpolation }} reference"
     )
     data_key: str = Field(alias="dataKey", description="Numeric value field")
     name_key: str = Field(alias="nameKey", description="Label field")
@@ -0,0 +1,274 @@
+"""Largest-Triangle-Three-Buckets downsampling for cartesian chart data.
+
+A 300px-high chart can't show 500k points, and Recharts slows to a crawl
+drawing them.  :func:`lttb` picks ``max_points`` of them that keep the
+shape of the line: the first and last points, plus, for each of the
+evenly sized buckets in between, the point forming the largest triangle
+with the previously chosen point and the average of the next bucket.
+Spikes and dips make large triangles, so they survive.
+
+:func:`downsample` applies it to chart data with several series sharing
+an x axis.  Each series is downsampled on its own and a row is kept when
+any series chose it, so every series keeps its own peaks.  Rows, either
+columnar form (:mod:`prefab_ui.columnar`) and DataFrame-like tables
+(:mod:`prefab_ui.frames`) are all accepted; the result has the same form.
+
+NumPy is used when it is installed; otherwise a pure-Python version of
+the same algorithm runs.  Both choose the same points.
+"""
+
+from __future__ import annotations
+
+import math
+import sys
+from collections.abc import Callable, Sequence
+from numbers import Real
+from typing import Any
+
+from prefab_ui import optional
+from prefab_ui.columnar import is_columns_values
+from prefab_ui.frames import _library
+
+
+def _bounds(n: int, max_points: int, bucket: int) -> tuple[int, int]:
+    """Index range of ``bucket`` (0-based, excluding the first/last point)."""
+    every = (n - 2) / (max_points - 2)
+    return int(bucket * every) + 1, min(int((bucket + 1) * every) + 1, n - 1)
+
+
+def _line(ax: float, ay: float, cx: float, cy: float) -> tuple[float, float, float]:
+    """``(p, q, r)`` with ``|p*y + q*x + r|`` twice the area of the triangle
+    ``(ax, ay), (x, y), (cx, cy)``.  A missing ``ay`` is taken as ``cy``."""
+    if math.isnan(ay):
+        ay = cy
+    p, q = ax - cx, cy - ay
+    return p, q, -p * ay - q * ax
+
+
+def _lttb_python(x: Sequence[float], y: Sequence[float], max_points: int) -> list[int]:
+    n = len(y)
+    chosen = [0]
+    a = 0
+    for bucket in range(max_points - 2):
+        start, end = _bounds(n, max_points, bucket)
+        # The next bucket's average; the last bucket looks at the final point.
+        if bucket == max_points - 3:
+            next_start, next_end = n - 1, n
+        else:
+            next_start, next_end = _bounds(n, max_points, bucket + 1)
+        ys = [v for v in y[next_start:next_end] if not math.isnan(v)]
+        avg_x = sum(x[next_start:next_end]) / (next_end - next_start)
+        avg_y = sum(ys) / len(ys) if ys else 0.0
+        p, q, r = _line(x[a], y[a], avg_x, avg_y)
+        best, best_area = start, -1.0
+        for i in range(start, end):
+            area = abs(p * y[i] + q * x[i] + r)
+            if area > best_area:
+                best, best_area = i, area
+        a = best
+        chosen.append(a)
+    chosen.append(n - 1)
+    return chosen
+
+
+def _lttb_numpy(x: Any, y: Any, max_points: int) -> list[int]:
+    np = optional.numpy()
+    n = len(y)
+    every = (n - 2) / (max_points - 2)
+    starts = (np.arange(max_points - 2) * every).astype(np.int64) + 1
+    ends = np.minimum(
+        (np.arange(1, max_points - 1) * every).astype(np.int64) + 1, n - 1
+    )
+    # Bucket averages in one pass; bucket k uses the average of bucket k+1,
+    # and the last bucket the final point.
+    finite = ~np.isnan(y)
+    y0 = np.where(finite, y, 0.0)
+    counts = np.add.reduceat(finite[: n - 1].astype(np.int64), starts)
+    sums = np.add.reduceat(y0[: n - 1], starts)
+    x_sums = np.add.reduceat(x[: n - 1], starts)
+    sizes = np.diff(np.append(starts, n - 1))
+    avg_x = np.append((x_sums / sizes)[1:], x[n - 1])
+    bucket_y = sums / np.maximum(counts, 1)
+    avg_y = np.append(bucket_y[1:], y0[n - 1])
+
+    starts_, ends_ = starts.tolist(), ends.tolist()
+    avg_x_, avg_y_ = avg_x.tolist(), avg_y.tolist()
+    missing = not finite.all()
+    chosen = [0]
+    a = 0
+    for bucket in range(max_points - 2):
+        start, end = starts_[bucket], ends_[bucket]
+        p, q, r = _line(float(x[a]), float(y[a]), avg_x_[bucket], avg_y_[bucket])
+        area = np.abs(p * y[start:end] + (q * x[start:end] + r))
+        if missing:
+            area[np.isnan(area)] = -1.0
+        a = start + int(area.argmax())
+        chosen.append(a)
+    chosen.append(n - 1)
+    return chosen
+
+
+def lttb(x: Sequence[float], y: Sequence[float], max_points: int) -> list[int]:
+    """Indices of the ``max_points`` points of ``(x, y)`` LTTB keeps.
+
+    ``x`` must be increasing.  NaN in ``y`` marks a missing value, which
+    is only chosen when a whole bucket is missing.  All indices are
+    returned when there are no more than ``max_points`` points.
+    """
+    if max_points < 3:
+        raise ValueError("max_points must be at least 3")
+    n = len(y)
+    if n <= max_points:
+        return list(range(n))
+    np = optional.numpy()
+    if np is not None:
+        return _lttb_numpy(
+            np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64), max_points
+        )
+    return _lttb_python(x, y, max_points)
+
+
+# ── Chart data ───────────────────────────────────────────────────────
+
+
+_FLOATS = frozenset({float, int})
+
+
+def _number(value: Any) -> float:
+    if isinstance(value, Real) and not isinstance(value, bool):
+        return float(value)
+    return math.nan
+
+
+def _list_column(values: Sequence[Any]) -> list[float] | None:
+    """``values`` as floats (None when none of them is a number)."""
+    if all(type(value) in _FLOATS for value in values):
+        return list(map(float, values))
+    column = [_number(value) for value in values]
+    if all(math.isnan(value) for value in column):
+        return None
+    return column
+
+
+def _frame_column(frame: Any, library: str, label: Any) -> Any:
+    """A numeric or datetime column as float64 (None for anything else).
+
+    Missing values, including ``NaT``, become NaN.
+    """
+    np = sys.modules["numpy"]
+    if library == "pandas":
+        column = frame[label]
+        if column.dtype.kind != "M":
+            if column.dtype.kind not in "iufb":
+                return None
+            return column.to_numpy(dtype=np.float64, na_value=np.nan)
+        column = column.to_numpy(dtype="datetime64[ns]")
+    elif library == "numpy":
+        column = frame[label]
+    else:
+        column = frame.column(label).to_numpy(zero_copy_only=False)
+    if column.dtype.kind in "Mm":
+        missing = np.isnat(column)
+        column = column.view(np.int64).astype(np.float64)
+        column[missing] = np.nan
+        return column
+    if column.dtype.kind not in "iufb":
+        return None
+    return column.astype(np.float64)
+
+
+def _frame_labels(frame: Any, library: str) -> dict[str, Any]:
+    """Column names, as series keys name them, mapped to the table's labels.
+
+    They differ for pandas, whose labels needn't be strings.
+    """
+    if library == "pandas":
+        return {str(label): label for label in frame.columns}
+    if library == "numpy":
+        return {name: name for name in frame.dtype.names}
+    return {name: name for name in frame.column_names}
+
+
+def _has_nan(values: Any) -> bool:
+    if isinstance(values, list):
+        return any(math.isnan(value) for value in values)
+    return bool(sys.modules["numpy"].isnan(values).any())
+
+
+def _take(data: Any, library: str | None, rows: list[int]) -> Any:
+    if library == "pandas":
+        return data.iloc[rows]
+    if library == "numpy":
+        return data[rows]
+    if library == "pyarrow":
+        return data.take(rows)
+    if isinstance(data, list):
+        return [data[i] for i in rows]
+    if is_columns_values(data):
+        values = data["values"]
+        return {"columns": data["columns"], "values": [values[i] for i in rows]}
+    return {key: [column[i] for i in rows] for key, column in data.items()}
+
+
+def downsample(
+    data: Any, series: Sequence[str], x_axis: str | None, max_points: int
+) -> Any:
+    """Downsample chart ``data`` so each series keeps ``max_points`` points.
+
+    Rows are kept when any series in ``series`` chose them, so up to
+    ``max_points`` rows per series remain.  ``x_axis`` values are used as
+    x coordinates when they are numbers (or datetimes, in a DataFrame-like
+    table) with none missing; otherwise rows are taken as evenly spaced.
+    Values in a series that aren't numbers count as missing.  ``data`` is
+    returned unchanged when it is already small enough or isn't row data
+    (e.g. a ``{{ }}`` reference).
+    """
+    column: Callable[[str], Any]
+    library = _library(data)
+    if library is not None:
+        n = data.num_rows if library == "pyarrow" else len(data)
+        labels = _frame_labels(data, library)
+        names = list(labels)
+
+        def column(key: str) -> Any:
+            return _frame_column(data, library, labels[key])
+
+    elif isinstance(data, list):
+        n = len(data)
+        names = list(data[0]) if n else []
+
+        def column(key: str) -> Any:
+            return _list_column([row.get(key) for row in data])
+
+    elif isinstance(data, dict) and is_columns_values(data):
+        names = data["columns"]
+        n = len(data["values"])
+
+        def column(key: str) -> Any:
+            i = names.index(key)
+            return _list_column([row[i] for row in data["values"]])
+
+    elif isinstance(data, dict):
+        names = list(data)
+        n = len(next(iter(data.values()), []))
+
+        def column(key: str) -> Any:
+            return _list_column(data[key])
+
+    else:
+        return data
+
+    keys = [key for key in dict.fromkeys(series) if key in names]
+    if n <= max_points or not keys:
+        return data
+    x = column(x_axis) if x_axis is not None and x_axis in names else None
+    if x is None or _has_nan(x):
+        x = range(n)
+    chosen: set[int] = set()
+    for key in keys:
+        y = column(key)
+        if y is not None:
+            chosen.update(lttb(x, y, max_points))
+    if not chosen:
+        return data
+    return _take(data, library, sorted(chosen))
@@ -16,22 +16,58 @@ Example::
         searchable=True,
         paginated=True,
     )
+
+For datasets too large to send to the browser, give the table a
+``source`` action instead of ``rows``; the server answers each page with
+:class:`DataTableSource`::
+
+    users = DataTableSource(load_users(), columns=USER_COLUMNS)
+
+    @mcp.tool
+    def list_users(
+        page: int = 0,
+        page_size: int = 10,
+        sort: str | None = None,
+        direction: str | None = None,
+        search: str = "",
+    ) -> dict:
+        return users.query(page, page_size, sort, direction, search)
+
+    DataTable(
+        columns=USER_COLUMNS,
+        source=CallTool("list_users"),
+        searchable=True,
+        paginated=True,
+    )
 """
 
 from __future__ import annotations
 
+import heapq
+import math
+import re
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
+from collections.abc import Collection, Iterable, Iterator, Mapping, Sequence
+from itertools import islice
+from operator import itemgetter
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import ConfigDict, Field, model_validator
 
+from prefab_ui.actions import Action
+from prefab_ui.columnar import RowData, to_rows
 from prefab_ui.components.base import Component
+from prefab_ui.frames import _library, frame_columns
 from prefab_ui.rx import RxStr
+from prefab_ui.tracking import TrackedModel
 
 
-class DataTableColumn(BaseModel):
+class DataTableColumn(TrackedModel):
     """Column definition for DataTable."""
 
-    model_config = {"populate_by_name": True}
+    model_config = ConfigDict(populate_by_name=True)
 
     key: str = Field(description="Data key to display in this column")
     header: str = Field(description="Column header text")
@@ -58,9 +94,16 @@ class DataTable(Component):
 
     type: Literal["DataTable"] = "DataTable"
     columns: list[DataTableColumn] = Field(description="Column definitions")
-    rows: list[dict[str, Any]] | str = Field(
+    rows: RowData | str = Field(
         default_factory=list,
-        description="Row data or {{ interpolation }} reference",
+        description="Row data (rows or columns) or {{ interpolation }} reference",
+    )
+    source: Action | list[Action] | None = Field(
+        default=None,
+        description="CallTool or Fetch that loads rows from the server instead"
+        " of rows. Runs on every page, sort and search change with the query"
+        " ({page, page_size, sort, direction, search}) as $event, and must"
+        " return {rows, total}.",
     )
     searchable: bool = Field(default=False, description="Show search/filter input")
     paginated: bool = Field(default=False, description="Show pagination controls")
@@ -68,3 +111,624 @@ class DataTable(Component):
         default=10, alias="pageSize", description="Rows per page when paginated"
     )
     caption: RxStr | None = Field(default=None, description="Optional table caption")
+
+    @model_validator(mode="after")
+    def _rows_or_source(self) -> DataTable:
+        if self.source is not None and "rows" in self.model_fields_set:
+            raise ValueError("DataTable takes either 'rows' or 'source', not both")
+        return self
+
+
+# ── Server-side queries ──────────────────────────────────────────────
+
+SortDirection = Literal["asc", "desc"]
+
+
+class DataTableSource:
+    """Answers ``DataTable(source=...)`` queries from rows on the server.
+
+    Holds the full dataset: a list of row dicts, the same rows in either
+    columnar form, or a DataFrame.  NumPy record arrays and Arrow tables
+    are read into rows once, up front.  :meth:`query` searches, sorts and
+    slices it like the renderer would in the browser and returns the
+    ``{"rows": [...], "total": n}`` response the table expects.  Each
+    query scans every row; :class:`DataTableIndex` answers the same
+    queries from indexes built in advance.
+
+    Query parameters come from the browser, so they are checked: only
+    sortable columns can be sorted by, and pages are capped at
+    ``max_page_size`` rows.
+
+    Args:
+        data: The rows to serve.
+        columns: The table's columns.  Searches match these columns and
+            only the ``sortable`` ones can be sorted by.  Defaults to the
+            keys of the first row, all of them sortable.
+        max_page_size: The most rows one query returns.
+
+    Example::
+
+        users = DataTableSource(df, columns=USER_COLUMNS)
+        users.query(page=2, page_size=25, sort="name", search="ada")
+        # {"rows": [...], "total": 3}
+    """
+
+    def __init__(
+        self,
+        data: Any,
+        *,
+        columns: Sequence[DataTableColumn] | None = None,
+        max_page_size: int = 1000,
+    ) -> None:
+        # A DataFrame is queried in place; anything else becomes rows.
+        self._frame: Any = data if _library(data) == "pandas" else None
+        self._data = _rows(data) if self._frame is None else []
+        # Column key -> the frame's own label for it.
+        self._labels: dict[str, Any] = {}
+        if self._frame is not None:
+            self._labels = {str(label): label for label in data.columns}
+            keys = list(self._labels)
+        else:
+            keys = list(self._data[0]) if self._data else []
+        if columns is None:
+            self._search_keys = keys
+            self._sortable = set(keys)
+        else:
+            self._search_keys = [column.key for column in columns]
+            self._sortable = {column.key for column in columns if column.sortable}
+        self.max_page_size = max_page_size
+
+    def __len__(self) -> int:
+        return len(self._data if self._frame is None else self._frame)
+
+    def query(
+        self,
+        page: int = 0,
+        page_size: int = 10,
+        sort: str | None = None,
+        direction: SortDirection | None = None,
+        search: str | None = None,
+    ) -> dict[str, Any]:
+        """One page of rows matching ``search``, sorted by ``sort``.
+
+        Searching keeps rows where any searched column contains ``search``,
+        ignoring case.  Sorting is stable and puts missing values (None
+        and NaN) last in either direction.  ``page`` counts from 0;
+        ``total`` is the number of matching rows on all pages.
+
+        Raises:
+            ValueError: A negative page, a page size below 1, or a sort
+                column that isn't sortable.
+        """
+        start, page_size = _check_query(
+            page, page_size, sort, self._sortable, self.max_page_size
+        )
+        descending = direction == "desc"
+        needle = search.lower() if search else ""
+        if self._frame is not None:
+            return self._query_frame(start, page_size, sort, descending, needle)
+
+        rows: Sequence[Mapping[str, Any]] = self._data
+        if needle:
+            rows = [row for row in rows if _contains(row, self._search_keys, needle)]
+        total = len(rows)
+        if sort:
+            rows = _sorted(rows, sort, descending, start + page_size)
+        return {"rows": list(rows[start : start + page_size]), "total": total}
+
+    def _query_frame(
+        self,
+        start: int,
+        page_size: int,
+        sort: str | None,
+        descending: bool,
+        needle: str,
+    ) -> dict[str, Any]:
+        frame = self._frame
+        if needle:
+            found = None
+            for key in self._search_keys:
+                if key not in self._labels:
+                    # A column the frame doesn't have, such as actions.
+                    continue
+                column = frame[self._labels[key]]
+                text = column.astype(str).str.lower()
+                hits = text.str.contains(needle, regex=False) & column.notna()
+                found = hits if found is None else found | hits
+            frame = frame[found] if found is not None else frame.iloc[:0]
+        if sort in self._labels:
+            label = self._labels[sort]
+            order = {"ascending": not descending, "na_position": "last"}
+            try:
+                frame = frame.sort_values(label, kind="stable", **order)
+            except TypeError:
+                # Mixed types, such as numbers and strings, sort as text.
+                frame = frame.sort_values(
+                    label,
+                    kind="stable",
+                    key=lambda column: column.astype(str).where(column.notna()),
+                    **order,
+                )
+        window = frame.iloc[start : start + page_size]
+        return {"rows": to_rows(frame_columns(window)), "total": len(frame)}
+
+
+def _rows(data: Any) -> Sequence[Mapping[str, Any]]:
+    """``data`` as a sequence of row mappings, converting other forms."""
+    if _library(data) is not None:
+        return to_rows(frame_columns(data))
+    if isinstance(data, Mapping):
+        return to_rows(data)
+    if isinstance(data, str) or not isinstance(data, Sequence):
+        raise TypeError(f"Expected a sequence of rows or a DataFrame: {data!r}")
+    return data
+
+
+def _check_query(
+    page: int,
+    page_size: int,
+    sort: str | None,
+    sortable: Collection[str],
+    max_page_size: int,
+) -> tuple[int, int]:
+    """The first row and size of the page a query asks for."""
+    if page < 0:
+        raise ValueError("page can't be negative")
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+    if sort and sort not in sortable:
+        raise ValueError(f"Can't sort by {sort!r}")
+    page_size = min(page_size, max_page_size)
+    return page * page_size, page_size
+
+
+def _missing(value: Any) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def _contains(row: Mapping[str, Any], keys: list[str], needle: str) -> bool:
+    for key in keys:
+        value = row.get(key)
+        if not _missing(value) and needle in str(value).lower():
+            return True
+    return False
+
+
+def _sorted(
+    rows: Sequence[Mapping[str, Any]], key: str, descending: bool, limit: int
+) -> list[Mapping[str, Any]]:
+    """The first ``limit`` of ``rows`` sorted by ``key``, missing values last.
+
+    Early pages of a long table only need the top few rows, which a heap
+    finds in one pass without sorting the rest.
+    """
+    present = [row for row in rows if not _missing(row.get(key))]
+    if len(present) < limit:
+        missing = [row for row in rows if _missing(row.get(key))]
+        missing = missing[: limit - len(present)]
+    else:
+        missing = []
+    select = heapq.nlargest if descending else heapq.nsmallest
+    try:
+        if limit < len(present) // 16:
+            return select(limit, present, key=itemgetter(key))
+        present.sort(key=itemgetter(key), reverse=descending)
+    except TypeError:
+        # Mixed types, such as numbers and strings, sort as text.
+        present.sort(key=lambda row: str(row[key]), reverse=descending)
+    return present[:limit] + missing
+
+
+# ── Indexes ──────────────────────────────────────────────────────────
+
+# Searches split text into runs of letters, digits and underscores.
+_WORD = re.compile(r"\w+")
+# Length of the substrings that index the search vocabulary.
+_GRAM = 3
+# Batches bigger than this are merged by copying runs of ids into a new
+# array, rather than by inserting or deleting one id at a time.
+_BATCH = 64
+# Ids are kept in arrays of 64-bit integers: half the memory of lists of
+# ints, and copying or shifting them doesn't touch every int object.
+_ID = "q"
+# Searches kept for paging through their results.
+_CACHED_SEARCHES = 8
+
+
+class DataTableIndex:
+    """Answers ``DataTable(source=...)`` queries from prebuilt indexes.
+
+    :class:`DataTableSource` scans every row on every query.  An index
+    does that work once, when it is built: each sortable column keeps its
+    row ids in sorted order, and the searched columns are split into
+    words, each listing the rows it appears in.  A page of sorted rows is
+    then a slice, and a search only looks at rows that contain its words.
+    On a million rows a page takes microseconds, sorted or not.  A
+    search only reads the rows holding its rarest word, which takes
+    milliseconds at most, and is cached, so paging through its results
+    doesn't search again.
+
+    Answers match :class:`DataTableSource`'s exactly, with one exception.
+    A column that mixes types, such as numbers and strings, sorts as text
+    here even when the rows a search keeps would compare as they are.
+
+    Rows can be added with :meth:`append` and dropped with :meth:`remove`
+    without rebuilding.  Each row gets an id: its position in ``data``,
+    then the next unused number for each appended row.  An index isn't
+    safe to update from several threads at once.
+
+    Args:
+        data: The rows to serve, in any form :class:`DataTableSource`
+            accepts.  DataFrames are read into rows up front.
+        columns: The table's columns.  Searches match these columns and
+            only the ``sortable`` ones can be sorted by.
+        max_page_size: The most rows one query returns.
+
+    Example::
+
+        users = DataTableIndex(load_users(), columns=USER_COLUMNS)
+        users.query(page=2, page_size=25, sort="name", search="ada")
+        ids = users.append(new_users)
+    """
+
+    def __init__(
+        self,
+        data: Any = (),
+        *,
+        columns: Sequence[DataTableColumn],
+        max_page_size: int = 1000,
+    ) -> None:
+        self.max_page_size = max_page_size
+        self._search_keys = [column.key for column in columns]
+        self._orders = {
+            column.key: _SortOrder(column.key) for column in columns if column.sortable
+        }
+        self._rows: dict[int, Mapping[str, Any]] = {}
+        self._ids = array(_ID)
+        self._next_id = 0
+        # Word -> ids of the rows it appears in, ascending.
+        self._postings: dict[str, array[int]] = {}
+        # Three-character substring -> the words that contain it.
+        self._grams: defaultdict[str, set[str]] = defaultdict(set)
+        self._searches: dict[str, _Match] = {}
+        self.append(_rows(data))
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, row_id: object) -> bool:
+        return row_id in self._rows
+
+    def __getitem__(self, row_id: int) -> Mapping[str, Any]:
+        return self._rows[row_id]
+
+    # ── Updating ─────────────────────────────────────────────────────
+
+    def append(self, rows: Iterable[Mapping[str, Any]]) -> list[int]:
+        """Add rows to the end of the table and return their ids."""
+        added = list(enumerate(rows, self._next_id))
+        if not added:
+            return []
+        self._next_id += len(added)
+        self._searches.clear()
+        postings = self._postings
+        new_words = []
+        for row_id, row in added:
+            self._rows[row_id] = row
+            for word in self._words(row):
+                posting = postings.get(word)
+                if posting is None:
+                    postings[word] = array(_ID, (row_id,))
+                    new_words.append(word)
+                else:
+                    posting.append(row_id)
+        for word in new_words:
+            for gram in _grams(word):
+                self._grams[gram].add(word)
+        ids = [row_id for row_id, _ in added]
+        self._ids.extend(ids)
+        for order in self._orders.values():
+            order.add(added)
+        return ids
+
+    def remove(self, ids: Iterable[int]) -> None:
+        """Drop the rows with these ids.
+
+        Raises:
+            KeyError: An id isn't in the index.
+        """
+        gone = set(ids)
+        for row_id in gone:
+            if row_id not in self._rows:
+                raise KeyError(row_id)
+        if not gone:
+            return
+        self._searches.clear()
+        _discard(self._ids, gone)
+        for order in self._orders.values():
+            order.remove(gone)
+        touched: dict[str, set[int]] = {}
+        for row_id in gone:
+            for word in self._words(self._rows.pop(row_id)):
+                touched.setdefault(word, set()).add(row_id)
+        for word, rows in touched.items():
+            posting = self._postings[word]
+            _discard(posting, rows)
+            if not posting:
+                del self._postings[word]
+                for gram in _grams(word):
+                    words = self._grams[gram]
+                    words.discard(word)
+                    if not words:
+                        del self._grams[gram]
+
+    def _words(self, row: Mapping[str, Any]) -> set[str]:
+        text = "\n".join(
+            str(value)
+            for value in map(row.get, self._search_keys)
+            if not _missing(value)
+        )
+        return set(_WORD.findall(text.lower()))
+
+    # ── Querying ─────────────────────────────────────────────────────
+
+    def query(
+        self,
+        page: int = 0,
+        page_size: int = 10,
+        sort: str | None = None,
+        direction: SortDirection | None = None,
+        search: str | None = None,
+    ) -> dict[str, Any]:
+        """One page of rows matching ``search``, sorted by ``sort``.
+
+        Takes the same parameters and returns the same rows as
+        :meth:`DataTableSource.query`.
+
+        Raises:
+            ValueError: A negative page, a page size below 1, or a sort
+                column that isn't sortable.
+        """
+        start, page_size = _check_query(
+            page, page_size, sort, self._orders, self.max_page_size
+        )
+        end = start + page_size
+        descending = direction == "desc"
+        needle = search.lower() if search else ""
+        if not needle:
+            total = len(self._ids)
+            if sort:
+                ids = self._orders[sort].slice(start, end, descending)
+            else:
+                ids = self._ids[start:end]
+        else:
+            match = self._search(needle)
+            total = len(match.ids)
+            if not sort:
+                ids = match.ids[start:end]
+            elif total * total > 4 * end * len(self._ids):
+                # Matches are common enough that walking the column's
+                # order reaches the page sooner than sorting them would.
+                members = match.members()
+                walk = self._orders[sort].walk(descending)
+                ids = list(islice((i for i in walk if i in members), start, end))
+            else:
+                ids = self._orders[sort].top(match.ids, end, descending)[start:]
+        return {"rows": [self._rows[row_id] for row_id in ids], "total": total}
+
+    def _search(self, needle: str) -> _Match:
+        match = self._searches.pop(needle, None)
+        if match is None:
+            match = _Match(self._find(needle))
+            if len(self._searches) >= _CACHED_SEARCHES:
+                del self._searches[next(iter(self._searches))]
+        self._searches[needle] = match
+        return match
+
+    def _find(self, needle: str) -> list[int]:
+        """Ids of the rows containing ``needle``, ascending."""
+        words = _WORD.findall(needle)
+        if not words:
+            return [
+                row_id
+                for row_id in self._ids
+                if _contains(self._rows[row_id], self._search_keys, needle)
+            ]
+        # Every word of the needle is part of a word of a matching row, so
+        # the rows of the word that's in the fewest rows hold every match.
+        candidates: list[array[int]] | None = None
+        for word in set(words):
+            postings = [self._postings[w] for w in self._containing(word)]
+            if candidates is None or sum(map(len, postings)) < sum(
+                map(len, candidates)
+            ):
+                candidates = postings
+        assert candidates is not None
+        if len(candidates) == 1:
+            ids = candidates[0].tolist()
+        else:
+            ids = sorted(set().union(*candidates))
+        if words == [needle]:
+            return ids
+        # Words alone can't tell whether they're adjacent, or in the same
+        # column, so check the rows they point to.
+        return [
+            row_id
+            for row_id in ids
+            if _contains(self._rows[row_id], self._search_keys, needle)
+        ]
+
+    def _containing(self, word: str) -> list[str]:
+        """The indexed words that ``word`` is part of."""
+        if len(word) < _GRAM:
+            return [w for w in self._postings if word in w]
+        empty: set[str] = set()
+        sets = [self._grams.get(gram, empty) for gram in _grams(word)]
+        sets.sort(key=len)
+        return [w for w in sets[0].intersection(*sets[1:]) if word in w]
+
+
+def _grams(word: str) -> set[str]:
+    return {word[i : i + _GRAM] for i in range(len(word) - _GRAM + 1)}
+
+
+def _discard(ids: array[int], gone: set[int]) -> None:
+    """Remove ``gone`` from ``ids``, in ascending order, in place."""
+    found = []
+    for row_id in gone:
+        at = bisect_left(ids, row_id)
+        if at < len(ids) and ids[at] == row_id:
+            found.append(at)
+    _drop(ids, found)
+
+
+def _drop(items: array[int], positions: list[int]) -> None:
+    """Delete the items at ``positions`` from ``items``, in place."""
+    positions.sort()
+    if len(positions) <= _BATCH:
+        for at in reversed(positions):
+            del items[at]
+        return
+    # Copy the runs between deletions rather than shifting the tail of
+    # the array once per deletion.
+    kept = array(_ID)
+    start = 0
+    for at in positions:
+        kept += items[start:at]
+        start = at + 1
+    kept += items[start:]
+    items[:] = kept
+
+
+class _Match:
+    """The rows a search matched, with a set for membership tests."""
+
+    __slots__ = ("_members", "ids")
+
+    def __init__(self, ids: list[int]) -> None:
+        self.ids = ids
+        self._members: set[int] | None = None
+
+    def members(self) -> set[int]:
+        if self._members is None:
+            self._members = set(self.ids)
+        return self._members
+
+
+class _SortOrder:
+    """Row ids sorted by one column, ties broken by id.
+
+    Rows with no value in the column are kept apart, by id, and come
+    last in either direction.  Descending order visits equal values in
+    ascending id order, as a stable sort would.
+    """
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+        # Row id -> the value it sorts by.
+        self.values: dict[int, Any] = {}
+        self.ids = array(_ID)
+        self.missing = array(_ID)
+        # Whether the column mixes types and so sorts as text.
+        self.text = False
+
+    def add(self, rows: list[tuple[int, Mapping[str, Any]]]) -> None:
+        new = []
+        for row_id, row in rows:
+            value = row.get(self.key)
+            if _missing(value):
+                self.missing.append(row_id)
+            else:
+                self.values[row_id] = str(value) if self.text else value
+                new.append(row_id)
+        key = self.values.__getitem__
+        try:
+            new.sort(key=key)
+            # New ids are the highest, so they go after equal values.
+            if len(new) <= _BATCH:
+                for row_id in new:
+                    insort(self.ids, row_id, key=key)
+                return
+            # Copy the runs of old ids between insertion points, rather
+            # than shifting the tail of the array once per new id.
+            merged = array(_ID)
+            start = 0
+            for row_id in new:
+                at = bisect_right(self.ids, key(row_id), start, key=key)
+                merged += self.ids[start:at]
+                merged.append(row_id)
+                start = at
+            merged += self.ids[start:]
+            self.ids = merged
+        except TypeError:
+            self._as_text()
+
+    def _as_text(self) -> None:
+        """Compare every value as a string, once the column mixes types."""
+        self.text = True
+        self.values = {i: str(value) for i, value in self.values.items()}
+        self.ids = array(_ID, sorted(sorted(self.values), key=self.values.__getitem__))
+
+    def remove(self, gone: set[int]) -> None:
+        values = self.values
+        present = [row_id for row_id in gone if row_id in values]
+        # Ids are sorted by value and then by id, so each has one place.
+        positions = [
+            bisect_left(
+                self.ids, (values[row_id], row_id), key=lambda i: (values[i], i)
+            )
+            for row_id in present
+        ]
+        _drop(self.ids, positions)
+        for row_id in present:
+            del values[row_id]
+        _discard(self.missing, gone)
+
+    def slice(self, start: int, end: int, descending: bool) -> array[int]:
+        """Ids at positions ``start`` to ``end`` in this order."""
+        ids, n = self.ids, len(self.ids)
+        if not descending:
+            page = ids[start:end]
+        else:
+            page = array(_ID)
+            key = self.values.__getitem__
+            at = start
+            while at < min(end, n):
+                # The run of equal values holding position ``at`` from the
+                # end.  Reversed, it starts at position n - hi.
+                value = key(ids[n - 1 - at])
+                lo = bisect_left(ids, value, 0, n - at, key=key)
+                hi = bisect_right(ids, value, n - 1 - at, n, key=key)
+                run = ids[lo + at - (n - hi) : hi][: end - at]
+                page += run
+                at += len(run)
+        if len(page) < end - start:
+            skip = max(start - n, 0)
+            page += self.missing[skip : skip + end - start - len(page)]
+        return page
+
+    def walk(self, descending: bool) -> Iterator[int]:
+        """Every id, in this order."""
+        if not descending:
+            yield from self.ids
+        else:
+            ids, values = self.ids, self.values
+            hi = len(ids)
+            while hi:
+                value = values[ids[hi - 1]]
+                lo = hi - 1
+                while lo and values[ids[lo - 1]] == value:
+                    lo -= 1
+                yield from ids[lo:hi]
+                hi = lo
+        yield from self.missing
+
+    def top(self, ids: list[int], limit: int, descending: bool) -> list[int]:
+        """The first ``limit`` of ``ids``, given in ascending order."""
+        values = self.values
+        present = [row_id for row_id in ids if row_id in values]
+        select = heapq.nlargest if descending else heapq.nsmallest
+        page = select(limit, present, key=values.__getitem__)
+        if len(page) < limit:
+            page += [row_id for row_id in ids if row_id not in values]
+        return page[:limit]
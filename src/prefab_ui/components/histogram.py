@@ -4,6 +4,12 @@ Binning happens in Python at construction time. The renderer receives a
 standard BarChart payload with pre-computed bin labels and counts, so no
 new React component or Zod schema is needed.
 
+``values`` may be a list, a NumPy array or pandas Series (binned with
+NumPy), or any iterable of numbers or of chunks of numbers.  With
+``bin_edges``, or ``bin_range`` and a number of bins, values are counted
+in one pass holding a chunk at a time.  For unbounded streams, count
+values into a :class:`HistogramSketch` and pass that as ``values``.
+
 Example::
 
     from prefab_ui.components import Histogram
@@ -20,18 +26,38 @@ Example::
         values=[1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
         bin_edges=[0, 3, 7, 10],
     )
+
+    Histogram(values=latencies_ms, bins="fd")
+
+    Histogram(
+        values=(chunk["latency_ms"] for chunk in reader),
+        bins=50,
+        bin_range=(0, 2_000),
+    )
 """
 
 from __future__ import annotations
 
 import math
-from typing import Any, Literal
+import statistics
+import sys
+from bisect import bisect_right
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from itertools import islice
+from numbers import Real
+from typing import Annotated, Any, Literal
 
-from pydantic import Field
+from pydantic import Field, PlainValidator
 
+from prefab_ui import optional
 from prefab_ui.components.base import Component
 from prefab_ui.components.charts import ChartSeries
 
+BinRule = Literal["auto", "sturges", "fd"]
+
+# Arrays and iterators of numbers are binned this many values at a time.
+_CHUNK_SIZE = 65_536
+
 
 def _format_edge(value: float) -> str:
     """Format a bin edge as a human-readable string.
@@ -43,66 +69,551 @@ def _format_edge(value: float) -> str:
     return f"{value:.2g}"
 
 
+# ── Sources ──────────────────────────────────────────────────────────
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, Real) and not isinstance(value, bool)
+
+
+def _is_array(value: Any) -> bool:
+    """Whether ``value`` is a NumPy array or a pandas Series."""
+    module = type(value).__module__.partition(".")[0]
+    if module == "numpy":
+        return isinstance(value, sys.modules["numpy"].ndarray)
+    if module == "pandas":
+        return isinstance(value, sys.modules["pandas"].Series)
+    return False
+
+
+def _floats(chunk: Any) -> Any:
+    """``chunk`` as a float64 array, or as given when NumPy isn't installed."""
+    np = optional.numpy()
+    if np is None:
+        return chunk
+    if type(chunk).__module__.partition(".")[0] == "pandas":
+        return chunk.to_numpy(dtype=np.float64, na_value=np.nan)
+    return np.asarray(chunk, dtype=np.float64).ravel()
+
+
+def _chunks(values: Any) -> Iterator[Any]:
+    """Yield ``values`` a chunk at a time.
+
+    Lists of numbers are one chunk, and arrays and Series are split into
+    views of ``_CHUNK_SIZE`` values.  Any other iterable yields either
+    numbers, which are read in batches, or chunks (lists, arrays, Series),
+    e.g. one column of each ``pd.read_csv(chunksize=...)`` frame.
+    """
+    if _is_array(values) and optional.numpy() is not None:
+        # Views, so temporaries while binning stay the size of a chunk.
+        array = _floats(values)
+        for start in range(0, max(len(array), 1), _CHUNK_SIZE):
+            yield array[start : start + _CHUNK_SIZE]
+        return
+    if _is_array(values) or (
+        isinstance(values, (list, tuple)) and (not values or _is_number(values[0]))
+    ):
+        yield _floats(values)
+        return
+    items = iter(values)
+    for first in items:
+        if not _is_number(first):
+            yield _floats(first)
+            for item in items:
+                yield _floats(item)
+            return
+        batch = [first, *islice(items, _CHUNK_SIZE - 1)]
+        while batch:
+            yield _floats(batch)
+            batch = list(islice(items, _CHUNK_SIZE))
+
+
+def _check_values(value: Any) -> Any:
+    numbers = isinstance(value, (Iterable, HistogramSketch)) and not isinstance(
+        value, (str, bytes, Mapping)
+    )
+    if not numbers:
+        raise ValueError(
+            "Expected numbers: a list, array, Series, iterator or iterable of chunks"
+        )
+    return value
+
+
+Values = Annotated[
+    Any, PlainValidator(_check_values, json_schema_input_type=list[float])
+]
+"""Numbers to bin, held by reference rather than copied into a list."""
+
+
+# ── Binning ──────────────────────────────────────────────────────────
+
+
+class _BinCounts:
+    """Count values per bin, a chunk at a time, in O(bins) memory.
+
+    Bins are half-open ``[lo, hi)`` except the last, which includes its
+    upper edge.  Values outside the edges, and NaN, aren't counted.  Bins
+    are found with :func:`bisect.bisect_right`, or with NumPy when it is
+    installed: ``searchsorted`` for explicit edges, and for equal-width
+    edges the bin arithmetic ``numpy.histogram`` uses, checked against
+    the edges, which avoids a binary search per value.
+    """
+
+    def __init__(self, edges: list[float], *, uniform: bool = False) -> None:
+        self.edges = edges
+        self.uniform = uniform
+        self.counts = [0] * (len(edges) - 1)
+        self.seen = 0
+
+    def add(self, chunk: Any, weights: Any = None) -> None:
+        """Count ``chunk``, each value once or ``weights[i]`` times."""
+        self.seen += len(chunk)
+        np = optional.numpy()
+        if np is not None:
+            counts = self._count_array(np, chunk, weights).tolist()
+            self.counts = [a + b for a, b in zip(self.counts, counts, strict=True)]
+            return
+        edges, counts = self.edges, self.counts
+        n, hi = len(counts), edges[-1]
+        for value, weight in zip(chunk, weights or [1] * len(chunk), strict=True):
+            i = bisect_right(edges, value) - 1
+            if 0 <= i < n:
+                counts[i] += weight
+            elif value == hi:
+                counts[-1] += weight
+
+    def _count_array(self, np: Any, chunk: Any, weights: Any) -> Any:
+        n = len(self.counts)
+        edges = np.asarray(self.edges)
+        if not self.uniform:
+            index = np.searchsorted(edges, chunk, side="right") - 1
+            index[chunk == edges[-1]] = n - 1
+            keep = (index >= 0) & (index < n)
+            index = index[keep]
+        else:
+            lo, hi = edges[0], edges[-1]
+            keep = (chunk >= lo) & (chunk <= hi)
+            inside = chunk[keep]
+            index = ((inside - lo) * (n / (hi - lo))).astype(np.intp)
+            index[index == n] = n - 1
+            # Rounding can put a value next to its bin; the edges decide.
+            index -= inside < edges[index]
+            index += (inside >= edges[index + 1]) & (index != n - 1)
+        if weights is None:
+            return np.bincount(index, minlength=n)
+        counts = np.bincount(index, weights=weights[keep], minlength=n)
+        return counts.round().astype(np.int64)
+
+
+def _finite(chunk: Any) -> Any:
+    """``chunk`` without NaN and infinities (itself when it has none)."""
+    if optional.numpy() is not None:
+        np = sys.modules["numpy"]
+        if len(chunk) and np.isfinite(chunk.min() + chunk.max()):
+            return chunk
+        return chunk[np.isfinite(chunk)]
+    if all(map(math.isfinite, chunk)):
+        return chunk
+    return [value for value in chunk if math.isfinite(value)]
+
+
+def _equal_edges(lo: float, hi: float, bins: int) -> list[float]:
+    if lo == hi:
+        return [lo, hi + 1]
+    step = (hi - lo) / bins
+    return [lo + i * step for i in range(bins)] + [hi]
+
+
+def _quartiles(chunks: list[Any]) -> tuple[float, float]:
+    np = optional.numpy()
+    if np is not None:
+        q1, q3 = np.percentile(np.concatenate(chunks), [25, 75])
+        return float(q1), float(q3)
+    values = [value for chunk in chunks for value in chunk]
+    if len(values) < 2:
+        return values[0], values[0]
+    q1, _, q3 = statistics.quantiles(values, n=4, method="inclusive")
+    return q1, q3
+
+
+def _rule_bins(
+    rule: BinRule,
+    n: int,
+    lo: float,
+    hi: float,
+    quartiles: Callable[[], tuple[float, float]],
+) -> int:
+    """Bin count from Sturges' rule, Freedman-Diaconis, or the larger."""
+    sturges = math.ceil(math.log2(n)) + 1
+    if rule == "sturges":
+        return sturges
+    q1, q3 = quartiles()
+    if q3 == q1:
+        return sturges
+    fd = math.ceil((hi - lo) / (2 * (q3 - q1) / n ** (1 / 3)))
+    return max(fd, 1) if rule == "fd" else max(fd, sturges)
+
+
+def _auto_edges(
+    values: Any, bins: int | BinRule, bin_range: tuple[float, float] | None
+) -> list[float] | None:
+    """Edges spanning ``bin_range`` or the finite values (None if none)."""
+    chunks = [_finite(chunk) for chunk in _chunks(values)]
+    chunks = [chunk for chunk in chunks if len(chunk)]
+    if not chunks:
+        return None
+    if bin_range is not None:
+        lo, hi = bin_range
+    else:
+        arrays = optional.numpy() is not None
+        lo = float(min(chunk.min() if arrays else min(chunk) for chunk in chunks))
+        hi = float(max(chunk.max() if arrays else max(chunk) for chunk in chunks))
+    if isinstance(bins, str):
+        n = sum(len(chunk) for chunk in chunks)
+        bins = _rule_bins(bins, n, lo, hi, lambda: _quartiles(chunks))
+    return _equal_edges(lo, hi, bins)
+
+
 def _compute_bins(
-    values: list[int | float],
-    bins: int,
+    values: Any,
+    bins: int | BinRule,
     bin_edges: list[float] | None,
+    bin_range: tuple[float, float] | None = None,
 ) -> list[dict[str, Any]]:
     """Compute histogram bin counts from raw values.
 
+    ``values`` is anything :func:`_chunks` accepts.  With ``bin_edges``,
+    or ``bin_range`` and a number of bins, the edges are known up front
+    and the values are counted in one pass holding a chunk at a time.
+    Otherwise the range (and, for a rule, the bin count) comes from the
+    data first, so a one-shot iterator is read into memory.
+
     Returns a list of ``{"bin": "lo-hi", "count": n}`` dicts suitable for
     BarChart data.
     """
-    if not values:
-        return []
-
+    if bin_range is not None and bin_range[0] > bin_range[1]:
+        raise ValueError("bin_range must be (low, high) with low <= high")
+    if isinstance(values, HistogramSketch):
+        return _sketch_bins(values, bins, bin_edges, bin_range)
+    uniform = bin_edges is None
     if bin_edges is not None:
-        edges = sorted(bin_edges)
+        edges = sorted(float(edge) for edge in bin_edges)
+    elif bin_range is not None and isinstance(bins, int):
+        edges = _equal_edges(float(bin_range[0]), float(bin_range[1]), bins)
     else:
-        lo = float(min(values))
-        hi = float(max(values))
-        if lo == hi:
-            edges = [lo, hi + 1]
-            bins = 1
-        else:
-            step = (hi - lo) / bins
-            edges = [lo + i * step for i in range(bins)] + [hi]
-
-    n_bins = len(edges) - 1
-    counts = [0] * n_bins
-
-    for v in values:
-        for i in range(n_bins):
-            lower = edges[i]
-            upper = edges[i + 1]
-            if i == n_bins - 1:
-                if lower <= v <= upper:
-                    counts[i] += 1
-                    break
-            else:
-                if lower <= v < upper:
-                    counts[i] += 1
-                    break
+        # Read once here: an iterator can't be read twice, and a list is
+        # converted to arrays once rather than once per pass.
+        one_shot = isinstance(values, Iterator)
+        if one_shot or (
+            optional.numpy() is not None and isinstance(values, (list, tuple))
+        ):
+            values = list(_chunks(values))
+        found = _auto_edges(values, bins, bin_range)
+        if found is None:
+            return []
+        edges = found
+
+    counter = _BinCounts(edges, uniform=uniform)
+    for chunk in _chunks(values):
+        counter.add(chunk)
+    if not counter.seen:
+        return []
+    return _rows(edges, counter.counts)
+
 
+def _rows(edges: list[float], counts: list[int]) -> list[dict[str, Any]]:
     data: list[dict[str, Any]] = []
-    for i in range(n_bins):
+    for i, count in enumerate(counts):
         label = f"{_format_edge(edges[i])}\u2013{_format_edge(edges[i + 1])}"
-        data.append({"bin": label, "count": counts[i]})
-
+        data.append({"bin": label, "count": count})
     return data
 
 
+# ── Sketches ─────────────────────────────────────────────────────────
+
+# Magnitudes below this go to the zero bucket of a log sketch.
+_TINY = sys.float_info.min
+
+
+class HistogramSketch:
+    """Bucket counts of a value stream, in memory bounded by the buckets.
+
+    ``Histogram`` bins values it can read; a sketch is for values that
+    arrive over time, such as request latencies.  Each value is counted
+    in a bucket and then dropped, so memory depends on the number of
+    buckets, not of values.  Pass the sketch to ``Histogram(values=...)``
+    to chart it.
+
+    Buckets are either fixed-width, ``[origin + k * width, origin + (k+1)
+    * width)``, or logarithmic as in DDSketch: bucket ``k`` holds
+    magnitudes in ``(gamma ** (k-1), gamma ** k]`` with ``gamma = (1 + a)
+    / (1 - a)`` for ``relative_accuracy=a``, so any value is known to
+    within ``a`` of itself and a 1% sketch of values between 1µs and one
+    hour needs about 1,100 buckets.  Fixed-width buckets suit values in a
+    known range; log buckets suit long-tailed ones.
+
+    Sketches with the same bucket layout can be merged, so each thread or
+    process can keep its own and combine them at the end.  A sketch isn't
+    safe to update from several threads at once.  It pickles like any
+    plain object.  NaN and infinities aren't counted.
+
+    Args:
+        width: Bucket width, for fixed-width buckets.
+        origin: A bucket boundary, for fixed-width buckets.
+        relative_accuracy: Relative error of each bucket, for log buckets.
+
+    Example::
+
+        sketch = HistogramSketch(relative_accuracy=0.01)
+        for event in events:
+            sketch.add(event.latency_ms)
+
+        Histogram(values=sketch, bins=40)
+    """
+
+    def __init__(
+        self,
+        *,
+        width: float | None = None,
+        origin: float = 0.0,
+        relative_accuracy: float | None = None,
+    ) -> None:
+        if (width is None) == (relative_accuracy is None):
+            raise ValueError("Pass exactly one of width or relative_accuracy")
+        if width is not None and not width > 0:
+            raise ValueError("width must be positive")
+        if relative_accuracy is not None and not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.width = width
+        self.origin = origin
+        self.relative_accuracy = relative_accuracy
+        self._gamma = 0.0
+        if relative_accuracy is not None:
+            self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma) if self._gamma else 0.0
+        # Bucket key -> count.  Fixed-width sketches only use ``_positive``.
+        self._positive: dict[int, int] = {}
+        self._negative: dict[int, int] = {}
+        self._zero = 0
+        self.count = 0
+        self.sum = 0.0
+        self._min = math.inf
+        self._max = -math.inf
+
+    def __repr__(self) -> str:
+        if self.width is not None:
+            layout = f"width={self.width!r}, origin={self.origin!r}"
+        else:
+            layout = f"relative_accuracy={self.relative_accuracy!r}"
+        return f"HistogramSketch({layout}, count={self.count})"
+
+    @property
+    def min(self) -> float | None:
+        """The smallest value added, or None when empty."""
+        return self._min if self.count else None
+
+    @property
+    def max(self) -> float | None:
+        """The largest value added, or None when empty."""
+        return self._max if self.count else None
+
+    @property
+    def buckets(self) -> int:
+        """How many buckets hold at least one value."""
+        return len(self._positive) + len(self._negative) + (self._zero > 0)
+
+    # ── Adding ───────────────────────────────────────────────────────
+
+    def add(self, value: float) -> None:
+        """Count one value."""
+        if not math.isfinite(value):
+            return
+        self.count += 1
+        self.sum += value
+        self._min = min(self._min, value)
+        self._max = max(self._max, value)
+        if self.width is not None:
+            key = math.floor((value - self.origin) / self.width)
+            self._positive[key] = self._positive.get(key, 0) + 1
+        elif abs(value) < _TINY:
+            self._zero += 1
+        else:
+            store = self._positive if value > 0 else self._negative
+            key = math.ceil(math.log(abs(value)) / self._log_gamma)
+            store[key] = store.get(key, 0) + 1
+
+    def add_many(self, values: Any) -> None:
+        """Count many values: anything ``Histogram(values=...)`` accepts."""
+        np = optional.numpy()
+        for chunk in _chunks(values):
+            chunk = _finite(chunk)
+            if not len(chunk):
+                continue
+            if np is None:
+                for value in chunk:
+                    self.add(value)
+                continue
+            self.count += len(chunk)
+            self.sum += float(chunk.sum())
+            self._min = min(self._min, float(chunk.min()))
+            self._max = max(self._max, float(chunk.max()))
+            if self.width is not None:
+                keys = np.floor((chunk - self.origin) / self.width)
+                _count_keys(np, self._positive, keys)
+                continue
+            magnitude = np.abs(chunk)
+            nonzero = magnitude >= _TINY
+            self._zero += int(len(chunk) - nonzero.sum())
+            keys = np.ceil(np.log(magnitude[nonzero]) / self._log_gamma)
+            positive = chunk[nonzero] > 0
+            _count_keys(np, self._positive, keys[positive])
+            _count_keys(np, self._negative, keys[~positive])
+
+    def merge(self, *others: HistogramSketch) -> HistogramSketch:
+        """Add the counts of ``others`` to this sketch and return it.
+
+        Raises:
+            ValueError: A sketch has a different bucket layout.
+        """
+        for other in others:
+            if other._layout() != self._layout():
+                raise ValueError(
+                    f"Can't merge sketches with different buckets: {self!r}, {other!r}"
+                )
+            for store, theirs in (
+                (self._positive, other._positive),
+                (self._negative, other._negative),
+            ):
+                for key, count in theirs.items():
+                    store[key] = store.get(key, 0) + count
+            self._zero += other._zero
+            self.count += other.count
+            self.sum += other.sum
+            self._min = min(self._min, other._min)
+            self._max = max(self._max, other._max)
+        return self
+
+    def _layout(self) -> tuple[Any, ...]:
+        if self.width is not None:
+            return ("fixed", self.width, self.origin)
+        return ("log", self._gamma)
+
+    # ── Reading ──────────────────────────────────────────────────────
+
+    def _values(self) -> tuple[list[float], list[int]]:
+        """Each bucket's representative value, ascending, and its count.
+
+        Representatives are clamped to ``[min, max]``, so the buckets at
+        either end stay inside the range of the values themselves.
+        """
+        pairs: list[tuple[float, int]]
+        if self.width is not None:
+            pairs = [
+                (self.origin + (key + 0.5) * self.width, self._positive[key])
+                for key in sorted(self._positive)
+            ]
+        else:
+            pairs = [
+                (-self._representative(key), self._negative[key])
+                for key in sorted(self._negative, reverse=True)
+            ]
+            if self._zero:
+                pairs.append((0.0, self._zero))
+            pairs += [
+                (self._representative(key), self._positive[key])
+                for key in sorted(self._positive)
+            ]
+        values = [min(max(value, self._min), self._max) for value, _ in pairs]
+        return values, [count for _, count in pairs]
+
+    def _representative(self, key: int) -> float:
+        # Within relative_accuracy of every magnitude in the bucket.
+        return 2 * self._gamma**key / (self._gamma + 1)
+
+    def quantile(self, q: float) -> float | None:
+        """The value at quantile ``q`` (0 to 1), or None when empty.
+
+        Exact for fixed-width buckets to within half a bucket, and for log
+        buckets to within ``relative_accuracy``.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        values, counts = self._values()
+        for value, count in zip(values, counts, strict=True):
+            seen += count
+            if seen > rank:
+                return value
+        return values[-1]
+
+
+def _count_keys(np: Any, store: dict[int, int], keys: Any) -> None:
+    if not len(keys):
+        return
+    keys = keys.astype(np.int64)
+    low = int(keys.min())
+    if int(keys.max()) - low < 1 << 16:
+        counts = np.bincount(keys - low)
+        found = np.flatnonzero(counts)
+        pairs = zip((found + low).tolist(), counts[found].tolist(), strict=True)
+    else:
+        unique, counts = np.unique(keys, return_counts=True)
+        pairs = zip(unique.tolist(), counts.tolist(), strict=True)
+    for key, count in pairs:
+        store[key] = store.get(key, 0) + count
+
+
+def _sketch_bins(
+    sketch: HistogramSketch,
+    bins: int | BinRule,
+    bin_edges: list[float] | None,
+    bin_range: tuple[float, float] | None,
+) -> list[dict[str, Any]]:
+    """Bin a sketch, counting each bucket at its representative value."""
+    if not sketch.count:
+        return []
+    if bin_edges is not None:
+        edges = sorted(float(edge) for edge in bin_edges)
+    else:
+        lo, hi = bin_range or (sketch._min, sketch._max)
+        if isinstance(bins, str):
+            bins = _rule_bins(
+                bins,
+                sketch.count,
+                lo,
+                hi,
+                lambda: (sketch.quantile(0.25) or 0.0, sketch.quantile(0.75) or 0.0),
+            )
+        edges = _equal_edges(float(lo), float(hi), bins)
+    values, counts = sketch._values()
+    counter = _BinCounts(edges, uniform=bin_edges is None)
+    counter.add(_floats(values), _floats(counts))
+    return _rows(edges, counter.counts)
+
+
 class Histogram(Component):
     """Histogram that auto-bins raw values and renders as a BarChart.
 
-    The ``values``, ``bins``, and ``bin_edges`` fields are consumed during
-    construction and excluded from the serialized output. The renderer
-    receives a standard BarChart payload.
+    The ``values``, ``bins``, ``bin_edges`` and ``bin_range`` fields are
+    consumed during construction and excluded from the serialized output.
+    The renderer receives a standard BarChart payload.
 
     Args:
-        values: Raw numeric values to bin.
-        bins: Number of equal-width bins (ignored when *bin_edges* is set).
+        values: Raw numeric values to bin: a list, NumPy array, pandas
+            Series, or any iterable of numbers or of chunks of numbers.
+            Held by reference, not copied. A :class:`HistogramSketch` is
+            binned by its buckets' representative values.
+        bins: Number of equal-width bins, or a rule choosing it from the
+            data: ``"sturges"``, ``"fd"`` (Freedman-Diaconis) or ``"auto"``
+            (the larger of the two). Ignored when *bin_edges* is set.
         bin_edges: Explicit bin boundaries. Overrides *bins* when provided.
+        bin_range: ``(low, high)`` span of the equal-width bins, instead of
+            the data's minimum and maximum. Values outside it aren't counted.
+            With *bin_edges*, or with this and a number of *bins*, values are
+            counted in a single pass without being held in memory.
         height: Chart height in pixels.
         show_tooltip: Show tooltip on hover.
         show_legend: Show legend.
@@ -117,9 +628,10 @@ class Histogram(Component):
 
     type: Literal["BarChart"] = "BarChart"
 
-    values: list[int | float] = Field(exclude=True)
-    bins: int = Field(default=10, exclude=True)
+    values: Values = Field(exclude=True)
+    bins: int | BinRule = Field(default=10, exclude=True)
     bin_edges: list[float] | None = Field(default=None, exclude=True)
+    bin_range: tuple[float, float] | None = Field(default=None, exclude=True)
 
     data: list[dict[str, Any]] = Field(default_factory=list)
     series: list[ChartSeries] = Field(default_factory=list)
@@ -141,7 +653,9 @@ class Histogram(Component):
     )
 
     def model_post_init(self, __context: Any) -> None:
-        self.data = _compute_bins(self.values, self.bins, self.bin_edges)
+        self.data = _compute_bins(
+            self.values, self.bins, self.bin_edges, self.bin_range
+        )
         series_kwargs: dict[str, Any] = {"data_key": "count"}
         if self.color is not None:
             series_kwargs["color"] = self.color
@@ -30,7 +30,7 @@ from typing import Any, Literal
 
 from pydantic import Field
 
-from prefab_ui.components.base import ContainerComponent
+from prefab_ui.components.base import ContainerComponent, _child_json
 
 
 class Define(ContainerComponent):
@@ -62,8 +62,8 @@ class Define(ContainerComponent):
         children are wrapped in an implicit Column.
         """
         if len(self.children) == 1:
-            return self.children[0].to_json()
+            return _child_json(self.children[0])
         return {
             "type": "Column",
-            "children": [c.to_json() for c in self.children],
+            "children": [_child_json(c) for c in self.children],
         }
@@ -0,0 +1,72 @@
+"""Server-side evaluation of Prefab's ``{{ }}`` expressions.
+
+The renderer resolves templates like ``{{ price * qty | currency }}`` in
+the browser.  This package implements the same expression language in
+Python, so servers can evaluate, test and pre-render them::
+
+    from prefab_ui.expr import evaluate, interpolate
+
+    evaluate("price * qty | currency", {"price": 10, "qty": 3})  # '$30.00'
+    interpolate("Hello {{ name | upper }}!", {"name": "ford"})  # 'Hello FORD!'
+
+The grammar, pipes, and coercion rules mirror
+``renderer/src/expression.ts``, including JavaScript's ``null`` versus
+``undefined`` distinction (see :data:`UNDEFINED`).  Both implementations
+are checked against the shared corpus in ``schemas/expressions.json``.
+
+:class:`~prefab_ui.rx.Rx` expressions are accepted directly; their operator
+tree is converted to an AST without rendering and re-parsing the string.
+Parsed expressions are cached by source, so evaluating the same template
+repeatedly only parses it once.  :func:`fold` simplifies a parsed
+expression given state that never changes, and :func:`unparse` writes it
+back out as source.
+"""
+
+from __future__ import annotations
+
+from prefab_ui.expr.evaluator import (
+    compile_expression,
+    evaluate,
+    interpolate,
+    sole_expression,
+    split_template,
+)
+from prefab_ui.expr.fold import fold, unparse
+from prefab_ui.expr.parser import (
+    Binary,
+    Default,
+    ExpressionError,
+    Literal,
+    Node,
+    Path,
+    Pipe,
+    Ternary,
+    Unary,
+    from_rx,
+    parse,
+)
+from prefab_ui.expr.pipes import PIPES
+from prefab_ui.expr.values import UNDEFINED
+
+__all__ = [
+    "PIPES",
+    "UNDEFINED",
+    "Binary",
+    "Default",
+    "ExpressionError",
+    "Literal",
+    "Node",
+    "Path",
+    "Pipe",
+    "Ternary",
+    "Unary",
+    "compile_expression",
+    "evaluate",
+    "fold",
+    "from_rx",
+    "interpolate",
+    "parse",
+    "sole_expression",
+    "split_template",
+    "unparse",
+]
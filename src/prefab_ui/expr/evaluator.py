@@ -0,0 +1,248 @@
+"""Evaluate parsed expressions and ``{{ }}`` templates against state."""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from prefab_ui.expr.parser import (
+    Binary,
+    Default,
+    ExpressionError,
+    Literal,
+    Node,
+    Path,
+    Pipe,
+    Ternary,
+    Unary,
+    from_rx,
+    parse,
+)
+from prefab_ui.expr.pipes import PIPES
+from prefab_ui.expr.values import (
+    UNDEFINED,
+    compare,
+    get_property,
+    is_nullish,
+    js_length,
+    js_number,
+    loose_equals,
+    to_number,
+    to_string,
+    truthy,
+)
+from prefab_ui.rx import Rx
+
+
+def _resolve_path(parts: tuple[str, ...], ctx: Mapping[str, Any]) -> Any:
+    current: Any = ctx
+    for part in parts:
+        if current is None or current is UNDEFINED:
+            return UNDEFINED
+        if part == "length" and isinstance(current, (list, str)):
+            return len(current) if isinstance(current, list) else js_length(current)
+        current = get_property(current, part)
+    return current
+
+
+def _divide(left: float, right: float) -> float:
+    if right != 0:
+        return left / right
+    if left == 0 or math.isnan(left):
+        return math.nan
+    return math.copysign(math.inf, left) * math.copysign(1.0, right)
+
+
+def _binary(op: str, left: Any, right: Any) -> Any:
+    if op == "+":
+        if isinstance(left, str) or isinstance(right, str):
+            return to_string(left) + to_string(right)
+        return js_number(to_number(left) + to_number(right))
+    if op == "-":
+        return js_number(to_number(left) - to_number(right))
+    if op == "*":
+        return js_number(to_number(left) * to_number(right))
+    if op == "/":
+        return js_number(_divide(to_number(left), to_number(right)))
+    if op == "&&":
+        return right if truthy(left) else left
+    if op == "||":
+        return left if truthy(left) else right
+    if op == "==":
+        return loose_equals(left, right)
+    if op == "!=":
+        return not loose_equals(left, right)
+    return compare(op, left, right)
+
+
+def _eval(node: Node, ctx: Mapping[str, Any]) -> Any:
+    return _EVALUATORS[type(node)](node, ctx)
+
+
+def _eval_path(node: Path, ctx: Mapping[str, Any]) -> Any:
+    return _resolve_path(node.parts, ctx)
+
+
+def _eval_literal(node: Literal, ctx: Mapping[str, Any]) -> Any:
+    return node.value
+
+
+def _eval_binary(node: Binary, ctx: Mapping[str, Any]) -> Any:
+    # Operator chains are left-deep; fold them in a loop so long chains
+    # don't recurse once per term.
+    chain: list[Binary] = []
+    inner: Node = node
+    while type(inner) is Binary:
+        chain.append(inner)
+        inner = inner.left
+    value = _eval(inner, ctx)
+    for binary in reversed(chain):
+        value = _binary(binary.op, value, _eval(binary.right, ctx))
+    return value
+
+
+def _eval_pipe(node: Pipe | Default, ctx: Mapping[str, Any]) -> Any:
+    steps: list[Pipe | Default] = []
+    inner: Node = node
+    while type(inner) is Pipe or type(inner) is Default:
+        steps.append(inner)
+        inner = inner.expr
+    value = _eval(inner, ctx)
+    for step in reversed(steps):
+        if isinstance(step, Default):
+            if is_nullish(value):
+                value = step.value
+        else:
+            fn = PIPES.get(step.name)
+            if fn is not None:
+                value = fn(value, step.arg)
+    return value
+
+
+def _eval_unary(node: Unary, ctx: Mapping[str, Any]) -> Any:
+    operand = _eval(node.operand, ctx)
+    if node.op == "!":
+        return not truthy(operand)
+    number = to_number(operand)
+    return js_number(-number if node.op == "-" else number)
+
+
+def _eval_ternary(node: Ternary, ctx: Mapping[str, Any]) -> Any:
+    # The renderer evaluates both branches before choosing one.
+    cond = _eval(node.cond, ctx)
+    if_true = _eval(node.if_true, ctx)
+    if_false = _eval(node.if_false, ctx)
+    return if_true if truthy(cond) else if_false
+
+
+_EVALUATORS: dict[type, Callable[[Any, Mapping[str, Any]], Any]] = {
+    Path: _eval_path,
+    Literal: _eval_literal,
+    Binary: _eval_binary,
+    Pipe: _eval_pipe,
+    Default: _eval_pipe,
+    Unary: _eval_unary,
+    Ternary: _eval_ternary,
+}
+
+
+def compile_expression(expression: str | Rx | Node) -> Node:
+    """Return the AST for an expression string, ``Rx`` or existing AST."""
+    if isinstance(expression, str):
+        return parse(expression)
+    if isinstance(expression, Rx):
+        return from_rx(expression)
+    if isinstance(expression, (Literal, Path, Unary, Binary, Ternary, Pipe, Default)):
+        return expression
+    raise TypeError(
+        f"Expected an expression string, Rx or AST node, "
+        f"not {type(expression).__name__}"
+    )
+
+
+def evaluate(expression: str | Rx | Node, ctx: Mapping[str, Any] | None = None) -> Any:
+    """Evaluate an expression against ``ctx``, the way the renderer does.
+
+    ``expression`` is the text inside ``{{ }}`` (``"price * qty | currency"``),
+    an :class:`~prefab_ui.rx.Rx` or a parsed AST.  Values keep their types;
+    a missing key evaluates to :data:`UNDEFINED` (not ``None``, which is
+    ``null``).
+
+    Raises:
+        ExpressionError: The expression doesn't parse, or a pipe rejects
+            its argument.
+    """
+    node = compile_expression(expression)
+    try:
+        return _eval(node, {} if ctx is None else ctx)
+    except RecursionError:
+        raise ExpressionError("Expression is nested too deeply") from None
+
+
+def sole_expression(template: str) -> str | None:
+    """Return the source of ``template`` if it is a single ``{{ expr }}``.
+
+    Such a template keeps its value's type when interpolated; anything
+    else (plain text, several expressions, text around one) gives ``None``.
+    """
+    stripped = template.strip()
+    if not (stripped.startswith("{{") and stripped.endswith("}}")):
+        return None
+    inner = stripped[2:-2]
+    if "{{" in inner or "}}" in inner:
+        return None
+    return inner.strip()
+
+
+def split_template(template: str) -> tuple[list[str], list[str]]:
+    """Split a mixed template into literal text and expression sources.
+
+    There is one more text part than expression, and an unclosed ``{{``
+    stays text, as in :func:`interpolate`.
+    """
+    texts: list[str] = []
+    sources: list[str] = []
+    i = 0
+    while True:
+        start = template.find("{{", i)
+        end = template.find("}}", start + 2) if start != -1 else -1
+        if end == -1:
+            texts.append(template[i:])
+            return texts, sources
+        texts.append(template[i:start])
+        sources.append(template[start + 2 : end].strip())
+        i = end + 2
+
+
+def interpolate(template: str, ctx: Mapping[str, Any] | None = None) -> Any:
+    """Resolve the ``{{ }}`` expressions in ``template``, like the renderer.
+
+    A template that is a single ``{{ expr }}`` keeps the value's type, and
+    comes back unchanged if the value is undefined or the expression is
+    invalid.  Mixed templates always produce a string; undefined values
+    and invalid expressions contribute nothing.
+    """
+    if "{{" not in template:
+        return template
+    ctx = {} if ctx is None else ctx
+
+    sole = sole_expression(template)
+    if sole is not None:
+        try:
+            value = evaluate(sole, ctx)
+        except ExpressionError:
+            return template
+        return template if value is UNDEFINED else value
+
+    texts, sources = split_template(template)
+    parts = [texts[0]]
+    for source, text in zip(sources, texts[1:], strict=True):
+        try:
+            value = evaluate(source, ctx)
+        except ExpressionError:
+            value = UNDEFINED
+        if value is not UNDEFINED:
+            parts.append(to_string(value))
+        parts.append(text)
+    return "".join(parts)
@@ -0,0 +1,256 @@
+"""Constant folding for parsed expressions, and printing them back to source.
+
+:func:`fold` replaces references to known-constant state with literals and
+evaluates operators whose operands are all literal, so the renderer has
+less to do per render.  :func:`unparse` turns an AST back into expression
+text that parses to the same tree.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Mapping
+from decimal import Decimal
+from typing import Any
+
+from prefab_ui.expr.evaluator import _binary, _eval, _resolve_path
+from prefab_ui.expr.parser import (
+    _IDENT,
+    _KEYWORDS,
+    _NUMBER,
+    Binary,
+    Default,
+    ExpressionError,
+    Literal,
+    Node,
+    Path,
+    Pipe,
+    Ternary,
+    Unary,
+)
+from prefab_ui.expr.values import is_nullish, truthy
+
+
+def is_literal_value(value: Any) -> bool:
+    """Whether ``value`` can be written as a literal in an expression.
+
+    Expressions have no array or object literals, no string escapes and no
+    ``NaN``/``Infinity``, so only plain scalars qualify.
+    """
+    if value is None or isinstance(value, (bool, int)):
+        return True
+    if isinstance(value, float):
+        return math.isfinite(value)
+    return isinstance(value, str) and "'" not in value
+
+
+def _has_pipe(node: Node) -> bool:
+    """Whether evaluating ``node`` could raise (only pipes reject input)."""
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, Pipe):
+            return True
+        if isinstance(current, Unary):
+            stack.append(current.operand)
+        elif isinstance(current, Binary):
+            stack += (current.left, current.right)
+        elif isinstance(current, Ternary):
+            stack += (current.cond, current.if_true, current.if_false)
+        elif isinstance(current, Default):
+            stack.append(current.expr)
+    return False
+
+
+def _literal(node: Node, fallback: Node) -> Node:
+    value = _eval(node, {})
+    return Literal(value) if is_literal_value(value) else fallback
+
+
+def _fold(node: Node, constants: Mapping[str, Any]) -> Node:
+    if isinstance(node, Path):
+        if node.parts[0] not in constants:
+            return node
+        value = _resolve_path(node.parts, constants)
+        return Literal(value) if is_literal_value(value) else node
+    if isinstance(node, Unary):
+        operand = _fold(node.operand, constants)
+        folded = Unary(node.op, operand)
+        return _literal(folded, folded) if isinstance(operand, Literal) else folded
+    if isinstance(node, Binary):
+        return _fold_binary(node, constants)
+    if isinstance(node, Ternary):
+        cond = _fold(node.cond, constants)
+        if_true = _fold(node.if_true, constants)
+        if_false = _fold(node.if_false, constants)
+        if isinstance(cond, Literal):
+            # The renderer evaluates both branches, so the other one can
+            # only be dropped if it can't raise.
+            taken, dropped = (
+                (if_true, if_false) if truthy(cond.value) else (if_false, if_true)
+            )
+            if not _has_pipe(dropped):
+                return taken
+        return Ternary(cond, if_true, if_false)
+    if isinstance(node, Pipe):
+        return Pipe(_fold(node.expr, constants), node.name, node.arg)
+    if isinstance(node, Default):
+        expr = _fold(node.expr, constants)
+        if isinstance(expr, Literal):
+            return Literal(node.value) if is_nullish(expr.value) else expr
+        return Default(expr, node.value)
+    return node
+
+
+def _fold_binary(node: Binary, constants: Mapping[str, Any]) -> Node:
+    # Fold left-deep chains in a loop, like the evaluator does.
+    chain: list[Binary] = []
+    inner: Node = node
+    while isinstance(inner, Binary):
+        chain.append(inner)
+        inner = inner.left
+    left = _fold(inner, constants)
+    for binary in reversed(chain):
+        right = _fold(binary.right, constants)
+        left = _fold_operator(binary.op, left, right)
+    return left
+
+
+def _fold_operator(op: str, left: Node, right: Node) -> Node:
+    folded = Binary(op, left, right)
+    if not isinstance(left, Literal):
+        return folded
+    if isinstance(right, Literal):
+        value = _binary(op, left.value, right.value)
+        return Literal(value) if is_literal_value(value) else folded
+    if op in ("&&", "||"):
+        # ``a && b`` is b when a is truthy, else a; ``||`` the reverse.
+        keep_left = truthy(left.value) == (op == "||")
+        if not keep_left:
+            return right
+        if not _has_pipe(right):
+            return left
+    return folded
+
+
+def fold(node: Node, constants: Mapping[str, Any] | None = None) -> Node:
+    """Simplify ``node`` given state values that are known not to change.
+
+    References into ``constants`` whose values are scalars become literals;
+    unary, binary, ternary and default (``| 'x'``) nodes with literal
+    operands are replaced by their result.  Pipes are kept as written.
+    Results that have no literal form (``NaN``, arrays) stay unfolded, and
+    a branch is only pruned when dropping it can't hide an error, so the
+    folded expression evaluates exactly like the original.
+    """
+    try:
+        return _fold(node, constants or {})
+    except RecursionError:
+        return node
+
+
+# ── Printing ─────────────────────────────────────────────────────────
+
+# Binding strength of each node, following the parser's precedence levels.
+_PIPE, _TERNARY, _OR, _AND, _NOT, _COMP, _ADD, _MUL, _UNARY, _PRIMARY = range(10)
+_BINARY_LEVELS = {"||": _OR, "&&": _AND, "+": _ADD, "-": _ADD, "*": _MUL, "/": _MUL}
+
+
+def _level(node: Node) -> int:
+    if isinstance(node, Literal):
+        value = node.value
+        negative = isinstance(value, (int, float)) and not isinstance(value, bool)
+        return _UNARY if negative and math.copysign(1, value) < 0 else _PRIMARY
+    if isinstance(node, Path):
+        return _PRIMARY
+    if isinstance(node, Unary):
+        return _NOT if node.op == "!" else _UNARY
+    if isinstance(node, Binary):
+        return _BINARY_LEVELS.get(node.op, _COMP)
+    if isinstance(node, Ternary):
+        return _TERNARY
+    return _PIPE
+
+
+def _number_source(value: float) -> str:
+    text = (
+        f"{Decimal(repr(float(value))):f}" if isinstance(value, float) else str(value)
+    )
+    if "." in text:
+        text = text.rstrip("0").rstrip(".")
+    return text
+
+
+def _literal_source(value: Any) -> str:
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if isinstance(value, str):
+        if "'" in value:
+            raise ExpressionError("String literals can't contain a quote")
+        return f"'{value}'"
+    if not is_literal_value(value):
+        raise ExpressionError(f"No literal form for {value!r}")
+    if math.copysign(1, value) < 0:
+        return "-" + _number_source(-value)
+    return _number_source(value)
+
+
+def _pipe_arg_source(arg: str) -> str:
+    # The parser keeps only the text of the argument token, so any token
+    # with the same text round-trips.
+    if arg not in _KEYWORDS and (_IDENT.fullmatch(arg) or _NUMBER.fullmatch(arg)):
+        return arg
+    return _literal_source(arg)
+
+
+def _wrap(node: Node, minimum: int) -> str:
+    source = _unparse(node)
+    return f"({source})" if _level(node) < minimum else source
+
+
+def _unparse(node: Node) -> str:
+    if isinstance(node, Literal):
+        return _literal_source(node.value)
+    if isinstance(node, Path):
+        return ".".join(node.parts)
+    if isinstance(node, Unary):
+        return node.op + _wrap(node.operand, _NOT if node.op == "!" else _UNARY)
+    if isinstance(node, Binary):
+        level = _level(node)
+        # Comparisons don't chain, so both sides bind tighter; the other
+        # operators are left-associative.
+        left_min = _ADD if level == _COMP else level
+        return f"{_wrap(node.left, left_min)} {node.op} {_wrap(node.right, level + 1)}"
+    if isinstance(node, Ternary):
+        # A pipe inside a branch would swallow the ':' as its argument.
+        return (
+            f"{_wrap(node.cond, _OR)} ? {_wrap(node.if_true, _TERNARY)}"
+            f" : {_wrap(node.if_false, _TERNARY)}"
+        )
+    if isinstance(node, Pipe):
+        source = f"{_wrap(node.expr, _PIPE if _level(node.expr) == _PIPE else _OR)} | {node.name}"
+        return source if node.arg is None else f"{source}:{_pipe_arg_source(node.arg)}"
+    if isinstance(node, Default):
+        if isinstance(node.value, (int, float)) and not isinstance(node.value, bool):
+            if math.copysign(1, node.value) < 0:
+                raise ExpressionError("Default values can't be negative")
+        head = _wrap(node.expr, _PIPE if _level(node.expr) == _PIPE else _OR)
+        return f"{head} | {_literal_source(node.value)}"
+    raise TypeError(f"Not an expression node: {node!r}")
+
+
+def unparse(node: Node) -> str:
+    """Write ``node`` as expression source, adding parentheses where needed.
+
+    Raises:
+        ExpressionError: The tree holds a literal with no source form (a
+            string containing ``'``, ``NaN``, a negative default value).
+    """
+    try:
+        return _unparse(node)
+    except RecursionError:
+        raise ExpressionError("Expression is nested too deeply") from None
@@ -0,0 +1,400 @@
+"""Tokenizer, AST and recursive-descent parser for ``{{ }}`` expressions.
+
+Mirrors ``renderer/src/expression.ts`` token for token.  Grammar (lowest
+to highest precedence)::
+
+    expr       → pipe
+    pipe       → ternary ( '|' ( IDENT ( ':' pipeArg )? | literal ) )*
+    ternary    → or ( '?' expr ':' expr )?
+    or         → and ( '||' and )*
+    and        → not ( '&&' not )*
+    not        → '!' not | comp
+    comp       → add ( ( '==' | '!=' | '>' | '>=' | '<' | '<=' ) add )?
+    add        → mul ( ( '+' | '-' ) mul )*
+    mul        → unary ( ( '*' | '/' ) unary )*
+    unary      → ( '-' | '+' ) unary | primary
+    primary    → '(' expr ')' | NUMBER | STRING | 'true' | 'false' | 'null' | IDENT
+    IDENT      → name ( '.' name )*
+
+The renderer parses and evaluates in a single pass; here parsing produces
+an immutable AST so that it can be cached (see :func:`parse`), walked by
+static tooling, and evaluated many times.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Any, NamedTuple
+
+from prefab_ui.expr.values import js_number, parse_float
+from prefab_ui.rx import (
+    Rx,
+    _BinOp,
+    _DotPath,
+    _format_pipe_arg,
+    _IndexPath,
+    _Pipe,
+    _Ternary,
+    _UnaryOp,
+)
+
+
+class ExpressionError(ValueError):
+    """Raised when an expression can't be tokenized, parsed or evaluated."""
+
+
+# ── AST ──────────────────────────────────────────────────────────────
+
+
+class Literal(NamedTuple):
+    """A number, string, boolean or ``null`` literal."""
+
+    value: Any
+
+
+class Path(NamedTuple):
+    """A state reference such as ``user.name``, split on dots."""
+
+    parts: tuple[str, ...]
+
+
+class Unary(NamedTuple):
+    op: str  # "-", "+", "!"
+    operand: Node
+
+
+class Binary(NamedTuple):
+    op: str  # "+", "-", "*", "/", "==", "!=", ">", ">=", "<", "<=", "&&", "||"
+    left: Node
+    right: Node
+
+
+class Ternary(NamedTuple):
+    cond: Node
+    if_true: Node
+    if_false: Node
+
+
+class Pipe(NamedTuple):
+    """``expr | name`` or ``expr | name:arg``.  ``arg`` is the raw token text."""
+
+    expr: Node
+    name: str
+    arg: str | None
+
+
+class Default(NamedTuple):
+    """``expr | literal``: the literal replaces a null or undefined value."""
+
+    expr: Node
+    value: Any
+
+
+Node = Literal | Path | Unary | Binary | Ternary | Pipe | Default
+
+
+# ── Tokenizer ────────────────────────────────────────────────────────
+
+
+class _Token(NamedTuple):
+    type: str  # string, number, ident, bool, null, op, paren, not, pipe, ...
+    value: str
+
+
+_TWO_CHAR_OPS = frozenset({"==", "!=", ">=", "<=", "||", "&&"})
+_SINGLE_CHAR = {
+    ">": "op",
+    "<": "op",
+    "+": "op",
+    "-": "op",
+    "*": "op",
+    "/": "op",
+    "!": "not",
+    "(": "paren",
+    ")": "paren",
+    "|": "pipe",
+    "?": "question",
+    ":": "colon",
+}
+_KEYWORDS = {
+    "true": _Token("bool", "true"),
+    "false": _Token("bool", "false"),
+    "null": _Token("null", "null"),
+    "not": _Token("not", "!"),
+    "and": _Token("op", "&&"),
+    "or": _Token("op", "||"),
+}
+_NUMBER = re.compile(r"[0-9.]+")
+_IDENT = re.compile(r"[a-zA-Z_$][a-zA-Z0-9_.$]*")
+_PATH_SEGMENT = re.compile(r"[a-zA-Z0-9_$]+")
+_DIGITS = frozenset("0123456789")
+
+
+def _tokenize(source: str) -> list[_Token]:
+    tokens: list[_Token] = []
+    i = 0
+    n = len(source)
+    while i < n:
+        ch = source[i]
+        if ch.isspace():
+            i += 1
+            continue
+        two = source[i : i + 2]
+        if two in _TWO_CHAR_OPS:
+            tokens.append(_Token("op", two))
+            i += 2
+            continue
+        kind = _SINGLE_CHAR.get(ch)
+        if kind is not None:
+            tokens.append(_Token(kind, ch))
+            i += 1
+            continue
+        if ch == "'":
+            end = source.find("'", i + 1)
+            if end == -1:
+                end = n  # unterminated: the string runs to the end
+            tokens.append(_Token("string", source[i + 1 : end]))
+            i = end + 1
+            continue
+        if ch in _DIGITS or (ch == "." and i + 1 < n and source[i + 1] in _DIGITS):
+            match = _NUMBER.match(source, i)
+            assert match is not None
+            tokens.append(_Token("number", match.group()))
+            i = match.end()
+            continue
+        match = _IDENT.match(source, i)
+        if match is not None:
+            word = match.group()
+            tokens.append(_KEYWORDS.get(word) or _Token("ident", word))
+            i = match.end()
+            continue
+        raise ExpressionError(f"Unexpected character: {ch}")
+    tokens.append(_Token("end", ""))
+    return tokens
+
+
+# ── Parser ───────────────────────────────────────────────────────────
+
+_COMPARISON_OPS = frozenset({"==", "!=", ">", ">=", "<", "<="})
+_LITERAL_TOKENS = frozenset({"string", "number", "bool", "null"})
+
+
+def _literal(token: _Token) -> Any:
+    if token.type == "number":
+        return js_number(parse_float(token.value))
+    if token.type == "bool":
+        return token.value == "true"
+    if token.type == "null":
+        return None
+    return token.value
+
+
+class _Parser:
+    def __init__(self, tokens: list[_Token]) -> None:
+        self.tokens = tokens
+        self.pos = 0
+
+    def peek(self) -> _Token:
+        return self.tokens[self.pos]
+
+    def advance(self) -> _Token:
+        token = self.tokens[self.pos]
+        if token.type == "end":
+            raise ExpressionError("Unexpected end of expression")
+        self.pos += 1
+        return token
+
+    def expect(self, type: str, value: str | None = None) -> _Token:
+        token = self.advance()
+        if token.type != type or (value is not None and token.value != value):
+            wanted = f"{type} '{value}'" if value else type
+            raise ExpressionError(
+                f"Expected {wanted}, got {token.type} '{token.value}'"
+            )
+        return token
+
+    def expect_end(self) -> None:
+        if self.peek().type != "end":
+            raise ExpressionError(f"Unexpected token: {self.peek().value}")
+
+    def parse_expr(self) -> Node:
+        node = self.parse_ternary()
+        while self.peek().type == "pipe":
+            self.advance()
+            token = self.peek()
+            if token.type == "ident":
+                name = self.advance().value
+                arg = None
+                if self.peek().type == "colon":
+                    self.advance()
+                    arg = self.advance().value
+                node = Pipe(node, name, arg)
+            elif token.type in _LITERAL_TOKENS:
+                node = Default(node, _literal(self.advance()))
+            else:
+                raise ExpressionError(
+                    f"Expected pipe name or default value, got {token.type}"
+                )
+        return node
+
+    def parse_ternary(self) -> Node:
+        cond = self.parse_or()
+        if self.peek().type == "question":
+            self.advance()
+            if_true = self.parse_expr()
+            self.expect("colon")
+            return Ternary(cond, if_true, self.parse_expr())
+        return cond
+
+    def parse_or(self) -> Node:
+        left = self.parse_and()
+        while self.peek() == ("op", "||"):
+            self.advance()
+            left = Binary("||", left, self.parse_and())
+        return left
+
+    def parse_and(self) -> Node:
+        left = self.parse_not()
+        while self.peek() == ("op", "&&"):
+            self.advance()
+            left = Binary("&&", left, self.parse_not())
+        return left
+
+    def parse_not(self) -> Node:
+        if self.peek().type == "not":
+            self.advance()
+            return Unary("!", self.parse_not())
+        return self.parse_comp()
+
+    def parse_comp(self) -> Node:
+        left = self.parse_add()
+        token = self.peek()
+        if token.type == "op" and token.value in _COMPARISON_OPS:
+            self.advance()
+            return Binary(token.value, left, self.parse_add())
+        return left
+
+    def parse_add(self) -> Node:
+        left = self.parse_mul()
+        while self.peek().type == "op" and self.peek().value in ("+", "-"):
+            op = self.advance().value
+            left = Binary(op, left, self.parse_mul())
+        return left
+
+    def parse_mul(self) -> Node:
+        left = self.parse_unary()
+        while self.peek().type == "op" and self.peek().value in ("*", "/"):
+            op = self.advance().value
+            left = Binary(op, left, self.parse_unary())
+        return left
+
+    def parse_unary(self) -> Node:
+        token = self.peek()
+        if token.type == "op" and token.value in ("-", "+"):
+            self.advance()
+            return Unary(token.value, self.parse_unary())
+        return self.parse_primary()
+
+    def parse_primary(self) -> Node:
+        token = self.peek()
+        if token == ("paren", "("):
+            self.advance()
+            node = self.parse_expr()
+            self.expect("paren", ")")
+            return node
+        if token.type in _LITERAL_TOKENS:
+            self.advance()
+            return Literal(_literal(token))
+        if token.type == "ident":
+            self.advance()
+            return Path(tuple(token.value.split(".")))
+        raise ExpressionError(f"Unexpected token: {token.type} '{token.value}'")
+
+
+@lru_cache(maxsize=4096)
+def parse(source: str) -> Node:
+    """Parse an expression (the text between ``{{`` and ``}}``) into an AST.
+
+    Results are cached by source string, so templates repeated across a
+    view (or across requests) are parsed once.  The AST is immutable and
+    safe to share.
+
+    Raises:
+        ExpressionError: The expression doesn't tokenize or parse.
+    """
+    parser = _Parser(_tokenize(source))
+    try:
+        node = parser.parse_expr()
+    except RecursionError:
+        raise ExpressionError("Expression is nested too deeply") from None
+    parser.expect_end()
+    return node
+
+
+# ── Rx → AST ─────────────────────────────────────────────────────────
+
+
+class _Unsupported(Exception):
+    """An Rx tree that can't be converted faithfully; parse its key instead."""
+
+
+def _rx_operand(value: object) -> Node:
+    if isinstance(value, Rx):
+        return _rx_node(value)
+    if value is None or isinstance(value, (bool, int, float)):
+        return Literal(value)
+    if isinstance(value, str) and "'" not in value:
+        return Literal(value)
+    raise _Unsupported
+
+
+def _rx_node(rx: Rx) -> Node:
+    raw = object.__getattribute__(rx, "_key")
+    if isinstance(raw, _BinOp):
+        return Binary(raw.op, _rx_operand(raw.left), _rx_operand(raw.right))
+    if isinstance(raw, _UnaryOp):
+        return Unary(raw.op, _rx_node(raw.operand))
+    if isinstance(raw, _Ternary):
+        return Ternary(
+            _rx_node(raw.cond), _rx_operand(raw.if_true), _rx_operand(raw.if_false)
+        )
+    if isinstance(raw, _Pipe):
+        arg = None
+        if raw.arg is not None:
+            # The renderer reads the single token after the colon.
+            try:
+                tokens = _tokenize(_format_pipe_arg(raw.arg))
+            except ExpressionError:
+                raise _Unsupported from None
+            if len(tokens) != 2:
+                raise _Unsupported
+            arg = tokens[0].value
+        return Pipe(_rx_node(raw.expr), raw.name, arg)
+    if isinstance(raw, (_DotPath, _IndexPath)):
+        base = _rx_node(raw.expr)
+        segment = raw.attr if isinstance(raw, _DotPath) else raw.index
+        if (
+            not isinstance(base, Path)
+            or not isinstance(segment, (str, int))
+            or not _PATH_SEGMENT.fullmatch(str(segment))
+        ):
+            raise _Unsupported
+        return Path((*base.parts, str(segment)))
+    # Leaf keys and forward references: parse the resolved key.
+    return parse(rx.key)
+
+
+def from_rx(rx: Rx) -> Node:
+    """Build the AST for an :class:`~prefab_ui.rx.Rx` expression.
+
+    Walks the Rx operator tree directly instead of rendering and re-parsing
+    it.  Leaf keys and forward references are parsed from their resolved
+    key; trees that can't be mapped node for node (index access with an
+    ``Rx`` index, string operands containing quotes) fall back to parsing
+    the full expression string.
+    """
+    try:
+        return _rx_node(rx)
+    except (_Unsupported, RecursionError):
+        return parse(rx.key)
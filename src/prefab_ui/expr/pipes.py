@@ -0,0 +1,351 @@
+"""The pipe registry: ``value | name:arg`` transforms.
+
+Each pipe mirrors its counterpart in ``renderer/src/expression.ts``.
+Number and currency formatting follow the browser's ``en-US`` locale.
+
+Dates are formatted without a viewer timezone: timestamps without an
+offset are shown as written (the browser reads them as local time, so it
+shows the same wall-clock value), and timestamps with an offset or ``Z``
+are shown in UTC.  Only ISO 8601 style dates (``2024-01-15``,
+``2024-01-15T10:30:00Z``, ``2024/01/15``) are recognized; other strings
+pass through unchanged.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from collections.abc import Callable, Mapping
+from datetime import datetime, timedelta
+from typing import Any
+
+from prefab_ui.expr.parser import ExpressionError
+from prefab_ui.expr.values import (
+    UNDEFINED,
+    format_grouped,
+    get_property,
+    is_negative,
+    is_nullish,
+    js_length,
+    js_number,
+    js_slice,
+    parse_int,
+    to_fixed,
+    to_number,
+    to_string,
+    truthy,
+)
+
+PipeFn = Callable[[Any, "str | None"], Any]
+
+# en-US symbol and minor units for currencies that don't render as
+# "<code>\xa0" with two decimals.
+_CURRENCIES: dict[str, tuple[str, int]] = {
+    "AFN": ("AFN\xa0", 0),
+    "ALL": ("ALL\xa0", 0),
+    "AUD": ("A$", 2),
+    "BHD": ("BHD\xa0", 3),
+    "BIF": ("BIF\xa0", 0),
+    "BRL": ("R$", 2),
+    "CAD": ("CA$", 2),
+    "CLP": ("CLP\xa0", 0),
+    "CNY": ("CN¥", 2),
+    "DJF": ("DJF\xa0", 0),
+    "EUR": ("€", 2),
+    "GBP": ("£", 2),
+    "GNF": ("GNF\xa0", 0),
+    "HKD": ("HK$", 2),
+    "ILS": ("₪", 2),
+    "INR": ("₹", 2),
+    "IQD": ("IQD\xa0", 0),
+    "IRR": ("IRR\xa0", 0),
+    "ISK": ("ISK\xa0", 0),
+    "JOD": ("JOD\xa0", 3),
+    "JPY": ("¥", 0),
+    "KMF": ("KMF\xa0", 0),
+    "KPW": ("KPW\xa0", 0),
+    "KRW": ("₩", 0),
+    "KWD": ("KWD\xa0", 3),
+    "LAK": ("LAK\xa0", 0),
+    "LBP": ("LBP\xa0", 0),
+    "LYD": ("LYD\xa0", 3),
+    "MGA": ("MGA\xa0", 0),
+    "MMK": ("MMK\xa0", 0),
+    "MXN": ("MX$", 2),
+    "NZD": ("NZ$", 2),
+    "OMR": ("OMR\xa0", 3),
+    "PHP": ("₱", 2),
+    "PYG": ("PYG\xa0", 0),
+    "RSD": ("RSD\xa0", 0),
+    "RWF": ("RWF\xa0", 0),
+    "SLL": ("SLL\xa0", 0),
+    "SOS": ("SOS\xa0", 0),
+    "SYP": ("SYP\xa0", 0),
+    "TND": ("TND\xa0", 3),
+    "TWD": ("NT$", 2),
+    "UGX": ("UGX\xa0", 0),
+    "USD": ("$", 2),
+    "VND": ("₫", 0),
+    "VUV": ("VUV\xa0", 0),
+    "XAF": ("FCFA\xa0", 0),
+    "XCD": ("EC$", 2),
+    "XCG": ("Cg.\xa0", 2),
+    "XOF": ("F\u202fCFA\xa0", 0),
+    "XPF": ("CFPF\xa0", 0),
+    "YER": ("YER\xa0", 0),
+}
+_CURRENCY_CODE = re.compile(r"[A-Za-z]{3}")
+_MONTHS = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+_DATE = re.compile(
+    r"""
+    \+?(?P<year>\d{4,6})
+    (?:[-/](?P<month>\d{1,2})(?:[-/](?P<day>\d{1,2}))?)?
+    (?:[T\x20](?P<hour>\d{2}):(?P<minute>\d{2})
+        (?::(?P<second>\d{2})(?:\.(?P<fraction>\d+))?)?)?
+    (?P<tz>Z|[+-]\d{2}:?\d{2})?
+    """,
+    re.VERBOSE,
+)
+
+
+# ── Helpers ──────────────────────────────────────────────────────────
+
+
+def _decimals(arg: str | None, default: float) -> float:
+    return parse_int(arg) if arg else default
+
+
+def _fraction_digits(value: float) -> int:
+    if math.isnan(value) or not 0 <= value <= 100:
+        raise ExpressionError("fraction digits value is out of range")
+    return int(value)
+
+
+def _signed(number: float, text: str) -> str:
+    return "-" + text if is_negative(number) else text
+
+
+def _parse_date(value: Any) -> datetime | None:
+    """``new Date(String(value))`` for ISO 8601 style strings."""
+    match = _DATE.fullmatch(to_string(value).strip())
+    if match is None:
+        return None
+    parts = match.groupdict()
+    if parts["month"] is None and parts["hour"] is not None:
+        return None
+    try:
+        moment = datetime(
+            int(parts["year"]),
+            int(parts["month"] or 1),
+            int(parts["day"] or 1),
+            int(parts["hour"] or 0),
+            int(parts["minute"] or 0),
+            int(parts["second"] or 0),
+            int((parts["fraction"] or "0")[:3].ljust(3, "0")) * 1000,
+        )
+    except ValueError:
+        return None
+    offset = parts["tz"]
+    if offset and offset != "Z":
+        sign = -1 if offset[0] == "-" else 1
+        digits = offset[1:].replace(":", "")
+        delta = timedelta(hours=int(digits[:2]), minutes=int(digits[2:]))
+        moment -= sign * delta
+    return moment
+
+
+def _format_time(moment: datetime) -> str:
+    hour = moment.hour % 12 or 12
+    return f"{hour}:{moment.minute:02d} {'AM' if moment.hour < 12 else 'PM'}"
+
+
+def _format_date(moment: datetime, style: str) -> str:
+    if style == "short":
+        return f"{moment.month}/{moment.day}/{moment.year}"
+    month = _MONTHS[moment.month - 1]
+    if style != "long":
+        month = month[:3]
+    return f"{month} {moment.day}, {moment.year}"
+
+
+# ── Pipes ────────────────────────────────────────────────────────────
+
+
+def _percent(value: Any, arg: str | None) -> Any:
+    number = to_number(value)
+    if math.isnan(number):
+        return to_string(value)
+    try:
+        return to_fixed(number * 100, _decimals(arg, 0)) + "%"
+    except ValueError as exc:
+        raise ExpressionError(str(exc)) from None
+
+
+def _number(value: Any, arg: str | None) -> Any:
+    number = to_number(value)
+    if math.isnan(number):
+        return to_string(value)
+    if arg:
+        digits = _fraction_digits(parse_int(arg))
+        return _signed(number, format_grouped(number, digits, digits))
+    return _signed(number, format_grouped(number, 0, 3))
+
+
+def _currency(value: Any, arg: str | None) -> Any:
+    number = to_number(value)
+    if math.isnan(number):
+        return to_string(value)
+    code = "USD" if arg is None else arg
+    if not _CURRENCY_CODE.fullmatch(code):
+        raise ExpressionError(f"Invalid currency code : {code}")
+    code = code.upper()
+    symbol, digits = _CURRENCIES.get(code, (code + "\xa0", 2))
+    return _signed(number, symbol + format_grouped(number, digits, digits))
+
+
+def _date(value: Any, arg: str | None) -> Any:
+    moment = _parse_date(value)
+    if moment is None:
+        return to_string(value)
+    return _format_date(moment, "medium" if arg is None else arg)
+
+
+def _time(value: Any, arg: str | None) -> Any:
+    moment = _parse_date(value)
+    if moment is None:
+        moment = _parse_date(f"1970-01-01T{to_string(value)}")
+        if moment is None:
+            return to_string(value)
+    return _format_time(moment)
+
+
+def _datetime(value: Any, arg: str | None) -> Any:
+    moment = _parse_date(value)
+    if moment is None:
+        return to_string(value)
+    return f"{_format_date(moment, 'medium')}, {_format_time(moment)}"
+
+
+def _upper(value: Any, arg: str | None) -> Any:
+    return to_string(value).upper()
+
+
+def _lower(value: Any, arg: str | None) -> Any:
+    return to_string(value).lower()
+
+
+def _length(value: Any, arg: str | None) -> Any:
+    if isinstance(value, list):
+        return len(value)
+    if isinstance(value, str):
+        return js_length(value)
+    return 0
+
+
+def _join(value: Any, arg: str | None) -> Any:
+    if isinstance(value, list):
+        separator = ", " if arg is None else arg
+        return separator.join("" if is_nullish(v) else to_string(v) for v in value)
+    return to_string(value)
+
+
+def _truncate(value: Any, arg: str | None) -> Any:
+    text = to_string(value)
+    limit = _decimals(arg, 0)
+    if limit > 0 and js_length(text) > limit:
+        return js_slice(text, int(limit)) + "..."
+    return text
+
+
+def _default(value: Any, arg: str | None) -> Any:
+    if is_nullish(value):
+        return "" if arg is None else arg
+    return value
+
+
+def _first(value: Any, arg: str | None) -> Any:
+    if isinstance(value, list):
+        return value[0] if value else UNDEFINED
+    return value
+
+
+def _last(value: Any, arg: str | None) -> Any:
+    if isinstance(value, list):
+        return value[-1] if value else UNDEFINED
+    return value
+
+
+def _abs(value: Any, arg: str | None) -> Any:
+    number = to_number(value)
+    if math.isnan(number):
+        return value
+    return js_number(abs(number))
+
+
+def _round(value: Any, arg: str | None) -> Any:
+    number = to_number(value)
+    if math.isnan(number):
+        return value
+    factor = 10 ** _decimals(arg, 0)
+    scaled = number * factor
+    if math.isfinite(scaled):
+        # Math.round: nearest integer, ties toward +Infinity.
+        floor = math.floor(scaled)
+        scaled = float(floor + 1 if scaled - floor >= 0.5 else floor)
+    return js_number(scaled / factor)
+
+
+def _attr_filter(keep: bool) -> PipeFn:
+    def pipe(value: Any, arg: str | None) -> Any:
+        if not isinstance(value, list) or not arg:
+            return value
+        return [
+            item
+            for item in value
+            if isinstance(item, (Mapping, list))
+            and truthy(get_property(item, arg)) == keep
+        ]
+
+    return pipe
+
+
+def _pluralize(value: Any, arg: str | None) -> Any:
+    singular = "item" if arg is None else arg
+    return singular if to_number(value) == 1 else singular + "s"
+
+
+PIPES: dict[str, PipeFn] = {
+    "percent": _percent,
+    "number": _number,
+    "currency": _currency,
+    "date": _date,
+    "time": _time,
+    "datetime": _datetime,
+    "upper": _upper,
+    "lower": _lower,
+    "length": _length,
+    "join": _join,
+    "truncate": _truncate,
+    "default": _default,
+    "first": _first,
+    "last": _last,
+    "abs": _abs,
+    "round": _round,
+    "selectattr": _attr_filter(True),
+    "rejectattr": _attr_filter(False),
+    "pluralize": _pluralize,
+}
+"""Pipe name → transform.  Unknown pipe names pass the value through."""
@@ -0,0 +1,313 @@
+"""JavaScript value semantics for the expression evaluator.
+
+The renderer evaluates expressions with JavaScript's coercion rules:
+``Number(x)``, ``String(x)``, truthiness, loose ``==`` and relational
+comparison.  These helpers reproduce those rules for JSON-shaped Python
+values (``dict``, ``list``, ``str``, ``int``, ``float``, ``bool``,
+``None``) so server-side results match the browser's.
+"""
+
+from __future__ import annotations
+
+import math
+import operator
+import re
+from collections.abc import Callable, Mapping
+from decimal import ROUND_HALF_UP, Context, Decimal
+from typing import Any
+
+
+class _Undefined:
+    """JavaScript ``undefined``: a missing key, as opposed to ``null``."""
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __repr__(self) -> str:
+        return "UNDEFINED"
+
+    def __reduce__(self) -> str:
+        return "UNDEFINED"
+
+
+UNDEFINED: Any = _Undefined()
+"""Result of resolving a path that doesn't exist.  Falsy, distinct from ``None``."""
+
+_MAX_SAFE_INTEGER = 2**53
+_DECIMAL_CONTEXT = Context(prec=400)
+_JS_WHITESPACE = " \t\n\v\f\r\xa0\u1680\u2028\u2029\u202f\u205f\u3000\ufeff" + "".join(
+    chr(c) for c in range(0x2000, 0x200B)
+)
+_NUMERIC_LITERAL = re.compile(
+    r"[+-]?(?:Infinity|(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)\Z"
+)
+_PREFIXED_INTEGER = re.compile(r"0(?:[xX][0-9a-fA-F]+|[oO][0-7]+|[bB][01]+)\Z")
+_FLOAT_PREFIX = re.compile(r"\d+\.?\d*|\.\d+")
+_INT_PREFIX = re.compile(r"([+-]?)(?:0[xX]([0-9a-fA-F]+)|(\d+))")
+
+
+def is_nullish(value: Any) -> bool:
+    """``value == null`` in JavaScript: ``None`` or ``UNDEFINED``."""
+    return value is None or value is UNDEFINED
+
+
+def js_number(value: float) -> int | float:
+    """Normalize an arithmetic result: integral floats become ``int``.
+
+    JavaScript has one number type, so ``3`` and ``3.0`` are the same
+    value and both serialize as ``3``.  Returning ``int`` keeps Python
+    callers and JSON output in agreement with that.
+    """
+    if isinstance(value, int):
+        return int(value)
+    if (
+        value.is_integer()
+        and -_MAX_SAFE_INTEGER <= value <= _MAX_SAFE_INTEGER
+        and not (value == 0 and math.copysign(1.0, value) < 0)
+    ):
+        return int(value)
+    return value
+
+
+def truthy(value: Any) -> bool:
+    """JavaScript truthiness: empty lists and objects are truthy."""
+    if value is None or value is UNDEFINED or value is False:
+        return False
+    if isinstance(value, (int, float)):
+        return not math.isnan(value) and value != 0
+    if isinstance(value, str):
+        return value != ""
+    return True
+
+
+def to_number(value: Any) -> float:
+    """``Number(value)``."""
+    if type(value) is float:
+        return value
+    if isinstance(value, bool):
+        return 1.0 if value else 0.0
+    if isinstance(value, float):
+        return value
+    if isinstance(value, int):
+        try:
+            return float(value)
+        except OverflowError:
+            return math.inf if value > 0 else -math.inf
+    if value is None:
+        return 0.0
+    if isinstance(value, str):
+        return string_to_number(value)
+    if isinstance(value, (list, tuple)):
+        return string_to_number(to_string(value))
+    return math.nan
+
+
+def string_to_number(text: str) -> float:
+    """``Number(text)`` for a string: the whole string must be numeric."""
+    text = text.strip(_JS_WHITESPACE)
+    if not text:
+        return 0.0
+    if _NUMERIC_LITERAL.match(text):
+        return float(text)
+    if _PREFIXED_INTEGER.match(text):
+        return float(int(text, 0))
+    return math.nan
+
+
+def parse_float(text: str) -> float:
+    """``parseFloat`` for a number token (digits and dots only)."""
+    match = _FLOAT_PREFIX.match(text)
+    return float(match.group()) if match else math.nan
+
+
+def parse_int(text: str) -> float:
+    """``parseInt(text)``: leading integer, or NaN."""
+    match = _INT_PREFIX.match(text.lstrip(_JS_WHITESPACE))
+    if not match:
+        return math.nan
+    sign, hex_digits, digits = match.groups()
+    number = int(hex_digits, 16) if hex_digits else int(digits)
+    return float(-number if sign == "-" else number)
+
+
+def number_to_string(value: float) -> str:
+    """``String(number)``: shortest round-trip digits, JavaScript layout."""
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "Infinity" if value > 0 else "-Infinity"
+    if value == 0:
+        return "0"
+    if isinstance(value, int) and abs(value) < 10**21:
+        return str(value)
+    value = float(value)
+    sign = "-" if value < 0 else ""
+    decimal = Decimal(repr(abs(value))).as_tuple()
+    digit_tuple = decimal.digits
+    digits = "".join(map(str, digit_tuple)).rstrip("0")
+    # Finite, so the exponent is an int rather than a NaN/Infinity marker.
+    exponent = int(decimal.exponent) + len(digit_tuple) - len(digits)
+    k = len(digits)
+    n = exponent + k  # decimal point position relative to the digits
+    if k <= n <= 21:
+        return sign + digits + "0" * (n - k)
+    if 0 < n <= 21:
+        return sign + digits[:n] + "." + digits[n:]
+    if -6 < n <= 0:
+        return sign + "0." + "0" * -n + digits
+    e = n - 1
+    mantissa = digits[0] + ("." + digits[1:] if k > 1 else "")
+    return f"{sign}{mantissa}e{'+' if e > 0 else '-'}{abs(e)}"
+
+
+def to_string(value: Any) -> str:
+    """``String(value)``."""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return number_to_string(value)
+    if value is None:
+        return "null"
+    if value is UNDEFINED:
+        return "undefined"
+    if isinstance(value, (list, tuple)):
+        return ",".join("" if is_nullish(item) else to_string(item) for item in value)
+    if isinstance(value, Mapping):
+        return "[object Object]"
+    return str(value)
+
+
+def _type_of(value: Any) -> str:
+    if value is None:
+        return "null"
+    if value is UNDEFINED:
+        return "undefined"
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, (int, float)):
+        return "number"
+    if isinstance(value, str):
+        return "string"
+    return "object"
+
+
+def _to_primitive(value: Any) -> Any:
+    return to_string(value) if _type_of(value) == "object" else value
+
+
+def loose_equals(left: Any, right: Any) -> bool:
+    """JavaScript ``left == right``."""
+    lt, rt = _type_of(left), _type_of(right)
+    if lt == rt:
+        if lt == "number":
+            return to_number(left) == to_number(right)
+        if lt == "object":
+            return left is right
+        return left == right
+    if lt in ("null", "undefined") or rt in ("null", "undefined"):
+        return lt in ("null", "undefined") and rt in ("null", "undefined")
+    if lt == "boolean":
+        return loose_equals(to_number(left), right)
+    if rt == "boolean":
+        return loose_equals(left, to_number(right))
+    if lt == "object":
+        return loose_equals(_to_primitive(left), right)
+    if rt == "object":
+        return loose_equals(left, _to_primitive(right))
+    # number vs string
+    return to_number(left) == to_number(right)
+
+
+def get_property(obj: Any, key: str) -> Any:
+    """``obj[key]`` for an object or array; ``UNDEFINED`` when missing."""
+    if type(obj) is dict or isinstance(obj, Mapping):
+        return obj.get(key, UNDEFINED)
+    if isinstance(obj, (list, tuple)) and key.isdigit() and key.isascii():
+        index = int(key)
+        if str(index) == key and index < len(obj):
+            return obj[index]
+    return UNDEFINED
+
+
+def _utf16(text: str) -> bytes:
+    return text.encode("utf-16-be", "surrogatepass")
+
+
+_RELATIONAL: dict[str, Callable[[Any, Any], bool]] = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+
+def compare(op: str, left: Any, right: Any) -> bool:
+    """JavaScript relational comparison (``<``, ``<=``, ``>``, ``>=``)."""
+    left, right = _to_primitive(left), _to_primitive(right)
+    if isinstance(left, str) and isinstance(right, str):
+        if not (left.isascii() and right.isascii()):
+            left, right = _utf16(left), _utf16(right)  # code-unit order
+    else:
+        left, right = to_number(left), to_number(right)
+    return _RELATIONAL[op](left, right)
+
+
+def js_length(text: str) -> int:
+    """``text.length``: UTF-16 code units."""
+    if text.isascii():
+        return len(text)
+    return len(_utf16(text)) // 2
+
+
+def js_slice(text: str, end: int) -> str:
+    """``text.slice(0, end)`` in UTF-16 code units."""
+    if text.isascii():
+        return text[:end]
+    return _utf16(text)[: 2 * end].decode("utf-16-be", "surrogatepass")
+
+
+# ── Number formatting ────────────────────────────────────────────────
+
+
+def to_fixed(value: float, digits: float) -> str:
+    """``value.toFixed(digits)``: rounds the exact binary value, ties up."""
+    digits = 0 if math.isnan(digits) else int(digits)
+    if not 0 <= digits <= 100:
+        raise ValueError("toFixed() digits argument must be between 0 and 100")
+    if math.isnan(value) or math.isinf(value) or abs(value) >= 1e21:
+        return number_to_string(value)
+    if value == 0:
+        value = 0.0
+    exact = Decimal(value).quantize(
+        Decimal(1).scaleb(-digits), ROUND_HALF_UP, _DECIMAL_CONTEXT
+    )
+    return f"{exact:f}"
+
+
+def format_grouped(value: float, min_fraction: int, max_fraction: int) -> str:
+    """``Intl.NumberFormat("en-US")`` digits: grouped, half-expand rounding.
+
+    Rounds the shortest decimal representation (not the exact binary
+    value), so ``1.005`` rounds to ``1.01`` like the browser's.  The sign
+    is left to the caller; see :func:`is_negative`.
+    """
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "∞"
+    exact = Decimal(repr(abs(float(value)))).quantize(
+        Decimal(1).scaleb(-max_fraction), ROUND_HALF_UP, _DECIMAL_CONTEXT
+    )
+    text = f"{exact:,f}"
+    if max_fraction > min_fraction:
+        whole, _, fraction = text.partition(".")
+        fraction = fraction.rstrip("0").ljust(min_fraction, "0")
+        text = f"{whole}.{fraction}" if fraction else whole
+    return text
+
+
+def is_negative(value: float) -> bool:
+    """True for negative numbers, including ``-0``."""
+    return value < 0 or (value == 0 and math.copysign(1.0, value) < 0)
@@ -0,0 +1,197 @@
+"""DataFrames, NumPy record arrays and Arrow tables as row data.
+
+Chart ``data``, ``DataTable.rows`` and ``PrefabApp.state`` accept a
+``pandas.DataFrame``, a NumPy structured (record) array, or a
+``pyarrow.Table`` / ``RecordBatch`` directly::
+
+    LineChart(data=df, series=[ChartSeries(data_key="downloads")], x_axis="week")
+
+The frame is stored by reference; validation only looks at its column
+names.  It is serialized column by column, in the one-array-per-column
+form described in :mod:`prefab_ui.columnar`, with each column converted
+by the library's own bulk conversion rather than row by row:
+
+- NaN, infinities and missing values become ``null``
+- ``datetime64`` and Arrow timestamp or date columns become ISO 8601
+  strings, every value in a column to the same precision: the coarsest
+  unit that writes them all exactly (``2025-01-06`` when a naive column
+  holds only whole days); timezone-aware values are written in UTC with
+  a ``Z`` suffix
+- everything else goes through ``tolist()`` / ``to_pylist()``
+
+None of these libraries is a dependency.  They are never imported here:
+a value can only be a DataFrame if pandas is already loaded, so the
+checks look the classes up in ``sys.modules``.
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import Annotated, Any
+
+import pydantic_core
+from pydantic import PlainSerializer, PlainValidator
+
+
+def _library(value: Any) -> str | None:
+    """The library ``value`` is a table from, if it is one."""
+    module = type(value).__module__.partition(".")[0]
+    if module == "pandas":
+        if isinstance(value, sys.modules["pandas"].DataFrame):
+            return "pandas"
+    elif module == "numpy":
+        np = sys.modules["numpy"]
+        if isinstance(value, np.ndarray) and value.dtype.names is not None:
+            return "numpy"
+    elif module == "pyarrow":
+        pa = sys.modules["pyarrow"]
+        if isinstance(value, (pa.Table, pa.RecordBatch)):
+            return "pyarrow"
+    return None
+
+
+def is_frame(value: Any) -> bool:
+    """Whether ``value`` is a table this module can serialize."""
+    return _library(value) is not None
+
+
+# ── Columns ──────────────────────────────────────────────────────────
+
+
+_DATETIME_UNITS = ("D", "m", "s", "ms", "us", "ns")
+
+
+def _datetime_unit(array: Any, missing: Any, *, utc: bool) -> str:
+    """The coarsest unit that writes every value of ``array`` exactly.
+
+    Chosen once for the column, so its strings all have the same form.
+    Only naive columns are written as dates, so aware ones keep their
+    ``Z``.
+    """
+    np = sys.modules["numpy"]
+    base, count = np.datetime_data(array.dtype)
+    if base in ("Y", "M", "W"):
+        return "D" if not utc else "m"
+    tick = np.timedelta64(count, base)
+    # A unit of ``step`` ticks writes every value exactly when ``step``
+    # divides each of them, that is, divides their common divisor.
+    ticks = np.gcd.reduce(array[~missing].view("i8"))
+    for unit in _DATETIME_UNITS[utc:]:
+        step = np.timedelta64(1, unit) / tick
+        if step <= 1 or (step.is_integer() and ticks % int(step) == 0):
+            return unit
+    return base
+
+
+def _numpy_column(array: Any, *, utc: bool = False) -> list[Any]:
+    np = sys.modules["numpy"]
+    kind = array.dtype.kind
+    if kind == "f":
+        missing = ~np.isfinite(array)
+    elif kind == "M":
+        timezone = "UTC" if utc else "naive"
+        missing = np.isnat(array)
+        unit = _datetime_unit(array, missing, utc=utc)
+        array = np.datetime_as_string(array, unit=unit, timezone=timezone)
+    elif kind == "m":
+        # Python timedeltas, which pydantic writes as ISO 8601 durations.
+        return array.astype("timedelta64[us]").tolist()
+    else:
+        return array.tolist()
+    if missing.any():
+        array = array.astype(object)
+        array[missing] = None
+    return array.tolist()
+
+
+def _pandas_column(series: Any) -> list[Any]:
+    np = sys.modules["numpy"]
+    pd = sys.modules["pandas"]
+    dtype = series.dtype
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        naive = series.dt.tz_convert("UTC").dt.tz_localize(None)
+        return _numpy_column(naive.to_numpy(), utc=True)
+    if isinstance(dtype, np.dtype) and dtype.kind != "O":
+        # NumPy-backed columns are handed over without a copy.
+        return _numpy_column(series.to_numpy(copy=False))
+    # Object and extension dtypes (nullable integers, strings, categories):
+    # pandas maps every kind of missing value to None in one pass.
+    return series.to_numpy(dtype=object, na_value=None).tolist()
+
+
+def _arrow_column(column: Any) -> list[Any]:
+    types = sys.modules["pyarrow"].types
+    kind = column.type
+    if types.is_timestamp(kind) or types.is_date(kind):
+        utc = types.is_timestamp(kind) and kind.tz is not None
+        return _numpy_column(column.to_numpy(zero_copy_only=False), utc=utc)
+    numeric = types.is_integer(kind) or types.is_boolean(kind)
+    if types.is_floating(kind) or (numeric and column.null_count == 0):
+        return _numpy_column(column.to_numpy(zero_copy_only=False))
+    return column.to_pylist()
+
+
+def _names(frame: Any, library: str) -> list[str]:
+    if library == "pandas":
+        names = [str(name) for name in frame.columns]
+    elif library == "numpy":
+        names = list(frame.dtype.names)
+    else:
+        names = list(frame.column_names)
+    if len(set(names)) != len(names):
+        raise ValueError("Column names must be unique")
+    return names
+
+
+def frame_columns(frame: Any) -> dict[str, list[Any]]:
+    """Encode a table as one JSON-ready list per column."""
+    library = _library(frame)
+    if library is None:
+        raise TypeError(f"Not a DataFrame, record array or Arrow table: {frame!r}")
+    names = _names(frame, library)
+    if library == "pandas":
+        columns = [_pandas_column(frame.iloc[:, i]) for i in range(len(names))]
+    elif library == "numpy":
+        columns = [_numpy_column(frame[name]) for name in names]
+    else:
+        columns = [_arrow_column(frame.column(i)) for i in range(len(names))]
+    return dict(zip(names, columns, strict=True))
+
+
+# ── Pydantic and pydantic-core hooks ─────────────────────────────────
+
+
+def _check_frame(value: Any) -> Any:
+    library = _library(value)
+    if library is None:
+        raise ValueError("Expected a DataFrame, NumPy record array or Arrow table")
+    _names(value, library)
+    return value
+
+
+Frame = Annotated[
+    Any,
+    PlainValidator(_check_frame, json_schema_input_type=dict[str, list[Any]]),
+    PlainSerializer(frame_columns, return_type=dict[str, list[Any]]),
+]
+"""A table held by reference and serialized column by column."""
+
+
+def json_fallback(value: Any) -> Any:
+    """``fallback`` for pydantic-core's encoders: tables and NumPy values.
+
+    Tables become :func:`frame_columns`, NumPy arrays lists and NumPy
+    scalars the matching Python value.  Anything else raises the error
+    pydantic-core would have raised.
+    """
+    if is_frame(value):
+        return frame_columns(value)
+    if type(value).__module__.partition(".")[0] == "numpy":
+        np = sys.modules["numpy"]
+        if isinstance(value, np.ndarray):
+            return _numpy_column(value)
+        if isinstance(value, np.generic):
+            return _numpy_column(np.asarray(value)[None])[0]
+    raise pydantic_core.PydanticSerializationError(
+        f"Unable to serialize unknown type: {type(value)}"
+    )
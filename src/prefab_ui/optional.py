@@ -0,0 +1,22 @@
+"""Optional dependencies used to speed things up when they're installed.
+
+Downsampling and histogram binning run on NumPy arrays when NumPy is
+available and fall back to pure Python otherwise.  Both ask
+:func:`numpy` rather than importing it themselves, so there is one place
+to look it up (and one place for tests to patch to force the fallback).
+"""
+
+from __future__ import annotations
+
+from functools import cache
+from typing import Any
+
+
+@cache
+def numpy() -> Any:
+    """The ``numpy`` module, or ``None`` if it isn't installed."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
@@ -0,0 +1,92 @@
+"""Versioned results for tools a view polls.
+
+A dashboard that refreshes with ``SetInterval(on_tick=CallTool(...))``
+downloads the tool's whole result every tick, even when nothing changed.
+With ``version_argument`` set, ``CallTool`` sends the version of the last
+result it received as that tool argument, and :class:`VersionedResult`
+answers with a few bytes when the version still matches::
+
+    @mcp.tool
+    def metrics(version: str | None = None) -> dict:
+        return VersionedResult(load_metrics()).respond(version)
+
+    SetInterval(5000, on_tick=CallTool(
+        "metrics",
+        version_argument="version",
+        on_success=SetState("metrics", RESULT),
+    ))
+
+The renderer unwraps the response, so ``$result`` is the data itself, and
+skips ``on_success`` when the result is unchanged.  A tool that knows
+when its data last changed, such as a revision number or a modification
+time, can pass that as ``version`` and load the data only when the
+client is out of date::
+
+    VersionedResult(load_metrics, version=store.revision).respond(version)
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Callable
+from typing import Any
+
+import pydantic_core
+
+from prefab_ui.frames import json_fallback
+
+__all__ = ["VersionedResult"]
+
+
+class VersionedResult:
+    """A tool result tagged with a version of its content.
+
+    Args:
+        data: The result, anything a tool can return as JSON.  A callable
+            is called for the data the first time it's needed, which with
+            an explicit ``version`` is only when a client is out of date.
+        version: A version for ``data``.  Any value that changes whenever
+            the data does will do.  Defaults to a hash of the data's JSON
+            encoding, computed once per instance.
+
+    Keep one instance for as long as the data is unchanged and every
+    client polling it shares the version it computed.
+    """
+
+    __slots__ = ("_data", "_loaded", "_version")
+
+    def __init__(
+        self, data: Any | Callable[[], Any], *, version: str | int | None = None
+    ) -> None:
+        self._data = data
+        self._loaded = not callable(data)
+        self._version = None if version is None else str(version)
+
+    @property
+    def data(self) -> Any:
+        """The result data, loaded on first access."""
+        if not self._loaded:
+            self._data = self._data()
+            self._loaded = True
+        return self._data
+
+    @property
+    def version(self) -> str:
+        """The version clients send back to ask whether the data changed."""
+        if self._version is None:
+            encoded = pydantic_core.to_json(self.data, fallback=json_fallback)
+            self._version = hashlib.blake2b(encoded, digest_size=8).hexdigest()
+        return self._version
+
+    def respond(self, since: str | None = None) -> dict[str, Any]:
+        """The tool's response to a client that last saw version ``since``.
+
+        ``{"unchanged": True}`` if ``since`` is the current version,
+        otherwise ``{"version": ..., "data": ...}``.
+        """
+        if since is not None and since == self.version:
+            return {"unchanged": True}
+        return {"version": self.version, "data": self.data}
+
+    def __repr__(self) -> str:
+        return f"VersionedResult(version={self._version!r})"
@@ -0,0 +1,37 @@
+"""Server-side pre-rendering of component trees to static HTML.
+
+``PrefabApp.html(prerender=True)`` uses this to fill ``<div id="root">``
+with markup for the initial view, so the page paints before the renderer
+bundle has loaded; the renderer replaces it when it mounts::
+
+    from prefab_ui.prerender import prerender
+
+    prerender(view.to_json(), state={"name": "Ford"})
+
+Rendering happens in two steps.  :func:`resolve_tree` evaluates the tree
+against the initial state (``{{ }}`` templates, ``Condition``,
+``ForEach``, ``Slot`` and ``$ref``), using the same expression engine as
+:mod:`prefab_ui.expr`.  :func:`render_json` then turns the resolved tree
+into Tailwind-classed HTML matching the shadcn components.  Component
+types without a static equivalent render their children only.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+from prefab_ui.prerender.html import render_json
+from prefab_ui.prerender.resolve import resolve_tree
+
+
+def prerender(
+    view: Mapping[str, Any],
+    state: Mapping[str, Any] | None = None,
+    defs: Mapping[str, Any] | None = None,
+) -> str:
+    """Render component JSON to HTML as it first appears for ``state``."""
+    return "".join(render_json(node) for node in resolve_tree(view, state, defs))
+
+
+__all__ = ["prerender", "render_json", "resolve_tree"]
@@ -0,0 +1,258 @@
+"""Tailwind class strings for the static HTML renderer.
+
+Derived from ``renderer/src/style-nova.css`` (the ``@apply`` content of each
+``cn-*`` class) plus the component TSX files.  When shadcn is upgraded,
+update these to match.
+"""
+
+from __future__ import annotations
+
+# Button -------------------------------------------------------------------
+
+BUTTON_BASE = (
+    "focus-visible:border-ring focus-visible:ring-ring/50"
+    " aria-invalid:ring-destructive/20 dark:aria-invalid:ring-destructive/40"
+    " aria-invalid:border-destructive dark:aria-invalid:border-destructive/50"
+    " rounded-lg border border-transparent bg-clip-padding text-sm font-medium"
+    " focus-visible:ring-[3px] aria-invalid:ring-[3px]"
+    " [&_svg:not([class*='size-'])]:size-4"
+    # cva base
+    " inline-flex items-center justify-center whitespace-nowrap transition-all"
+    " disabled:pointer-events-none disabled:opacity-50"
+    " [&_svg]:pointer-events-none shrink-0 [&_svg]:shrink-0"
+    " outline-none group/button select-none"
+)
+
+BUTTON_VARIANTS: dict[str, str] = {
+    "default": "bg-primary text-primary-foreground [a]:hover:bg-primary/80",
+    "outline": (
+        "border-border bg-background hover:bg-muted hover:text-foreground"
+        " dark:bg-input/30 dark:border-input dark:hover:bg-input/50"
+        " aria-expanded:bg-muted aria-expanded:text-foreground"
+    ),
+    "secondary": (
+        "bg-secondary text-secondary-foreground hover:bg-secondary/80"
+        " aria-expanded:bg-secondary aria-expanded:text-secondary-foreground"
+    ),
+    "ghost": (
+        "hover:bg-muted hover:text-foreground dark:hover:bg-muted/50"
+        " aria-expanded:bg-muted aria-expanded:text-foreground"
+    ),
+    "destructive": (
+        "bg-destructive/10 hover:bg-destructive/20"
+        " focus-visible:ring-destructive/20 dark:focus-visible:ring-destructive/40"
+        " dark:bg-destructive/20 text-destructive"
+        " focus-visible:border-destructive/40 dark:hover:bg-destructive/30"
+    ),
+    "link": "text-primary underline-offset-4 hover:underline",
+    "success": (
+        "bg-success/10 hover:bg-success/20"
+        " focus-visible:ring-success/20 dark:focus-visible:ring-success/40"
+        " dark:bg-success/20 text-success"
+        " focus-visible:border-success/40 dark:hover:bg-success/30"
+    ),
+    "warning": (
+        "bg-warning/10 hover:bg-warning/20"
+        " focus-visible:ring-warning/20 dark:focus-visible:ring-warning/40"
+        " dark:bg-warning/20 text-warning"
+        " focus-visible:border-warning/40 dark:hover:bg-warning/30"
+    ),
+    "info": (
+        "bg-info/10 hover:bg-info/20"
+        " focus-visible:ring-info/20 dark:focus-visible:ring-info/40"
+        " dark:bg-info/20 text-info"
+        " focus-visible:border-info/40 dark:hover:bg-info/30"
+    ),
+}
+
+# For success/warning/info, use the focus-visible:ring-ring/50 variant
+# (destructive overrides to destructive ring, others keep default ring)
+BUTTON_VARIANT_RING_OVERRIDE = {"destructive", "success", "warning", "info"}
+
+BUTTON_SIZES: dict[str, str] = {
+    "default": (
+        "h-8 gap-1.5 px-2.5"
+        " has-data-[icon=inline-end]:pr-2 has-data-[icon=inline-start]:pl-2"
+    ),
+    "xs": (
+        "h-6 gap-1 rounded-[min(var(--radius-md),10px)] px-2 text-xs"
+        " in-data-[slot=button-group]:rounded-lg"
+        " has-data-[icon=inline-end]:pr-1.5 has-data-[icon=inline-start]:pl-1.5"
+        " [&_svg:not([class*='size-'])]:size-3"
+    ),
+    "sm": (
+        "h-7 gap-1 rounded-[min(var(--radius-md),12px)] px-2.5 text-[0.8rem]"
+        " in-data-[slot=button-group]:rounded-lg"
+        " has-data-[icon=inline-end]:pr-1.5 has-data-[icon=inline-start]:pl-1.5"
+        " [&_svg:not([class*='size-'])]:size-3.5"
+    ),
+    "lg": (
+        "h-9 gap-1.5 px-2.5"
+        " has-data-[icon=inline-end]:pr-3 has-data-[icon=inline-start]:pl-3"
+    ),
+    "icon": "size-8",
+    "icon-xs": (
+        "size-6 rounded-[min(var(--radius-md),10px)]"
+        " in-data-[slot=button-group]:rounded-lg"
+        " [&_svg:not([class*='size-'])]:size-3"
+    ),
+    "icon-sm": (
+        "size-7 rounded-[min(var(--radius-md),12px)]"
+        " in-data-[slot=button-group]:rounded-lg"
+    ),
+    "icon-lg": "size-9",
+}
+
+# Badge --------------------------------------------------------------------
+
+BADGE_BASE = (
+    "inline-flex items-center justify-center w-fit whitespace-nowrap shrink-0"
+    " [&>svg]:pointer-events-none focus-visible:border-ring"
+    " focus-visible:ring-ring/50 focus-visible:ring-[3px]"
+    " aria-invalid:ring-destructive/20 dark:aria-invalid:ring-destructive/40"
+    " aria-invalid:border-destructive overflow-hidden group/badge"
+    # cn-badge
+    " h-5 gap-1 rounded-4xl border border-transparent px-2 py-0.5"
+    " text-xs font-medium transition-all"
+    " has-data-[icon=inline-end]:pr-1.5 has-data-[icon=inline-start]:pl-1.5"
+    " [&>svg]:size-3!"
+)
+
+BADGE_VARIANTS: dict[str, str] = {
+    "default": "bg-primary text-primary-foreground [a]:hover:bg-primary/80",
+    "secondary": "bg-secondary text-secondary-foreground [a]:hover:bg-secondary/80",
+    "outline": "border-border text-foreground [a]:hover:bg-muted [a]:hover:text-muted-foreground",
+    "destructive": (
+        "bg-destructive/10 [a]:hover:bg-destructive/20"
+        " focus-visible:ring-destructive/20 dark:focus-visible:ring-destructive/40"
+        " text-destructive dark:bg-destructive/20"
+    ),
+    "ghost": "hover:bg-muted hover:text-muted-foreground dark:hover:bg-muted/50",
+    "link": "text-primary underline-offset-4 hover:underline",
+    "success": "bg-[var(--success)]/10 text-[var(--success)] dark:bg-[var(--success)]/20",
+    "warning": "bg-[var(--warning)]/10 text-[var(--warning)] dark:bg-[var(--warning)]/20",
+    "info": "bg-[var(--info)]/10 text-[var(--info)] dark:bg-[var(--info)]/20",
+}
+
+# Card ---------------------------------------------------------------------
+
+CARD_CLS = (
+    "ring-foreground/10 bg-card text-card-foreground gap-4 overflow-hidden"
+    " rounded-xl py-4 text-sm ring-1 has-data-[slot=card-footer]:pb-0"
+    " has-[>img:first-child]:pt-0"
+    " group/card flex flex-col"
+)
+CARD_HEADER_CLS = (
+    "grid auto-rows-min items-start"
+    " has-data-[slot=card-action]:grid-cols-[1fr_auto]"
+    " has-data-[slot=card-description]:grid-rows-[auto_auto]"
+    " @container/card-header"
+    # cn-card-header
+    " gap-1 rounded-t-xl px-4"
+)
+CARD_TITLE_CLS = "text-base leading-snug font-medium"
+CARD_DESCRIPTION_CLS = "text-muted-foreground text-sm"
+CARD_CONTENT_CLS = "px-4"
+CARD_FOOTER_CLS = "bg-muted/50 rounded-b-xl border-t p-4 flex items-center"
+
+
+# Alert --------------------------------------------------------------------
+
+ALERT_BASE = (
+    "w-full relative group/alert"
+    " grid gap-0.5 rounded-lg border px-2.5 py-2 text-left text-sm"
+    " has-data-[slot=alert-action]:relative has-data-[slot=alert-action]:pr-18"
+    " has-[>svg]:grid-cols-[auto_1fr] has-[>svg]:gap-x-2"
+    " *:[svg]:row-span-2 *:[svg]:translate-y-0.5 *:[svg]:text-current"
+    " *:[svg:not([class*='size-'])]:size-4"
+)
+
+ALERT_VARIANTS: dict[str, str] = {
+    "default": "bg-card text-card-foreground",
+    "destructive": "text-destructive bg-card *:data-[slot=alert-description]:text-destructive/90 *:[svg]:text-current",
+    "success": "text-[var(--success)] bg-card",
+    "warning": "text-[var(--warning)] bg-card",
+    "info": "text-[var(--info)] bg-card",
+}
+
+ALERT_TITLE_CLS = "font-medium group-has-[>svg]/alert:col-start-2"
+ALERT_DESCRIPTION_CLS = "text-muted-foreground text-sm text-balance md:text-pretty [&_p:not(:last-child)]:mb-4"
+
+
+# Form components ----------------------------------------------------------
+
+INPUT_CLS = (
+    "dark:bg-input/30 border-input focus-visible:border-ring"
+    " focus-visible:ring-ring/50 aria-invalid:ring-destructive/20"
+    " dark:aria-invalid:ring-destructive/40 aria-invalid:border-destructive"
+    " dark:aria-invalid:border-destructive/50"
+    " disabled:bg-input/50 dark:disabled:bg-input/80"
+    " h-8 rounded-lg border bg-transparent px-2.5 py-1 text-base"
+    " transition-colors file:h-6 file:text-sm file:font-medium"
+    " focus-visible:ring-[3px] aria-invalid:ring-[3px] md:text-sm"
+)
+
+TEXTAREA_CLS = (
+    "border-input dark:bg-input/30 focus-visible:border-ring"
+    " focus-visible:ring-ring/50 aria-invalid:ring-destructive/20"
+    " dark:aria-invalid:ring-destructive/40 aria-invalid:border-destructive"
+    " dark:aria-invalid:border-destructive/50"
+    " disabled:bg-input/50 dark:disabled:bg-input/80"
+    " rounded-lg border bg-transparent px-2.5 py-2 text-base"
+    " transition-colors focus-visible:ring-[3px] aria-invalid:ring-[3px]"
+    " md:text-sm"
+)
+
+LABEL_CLS = "gap-2 text-sm leading-none font-medium group-data-[disabled=true]:opacity-50 peer-disabled:opacity-50"
+
+CHECKBOX_CLS = (
+    "border-input dark:bg-input/30"
+    " data-[state=checked]:bg-primary data-[state=checked]:text-primary-foreground"
+    " dark:data-[state=checked]:bg-primary"
+    " data-[state=checked]:border-primary"
+    " focus-visible:border-ring focus-visible:ring-ring/50"
+    " aria-invalid:ring-destructive/20 dark:aria-invalid:ring-destructive/40"
+    " flex size-4 items-center justify-center rounded-[4px] border"
+    " transition-colors focus-visible:ring-[3px] aria-invalid:ring-[3px]"
+)
+
+SWITCH_CLS = (
+    "data-[state=checked]:bg-primary data-[state=unchecked]:bg-input"
+    " focus-visible:border-ring focus-visible:ring-ring/50"
+    " aria-invalid:ring-destructive/20 dark:aria-invalid:ring-destructive/40"
+    " dark:data-[state=unchecked]:bg-input/80"
+    " shrink-0 rounded-full border border-transparent"
+    " focus-visible:ring-[3px] aria-invalid:ring-[3px]"
+    " h-[18.4px] w-[32px]"
+)
+
+SELECT_TRIGGER_CLS = (
+    "border-input data-[placeholder]:text-muted-foreground"
+    " dark:bg-input/30 dark:hover:bg-input/50"
+    " focus-visible:border-ring focus-visible:ring-ring/50"
+    " aria-invalid:ring-destructive/20 dark:aria-invalid:ring-destructive/40"
+    " gap-1.5 rounded-lg border bg-transparent py-2 pr-2 pl-2.5 text-sm"
+    " transition-colors select-none focus-visible:ring-[3px]"
+    " aria-invalid:ring-[3px] h-8"
+    " inline-flex items-center justify-between w-full"
+)
+
+SEPARATOR_CLS = "bg-border shrink-0"
+
+SLIDER_CLS = "relative flex w-full touch-none select-none items-center"
+
+
+# ButtonGroup --------------------------------------------------------------
+
+BUTTON_GROUP_H = (
+    "flex w-fit items-stretch"
+    " [&>*:not(:first-child)]:rounded-l-none"
+    " [&>*:not(:last-child)]:rounded-r-none"
+    " [&>*+*]:border-l-0"
+)
+BUTTON_GROUP_V = (
+    "flex flex-col w-fit items-stretch"
+    " [&>*:not(:first-child)]:rounded-t-none"
+    " [&>*:not(:last-child)]:rounded-b-none"
+    " [&>*+*]:border-t-0"
+)
@@ -0,0 +1,534 @@
+"""Render resolved component JSON to static HTML.
+
+Produces markup with the Tailwind utility classes the React/shadcn renderer
+uses, so a page painted from it matches the live renderer until that takes
+over.  The input is a tree with no templates left in it: see
+:mod:`prefab_ui.prerender.resolve` for evaluating a tree against state.
+"""
+
+from __future__ import annotations
+
+from html import escape
+from typing import Any
+
+from prefab_ui.expr.values import to_string
+from prefab_ui.prerender.classes import (
+    ALERT_BASE,
+    ALERT_DESCRIPTION_CLS,
+    ALERT_TITLE_CLS,
+    ALERT_VARIANTS,
+    BADGE_BASE,
+    BADGE_VARIANTS,
+    BUTTON_BASE,
+    BUTTON_GROUP_H,
+    BUTTON_GROUP_V,
+    BUTTON_SIZES,
+    BUTTON_VARIANT_RING_OVERRIDE,
+    BUTTON_VARIANTS,
+    CARD_CLS,
+    CARD_CONTENT_CLS,
+    CARD_DESCRIPTION_CLS,
+    CARD_FOOTER_CLS,
+    CARD_HEADER_CLS,
+    CARD_TITLE_CLS,
+    CHECKBOX_CLS,
+    INPUT_CLS,
+    LABEL_CLS,
+    SELECT_TRIGGER_CLS,
+    SEPARATOR_CLS,
+    SLIDER_CLS,
+    SWITCH_CLS,
+    TEXTAREA_CLS,
+)
+
+# ---------------------------------------------------------------------------
+#  Helpers
+# ---------------------------------------------------------------------------
+
+
+def _cls(*parts: Any) -> str:
+    """Merge non-empty class string fragments into an attribute value.
+
+    Implements minimal tailwind-merge logic: when a later fragment overrides a
+    border-color (e.g. ``border-border`` vs ``border-transparent``), the earlier
+    one is stripped so the override wins regardless of CSS source order.
+    Quotes are escaped, since ``cssClass`` can come from state.
+    """
+    merged = " ".join(to_string(p) for p in parts if p).replace('"', "&quot;")
+    # If a real border color class appears, remove the transparent override
+    if "border-border" in merged or "border-input" in merged:
+        merged = merged.replace("border-transparent", "").strip()
+        # collapse any double spaces
+        while "  " in merged:
+            merged = merged.replace("  ", " ")
+    return merged
+
+
+def _gap_style(gap: int | list[int | None] | None) -> str:
+    """Convert gap to inline CSS style string (matching React layout.tsx)."""
+    if gap is None:
+        return ""
+    if isinstance(gap, (int, float)):
+        return f"gap: {gap * 0.25}rem"
+    # [x, y] tuple
+    parts: list[str] = []
+    if gap[0] is not None:
+        parts.append(f"column-gap: {gap[0] * 0.25}rem")
+    if gap[1] is not None:
+        parts.append(f"row-gap: {gap[1] * 0.25}rem")
+    return "; ".join(parts)
+
+
+def _escape(value: Any) -> str:
+    """HTML-escape a prop value, stringifying resolved non-string values.
+
+    Templates can resolve to numbers or booleans; React renders numbers as
+    text and drops ``null``, ``undefined`` and booleans.
+    """
+    if isinstance(value, str):
+        return escape(value)
+    if value is None or isinstance(value, bool):
+        return ""
+    return escape(to_string(value))
+
+
+def _style_attr(style: str) -> str:
+    """Build a style='...' attribute string, or empty string."""
+    return f' style="{_escape(style)}"' if style else ""
+
+
+def _text(node: dict[str, Any]) -> str:
+    """Extract text content from a node, HTML-escaped."""
+    for key in ("text", "content", "label"):
+        value = node.get(key)
+        if value is not None and value != "":
+            return _escape(value)
+    return ""
+
+
+def _children_html(node: dict[str, Any]) -> str:
+    """Render all children of a node."""
+    children = node.get("children")
+    if not children:
+        return ""
+    return "".join(render_json(c) for c in children)
+
+
+# ---------------------------------------------------------------------------
+#  Component renderers
+# ---------------------------------------------------------------------------
+
+
+def _render_row(n: dict[str, Any]) -> str:
+    gap = _gap_style(n.get("gap"))
+    cls = _cls("flex flex-row", n.get("cssClass"))
+    return f'<div class="{cls}"{_style_attr(gap)}>{_children_html(n)}</div>'
+
+
+def _render_column(n: dict[str, Any]) -> str:
+    gap = _gap_style(n.get("gap"))
+    cls = _cls("flex flex-col", n.get("cssClass"))
+    return f'<div class="{cls}"{_style_attr(gap)}>{_children_html(n)}</div>'
+
+
+def _render_grid(n: dict[str, Any]) -> str:
+    parts: list[str] = []
+    cols = n.get("columns")
+    if cols:
+        parts.append(f"grid-template-columns: repeat({cols}, minmax(0, 1fr))")
+    gap = _gap_style(n.get("gap"))
+    if gap:
+        parts.append(gap)
+    cls = _cls("grid", n.get("cssClass"))
+    return (
+        f'<div class="{cls}"{_style_attr("; ".join(parts))}>{_children_html(n)}</div>'
+    )
+
+
+def _render_div(n: dict[str, Any]) -> str:
+    cls = _cls(n.get("cssClass"))
+    inner = _children_html(n) or _text(n)
+    return f'<div class="{cls}">{inner}</div>' if cls else f"<div>{inner}</div>"
+
+
+def _render_span(n: dict[str, Any]) -> str:
+    cls = _cls(n.get("cssClass"))
+    inner = _children_html(n) or _text(n)
+    return f'<span class="{cls}">{inner}</span>' if cls else f"<span>{inner}</span>"
+
+
+def _render_text(n: dict[str, Any]) -> str:
+    cls = _cls(n.get("cssClass"))
+    txt = _text(n)
+    return f'<span class="{cls}">{txt}</span>' if cls else f"<span>{txt}</span>"
+
+
+def _render_heading(n: dict[str, Any]) -> str:
+    level = n.get("level", 1)
+    styles = {
+        1: "text-3xl font-semibold tracking-tight",
+        2: "text-2xl font-semibold tracking-tight",
+        3: "text-xl font-semibold tracking-tight",
+        4: "text-lg font-semibold tracking-tight",
+    }
+    cls = _cls(styles.get(level, styles[1]), n.get("cssClass"))
+    tag = f"h{level}"
+    txt = _text(n) or _children_html(n)
+    return f'<{tag} class="{cls}">{txt}</{tag}>'
+
+
+def _render_typography(tag: str, base_cls: str, n: dict[str, Any]) -> str:
+    cls = _cls(base_cls, n.get("cssClass"))
+    txt = _text(n) or _children_html(n)
+    return f'<{tag} class="{cls}">{txt}</{tag}>'
+
+
+def _render_button(n: dict[str, Any]) -> str:
+    variant = n.get("variant", "default")
+    size = n.get("size", "default")
+    disabled = n.get("disabled", False)
+
+    variant_cls = BUTTON_VARIANTS.get(variant, BUTTON_VARIANTS["default"])
+    size_cls = BUTTON_SIZES.get(size, BUTTON_SIZES["default"])
+
+    # For non-destructive colored variants, keep the default ring behavior
+    base = BUTTON_BASE
+    if variant in BUTTON_VARIANT_RING_OVERRIDE:
+        base = base.replace("focus-visible:ring-ring/50 ", "")
+
+    cls = _cls(base, variant_cls, size_cls, n.get("cssClass"))
+    disabled_attr = " disabled" if disabled else ""
+    label = _escape(n.get("label", ""))
+    return f'<button data-slot="button" class="{cls}"{disabled_attr}>{label}</button>'
+
+
+def _render_badge(n: dict[str, Any]) -> str:
+    variant = n.get("variant", "default")
+    variant_cls = BADGE_VARIANTS.get(variant, BADGE_VARIANTS["default"])
+    cls = _cls(BADGE_BASE, variant_cls, n.get("cssClass"))
+    label = _escape(n.get("label", ""))
+    return f'<span data-slot="badge" data-variant="{_escape(variant)}" class="{cls}">{label}</span>'
+
+
+def _render_card(n: dict[str, Any]) -> str:
+    cls = _cls(CARD_CLS, n.get("cssClass"))
+    return f'<div data-slot="card" class="{cls}">{_children_html(n)}</div>'
+
+
+def _render_card_header(n: dict[str, Any]) -> str:
+    cls = _cls(CARD_HEADER_CLS, n.get("cssClass"))
+    return f'<div data-slot="card-header" class="{cls}">{_children_html(n)}</div>'
+
+
+def _render_card_title(n: dict[str, Any]) -> str:
+    cls = _cls(CARD_TITLE_CLS, n.get("cssClass"))
+    return f'<div data-slot="card-title" class="{cls}">{_text(n)}</div>'
+
+
+def _render_card_description(n: dict[str, Any]) -> str:
+    cls = _cls(CARD_DESCRIPTION_CLS, n.get("cssClass"))
+    return f'<div data-slot="card-description" class="{cls}">{_text(n)}</div>'
+
+
+def _render_card_content(n: dict[str, Any]) -> str:
+    cls = _cls(CARD_CONTENT_CLS, n.get("cssClass"))
+    return f'<div data-slot="card-content" class="{cls}">{_children_html(n)}</div>'
+
+
+def _render_card_footer(n: dict[str, Any]) -> str:
+    cls = _cls(CARD_FOOTER_CLS, n.get("cssClass"))
+    return f'<div data-slot="card-footer" class="{cls}">{_children_html(n)}</div>'
+
+
+def _render_alert(n: dict[str, Any]) -> str:
+    variant = n.get("variant", "default")
+    variant_cls = ALERT_VARIANTS.get(variant, ALERT_VARIANTS["default"])
+    cls = _cls(ALERT_BASE, variant_cls, n.get("cssClass"))
+    return (
+        f'<div data-slot="alert" role="alert" class="{cls}">{_children_html(n)}</div>'
+    )
+
+
+def _render_alert_title(n: dict[str, Any]) -> str:
+    cls = _cls(ALERT_TITLE_CLS, n.get("cssClass"))
+    return f'<div data-slot="alert-title" class="{cls}">{_text(n)}</div>'
+
+
+def _render_alert_description(n: dict[str, Any]) -> str:
+    cls = _cls(ALERT_DESCRIPTION_CLS, n.get("cssClass"))
+    return f'<div data-slot="alert-description" class="{cls}">{_text(n)}</div>'
+
+
+def _render_input(n: dict[str, Any]) -> str:
+    cls = _cls(INPUT_CLS, n.get("cssClass"))
+    input_type = n.get("inputType") or n.get("type", "text")
+    if input_type == "Input":
+        input_type = "text"
+    placeholder = n.get("placeholder", "")
+    disabled = " disabled" if n.get("disabled") else ""
+    name = f' name="{_escape(n["name"])}"' if n.get("name") else ""
+    return (
+        f'<input data-slot="input" type="{_escape(input_type)}"'
+        f' class="{cls}" placeholder="{_escape(placeholder)}"{name}{disabled} />'
+    )
+
+
+def _render_textarea(n: dict[str, Any]) -> str:
+    cls = _cls(TEXTAREA_CLS, n.get("cssClass"))
+    placeholder = n.get("placeholder", "")
+    disabled = " disabled" if n.get("disabled") else ""
+    name = f' name="{_escape(n["name"])}"' if n.get("name") else ""
+    return (
+        f'<textarea data-slot="textarea" class="{cls}"'
+        f' placeholder="{_escape(placeholder)}"{name}{disabled}></textarea>'
+    )
+
+
+def _render_label(n: dict[str, Any]) -> str:
+    cls = _cls(LABEL_CLS, n.get("cssClass"))
+    txt = _escape(n.get("text") or n.get("content") or "")
+    return f'<label data-slot="label" class="{cls}">{txt}</label>'
+
+
+def _render_checkbox(n: dict[str, Any]) -> str:
+    label = n.get("label")
+    checked = n.get("checked", False)
+    name = n.get("name")
+    disabled = n.get("disabled", False)
+
+    state = "checked" if checked else "unchecked"
+    disabled_attr = " disabled" if disabled else ""
+    name_attr = f' name="{_escape(name)}"' if name else ""
+    id_attr = f' id="checkbox-{_escape(name)}"' if name else ""
+    # Checked indicator: SVG checkmark matching shadcn's CheckIcon
+    check_svg = (
+        (
+            '<svg class="size-3.5 text-current" xmlns="http://www.w3.org/2000/svg"'
+            ' viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="3"'
+            ' stroke-linecap="round" stroke-linejoin="round">'
+            '<path d="M20 6 9 17l-5-5"/></svg>'
+        )
+        if checked
+        else ""
+    )
+    cb = (
+        f'<button role="checkbox" data-state="{state}"'
+        f' class="{CHECKBOX_CLS}"{id_attr}{name_attr}{disabled_attr}>'
+        f"{check_svg}</button>"
+    )
+    if label:
+        label_for = f' for="checkbox-{_escape(name)}"' if name else ""
+        return (
+            f'<div class="flex items-center space-x-2">{cb}'
+            f'<label class="{LABEL_CLS} cursor-pointer"{label_for}>{_escape(label)}</label>'
+            f"</div>"
+        )
+    return cb
+
+
+def _render_switch(n: dict[str, Any]) -> str:
+    label = n.get("label")
+    checked = n.get("checked", False)
+    name = n.get("name")
+
+    state = "checked" if checked else "unchecked"
+    name_attr = f' name="{_escape(name)}"' if name else ""
+    id_attr = f' id="switch-{_escape(name)}"' if name else ""
+    sw = (
+        f'<button role="switch" data-state="{state}"'
+        f' class="{SWITCH_CLS}"{id_attr}{name_attr}>'
+        f"</button>"
+    )
+    if label:
+        label_for = f' for="switch-{_escape(name)}"' if name else ""
+        return (
+            f'<div class="flex items-center space-x-2">{sw}'
+            f'<label class="{LABEL_CLS} cursor-pointer"{label_for}>{_escape(label)}</label>'
+            f"</div>"
+        )
+    return sw
+
+
+def _render_radio_group(n: dict[str, Any]) -> str:
+    name = n.get("name")
+    items = n.get("children", [])
+    inner_parts: list[str] = []
+    for item in items:
+        if item.get("type") != "Radio":
+            continue
+        value = item.get("value", "")
+        label = item.get("label", "")
+        checked = item.get("checked", False)
+        radio_id = f"radio-{name or ''}-{value}"
+        state = "checked" if checked else "unchecked"
+        radio_cls = (
+            "border-input text-primary dark:bg-input/30"
+            " focus-visible:border-ring focus-visible:ring-ring/50"
+            " flex size-4 rounded-full focus-visible:ring-[3px]"
+        )
+        radio_el = f'<button role="radio" data-state="{state}" class="{radio_cls}" id="{_escape(radio_id)}"></button>'
+        if label:
+            label_el = f'<label class="{LABEL_CLS} cursor-pointer" for="{_escape(radio_id)}">{_escape(label)}</label>'
+            inner_parts.append(
+                f'<div class="flex items-center space-x-2">{radio_el}{label_el}</div>'
+            )
+        else:
+            inner_parts.append(radio_el)
+
+    cls = _cls("grid gap-2", n.get("cssClass"))
+    return f'<div role="radiogroup" class="{cls}">{"".join(inner_parts)}</div>'
+
+
+def _render_select(n: dict[str, Any]) -> str:
+    placeholder = n.get("placeholder", "")
+    cls = _cls(SELECT_TRIGGER_CLS, n.get("cssClass"))
+    return (
+        f'<button data-slot="select-trigger" class="{cls}">'
+        f'<span data-slot="select-value" data-placeholder class="flex flex-1 text-left">'
+        f"{_escape(placeholder)}</span>"
+        f'<svg class="text-muted-foreground size-4" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><path d="m6 9 6 6 6-6"/></svg>'
+        f"</button>"
+    )
+
+
+def _render_slider(n: dict[str, Any]) -> str:
+    cls = _cls(SLIDER_CLS, n.get("cssClass"))
+    return (
+        f'<div class="{cls}" data-orientation="horizontal">'
+        f'<span class="bg-muted relative rounded-full data-[orientation=horizontal]:h-1 data-[orientation=horizontal]:w-full" data-orientation="horizontal">'
+        f'<span class="bg-primary absolute rounded-full data-[orientation=horizontal]:h-full" style="left: 0%; right: 50%;" data-orientation="horizontal"></span>'
+        f"</span>"
+        f'<span class="border-ring ring-ring/50 relative size-3 rounded-full border bg-white"></span>'
+        f"</div>"
+    )
+
+
+def _render_separator(n: dict[str, Any]) -> str:
+    orientation = n.get("orientation", "horizontal")
+    orient_cls = "h-px w-full" if orientation == "horizontal" else "h-full w-px"
+    cls = _cls(SEPARATOR_CLS, orient_cls, n.get("cssClass"))
+    return f'<div role="separator" data-orientation="{_escape(orientation)}" class="{cls}"></div>'
+
+
+def _render_button_group(n: dict[str, Any]) -> str:
+    orientation = n.get("orientation", "horizontal")
+    base = BUTTON_GROUP_H if orientation == "horizontal" else BUTTON_GROUP_V
+    cls = _cls(base, n.get("cssClass"))
+    return (
+        f'<div role="group" data-slot="button-group" data-orientation="{_escape(orientation)}" class="{cls}">'
+        f"{_children_html(n)}</div>"
+    )
+
+
+def _render_code(n: dict[str, Any]) -> str:
+    cls = _cls("rounded-md bg-muted p-4 text-sm overflow-x-auto", n.get("cssClass"))
+    code = _escape(n.get("code") or n.get("content") or "")
+    return f'<pre class="{cls}"><code>{code}</code></pre>'
+
+
+def _render_image(n: dict[str, Any]) -> str:
+    src = _escape(n.get("src", ""))
+    alt = _escape(n.get("alt", ""))
+    cls = _cls(n.get("cssClass"))
+    style_parts: list[str] = []
+    if n.get("width"):
+        style_parts.append(f"width: {n['width']}")
+    if n.get("height"):
+        style_parts.append(f"height: {n['height']}")
+    cls_attr = f' class="{cls}"' if cls else ""
+    style = _style_attr("; ".join(style_parts))
+    return f'<img src="{src}" alt="{alt}"{cls_attr}{style} />'
+
+
+def _render_markdown(n: dict[str, Any]) -> str:
+    cls = _cls("prose dark:prose-invert max-w-none", n.get("cssClass"))
+    txt = _escape(n.get("content") or n.get("text") or "")
+    return f'<div class="{cls}">{txt}</div>'
+
+
+def _render_foreach(n: dict[str, Any]) -> str:
+    # ForEach renders its template children once (no data expansion in static preview)
+    return _children_html(n)
+
+
+# ---------------------------------------------------------------------------
+#  Dispatcher
+# ---------------------------------------------------------------------------
+
+_RENDERERS: dict[str, Any] = {
+    # Layout
+    "Row": _render_row,
+    "Column": _render_column,
+    "Grid": _render_grid,
+    "Div": _render_div,
+    "Span": _render_span,
+    # Typography
+    "Text": _render_text,
+    "Heading": _render_heading,
+    "H1": lambda n: _render_typography(
+        "h1", "text-3xl font-semibold tracking-tight", n
+    ),
+    "H2": lambda n: _render_typography(
+        "h2", "text-2xl font-semibold tracking-tight", n
+    ),
+    "H3": lambda n: _render_typography("h3", "text-xl font-semibold tracking-tight", n),
+    "H4": lambda n: _render_typography("h4", "text-lg font-semibold tracking-tight", n),
+    "P": lambda n: _render_typography("p", "leading-7", n),
+    "Lead": lambda n: _render_typography("p", "text-xl text-muted-foreground", n),
+    "Large": lambda n: _render_typography("div", "text-lg font-semibold", n),
+    "Small": lambda n: _render_typography(
+        "small", "text-sm font-medium leading-none", n
+    ),
+    "Muted": lambda n: _render_typography("p", "text-sm text-muted-foreground", n),
+    "InlineCode": lambda n: _render_typography(
+        "code",
+        "relative rounded bg-muted px-[0.3rem] py-[0.2rem] font-mono text-sm font-semibold",
+        n,
+    ),
+    "BlockQuote": lambda n: _render_typography(
+        "blockquote", "mt-6 border-l-2 pl-6 italic", n
+    ),
+    # Interactive
+    "Button": _render_button,
+    "Badge": _render_badge,
+    "ButtonGroup": _render_button_group,
+    # Card
+    "Card": _render_card,
+    "CardHeader": _render_card_header,
+    "CardTitle": _render_card_title,
+    "CardDescription": _render_card_description,
+    "CardContent": _render_card_content,
+    "CardFooter": _render_card_footer,
+    # Alert
+    "Alert": _render_alert,
+    "AlertTitle": _render_alert_title,
+    "AlertDescription": _render_alert_description,
+    # Form
+    "Input": _render_input,
+    "Textarea": _render_textarea,
+    "Label": _render_label,
+    "Checkbox": _render_checkbox,
+    "Switch": _render_switch,
+    "RadioGroup": _render_radio_group,
+    "Radio": lambda n: "",  # consumed by RadioGroup
+    "Select": _render_select,
+    "SelectOption": lambda n: "",  # consumed by Select
+    "Slider": _render_slider,
+    # Display
+    "Separator": _render_separator,
+    "Code": _render_code,
+    "Image": _render_image,
+    "Markdown": _render_markdown,
+    # Control flow
+    "ForEach": _render_foreach,
+}
+
+
+def render_json(node: dict[str, Any]) -> str:
+    """Render a component JSON tree to an HTML string."""
+    comp_type = node.get("type", "")
+    renderer = _RENDERERS.get(comp_type)
+    if renderer is None:
+        # Unknown type — render children if any, otherwise return empty
+        return _children_html(node)
+    return renderer(node)
@@ -0,0 +1,203 @@
+"""Evaluate a component tree against state, the way the renderer does.
+
+Mirrors ``RenderNode`` in ``renderer/src/renderer.tsx``: ``{{ }}`` templates
+in props are interpolated, ``$ref`` nodes are inlined from ``defs``,
+``ForEach`` is expanded over its list, ``Condition`` keeps the children of
+the first matching case and ``Slot`` renders the component tree stored in
+state.  ``let`` bindings scope values to a subtree.  The result contains
+only plain components, ready for :func:`prefab_ui.prerender.html.render_json`.
+"""
+
+from __future__ import annotations
+
+from collections import ChainMap
+from collections.abc import Mapping
+from typing import Any
+
+from prefab_ui.expr import ExpressionError, evaluate, interpolate
+from prefab_ui.expr.values import UNDEFINED, get_property, truthy
+from prefab_ui.wire.nodes import ACTION_PROPS
+
+_Scope = ChainMap[str, Any]
+
+
+def _interpolate_value(value: Any, ctx: Mapping[str, Any]) -> Any:
+    if isinstance(value, str):
+        return interpolate(value, ctx)
+    if isinstance(value, list):
+        return [_interpolate_value(item, ctx) for item in value]
+    if isinstance(value, dict):
+        return {key: _interpolate_value(item, ctx) for key, item in value.items()}
+    return value
+
+
+def _resolve_dot_path(path: str, data: Mapping[str, Any]) -> Any:
+    current: Any = data
+    for part in path.split("."):
+        current = get_property(current, part)
+        if current is UNDEFINED:
+            break
+    return current
+
+
+def _condition(expr: Any, ctx: Mapping[str, Any]) -> bool:
+    """Port of ``evaluateCondition`` from ``renderer/src/conditions.ts``."""
+    trimmed = expr.strip() if isinstance(expr, str) else ""
+    if not trimmed:
+        return False
+    inner = trimmed
+    if inner.startswith("{{") and inner.endswith("}}"):
+        inner = inner[2:-2].strip()
+    try:
+        return truthy(evaluate(inner, ctx))
+    except ExpressionError:
+        return truthy(ctx.get(trimmed, UNDEFINED))
+
+
+def _with_let(node: dict[str, Any], ctx: _Scope) -> _Scope:
+    bindings = node.get("let")
+    if not isinstance(bindings, dict) or not bindings:
+        return ctx
+    return ctx.new_child(_interpolate_value(bindings, ctx))
+
+
+def _resolve_children(
+    children: Any,
+    ctx: _Scope,
+    state: Mapping[str, Any],
+    defs: Mapping[str, Any],
+    resolving: frozenset[str],
+) -> list[dict[str, Any]]:
+    if not isinstance(children, list):
+        return []
+    resolved: list[dict[str, Any]] = []
+    for child in children:
+        resolved += _resolve(child, ctx, state, defs, resolving)
+    return resolved
+
+
+def _resolve_ref(
+    node: dict[str, Any],
+    ctx: _Scope,
+    state: Mapping[str, Any],
+    defs: Mapping[str, Any],
+    resolving: frozenset[str],
+) -> list[dict[str, Any]]:
+    name = node["$ref"]
+    target = defs.get(name)
+    if target is None or name in resolving:
+        return []
+    resolved = _resolve(target, _with_let(node, ctx), state, defs, resolving | {name})
+    css_class = node.get("cssClass")
+    if css_class:
+        return [{"type": "Div", "cssClass": css_class, "children": resolved}]
+    return resolved
+
+
+def _resolve_foreach(
+    node: dict[str, Any],
+    ctx: _Scope,
+    state: Mapping[str, Any],
+    defs: Mapping[str, Any],
+    resolving: frozenset[str],
+) -> list[dict[str, Any]]:
+    key = node.get("key")
+    if key is None:
+        key = node.get("itemKey")
+    if isinstance(key, str):
+        key = interpolate(key, ctx)
+    items = _resolve_dot_path(key, ctx) if isinstance(key, str) and key else []
+    if not isinstance(items, list):
+        return []
+
+    expanded: list[dict[str, Any]] = []
+    for index, item in enumerate(items):
+        item_ctx = _with_let(node, ctx.new_child({"$index": index, "$item": item}))
+        expanded += _resolve_children(
+            node["children"], item_ctx, state, defs, resolving
+        )
+    # Without a cssClass the wrapper uses display:contents so iterated
+    # items participate in the parent's layout.
+    css_class = node.get("cssClass")
+    wrapper = f"w-full {css_class}" if css_class else "contents"
+    return [{"type": "Div", "cssClass": wrapper, "children": expanded}]
+
+
+def _resolve_condition(
+    node: dict[str, Any],
+    ctx: _Scope,
+    state: Mapping[str, Any],
+    defs: Mapping[str, Any],
+    resolving: frozenset[str],
+) -> list[dict[str, Any]]:
+    for case in node.get("cases") or []:
+        if isinstance(case, dict) and _condition(case.get("when"), ctx):
+            return _resolve_children(case.get("children"), ctx, state, defs, resolving)
+    return _resolve_children(node.get("else"), ctx, state, defs, resolving)
+
+
+def _resolve_slot(
+    node: dict[str, Any],
+    ctx: _Scope,
+    state: Mapping[str, Any],
+    defs: Mapping[str, Any],
+    resolving: frozenset[str],
+) -> list[dict[str, Any]]:
+    name = node.get("name")
+    if isinstance(name, str):
+        name = interpolate(name, ctx)
+    content = _resolve_dot_path(name, state) if isinstance(name, str) and name else None
+    if isinstance(content, dict) and "type" in content:
+        return _resolve(content, ctx, state, defs, resolving)
+    return _resolve_children(node.get("children"), ctx, state, defs, resolving)
+
+
+def _resolve(
+    node: Any,
+    ctx: _Scope,
+    state: Mapping[str, Any],
+    defs: Mapping[str, Any],
+    resolving: frozenset[str],
+) -> list[dict[str, Any]]:
+    if not isinstance(node, dict):
+        return []
+    if isinstance(node.get("$ref"), str):
+        return _resolve_ref(node, ctx, state, defs, resolving)
+
+    node_type = node.get("type")
+    if node_type == "ForEach" and node.get("children"):
+        return _resolve_foreach(node, ctx, state, defs, resolving)
+    if node_type == "Condition":
+        return _resolve_condition(node, ctx, state, defs, resolving)
+    if node_type == "Slot":
+        return _resolve_slot(node, ctx, state, defs, resolving)
+
+    resolved: dict[str, Any] = {}
+    for key, value in node.items():
+        if key in ("type", "children") or (
+            key in ACTION_PROPS and isinstance(value, (dict, list))
+        ):
+            resolved[key] = value
+        else:
+            resolved[key] = _interpolate_value(value, ctx)
+    if "children" in node:
+        resolved["children"] = _resolve_children(
+            node["children"], _with_let(node, ctx), state, defs, resolving
+        )
+    return [resolved]
+
+
+def resolve_tree(
+    view: Mapping[str, Any],
+    state: Mapping[str, Any] | None = None,
+    defs: Mapping[str, Any] | None = None,
+) -> list[dict[str, Any]]:
+    """Evaluate ``view`` (component JSON) against ``state``.
+
+    Returns the top-level nodes the view renders to: usually one, but a
+    ``Condition`` or ``Slot`` at the root can produce none or several.
+    ``defs`` maps ``$ref`` names to their component JSON, as in the
+    ``defs`` key of :meth:`PrefabApp.to_json`.
+    """
+    state = {} if state is None else state
+    return _resolve(view, ChainMap(dict(state)), state, defs or {}, frozenset())
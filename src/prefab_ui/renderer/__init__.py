@@ -8,14 +8,23 @@ Set ``PREFAB_RENDERER_URL`` to load renderer assets from an external origin
 instead — useful for local development with ``npx vite preview`` or a CDN::
 
     PREFAB_RENDERER_URL=http://localhost:4173 uv run python my_server.py
+
+The bundle is ~3 MB, so it is read once per process and cached along with
+its ``<head>`` slice.  The cache is keyed on the bundle's mtime/size and the
+current ``PREFAB_RENDERER_URL``, so rebuilding the renderer or changing the
+override is picked up on the next call.
 """
 
 from __future__ import annotations
 
+import dataclasses
 import os
+import threading
 from pathlib import Path
 from urllib.parse import urlparse
 
+from prefab_ui.renderer.compression import StaticSegment, compress_static
+
 _BUNDLED_HTML = Path(__file__).parent / "app.html"
 
 _EXTERNAL_HEAD = """\
@@ -51,17 +60,26 @@ def _get_origin(url: str) -> str:
     return origin
 
 
-def get_renderer_head() -> str:
-    """Return the renderer ``<head>`` content (JS, CSS, meta tags).
+@dataclasses.dataclass(frozen=True)
+class _RendererAssets:
+    """Loaded renderer resources for one bundle version or override URL."""
 
-    For bundled mode, extracts everything between ``<head>`` and
-    ``</head>`` from the self-contained HTML bundle.  For external mode,
-    returns ``<link>``/``<script>`` tags pointing at the external URL.
-    """
-    override = os.environ.get("PREFAB_RENDERER_URL")
-    if override:
-        return _EXTERNAL_HEAD.format(base_url=override.rstrip("/"))
-    html = _BUNDLED_HTML.read_text(encoding="utf-8")
+    key: tuple[object, ...]
+    html: str
+    head: str
+    head_bytes: bytes
+    resource_domains: tuple[str, ...]
+    compressed_head: dict[int, StaticSegment] = dataclasses.field(
+        default_factory=dict, compare=False, repr=False
+    )
+
+
+_assets_cache: _RendererAssets | None = None
+_assets_lock = threading.Lock()
+
+
+def _extract_head(html: str) -> str:
+    """Return everything between ``<head>`` and ``</head>`` in the bundle."""
     head_start = html.index("<head>") + len("<head>")
     # The bundled JS contains HTML string literals (e.g. "<head></head><body>"),
     # so we must search for </head> *after* the first real </script> tag.
@@ -72,6 +90,89 @@ def get_renderer_head() -> str:
     return html[head_start:head_end].rstrip()
 
 
+def _assets_key() -> tuple[object, ...]:
+    """Identify the renderer source the next lookup should come from."""
+    override = os.environ.get("PREFAB_RENDERER_URL")
+    if override:
+        return ("url", override)
+    stat = _BUNDLED_HTML.stat()
+    return ("bundle", stat.st_mtime_ns, stat.st_size)
+
+
+def _load_assets(key: tuple[object, ...]) -> _RendererAssets:
+    """Build renderer assets from scratch (no caching)."""
+    if key[0] == "url":
+        base_url = str(key[1]).rstrip("/")
+        html = _EXTERNAL_TEMPLATE.format(base_url=base_url)
+        head = _EXTERNAL_HEAD.format(base_url=base_url)
+        domains: tuple[str, ...] = (_get_origin(base_url),)
+    else:
+        html = _BUNDLED_HTML.read_text(encoding="utf-8")
+        head = _extract_head(html)
+        domains = ()
+    return _RendererAssets(
+        key=key,
+        html=html,
+        head=head,
+        head_bytes=head.encode("utf-8"),
+        resource_domains=domains,
+    )
+
+
+def _get_assets() -> _RendererAssets:
+    """Return cached renderer assets, reloading if the source changed."""
+    global _assets_cache
+    key = _assets_key()
+    cached = _assets_cache
+    if cached is not None and cached.key == key:
+        return cached
+    with _assets_lock:
+        cached = _assets_cache
+        if cached is None or cached.key != key:
+            cached = _load_assets(key)
+            _assets_cache = cached
+        return cached
+
+
+def clear_renderer_cache() -> None:
+    """Drop the cached renderer assets so the next call reloads them."""
+    global _assets_cache
+    with _assets_lock:
+        _assets_cache = None
+
+
+def get_renderer_head() -> str:
+    """Return the renderer ``<head>`` content (JS, CSS, meta tags).
+
+    For bundled mode, extracts everything between ``<head>`` and
+    ``</head>`` from the self-contained HTML bundle.  For external mode,
+    returns ``<link>``/``<script>`` tags pointing at the external URL.
+    """
+    return _get_assets().head
+
+
+def get_renderer_head_bytes() -> bytes:
+    """Return :func:`get_renderer_head` pre-encoded as UTF-8."""
+    return _get_assets().head_bytes
+
+
+def get_renderer_head_compressed(level: int = 9) -> StaticSegment:
+    """Return :func:`get_renderer_head_bytes` as a pre-compressed segment.
+
+    Compressed once per process (per ``level``) and reused; see
+    :mod:`prefab_ui.renderer.compression` for splicing it into responses.
+    """
+    assets = _get_assets()
+    segment = assets.compressed_head.get(level)
+    if segment is None:
+        with _assets_lock:
+            segment = assets.compressed_head.get(level)
+            if segment is None:
+                segment = compress_static(assets.head_bytes, level)
+                assets.compressed_head[level] = segment
+    return segment
+
+
 def get_renderer_html() -> str:
     """Return the renderer HTML.
 
@@ -79,10 +180,7 @@ def get_renderer_html() -> str:
     inlined.  When ``PREFAB_RENDERER_URL`` is set, returns a lightweight
     stub that loads assets from that external origin.
     """
-    override = os.environ.get("PREFAB_RENDERER_URL")
-    if override:
-        return _EXTERNAL_TEMPLATE.format(base_url=override.rstrip("/"))
-    return _BUNDLED_HTML.read_text(encoding="utf-8")
+    return _get_assets().html
 
 
 def get_renderer_csp() -> dict[str, list[str]]:
@@ -92,7 +190,4 @@ def get_renderer_csp() -> dict[str, list[str]]:
     needed.  When ``PREFAB_RENDERER_URL`` is set, returns the external
     origin so the host sandbox allows loading those assets.
     """
-    override = os.environ.get("PREFAB_RENDERER_URL")
-    if override:
-        return {"resource_domains": [_get_origin(override.rstrip("/"))]}
-    return {"resource_domains": []}
+    return {"resource_domains": list(_get_assets().resource_domains)}
@@ -0,0 +1,153 @@
+"""Content-hashed renderer assets for web servers.
+
+By default every Prefab page inlines the ~3 MB renderer.  A web backend can
+instead serve the renderer's JS and CSS as separate, immutable files whose
+names carry a content hash, so browsers download them once and cache them
+indefinitely.  Pages then only need a tiny shell that references them::
+
+    from prefab_ui.renderer.assets import CACHE_CONTROL, get_renderer_asset
+
+    @api.get("/_prefab/{name}")
+    def renderer_asset(name: str) -> Response:
+        asset = get_renderer_asset(name)
+        if asset is None:
+            raise HTTPException(404)
+        return Response(asset.content, media_type=asset.content_type,
+                        headers={"Cache-Control": CACHE_CONTROL, "ETag": asset.etag})
+
+    @api.get("/dashboard")
+    def dashboard() -> HTMLResponse:
+        return HTMLResponse(app.html(assets="hashed"))
+
+The assets are split out of the bundled ``app.html`` once per process and
+re-split automatically when the bundle changes on disk.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import threading
+
+from prefab_ui import renderer
+
+DEFAULT_PREFIX = "/_prefab"
+"""URL path the hashed asset names are resolved against by default."""
+
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+"""``Cache-Control`` value suitable for every hashed asset."""
+
+_SCRIPT_OPEN = '<script type="module" crossorigin>'
+_STYLE_OPEN = '<style rel="stylesheet" crossorigin>'
+
+_HASHED_HEAD = """\
+  <meta charset="UTF-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1.0">
+  <title>Prefab</title>
+  <script type="module" crossorigin src="{prefix}/{script}"></script>
+  <link rel="stylesheet" crossorigin href="{prefix}/{style}">"""
+
+
+@dataclasses.dataclass(frozen=True)
+class RendererAsset:
+    """One immutable renderer file, named by its content hash."""
+
+    name: str
+    content: bytes = dataclasses.field(repr=False)
+    content_type: str
+
+    @property
+    def etag(self) -> str:
+        """Strong ``ETag`` header value derived from the content hash."""
+        return f'"{self.name.split(".")[1]}"'
+
+
+@dataclasses.dataclass(frozen=True)
+class _HashedAssets:
+    key: tuple[object, ...]
+    script: RendererAsset
+    style: RendererAsset
+
+
+_cache: _HashedAssets | None = None
+_lock = threading.Lock()
+
+
+def _make_asset(stem: str, suffix: str, text: str, content_type: str) -> RendererAsset:
+    content = text.encode("utf-8")
+    digest = hashlib.sha256(content).hexdigest()[:16]
+    return RendererAsset(
+        name=f"{stem}.{digest}.{suffix}",
+        content=content,
+        content_type=content_type,
+    )
+
+
+def _split_bundle(key: tuple[object, ...]) -> _HashedAssets:
+    """Cut the inline ``<script>`` and ``<style>`` out of the bundle."""
+    html = renderer._BUNDLED_HTML.read_text(encoding="utf-8")
+    # Vite escapes </script> inside inline scripts, so the first literal
+    # closing tag after the opening one ends the renderer module.
+    script_start = html.index(_SCRIPT_OPEN) + len(_SCRIPT_OPEN)
+    script_end = html.index("</script>", script_start)
+    style_start = html.index(_STYLE_OPEN, script_end) + len(_STYLE_OPEN)
+    style_end = html.index("</style>", style_start)
+    return _HashedAssets(
+        key=key,
+        script=_make_asset(
+            "renderer",
+            "js",
+            html[script_start:script_end],
+            "text/javascript; charset=utf-8",
+        ),
+        style=_make_asset(
+            "renderer",
+            "css",
+            html[style_start:style_end],
+            "text/css; charset=utf-8",
+        ),
+    )
+
+
+def _get_hashed() -> _HashedAssets:
+    global _cache
+    stat = renderer._BUNDLED_HTML.stat()
+    key: tuple[object, ...] = (stat.st_mtime_ns, stat.st_size)
+    cached = _cache
+    if cached is not None and cached.key == key:
+        return cached
+    with _lock:
+        cached = _cache
+        if cached is None or cached.key != key:
+            cached = _split_bundle(key)
+            _cache = cached
+        return cached
+
+
+def get_renderer_assets() -> dict[str, RendererAsset]:
+    """Return every hashed renderer asset, keyed by file name."""
+    hashed = _get_hashed()
+    return {hashed.script.name: hashed.script, hashed.style.name: hashed.style}
+
+
+def get_renderer_asset(name: str) -> RendererAsset | None:
+    """Look up a hashed renderer asset by file name.
+
+    Returns ``None`` for unknown names, including names from an older
+    bundle — clients holding a stale page simply reload it.
+    """
+    return get_renderer_assets().get(name)
+
+
+def get_hashed_head(prefix: str = DEFAULT_PREFIX) -> str:
+    """Return ``<head>`` content that loads the renderer from hashed URLs.
+
+    ``prefix`` is the URL path (or absolute origin + path) where the
+    assets from :func:`get_renderer_assets` are mounted.
+    """
+    hashed = _get_hashed()
+    return _HASHED_HEAD.format(
+        prefix=prefix.rstrip("/"),
+        script=hashed.script.name,
+        style=hashed.style.name,
+    )
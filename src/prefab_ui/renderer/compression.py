@@ -0,0 +1,160 @@
+"""Splice pre-compressed static content into gzip/deflate responses.
+
+Most of a Prefab page is the same ~3 MB renderer bundle, so compressing the
+whole page per request wastes CPU.  :func:`compress_static` compresses a
+static block once into a self-contained run of raw deflate blocks;
+:func:`splice_compressed` then compresses only the per-request parts and
+stitches everything into one valid gzip or zlib stream::
+
+    head = compress_static(renderer_head_bytes)
+    body = splice_compressed([title_bytes, head, payload_bytes], "gzip")
+
+Each segment is compressed by a fresh compressor and ends on a full flush,
+so no segment back-references another and the concatenated blocks form a
+single deflate stream.  The trailing checksum is stitched together with
+``crc32_combine`` / ``adler32_combine`` (ported from zlib) so the static
+bytes are never re-scanned.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import struct
+import zlib
+from collections.abc import Iterable, Sequence
+from typing import Literal
+
+ContentEncoding = Literal["gzip", "deflate"]
+
+_GZIP_HEADER = b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff"
+_ZLIB_HEADER = b"\x78\x9c"
+_ADLER_BASE = 65521
+
+# ── Checksum combination (ported from zlib) ─────────────────────────
+
+
+def _gf2_times(matrix: Sequence[int], vector: int) -> int:
+    result = 0
+    i = 0
+    while vector:
+        if vector & 1:
+            result ^= matrix[i]
+        vector >>= 1
+        i += 1
+    return result
+
+
+def _gf2_compose(a: Sequence[int], b: Sequence[int]) -> list[int]:
+    """Return the operator that applies ``b`` then ``a``."""
+    return [_gf2_times(a, column) for column in b]
+
+
+def _crc32_shift(length: int) -> tuple[int, ...]:
+    """Return the GF(2) operator that appends ``length`` zero bytes to a CRC."""
+    # Operator for a single zero bit, squared three times for one zero byte.
+    op = [0xEDB88320] + [1 << n for n in range(31)]
+    for _ in range(3):
+        op = _gf2_compose(op, op)
+    result = [1 << n for n in range(32)]
+    while length:
+        if length & 1:
+            result = _gf2_compose(op, result)
+        op = _gf2_compose(op, op)
+        length >>= 1
+    return tuple(result)
+
+
+def crc32_combine(crc1: int, crc2: int, length2: int) -> int:
+    """Return the CRC-32 of ``a + b`` given ``crc32(a)``, ``crc32(b)``, ``len(b)``."""
+    return _gf2_times(_crc32_shift(length2), crc1) ^ crc2
+
+
+def adler32_combine(adler1: int, adler2: int, length2: int) -> int:
+    """Return the Adler-32 of ``a + b`` given both checksums and ``len(b)``."""
+    rem = length2 % _ADLER_BASE
+    sum1 = adler1 & 0xFFFF
+    sum2 = (rem * sum1) % _ADLER_BASE
+    sum1 += (adler2 & 0xFFFF) + _ADLER_BASE - 1
+    sum2 += ((adler1 >> 16) & 0xFFFF) + ((adler2 >> 16) & 0xFFFF) + _ADLER_BASE - rem
+    sum1 %= _ADLER_BASE
+    sum2 %= _ADLER_BASE
+    return sum1 | (sum2 << 16)
+
+
+# ── Segments ─────────────────────────────────────────────────────────
+
+
+@dataclasses.dataclass(frozen=True)
+class StaticSegment:
+    """A block of content compressed once for reuse in many responses."""
+
+    deflated: bytes
+    size: int
+    crc32: int
+    adler32: int
+    crc32_shift: tuple[int, ...] = dataclasses.field(repr=False)
+
+
+def compress_static(data: bytes, level: int = 9) -> StaticSegment:
+    """Compress ``data`` into a reusable, self-contained deflate segment.
+
+    This is the expensive step — call it once and keep the result.
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    deflated = compressor.compress(data) + compressor.flush(zlib.Z_FULL_FLUSH)
+    return StaticSegment(
+        deflated=deflated,
+        size=len(data),
+        crc32=zlib.crc32(data),
+        adler32=zlib.adler32(data),
+        crc32_shift=_crc32_shift(len(data)),
+    )
+
+
+def splice_compressed(
+    parts: Iterable[StaticSegment | bytes | Iterable[bytes]],
+    encoding: ContentEncoding,
+    level: int = 6,
+) -> bytes:
+    """Compress ``parts`` into one gzip or zlib (HTTP ``deflate``) stream.
+
+    ``StaticSegment`` parts are copied verbatim; ``bytes`` parts (or
+    iterables of ``bytes`` chunks) are compressed now.  Decompressing the
+    result yields the parts concatenated in order.
+    """
+    if encoding not in ("gzip", "deflate"):
+        raise ValueError(f"Unsupported encoding {encoding!r}: use 'gzip' or 'deflate'")
+
+    out: list[bytes] = [_GZIP_HEADER if encoding == "gzip" else _ZLIB_HEADER]
+    crc = 0
+    adler = 1
+    size = 0
+    compressor: zlib._Compress | None = None
+
+    for part in parts:
+        if isinstance(part, StaticSegment):
+            if compressor is not None:
+                out.append(compressor.flush(zlib.Z_FULL_FLUSH))
+                compressor = None
+            out.append(part.deflated)
+            crc = _gf2_times(part.crc32_shift, crc) ^ part.crc32
+            adler = adler32_combine(adler, part.adler32, part.size)
+            size += part.size
+            continue
+        if compressor is None:
+            compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+        for chunk in [part] if isinstance(part, bytes) else part:
+            out.append(compressor.compress(chunk))
+            crc = zlib.crc32(chunk, crc)
+            adler = zlib.adler32(chunk, adler)
+            size += len(chunk)
+
+    if compressor is None:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    out.append(compressor.flush(zlib.Z_FINISH))
+
+    if encoding == "gzip":
+        out.append(struct.pack("<II", crc, size & 0xFFFFFFFF))
+    else:
+        out.append(struct.pack(">I", adler))
+    return b"".join(out)
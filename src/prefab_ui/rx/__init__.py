@@ -102,6 +102,7 @@ class _IndexPath(NamedTuple):
 
 
 _Node = _BinOp | _UnaryOp | _Ternary | _Pipe | _DotPath | _IndexPath
+_NODE_TYPES = (_BinOp, _UnaryOp, _Ternary, _Pipe, _DotPath, _IndexPath)
 
 # Ops where RHS needs strict wrapping (parens at same precedence)
 _STRICT_RHS_OPS = frozenset({"-", "/", "&&", "||"})
@@ -174,13 +175,18 @@ def _resolve(raw: str | Callable[[], Rx] | _Node) -> str:
 
     if isinstance(raw, _Ternary):
         branch_prec = _PREC_TERNARY + 1
-        cond = _resolve_operand(raw.cond, _PREC_TERNARY)
+        # The condition is an ``or`` expression: a nested ternary there
+        # needs parentheses.
+        cond = _resolve_operand(raw.cond, _PREC_TERNARY, strict=True)
         if_true = _resolve_operand(raw.if_true, branch_prec)
         if_false = _resolve_operand(raw.if_false, branch_prec)
         return f"{cond} ? {if_true} : {if_false}"
 
     if isinstance(raw, _Pipe):
         inner_key = raw.expr.key
+        if raw.expr.prec == _PREC_TERNARY:
+            # A ternary's else branch would take the pipe with it.
+            inner_key = f"({inner_key})"
         if raw.arg is not None:
             return f"{inner_key} | {raw.name}:{_format_pipe_arg(raw.arg)}"
         return f"{inner_key} | {raw.name}"
@@ -203,6 +209,31 @@ def _resolve(raw: str | Callable[[], Rx] | _Node) -> str:
     return str(raw)  # pragma: no cover
 
 
+def _resolve_static(root: Rx) -> None:
+    """Memoize the keys of ``root`` and every unresolved node below it.
+
+    Nodes are resolved children-first from an explicit stack, so each
+    ``_resolve`` call only reads already-memoized child keys and deep
+    chains (thousands of terms) don't hit the recursion limit.
+    """
+    pending: list[tuple[Rx, bool]] = [(root, False)]
+    while pending:
+        node, children_done = pending.pop()
+        if object.__getattribute__(node, "_resolved") is not None:
+            continue
+        raw = object.__getattribute__(node, "_key")
+        if not children_done:
+            pending.append((node, True))
+            pending.extend(
+                (operand, False)
+                for operand in raw
+                if isinstance(operand, Rx)
+                and object.__getattribute__(operand, "_resolved") is None
+            )
+            continue
+        object.__setattr__(node, "_resolved", _resolve(raw))
+
+
 # Operator → precedence mapping (used by _resolve for _BinOp)
 _OP_PREC: dict[str, int] = {
     "+": _PREC_ADD,
@@ -257,13 +288,29 @@ class Rx:
         Rx("name").upper().truncate(20) # → {{ name | upper | truncate:20 }}
     """
 
-    __slots__ = ("_key", "_prec")
+    __slots__ = ("_key", "_prec", "_resolved", "_static")
 
     def __init__(
         self, key: str | Callable[[], Rx] | _Node, _prec: int = _PREC_ATOM
     ) -> None:
         object.__setattr__(self, "_key", key)
         object.__setattr__(self, "_prec", _prec)
+        object.__setattr__(self, "_resolved", key if isinstance(key, str) else None)
+        # Static trees (no forward references anywhere below) resolve to the
+        # same string forever, so their key is memoized on first access.
+        object.__setattr__(
+            self,
+            "_static",
+            isinstance(key, str)
+            or (
+                isinstance(key, _NODE_TYPES)
+                and all(
+                    object.__getattribute__(operand, "_static")
+                    for operand in key
+                    if isinstance(operand, Rx)
+                )
+            ),
+        )
 
     def __setattr__(self, name: str, value: object) -> None:
         raise AttributeError("Rx objects are immutable")
@@ -274,9 +321,17 @@ class Rx:
 
         Resolution walks the expression tree: leaf nodes return their key,
         operator nodes recurse into their children, and callable nodes
-        (forward references) invoke the callable on access.
+        (forward references) invoke the callable on access.  The result is
+        memoized unless a forward reference appears in the tree, since the
+        referenced object may not exist (or be named) yet.
         """
-        return _resolve(object.__getattribute__(self, "_key"))
+        resolved = object.__getattribute__(self, "_resolved")
+        if resolved is not None:
+            return resolved
+        if not object.__getattribute__(self, "_static"):
+            return _resolve(object.__getattribute__(self, "_key"))
+        _resolve_static(self)
+        return object.__getattribute__(self, "_resolved")
 
     @classmethod
     def __get_pydantic_core_schema__(cls, source_type: Any, handler: Any) -> Any:
@@ -0,0 +1,382 @@
+"""Patches between two versions of a state value.
+
+A tool that changes one item of a long list would otherwise send the
+whole list back for ``SetState`` to replace.  :func:`diff` compares the
+old and new values and returns the edits between them as JSON Patch
+operations (RFC 6902), which ``PatchState`` applies in the browser::
+
+    @mcp.tool
+    def complete(todo_id: int) -> list[dict]:
+        before = copy.deepcopy(todos)
+        todos[index_of(todo_id)]["done"] = True
+        return diff(before, todos)
+
+    CallTool("complete", arguments={"todo_id": "{{ $item.id }}"},
+             on_success=PatchState("todos", RESULT))
+
+The response then grows with the change, not with the list.
+
+Lists of objects that all have a unique ``id`` (or another ``key``) are
+matched by that key, so an inserted, removed or reordered item is one
+``add``, ``remove`` or ``move`` however long the list is.  Lists of
+unique strings or integers are matched by value the same way.  Other
+lists are compared position by position after skipping their common
+start and end.  :func:`apply_patch` applies a patch in Python, as the
+renderer does.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any
+
+__all__ = ["apply_patch", "diff"]
+
+Operation = dict[str, Any]
+"""One JSON Patch operation, such as ``{"op": "remove", "path": "/3"}``."""
+
+
+def diff(old: Any, new: Any, *, key: str = "id") -> list[Operation]:
+    """The JSON Patch operations that turn ``old`` into ``new``.
+
+    Both values are JSON-like: dicts, lists and scalars.  Paths are
+    relative to ``old`` itself, so apply the patch to the state key that
+    held it.  Items of a list are matched by their ``key`` field when
+    every item on both sides has a distinct one (see the module
+    docstring); a list that changed in more than half its items is
+    replaced whole, since the patch would be no smaller.  Values are
+    compared with ``==``, so a change from ``1`` to ``1.0`` or ``True``
+    isn't one.
+    """
+    patch: list[Operation] = []
+    _diff(old, new, "", key, patch)
+    return patch
+
+
+def _diff(old: Any, new: Any, path: str, key: str, patch: list[Operation]) -> None:
+    if isinstance(old, dict) and isinstance(new, dict):
+        if old == new:
+            return
+        for name in old:
+            if name not in new:
+                patch.append({"op": "remove", "path": f"{path}/{_escape(name)}"})
+        for name, value in new.items():
+            child = f"{path}/{_escape(name)}"
+            if name in old:
+                _diff(old[name], value, child, key, patch)
+            else:
+                patch.append({"op": "add", "path": child, "value": value})
+    elif _is_list(old) and _is_list(new):
+        if old == new:
+            return
+        # Only the part between the common start and end changed.
+        shortest = min(len(old), len(new))
+        start = 0
+        while start < shortest and old[start] == new[start]:
+            start += 1
+        tail = 0
+        while tail < shortest - start and old[-1 - tail] == new[-1 - tail]:
+            tail += 1
+        edit = _Edit(path, start, key, patch, new)
+        old, new = old[start : len(old) - tail], new[start : len(new) - tail]
+        old_keys, new_keys = _keys(old, key), _keys(new, key)
+        if old_keys is not None and new_keys is not None:
+            edit.keyed(old, new, old_keys, new_keys)
+        else:
+            edit.positions(old, new)
+    elif old != new:
+        patch.append({"op": "replace", "path": path, "value": new})
+
+
+class _Edit:
+    """Emits the operations for the changed middle of a list.
+
+    ``old`` and ``new`` passed to the methods are the middles, which
+    start at index ``start`` of the list at ``path``.
+    """
+
+    def __init__(
+        self, path: str, start: int, key: str, patch: list[Operation], whole: Any
+    ) -> None:
+        self.path = path
+        self.start = start
+        self.key = key
+        self.patch = patch
+        self.whole = whole
+
+    def at(self, index: int) -> str:
+        return f"{self.path}/{self.start + index}"
+
+    def replaced(self, changes: int) -> bool:
+        """Replace the whole list when most of it changed."""
+        if changes > 1 and changes * 2 > len(self.whole):
+            self.patch.append({"op": "replace", "path": self.path, "value": self.whole})
+            return True
+        return False
+
+    def positions(self, old: Sequence[Any], new: Sequence[Any]) -> None:
+        """Pair items up by position, then add or remove the rest."""
+        if self.replaced(max(len(old), len(new))):
+            return
+        paired = min(len(old), len(new))
+        for i in range(paired):
+            _diff(old[i], new[i], self.at(i), self.key, self.patch)
+        for _ in range(len(old) - paired):
+            self.patch.append({"op": "remove", "path": self.at(paired)})
+        for i in range(paired, len(new)):
+            self.patch.append({"op": "add", "path": self.at(i), "value": new[i]})
+
+    def keyed(
+        self,
+        old: Sequence[Any],
+        new: Sequence[Any],
+        old_keys: list[Any],
+        new_keys: list[Any],
+    ) -> None:
+        """Match items by key, then remove, move and add the unmatched."""
+        patch = self.patch
+        target = {k: i for i, k in enumerate(new_keys)}
+        removed = [i for i, k in enumerate(old_keys) if k not in target]
+        current = [k for k in old_keys if k in target]
+        # The longest run of kept items already in their new order stays
+        # put; every other item is moved or added after the item it
+        # follows in ``new``.
+        stable = _increasing(current, target)
+        if self.replaced(len(removed) + len(new_keys) - len(stable)):
+            return
+        for i in reversed(removed):
+            patch.append({"op": "remove", "path": self.at(i)})
+        kept = set(current)
+        # Lay out where each item lands first: a linked list of nodes, one
+        # per kept item in its old order behind a head node (0), plus a
+        # node inserted after its predecessor for each moved or added
+        # item.  A node is only ever inserted right after the node of the
+        # previous item in ``new``, so the list's final order agrees with
+        # the order of the items at every step in between.
+        node = {k: n for n, k in enumerate(current, 1)}
+        following = [*range(1, len(current) + 1), -1]
+        placed: list[tuple[int, int | None, int]] = []
+        for i, k in enumerate(new_keys):
+            if k in stable:
+                continue
+            after = node[new_keys[i - 1]] if i else 0
+            following.append(following[after])
+            following[after] = len(following) - 1
+            placed.append((i, node.get(k), len(following) - 1))
+            node[k] = len(following) - 1
+        slot = [0] * len(following)
+        n, position = 0, 0
+        while n != -1:
+            slot[n] = position
+            n, position = following[n], position + 1
+        # Then replay the moves and adds, counting the items before a node
+        # with a Fenwick tree over the slots that hold one.
+        items = _Counts(len(following), (slot[n] for n in range(1, len(current) + 1)))
+        for i, source, dest in placed:
+            at = None
+            if source is not None:
+                at = items.before(slot[source])
+                items.add(slot[source], -1)
+            to = items.before(slot[dest])
+            items.add(slot[dest], 1)
+            if at is None:
+                patch.append({"op": "add", "path": self.at(to), "value": new[i]})
+            elif at != to:
+                patch.append({"op": "move", "from": self.at(at), "path": self.at(to)})
+        before = dict(zip(old_keys, old, strict=True))
+        for i, k in enumerate(new_keys):
+            if k in kept and before[k] != new[i]:
+                _diff(before[k], new[i], self.at(i), self.key, patch)
+
+
+def _increasing(keys: list[Any], target: dict[Any, int]) -> set[Any]:
+    """The longest subsequence of ``keys`` in ascending ``target`` order."""
+    # Patience sorting: ends[n] is the smallest target that ends a run of
+    # n + 1 keys so far, and ``previous`` links each key to the one before
+    # it in the longest run it ends.
+    ends: list[int] = []
+    ends_at: list[int] = []
+    previous = [-1] * len(keys)
+    for i, k in enumerate(keys):
+        n = bisect_left(ends, target[k])
+        if n:
+            previous[i] = ends_at[n - 1]
+        if n == len(ends):
+            ends.append(target[k])
+            ends_at.append(i)
+        else:
+            ends[n] = target[k]
+            ends_at[n] = i
+    run = set()
+    i = ends_at[-1] if ends_at else -1
+    while i >= 0:
+        run.add(keys[i])
+        i = previous[i]
+    return run
+
+
+class _Counts:
+    """A Fenwick tree of 0/1 counts: how many of the slots before one hold
+    an item, updated as items come and go, each in O(log n)."""
+
+    def __init__(self, size: int, filled: Iterable[int]) -> None:
+        tree = [0] * (size + 1)
+        for slot in filled:
+            tree[slot + 1] = 1
+        for i in range(1, size + 1):
+            parent = i + (i & -i)
+            if parent <= size:
+                tree[parent] += tree[i]
+        self.tree = tree
+
+    def add(self, slot: int, delta: int) -> None:
+        tree = self.tree
+        i = slot + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def before(self, slot: int) -> int:
+        tree = self.tree
+        total, i = 0, slot
+        while i:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+
+def _keys(items: Sequence[Any], key: str) -> list[Any] | None:
+    """What identifies each item across versions, or None if not unique.
+
+    That's the ``key`` field when every item is a dict, and the item
+    itself when none is.
+    """
+    if all(type(item) is dict for item in items):
+        keys = [item.get(key) for item in items]
+    elif not any(isinstance(item, dict) for item in items):
+        keys = list(items)
+    else:
+        return None
+    if not {type(k) for k in keys} <= {str, int} or len(set(keys)) < len(keys):
+        return None
+    return keys
+
+
+def _is_list(value: Any) -> bool:
+    return isinstance(value, list | tuple)
+
+
+def _escape(name: Any) -> str:
+    return str(name).replace("~", "~0").replace("/", "~1")
+
+
+# ── Applying ─────────────────────────────────────────────────────────
+
+
+def apply_patch(value: Any, patch: Sequence[Mapping[str, Any]]) -> Any:
+    """Apply JSON Patch operations to ``value`` and return the result.
+
+    Supports the ``add``, ``remove``, ``replace`` and ``move`` operations
+    that :func:`diff` emits.  ``value`` is left as it was: each dict or
+    list on the way to an edit is copied, once per patch, and the rest is
+    shared with the result.
+
+    Raises:
+        ValueError: An operation is unknown, or its path doesn't exist.
+    """
+    root = [value]
+    # Containers copied for this patch, kept alive so their ids stay
+    # unique, and free to edit in place.
+    copies: dict[int, Any] = {id(root): root}
+    for operation in patch:
+        op = operation.get("op")
+        path = _tokens(operation.get("path"))
+        if op == "move":
+            source = _tokens(operation.get("from"))
+            if path[: len(source)] == source and len(path) > len(source):
+                raise ValueError(f"Can't move {operation['from']!r} into itself")
+            moved = _get(root, source)
+            _remove(root, source, copies)
+            _add(root, path, moved, copies)
+        elif op == "add":
+            _add(root, path, operation.get("value"), copies)
+        elif op == "remove":
+            _remove(root, path, copies)
+        elif op == "replace":
+            holder = _parent(root, path, copies)
+            holder[_child(holder, path[-1], path)] = operation.get("value")
+        else:
+            raise ValueError(f"Unknown patch operation: {op!r}")
+    return root[0]
+
+
+def _tokens(pointer: Any) -> list[Any]:
+    """A JSON Pointer as keys from the root wrapper down."""
+    if not isinstance(pointer, str) or (pointer and not pointer.startswith("/")):
+        raise ValueError(f"Invalid patch path: {pointer!r}")
+    names = pointer.split("/")[1:] if pointer else []
+    return [0, *(name.replace("~1", "/").replace("~0", "~") for name in names)]
+
+
+def _child(container: Any, name: Any, pointer: list[Any], end: bool = False) -> Any:
+    """The key or index ``name`` stands for in ``container``."""
+    if isinstance(container, dict):
+        if not end and name not in container:
+            raise ValueError(f"No {_pointer(pointer)!r} in the patched value")
+        return name
+    if isinstance(container, list):
+        length = len(container) + end
+        if name == "-" and end:
+            return len(container)
+        if isinstance(name, int) or (name.isdigit() and int(name) < length):
+            return int(name)
+    raise ValueError(f"No {_pointer(pointer)!r} in the patched value")
+
+
+def _get(root: list[Any], tokens: list[Any]) -> Any:
+    value: Any = root
+    for n, name in enumerate(tokens):
+        value = value[_child(value, name, tokens[: n + 1])]
+    return value
+
+
+def _parent(root: list[Any], tokens: list[Any], copies: dict[int, Any]) -> Any:
+    """The container holding ``tokens``, copied for editing."""
+    holder: Any = root
+    for n, name in enumerate(tokens[:-1]):
+        at = _child(holder, name, tokens[: n + 1])
+        value = holder[at]
+        if id(value) not in copies:
+            if isinstance(value, Mapping):
+                value = dict(value)
+            elif _is_list(value):
+                value = list(value)
+            else:
+                raise ValueError(f"{_pointer(tokens[: n + 1])!r} holds no items")
+            copies[id(value)] = value
+            holder[at] = value
+        holder = value
+    return holder
+
+
+def _add(
+    root: list[Any], tokens: list[Any], value: Any, copies: dict[int, Any]
+) -> None:
+    holder = _parent(root, tokens, copies)
+    at = _child(holder, tokens[-1], tokens, end=True)
+    if holder is root or isinstance(holder, dict):
+        holder[at] = value
+    else:
+        holder.insert(at, value)
+
+
+def _remove(root: list[Any], tokens: list[Any], copies: dict[int, Any]) -> None:
+    if len(tokens) == 1:
+        raise ValueError("Can't remove the whole patched value")
+    holder = _parent(root, tokens, copies)
+    del holder[_child(holder, tokens[-1], tokens)]
+
+
+def _pointer(tokens: list[Any]) -> str:
+    return "".join(f"/{_escape(name)}" for name in tokens[1:])
@@ -0,0 +1,79 @@
+"""Change tracking for models nested inside components.
+
+A component caches its serialized JSON, and that JSON includes the
+actions, chart series and table columns it holds.  Those are pydantic
+models of their own, so assigning one of their fields wouldn't otherwise
+reach the component's cache.  They derive from :class:`TrackedModel`,
+which drops the cached JSON of every component that embedded them.
+"""
+
+from __future__ import annotations
+
+import functools
+import typing
+import weakref
+from typing import Any, get_args
+
+from pydantic import BaseModel
+
+
+class TrackedModel(BaseModel):
+    """A model whose field assignments invalidate the components holding it.
+
+    Components link themselves to the models they hold (see
+    :func:`track_models`) when they cache their JSON.  Like component
+    cache state, the links live in a slot rather than ``__dict__``, so
+    pydantic never dumps, compares or copies them.
+    """
+
+    __slots__ = ("_json_parents",)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            for ref in getattr(self, "_json_parents", ()):
+                owner = ref()
+                if owner is not None:
+                    owner.invalidate_json()
+
+
+def track_models(owner: Any, value: Any) -> None:
+    """Link every :class:`TrackedModel` in ``value`` to ``owner``.
+
+    ``value`` is a field value: a model, or lists, tuples and dicts of
+    them, searched along fields that can hold models.  ``owner`` is the
+    component whose ``invalidate_json()`` an assignment should call.
+    """
+    if isinstance(value, TrackedModel):
+        parents = getattr(value, "_json_parents", None)
+        if parents is None:
+            parents = []
+            object.__setattr__(value, "_json_parents", parents)
+        if not any(ref() is owner for ref in parents):
+            parents.append(weakref.ref(owner))
+        for name in tracked_fields(type(value)):
+            track_models(owner, value.__dict__.get(name))
+    elif isinstance(value, list | tuple):
+        for item in value:
+            track_models(owner, item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            track_models(owner, item)
+
+
+@functools.cache
+def tracked_fields(cls: type[BaseModel]) -> tuple[str, ...]:
+    """Names of the fields of ``cls`` whose values can hold a model."""
+    return tuple(
+        name
+        for name, field in cls.model_fields.items()
+        if _may_hold_model(field.annotation)
+    )
+
+
+def _may_hold_model(annotation: Any) -> bool:
+    if isinstance(annotation, type) and issubclass(annotation, TrackedModel):
+        return True
+    if isinstance(annotation, typing.ForwardRef):
+        return True
+    return any(_may_hold_model(arg) for arg in get_args(annotation))
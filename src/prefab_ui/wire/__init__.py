@@ -0,0 +1,31 @@
+"""Optional transforms over the wire-format envelope.
+
+Each transform takes the envelope produced by :meth:`PrefabApp.to_json`
+and returns a new one (or, for :func:`dependencies`, a table to send
+alongside it); ``PrefabApp.to_json`` applies them when asked.
+"""
+
+from __future__ import annotations
+
+from prefab_ui.wire.columnar import columnar
+from prefab_ui.wire.dependencies import affected_nodes, affects, dependencies
+from prefab_ui.wire.expressions import (
+    decode_expression,
+    encode_expression,
+    parse_expressions,
+)
+from prefab_ui.wire.optimize import optimize
+from prefab_ui.wire.strings import expand_strings, intern_strings
+
+__all__ = [
+    "affected_nodes",
+    "affects",
+    "columnar",
+    "decode_expression",
+    "dependencies",
+    "encode_expression",
+    "expand_strings",
+    "intern_strings",
+    "optimize",
+    "parse_expressions",
+]
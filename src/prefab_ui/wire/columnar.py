@@ -0,0 +1,78 @@
+"""Columnar chart data and table rows in a wire-format envelope.
+
+Charts and ``DataTable`` accept their rows column by column (see
+:mod:`prefab_ui.columnar`).  :func:`columnar` rewrites inline row lists
+in ``view`` and ``defs`` into that form, so each key is sent once rather
+than once per row::
+
+    {"type": "LineChart", "data": {"week": [...], "downloads": [...]}, ...}
+
+Rows bound from state (``data="{{ rows }}"``) are left alone, since other
+readers of the same state key expect a list.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from prefab_ui.columnar import to_columns
+from prefab_ui.wire.strings import EXTENDED_PROTOCOL_VERSION
+
+# The prop holding row data, by component type.
+ROW_PROPS: dict[str, str] = {
+    "BarChart": "data",
+    "LineChart": "data",
+    "AreaChart": "data",
+    "PieChart": "data",
+    "RadarChart": "data",
+    "RadialChart": "data",
+    "ScatterChart": "data",
+    "DataTable": "rows",
+}
+
+
+class _Encoder:
+    def __init__(self) -> None:
+        self.changed = False
+
+    def encode(self, value: Any) -> Any:
+        if isinstance(value, list):
+            return [self.encode(item) for item in value]
+        if not isinstance(value, dict):
+            return value
+        kind = value.get("type")
+        prop = ROW_PROPS.get(kind) if isinstance(kind, str) else None
+        return {
+            key: self.rows(item) if key == prop else self.encode(item)
+            for key, item in value.items()
+        }
+
+    def rows(self, value: Any) -> Any:
+        # Row cells are data, not components, so they aren't walked.
+        if not isinstance(value, list) or len(value) < 2:
+            return value
+        if not all(isinstance(row, dict) for row in value):
+            return value
+        columns = to_columns(value)
+        if columns is None:
+            return value
+        self.changed = True
+        return columns
+
+
+def columnar(envelope: dict[str, Any]) -> dict[str, Any]:
+    """Return ``envelope`` with inline chart data and table rows as columns.
+
+    A row list is converted when it has at least two rows and every row
+    has the same keys.  The envelope is returned unchanged when nothing
+    qualifies.
+    """
+    encoder = _Encoder()
+    result = dict(envelope)
+    for key in ("view", "defs"):
+        if key in envelope:
+            result[key] = encoder.encode(envelope[key])
+    if not encoder.changed:
+        return envelope
+    result["version"] = EXTENDED_PROTOCOL_VERSION
+    return result
@@ -0,0 +1,326 @@
+"""State-dependency table for a wire-format envelope.
+
+For every node in ``view`` and ``defs`` that reads state, the table lists
+the state paths it reads, so a renderer can re-evaluate only the nodes a
+state change touches instead of the whole tree::
+
+    {
+        "paths": ["count", "rows", "rows.*.label"],
+        "view": {"/children/0": [0], "/children/2": [1], ...},
+        "defs": {"row": {"": [2]}},
+    }
+
+Nodes are keyed by their JSON Pointer within the view (or definition), and
+point into the shared ``paths`` list.  Nodes that read no state are left
+out.  A ``*`` segment stands for any key or index: ``rows.*.label`` is the
+``label`` of every item of ``rows``, and ``*`` on its own means the node
+may read anything.  A write to ``key`` affects a node when one of its paths
+and ``key`` are equal or one is a prefix of the other (see :func:`affects`).
+
+A node's entry covers what the renderer evaluates for that node itself:
+its templated props, a ``ForEach`` list, ``Condition`` tests, the state key
+a ``Slot`` or named form control reads.  Names bound by an enclosing
+``let`` or ``ForEach`` resolve to the state they were computed from, so
+``{{ $item.label }}`` under ``ForEach("rows")`` reads ``rows.*.label``.
+Inside ``defs`` names that aren't bound locally are reported as written,
+since a ``$ref`` may bind them with ``let``; the ``$ref`` node itself lists
+what its ``let`` reads.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
+from typing import Any, NamedTuple
+
+from prefab_ui.expr import (
+    Binary,
+    Default,
+    ExpressionError,
+    Node,
+    Path,
+    Pipe,
+    Ternary,
+    Unary,
+    parse,
+    sole_expression,
+    split_template,
+)
+from prefab_ui.wire.nodes import ACTION_PROPS, STATEFUL_TYPES
+
+WILDCARD = "*"
+
+
+class _Binding(NamedTuple):
+    """What a scoped name reads.
+
+    ``alias`` is the state path the name stands for, when it is one (so
+    ``name.field`` reads ``alias.field``); ``paths`` are further paths the
+    value was computed from.
+    """
+
+    alias: str | None
+    paths: frozenset[str]
+
+
+_Scope = Mapping[str, _Binding]
+
+_NO_BINDING = _Binding(None, frozenset())
+
+
+@lru_cache(maxsize=4096)
+def _parse_or_none(source: str) -> Node | None:
+    try:
+        return parse(source)
+    except ExpressionError:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _expression_names(source: str) -> tuple[tuple[str, ...], ...] | None:
+    """The dotted names an expression reads, or None if it doesn't parse."""
+    node = _parse_or_none(source)
+    if node is None:
+        return None
+    names: list[tuple[str, ...]] = []
+    stack: list[Node] = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, Path):
+            names.append(current.parts)
+        elif isinstance(current, Unary):
+            stack.append(current.operand)
+        elif isinstance(current, Binary):
+            stack += (current.right, current.left)
+        elif isinstance(current, Ternary):
+            stack += (current.if_false, current.if_true, current.cond)
+        elif isinstance(current, (Pipe, Default)):
+            stack.append(current.expr)
+    return tuple(names)
+
+
+def _lookup(parts: tuple[str, ...], scope: _Scope) -> _Binding:
+    """Resolve a dotted name against ``scope``, falling back to state."""
+    binding = scope.get(parts[0])
+    if binding is None:
+        if parts[0].startswith("$"):
+            # $event, $error and friends only exist while an action runs.
+            return _NO_BINDING
+        return _Binding(".".join(parts), frozenset())
+    if binding.alias is None:
+        return binding
+    return _Binding(".".join((binding.alias, *parts[1:])), binding.paths)
+
+
+def _binding_paths(binding: _Binding) -> set[str]:
+    paths = set(binding.paths)
+    if binding.alias is not None:
+        paths.add(binding.alias)
+    return paths
+
+
+def _expression_paths(source: str, scope: _Scope) -> set[str]:
+    paths: set[str] = set()
+    for parts in _expression_names(source) or ():
+        paths |= _binding_paths(_lookup(parts, scope))
+    return paths
+
+
+def _template_paths(template: str, scope: _Scope) -> set[str]:
+    if "{{" not in template:
+        return set()
+    paths: set[str] = set()
+    for source in split_template(template)[1]:
+        paths |= _expression_paths(source, scope)
+    return paths
+
+
+def _value_paths(value: Any, scope: _Scope) -> set[str]:
+    if isinstance(value, str):
+        return _template_paths(value, scope)
+    paths: set[str] = set()
+    if isinstance(value, list):
+        for item in value:
+            paths |= _value_paths(item, scope)
+    elif isinstance(value, dict):
+        for item in value.values():
+            paths |= _value_paths(item, scope)
+    return paths
+
+
+def _condition_paths(when: Any, scope: _Scope) -> set[str]:
+    """Paths read by ``evaluateCondition`` (``renderer/src/conditions.ts``)."""
+    trimmed = when.strip() if isinstance(when, str) else ""
+    if not trimmed:
+        return set()
+    inner = trimmed
+    if inner.startswith("{{") and inner.endswith("}}"):
+        inner = inner[2:-2].strip()
+    if _expression_names(inner) is None:
+        # Unparseable tests fall back to looking up the text as a key.
+        return _binding_paths(_lookup((trimmed,), scope))
+    return _expression_paths(inner, scope)
+
+
+def _bind(bindings: Any, scope: _Scope) -> _Scope:
+    """Scope for the children of a node with ``let`` bindings."""
+    if not isinstance(bindings, dict) or not bindings:
+        return scope
+    bound: dict[str, _Binding] = {}
+    for name, value in bindings.items():
+        sole = sole_expression(value) if isinstance(value, str) else None
+        node = _parse_or_none(sole) if sole is not None else None
+        if type(node) is Path:
+            # A plain reference: the name is an alias for that path.
+            bound[name] = _lookup(node.parts, scope)
+        else:
+            bound[name] = _Binding(None, frozenset(_value_paths(value, scope)))
+    return {**scope, **bound}
+
+
+def _list_binding(key: Any, scope: _Scope) -> _Binding:
+    """What a ``ForEach`` list key reads."""
+    if not isinstance(key, str) or not key:
+        return _NO_BINDING
+    if "{{" in key:
+        # The list is chosen at render time, so its items could be anything.
+        return _Binding(None, frozenset({WILDCARD, *_template_paths(key, scope)}))
+    return _lookup(tuple(key.split(".")), scope)
+
+
+class _Collector:
+    def __init__(self) -> None:
+        self.paths: dict[str, int] = {}
+
+    def record(
+        self, table: dict[str, list[int]], pointer: str, paths: set[str]
+    ) -> None:
+        if not paths:
+            return
+        if WILDCARD in paths:
+            paths = {WILDCARD}
+        indices = {self.paths.setdefault(path, len(self.paths)) for path in paths}
+        table[pointer] = sorted(indices)
+
+    def children(
+        self,
+        children: Any,
+        pointer: str,
+        scope: _Scope,
+        table: dict[str, list[int]],
+    ) -> None:
+        if isinstance(children, list):
+            for index, child in enumerate(children):
+                self.node(child, f"{pointer}/{index}", scope, table)
+
+    def node(
+        self,
+        node: Any,
+        pointer: str,
+        scope: _Scope,
+        table: dict[str, list[int]],
+    ) -> None:
+        if not isinstance(node, dict):
+            return
+        if isinstance(node.get("$ref"), str):
+            # The definition has its own table; the $ref node reads what
+            # its let bindings read.
+            paths = _value_paths(node.get("let"), scope)
+            self.record(table, pointer, paths)
+            return
+
+        node_type = node.get("type")
+        own: set[str] = set()
+        for key, value in node.items():
+            if key in ("type", "children", "let", "cases", "else"):
+                continue
+            if key in ACTION_PROPS and isinstance(value, (dict, list)):
+                continue
+            own |= _value_paths(value, scope)
+
+        child_scope = scope
+        if node_type == "ForEach" and node.get("children"):
+            key = node.get("key")
+            items = _list_binding(
+                key if key is not None else node.get("itemKey"), scope
+            )
+            own |= _binding_paths(items)
+            item_alias = None if items.alias is None else f"{items.alias}.{WILDCARD}"
+            child_scope = _bind(
+                node.get("let"),
+                {
+                    **scope,
+                    "$item": _Binding(item_alias, items.paths),
+                    "$index": _Binding(None, frozenset(_binding_paths(items))),
+                },
+            )
+        elif node_type == "Condition":
+            for index, case in enumerate(node.get("cases") or []):
+                if not isinstance(case, dict):
+                    continue
+                own |= _condition_paths(case.get("when"), scope)
+                self.children(
+                    case.get("children"),
+                    f"{pointer}/cases/{index}/children",
+                    scope,
+                    table,
+                )
+            self.children(node.get("else"), f"{pointer}/else", scope, table)
+        elif node_type == "Slot":
+            name = node.get("name")
+            if isinstance(name, str) and name:
+                own.add(WILDCARD if "{{" in name else name)
+        else:
+            if node_type in STATEFUL_TYPES:
+                name = node.get("name")
+                if isinstance(name, str) and name and "{{" not in name:
+                    own.add(name)
+            child_scope = _bind(node.get("let"), scope)
+
+        self.record(table, pointer, own)
+        self.children(node.get("children"), f"{pointer}/children", child_scope, table)
+
+
+def dependencies(envelope: Mapping[str, Any]) -> dict[str, Any]:
+    """Build the dependency table for a wire-format envelope.
+
+    See the module docstring for the format.  ``defs`` is only present when
+    the envelope has definitions.
+    """
+    collector = _Collector()
+    view: dict[str, list[int]] = {}
+    collector.node(envelope.get("view"), "", {}, view)
+    defs: dict[str, dict[str, list[int]]] = {}
+    for name, definition in (envelope.get("defs") or {}).items():
+        defs[name] = {}
+        collector.node(definition, "", {}, defs[name])
+    result: dict[str, Any] = {"paths": list(collector.paths), "view": view}
+    if defs:
+        result["defs"] = defs
+    return result
+
+
+def affects(path: str, written: str) -> bool:
+    """Whether writing state key ``written`` can change what ``path`` reads."""
+    if path == WILDCARD:
+        return True
+    for read, write in zip(path.split("."), written.split("."), strict=False):
+        if read != write and read != WILDCARD:
+            return False
+    return True
+
+
+def affected_nodes(table: Mapping[str, Any], written: Iterable[str]) -> set[str]:
+    """Pointers of the ``view`` nodes that a write to ``written`` can change."""
+    paths: list[str] = table["paths"]
+    written = list(written)
+    hit = {
+        index
+        for index, path in enumerate(paths)
+        if any(affects(path, key) for key in written)
+    }
+    return {
+        pointer
+        for pointer, indices in table["view"].items()
+        if not hit.isdisjoint(indices)
+    }
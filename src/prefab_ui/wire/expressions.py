@@ -0,0 +1,167 @@
+"""Pre-parsed expressions for a wire-format envelope.
+
+Every client re-tokenizes and re-parses each ``{{ }}`` expression it
+evaluates.  :func:`parse_expressions` parses the expressions in an
+envelope on the server (with the cached parser from
+:mod:`prefab_ui.expr`) and ships their syntax trees in a top-level
+``expressions`` table, keyed by the expression text the renderer would
+otherwise parse::
+
+    {
+        "version": "0.3",
+        "expressions": {
+            "$item.price * $item.qty | currency":
+                ["|", ["*", [".", "$item", "price"], [".", "$item", "qty"]],
+                 "currency"],
+        },
+        "view": {...},
+    }
+
+The templates themselves stay in place, so a client that ignores the table
+renders the same page.  Trees are JSON arrays with precedence already
+resolved; scalars are literals:
+
+=========================  =============================================
+``[".", part, ...]``       state path, e.g. ``user.name``
+``["!", x]``               logical not; ``["-", x]`` / ``["+", x]`` unary
+``[op, left, right]``      binary ``+ - * / == != > >= < <= && ||``
+``["?", c, a, b]``         ternary ``c ? a : b``
+``["|", x, name(, arg)]``  pipe ``x | name:arg``
+``["??", x, value]``       default ``x | 'value'``
+=========================  =============================================
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterator
+from typing import Any
+
+from prefab_ui.expr import (
+    Binary,
+    Default,
+    ExpressionError,
+    Literal,
+    Node,
+    Path,
+    Pipe,
+    Ternary,
+    Unary,
+    parse,
+    split_template,
+)
+from prefab_ui.wire.strings import EXTENDED_PROTOCOL_VERSION
+
+_BINARY_OPS = frozenset(
+    {"+", "-", "*", "/", "==", "!=", ">", ">=", "<", "<=", "&&", "||"}
+)
+
+
+def _literal(value: Any) -> Any:
+    if isinstance(value, float) and not math.isfinite(value):
+        raise ExpressionError(f"No JSON form for {value!r}")
+    return value
+
+
+def encode_expression(node: Node) -> Any:
+    """Encode a parsed expression as a JSON syntax tree.
+
+    Raises:
+        ExpressionError: The tree holds a number JSON can't represent.
+    """
+    if isinstance(node, Literal):
+        return _literal(node.value)
+    if isinstance(node, Path):
+        return [".", *node.parts]
+    if isinstance(node, Unary):
+        return [node.op, encode_expression(node.operand)]
+    if isinstance(node, Binary):
+        return [node.op, encode_expression(node.left), encode_expression(node.right)]
+    if isinstance(node, Ternary):
+        return [
+            "?",
+            encode_expression(node.cond),
+            encode_expression(node.if_true),
+            encode_expression(node.if_false),
+        ]
+    if isinstance(node, Pipe):
+        encoded = ["|", encode_expression(node.expr), node.name]
+        return encoded if node.arg is None else [*encoded, node.arg]
+    if isinstance(node, Default):
+        return ["??", encode_expression(node.expr), _literal(node.value)]
+    raise TypeError(f"Not an expression node: {node!r}")
+
+
+def decode_expression(data: Any) -> Node:
+    """Decode a JSON syntax tree from :func:`encode_expression`.
+
+    Raises:
+        ExpressionError: ``data`` is not a valid syntax tree.
+    """
+    if not isinstance(data, list):
+        if data is None or isinstance(data, (bool, int, float, str)):
+            return Literal(data)
+        raise ExpressionError(f"Invalid expression literal: {data!r}")
+    if not data:
+        raise ExpressionError("Empty expression node")
+    op, *args = data
+    if op == "." and args and all(isinstance(part, str) for part in args):
+        return Path(tuple(args))
+    if op in ("!", "-", "+") and len(args) == 1:
+        return Unary(op, decode_expression(args[0]))
+    if op in _BINARY_OPS and len(args) == 2:
+        return Binary(op, decode_expression(args[0]), decode_expression(args[1]))
+    if op == "?" and len(args) == 3:
+        return Ternary(*(decode_expression(arg) for arg in args))
+    if op == "|" and len(args) in (2, 3) and isinstance(args[1], str):
+        arg = args[2] if len(args) == 3 else None
+        if arg is None or isinstance(arg, str):
+            return Pipe(decode_expression(args[0]), args[1], arg)
+    if op == "??" and len(args) == 2 and not isinstance(args[1], (list, dict)):
+        return Default(decode_expression(args[0]), args[1])
+    raise ExpressionError(f"Invalid expression node: {data!r}")
+
+
+def _sources(value: Any) -> Iterator[str]:
+    """Every expression the renderer may evaluate in ``value``."""
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            if "{{" in item:
+                yield from split_template(item)[1]
+        elif isinstance(item, list):
+            stack += item
+        elif isinstance(item, dict):
+            when = item.get("when")
+            if isinstance(when, str) and "{{" not in when:
+                # Condition tests may be written without braces.
+                yield when.strip()
+            stack += item.values()
+
+
+def parse_expressions(envelope: dict[str, Any]) -> dict[str, Any]:
+    """Return ``envelope`` with an ``expressions`` table of parsed trees.
+
+    Expressions in ``view`` and ``defs`` are included; ``state`` is data,
+    which the renderer never interpolates.  Expressions that don't parse
+    are left out, and the renderer reports them as it does today.  The envelope is returned unchanged when it has no
+    expressions.
+    """
+    table: dict[str, Any] = {}
+    seen: set[str] = set()
+    for key in ("view", "defs"):
+        for source in _sources(envelope.get(key)):
+            if not source or source in seen:
+                continue
+            seen.add(source)
+            try:
+                table[source] = encode_expression(parse(source))
+            except (ExpressionError, RecursionError):
+                continue
+    if not table:
+        return envelope
+    result = dict(envelope)
+    result["version"] = EXTENDED_PROTOCOL_VERSION
+    result["expressions"] = table
+    return result
@@ -0,0 +1,33 @@
+"""What the wire passes know about component nodes.
+
+The optimizer, the dependency table and the pre-renderer all walk the
+same JSON the renderer receives, and have to agree with it on which props
+hold action specs and which components write state.  Both lists mirror
+the renderer and are kept here so the passes can't drift apart.
+"""
+
+from __future__ import annotations
+
+# Action specs are evaluated when the action runs, not when the node
+# renders (see ``ACTION_PROPS`` in ``renderer/src/prop-transforms.ts``).
+ACTION_PROPS = frozenset({"onClick", "onChange", "onSubmit", "source"})
+
+# Components that write their value to the state key in ``name``; the
+# renderer names them ``<type>_<n>`` when no name is given.
+STATEFUL_TYPES = frozenset(
+    {
+        "Input",
+        "Textarea",
+        "Checkbox",
+        "Switch",
+        "Slider",
+        "Calendar",
+        "DatePicker",
+        "DropZone",
+        "Select",
+        "RadioGroup",
+        "Combobox",
+        "Tabs",
+        "Pages",
+    }
+)
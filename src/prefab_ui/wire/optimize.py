@@ -0,0 +1,325 @@
+"""Build-time constant folding over a wire-format envelope.
+
+State keys that nothing on the page can change are constants: no
+``SetState``/``ToggleState``/``AppendState``/``PopState``/``PatchState``
+action or patching ``CallTool`` writes them and no stateful component is
+bound to them by ``name``.  Their values are inlined into ``{{ }}``
+expressions, operators over constants are folded (see
+:func:`prefab_ui.expr.fold`), and ``Condition`` nodes whose outcome is
+known are replaced by the chosen branch.  Constant keys that nothing refers
+to afterwards are dropped from ``state``.
+
+The rewrite works on the JSON the renderer receives, so ``Rx``-built and
+hand-written templates are treated alike.  Every rewrite is checked to
+evaluate exactly like the original; anything that can't be expressed
+safely (non-scalar values, strings containing ``'``) is left as written.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Mapping
+from typing import Any
+
+from prefab_ui.expr import (
+    ExpressionError,
+    Literal,
+    Node,
+    fold,
+    parse,
+    sole_expression,
+    split_template,
+    unparse,
+)
+from prefab_ui.expr.values import to_string, truthy
+from prefab_ui.wire.nodes import ACTION_PROPS, STATEFUL_TYPES
+
+_STATE_ACTIONS = frozenset(
+    {"setState", "toggleState", "appendState", "popState", "patchState"}
+)
+
+# Parents that read their children as data (options, panels) rather than
+# rendering them, so a Condition among them is left untouched.
+_CHILD_CONSUMING_TYPES = frozenset(
+    {"Select", "RadioGroup", "Combobox", "Tabs", "Accordion", "Pages"}
+)
+
+# Props that are state paths or names rather than templates.
+_RAW_PROPS = frozenset(
+    {"type", "children", "cases", "else", "name", "key", "itemKey", "$ref"}
+)
+
+
+class _Unknown(Exception):
+    """A state write whose key can't be determined at build time."""
+
+
+def _writes(trees: list[Any]) -> tuple[set[str], set[str]]:
+    """Return the root state keys the page can write, and let-bound names.
+
+    Raises:
+        _Unknown: An action or component writes a templated key.
+    """
+    written: set[str] = set()
+    shadowed: set[str] = set()
+    stack = list(trees)
+    while stack:
+        item = stack.pop()
+        if isinstance(item, list):
+            stack += item
+            continue
+        if not isinstance(item, dict):
+            continue
+        key = item.get("key") if item.get("action") in _STATE_ACTIONS else None
+        # A tool call whose result patches state (ResolvedTool.patch_state).
+        patched = item.get("patchState") if item.get("action") == "toolCall" else None
+        name = item.get("name") if "type" in item else None
+        for target in (key, patched, name):
+            if not isinstance(target, str):
+                continue
+            if "{{" in target:
+                raise _Unknown
+            written.add(target.split(".")[0])
+        if name is None and item.get("type") in STATEFUL_TYPES:
+            written.add(f"{item['type'].lower()}_*")
+        bindings = item.get("let")
+        if isinstance(bindings, dict):
+            shadowed.update(bindings)
+        stack += item.values()
+    return written, shadowed
+
+
+def _is_constant(key: str, written: set[str], shadowed: set[str]) -> bool:
+    if key in written or key in shadowed:
+        return False
+    prefix, _, suffix = key.rpartition("_")
+    return not (suffix.isdigit() and f"{prefix}_*" in written)
+
+
+class _Optimizer:
+    def __init__(self, constants: Mapping[str, Any]) -> None:
+        self.constants = constants
+
+    # ── Expressions ──────────────────────────────────────────────────
+
+    def expression(self, source: str) -> Node | None:
+        """Fold ``source``; None when it doesn't parse or can't improve."""
+        try:
+            node = parse(source)
+        except ExpressionError:
+            return None
+        folded = fold(node, self.constants)
+        if folded is node or repr(folded) == repr(node):
+            return None
+        return folded
+
+    def source(self, node: Node) -> str | None:
+        """Source for a folded node, if it parses back to the same tree."""
+        try:
+            source = unparse(node)
+            reparsed = fold(parse(source), self.constants)
+        except ExpressionError:
+            return None
+        return source if repr(reparsed) == repr(node) else None
+
+    def template(self, template: str) -> Any:
+        if "{{" not in template:
+            return template
+        sole = sole_expression(template)
+        if sole is not None:
+            node = self.expression(sole)
+            if node is None:
+                return template
+            if type(node) is Literal:
+                # A lone template keeps the value's type, so the literal
+                # value replaces the prop, unless it would be read as a
+                # template itself.
+                value = node.value
+                if isinstance(value, str) and "{{" in value:
+                    return template
+                return value
+            source = self.source(node)
+            return template if source is None else f"{{{{ {source} }}}}"
+        return self._mixed(template)
+
+    def _mixed(self, template: str) -> str:
+        texts, sources = split_template(template)
+        out: list[str] = [texts[0]]
+        kept_texts: list[str] = [texts[0]]
+        kept_sources: list[str] = []
+        changed = False
+        for source, text in zip(sources, texts[1:], strict=True):
+            node = self.expression(source)
+            if node is not None and type(node) is Literal:
+                inline = to_string(node.value)
+                out += (inline, text)
+                kept_texts[-1] += inline + text
+                changed = True
+                continue
+            if node is not None:
+                rewritten = self.source(node)
+                if rewritten is not None:
+                    source = rewritten
+                    changed = True
+            out += ("{{ ", source, " }}", text)
+            kept_sources.append(source)
+            kept_texts.append(text)
+        if not changed:
+            return template
+        result = "".join(out)
+        # Inlined text must not create or break up template markers.
+        if (
+            split_template(result) != (kept_texts, kept_sources)
+            or sole_expression(result) is not None
+        ):
+            return template
+        return result
+
+    def condition(self, when: Any) -> tuple[bool | None, Any]:
+        """Return the known outcome of a ``when`` (or None) and its rewrite."""
+        if not isinstance(when, str):
+            return None, when
+        trimmed = when.strip()
+        inner = trimmed
+        braced = inner.startswith("{{") and inner.endswith("}}")
+        if braced:
+            inner = inner[2:-2].strip()
+        node = self.expression(inner)
+        if node is None:
+            return None, when
+        if type(node) is Literal:
+            return truthy(node.value), when
+        source = self.source(node)
+        if source is None:
+            return None, when
+        return None, f"{{{{ {source} }}}}" if braced else source
+
+    # ── Components ───────────────────────────────────────────────────
+
+    def value(self, value: Any) -> Any:
+        if isinstance(value, str):
+            return self.template(value)
+        if isinstance(value, list):
+            return [self.value(item) for item in value]
+        if isinstance(value, dict):
+            return {
+                key: item if key in ACTION_PROPS else self.value(item)
+                for key, item in value.items()
+            }
+        return value
+
+    def props(self, node: dict[str, Any]) -> dict[str, Any]:
+        result: dict[str, Any] = {}
+        for key, value in node.items():
+            if key in _RAW_PROPS or key in ACTION_PROPS:
+                result[key] = value
+            else:
+                result[key] = self.value(value)
+        return result
+
+    def children(self, children: Any, splice: bool = True) -> Any:
+        if not isinstance(children, list):
+            return children
+        result: list[Any] = []
+        for child in children:
+            if isinstance(child, dict) and child.get("type") == "Condition" and splice:
+                branch = self.known_branch(child)
+                if branch is not None:
+                    result += branch
+                    continue
+            result.append(self.node(child))
+        return result
+
+    def known_branch(self, node: dict[str, Any]) -> list[Any] | None:
+        """The optimized children a Condition always renders, if known."""
+        for case in node.get("cases") or []:
+            if not isinstance(case, dict):
+                return None
+            outcome, _ = self.condition(case.get("when"))
+            if outcome is None:
+                return None
+            if outcome:
+                return self.children(case.get("children") or [])
+        return self.children(node.get("else") or [])
+
+    def node(self, node: Any) -> Any:
+        if not isinstance(node, dict):
+            return node
+        if node.get("type") == "Condition":
+            return self._condition_node(node)
+        result = self.props(node)
+        if "children" in node:
+            result["children"] = self.children(
+                node["children"],
+                splice=node.get("type") not in _CHILD_CONSUMING_TYPES,
+            )
+        return result
+
+    def _condition_node(self, node: dict[str, Any]) -> dict[str, Any]:
+        """Drop cases known to be false; a case known true becomes the else."""
+        result = self.props(node)
+        cases: list[Any] = []
+        else_children = node.get("else")
+        for case in node.get("cases") or []:
+            if not isinstance(case, dict):
+                cases.append(case)
+                continue
+            outcome, when = self.condition(case.get("when"))
+            if outcome is False:
+                continue
+            if outcome is True:
+                else_children = case.get("children") or []
+                break
+            cases.append(
+                {**case, "when": when, "children": self.children(case.get("children"))}
+            )
+        if not cases:
+            # The outcome is fixed; keep a Condition so the node still has
+            # a single root.
+            cases = [{"when": "true", "children": self.children(else_children or [])}]
+            result.pop("else", None)
+        elif else_children is not None:
+            result["else"] = self.children(else_children)
+        result["cases"] = cases
+        return result
+
+
+def optimize(envelope: dict[str, Any]) -> dict[str, Any]:
+    """Return ``envelope`` with constant state folded into the view.
+
+    ``envelope`` is the wire format from :meth:`PrefabApp.to_json`; it is
+    not modified.  See the module docstring for what is rewritten.
+    """
+    state = envelope.get("state")
+    view = envelope.get("view")
+    defs = envelope.get("defs") or {}
+    if not state or (view is None and not defs):
+        return envelope
+    try:
+        written, shadowed = _writes([view, *defs.values()])
+    except _Unknown:
+        return envelope
+    constants = {
+        key: value
+        for key, value in state.items()
+        if _is_constant(key, written, shadowed)
+    }
+    if not constants:
+        return envelope
+
+    optimizer = _Optimizer(constants)
+    result = dict(envelope)
+    if view is not None:
+        result["view"] = optimizer.node(view)
+    if defs:
+        result["defs"] = {name: optimizer.node(d) for name, d in defs.items()}
+
+    # Keys no longer mentioned anywhere in the tree can go.  Matching on
+    # the encoded text is coarse but never drops a key still in use.
+    text = json.dumps([result.get("view"), result.get("defs")], ensure_ascii=False)
+    result["state"] = {
+        key: value
+        for key, value in state.items()
+        if key not in constants or json.dumps(key, ensure_ascii=False)[1:-1] in text
+    }
+    return result
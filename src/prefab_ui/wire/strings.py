@@ -0,0 +1,152 @@
+"""String table for repeated strings in a wire-format envelope.
+
+Large trees repeat the same long strings many times: Tailwind class lists,
+``{{ $item.x | currency }}`` templates, column keys.  :func:`intern_strings`
+moves strings that occur often enough into a top-level ``strings`` list
+and replaces each occurrence with a reference ``{"$str": <index>}``::
+
+    {
+        "version": "0.3",
+        "strings": ["flex items-center gap-2 rounded-md", ...],
+        "view": {"type": "Row", "cssClass": {"$str": 0}, ...},
+    }
+
+Only string values are interned; object keys are left as they are.
+References are expanded before anything else reads the envelope, so
+``state`` may be interned too.  Payloads using the table are marked with
+protocol version ``0.3``; a string is only hoisted when that makes the
+encoded payload smaller.
+"""
+
+from __future__ import annotations
+
+import json
+from collections import Counter
+from collections.abc import Iterator
+from typing import Any
+
+# Version for envelopes using the opt-in encodings in this package (the
+# string table, pre-parsed expressions).
+EXTENDED_PROTOCOL_VERSION = "0.3"
+
+_REF = "$str"
+
+
+def _strings(value: Any) -> Iterator[str]:
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            yield item
+        elif isinstance(item, list):
+            stack += item
+        elif isinstance(item, dict):
+            stack += item.values()
+
+
+def _is_ref(value: Any) -> bool:
+    return isinstance(value, dict) and len(value) == 1 and _REF in value
+
+
+def _has_ref(value: Any) -> bool:
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, list):
+            stack += item
+        elif isinstance(item, dict):
+            if _is_ref(item):
+                return True
+            stack += item.values()
+    return False
+
+
+def _ref_size(index: int) -> int:
+    return len(f'{{"{_REF}":{index}}}')
+
+
+def _table(counts: Counter[str], min_length: int) -> list[str]:
+    """Pick the strings worth hoisting, most bytes saved first."""
+    sizes = {
+        text: len(json.dumps(text, ensure_ascii=False))
+        for text, count in counts.items()
+        if count > 1 and len(text) >= min_length
+    }
+    ranked = sorted(sizes, key=lambda text: counts[text] * sizes[text], reverse=True)
+    table: list[str] = []
+    for text in ranked:
+        count, size = counts[text], sizes[text]
+        # Each occurrence becomes a reference, and the table holds the
+        # string once plus a separating comma.
+        if count * _ref_size(len(table)) + size + 1 < count * size:
+            table.append(text)
+    return table
+
+
+def _replace(value: Any, index: dict[str, int]) -> Any:
+    if isinstance(value, str):
+        position = index.get(value)
+        return value if position is None else {_REF: position}
+    if isinstance(value, list):
+        return [_replace(item, index) for item in value]
+    if isinstance(value, dict):
+        return {key: _replace(item, index) for key, item in value.items()}
+    return value
+
+
+def intern_strings(envelope: dict[str, Any], *, min_length: int = 8) -> dict[str, Any]:
+    """Return ``envelope`` with repeated strings moved to a ``strings`` table.
+
+    ``view``, ``defs`` and ``state`` are interned.  Strings shorter than
+    ``min_length`` or seen only once stay inline.  The envelope is returned
+    unchanged when nothing is worth hoisting, or when it already contains
+    an object that looks like a reference (``{"$str": ...}``) and so could
+    not be told apart from one.
+    """
+    sections = [key for key in ("view", "defs", "state") if key in envelope]
+    if any(_has_ref(envelope[key]) for key in sections):
+        return envelope
+    counts: Counter[str] = Counter()
+    for key in sections:
+        counts.update(_strings(envelope[key]))
+    table = _table(counts, min_length)
+    if not table:
+        return envelope
+
+    index = {text: position for position, text in enumerate(table)}
+    result = dict(envelope)
+    result["version"] = EXTENDED_PROTOCOL_VERSION
+    result["strings"] = table
+    for key in sections:
+        result[key] = _replace(envelope[key], index)
+    return result
+
+
+def _expand(value: Any, table: list[str]) -> Any:
+    if isinstance(value, list):
+        return [_expand(item, table) for item in value]
+    if isinstance(value, dict):
+        if _is_ref(value):
+            position = value[_REF]
+            valid = type(position) is int and 0 <= position < len(table)
+            if not valid:
+                raise ValueError(f"Invalid string reference: {value!r}")
+            return table[position]
+        return {key: _expand(item, table) for key, item in value.items()}
+    return value
+
+
+def expand_strings(envelope: dict[str, Any]) -> dict[str, Any]:
+    """Undo :func:`intern_strings`, resolving every reference.
+
+    Raises:
+        ValueError: A reference points outside the ``strings`` table.
+    """
+    if "strings" not in envelope:
+        return envelope
+    table = envelope["strings"]
+    result = {key: value for key, value in envelope.items() if key != "strings"}
+    for key in ("view", "defs", "state"):
+        if key in result:
+            result[key] = _expand(result[key], table)
+    return result
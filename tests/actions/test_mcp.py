@@ -1,5 +1,6 @@
 """Tests for MCP transport actions (CallTool, SendMessage, UpdateContext, RequestDisplayMode)."""
 
+import json
 import types
 
 import pytest
@@ -97,6 +98,8 @@ class TestCallToolCallableRef:
 
         data = app.to_json(tool_resolver=resolver)
         assert data["view"]["onClick"]["tool"] == "save_contact-resolved"
+        encoded = json.loads(app.to_json_bytes(tool_resolver=resolver))
+        assert encoded["view"]["onClick"]["tool"] == "save_contact-resolved"
 
     def test_resolver_scoped_to_call(self):
         """Resolver ContextVar resets after to_json() returns."""
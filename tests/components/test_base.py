@@ -1,11 +1,32 @@
-"""Tests for context manager nesting, defer, and insert."""
+"""Tests for context manager nesting, defer, insert, and serialization."""
 
 from __future__ import annotations
 
-import pytest
+from typing import Annotated, Any, Literal
 
-from prefab_ui.components import Column, Heading, Row, Slider, Text, defer, insert
-from prefab_ui.components.base import ContainerComponent
+import pytest
+from pydantic import PlainSerializer
+
+from prefab_ui.actions import SetState, ShowToast
+from prefab_ui.app import PrefabApp
+from prefab_ui.components import (
+    Button,
+    Column,
+    Heading,
+    Row,
+    Slider,
+    Text,
+    defer,
+    insert,
+)
+from prefab_ui.components.base import (
+    ContainerComponent,
+    _may_hold_rx,
+    json_cache_stats,
+    reset_json_cache_stats,
+)
+from prefab_ui.components.charts import ChartSeries, LineChart
+from prefab_ui.rx import Rx
 
 
 class TestComponentId:
@@ -254,3 +275,268 @@ class TestInsert:
         text = col.children[0]
         assert "{{ " in text.content  # type: ignore[attr-defined]
         assert col.children[1] is volume
+
+
+class TestSerializationPasses:
+    def test_each_node_dumped_once(self):
+        calls = 0
+
+        def count(value: int) -> int:
+            nonlocal calls
+            calls += 1
+            return value
+
+        class Probe(ContainerComponent):
+            type: Literal["Probe"] = "Probe"
+            probe: Annotated[int, PlainSerializer(count)] = 0
+
+        node = Probe(probe=0)
+        for depth in range(1, 6):
+            node = Probe(probe=depth, children=[node])
+        result = node.to_json()
+        assert calls == 6
+        assert result["probe"] == 5
+        assert result["children"][0]["children"][0]["probe"] == 3
+
+    def test_children_key_last(self):
+        col = Column(children=[Text(content="a")], gap=2, let={"x": "{{ y }}"})
+        assert list(col.to_json())[-1] == "children"
+
+    def test_empty_children_omitted(self):
+        assert "children" not in Column().to_json()
+
+    def test_rx_coerced_in_untyped_fields(self):
+        x = Rx("x")
+        col = Column(let={"a": x, "b": [x + 1, {"c": x}]})
+        assert col.to_json()["let"] == {
+            "a": "{{ x }}",
+            "b": ["{{ x + 1 }}", {"c": "{{ x }}"}],
+        }
+        # model_dump keeps coercing too, with field names or aliases.
+        assert col.model_dump()["let"]["a"] == "{{ x }}"
+        assert col.model_dump(by_alias=True)["let"]["a"] == "{{ x }}"
+
+    def test_rx_in_nested_actions(self):
+        from prefab_ui.actions import SetState
+
+        x = Rx("x")
+        button = Button("Go", on_click=SetState("y", x + 1))
+        assert button.to_json()["onClick"]["value"] == "{{ x + 1 }}"
+
+    def test_may_hold_rx(self):
+        assert not _may_hold_rx(str)
+        assert not _may_hold_rx(str | Rx | None)
+        assert not _may_hold_rx(Literal["a", "b"])
+        assert not _may_hold_rx(list[Text])
+        assert _may_hold_rx(Any)
+        assert _may_hold_rx(dict[str, Any] | None)
+        assert _may_hold_rx(tuple[int, ...] | object)
+
+
+class TestSerializationCache:
+    @pytest.fixture
+    def dumps(self) -> tuple[type[ContainerComponent], list[int]]:
+        calls: list[int] = []
+
+        def count(value: int) -> int:
+            calls.append(value)
+            return value
+
+        class Probe(ContainerComponent):
+            type: Literal["Probe"] = "Probe"
+            probe: Annotated[int, PlainSerializer(count)] = 0
+
+        return Probe, calls
+
+    def test_unchanged_subtrees_reused(self, dumps):
+        Probe, calls = dumps
+        with Probe(probe=0) as root:
+            with Probe(probe=1):
+                Probe(probe=2)
+            Probe(probe=3)
+        app = PrefabApp(view=root)
+        first = app.to_json()
+        calls.clear()
+        second = app.to_json()
+        assert calls == []
+        assert second["view"] == first["view"]
+
+    def test_results_are_copies(self):
+        with Column() as col:
+            Text("a")
+        app = PrefabApp(view=col)
+        d = col.to_json()
+        d["children"][0]["content"] = "MUTATED"
+        app.to_json()["view"]["children"][0]["content"] = "MUTATED"
+        assert col.to_json()["children"][0]["content"] == "a"
+        assert app.to_json()["view"]["children"][0]["content"] == "a"
+        assert b"MUTATED" not in app.to_json_bytes()
+
+    def test_field_assignment_reserializes_dirty_path(self, dumps):
+        Probe, calls = dumps
+        with Probe(probe=0) as root:
+            with Probe(probe=1):
+                leaf = Probe(probe=2)
+            Probe(probe=3)
+        app = PrefabApp(view=root)
+        app.to_json()
+        calls.clear()
+        leaf.probe = 20
+        view = app.to_json()["view"]
+        assert sorted(calls) == [0, 1, 20]
+        assert view["children"][0]["children"][0]["probe"] == 20
+
+    def test_children_mutation_invalidates(self):
+        with Column() as root:
+            with Row() as row:
+                Text("a")
+        app = PrefabApp(view=root)
+        app.to_json()
+
+        row.children.append(Text("b"))
+        assert len(app.to_json()["view"]["children"][0]["children"]) == 2
+
+        with row:
+            Text("c")
+        assert len(app.to_json()["view"]["children"][0]["children"]) == 3
+
+        with defer():
+            extra = Text("d")
+        with row:
+            insert(extra)
+        assert len(app.to_json()["view"]["children"][0]["children"]) == 4
+
+        del row.children[0]
+        assert len(app.to_json()["view"]["children"][0]["children"]) == 3
+
+    def test_nested_action_assignment_invalidates(self):
+        inner = SetState("y", 1)
+        outer = SetState("x", 1, on_success=inner)
+        with Column() as root:
+            Button("Go", on_click=outer)
+        app = PrefabApp(view=root)
+        app.to_json_bytes()
+        outer.value = 2
+        inner.value = 3
+        on_click = app.to_json()["view"]["children"][0]["onClick"]
+        assert on_click["value"] == 2
+        assert on_click["onSuccess"]["value"] == 3
+        assert b'"value":3' in app.to_json_bytes()
+
+    def test_nested_model_assignment_invalidates(self):
+        chart = LineChart(data=[{"a": 1}], series=[ChartSeries(data_key="a")])
+        app = PrefabApp(view=chart)
+        app.to_json()
+        chart.series[0].label = "Sales"
+        assert app.to_json()["view"]["series"][0]["label"] == "Sales"
+
+    def test_tracked_models_unchanged(self):
+        toast = ShowToast("hi")
+        button = Button("Go", on_click=SetState("x", 1, on_success=toast))
+        app = PrefabApp(view=button)
+        app.to_json()
+        button.label = "Stop"
+        on_success = app.to_json()["view"]["onClick"]["onSuccess"]
+        assert on_success == {"action": "showToast", "message": "hi"}
+        assert toast == ShowToast("hi")
+        assert "_json_parents" not in toast.__dict__
+        assert "_json_cache" not in button.__dict__
+
+    def test_reparenting_invalidates_outer_parent(self):
+        with Column() as root:
+            text = Text("a")
+            app = PrefabApp(view=root)
+            assert len(app.to_json()["view"]["children"]) == 1
+            Row(children=[text])
+        view = app.to_json()["view"]
+        assert [c["type"] for c in view["children"]] == ["Row"]
+
+    def test_children_assignment_invalidates(self):
+        col = Column(children=[Text("a")])
+        app = PrefabApp(view=Row(children=[col]))
+        app.to_json()
+        col.children = [Text("b"), Text("c")]
+        assert len(app.to_json()["view"]["children"][0]["children"]) == 2
+        col.children.append(Text("d"))
+        assert len(app.to_json()["view"]["children"][0]["children"]) == 3
+
+    def test_condition_branches_invalidate(self):
+        from prefab_ui.components import Else, If
+
+        with Column() as root:
+            with If("{{ flag }}"):
+                yes = Text("yes")
+            with Else():
+                no = Text("no")
+        app = PrefabApp(view=root)
+        app.to_json()
+        yes.content = "YES"
+        no.content = "NO"
+        node = app.to_json()["view"]["children"][0]
+        assert node["cases"][0]["children"][0]["content"] == "YES"
+        assert node["else"][0]["content"] == "NO"
+
+    def test_define_body_invalidates(self):
+        from prefab_ui.define import Define
+
+        with Define("card") as card:
+            text = Text("{{ name }}")
+        app = PrefabApp(view=Column(), defs=[card])
+        app.to_json()
+        text.content = "{{ title }}"
+        assert app.to_json()["defs"]["card"]["content"] == "{{ title }}"
+
+    def test_in_place_mutation_needs_invalidate(self):
+        col = Column(let={"a": "1"})
+        app = PrefabApp(view=Row(children=[col]))
+        app.to_json()
+        assert col.let is not None
+        col.let["a"] = "2"
+        col.invalidate_json()
+        assert app.to_json()["view"]["children"][0]["let"] == {"a": "2"}
+
+    def test_model_copy_not_stale(self):
+        text = Text("a")
+        PrefabApp(view=Column(children=[text])).to_json()
+        copy = text.model_copy(update={"content": "b"})
+        assert (
+            PrefabApp(view=Column(children=[copy])).to_json()["view"]["children"][0][
+                "content"
+            ]
+            == "b"
+        )
+
+    def test_tool_resolver_output_not_cached(self):
+        from prefab_ui.actions.mcp import CallTool
+        from prefab_ui.app import ResolvedTool
+
+        def my_tool() -> None: ...
+
+        app = PrefabApp(
+            view=Column(children=[Button("Go", on_click=CallTool(my_tool))])
+        )
+        plain = app.to_json()["view"]["children"][0]["onClick"]
+        resolved = app.to_json(tool_resolver=lambda fn: ResolvedTool(name="x.my_tool"))
+        assert plain["tool"] == "my_tool"
+        assert resolved["view"]["children"][0]["onClick"]["tool"] == "x.my_tool"
+
+    def test_bytes_cache_tracks_dict_cache(self):
+        import json
+
+        leaf = Text("a")
+        app = PrefabApp(view=Column(children=[leaf]))
+        assert json.loads(app.to_json_bytes()) == app.to_json()
+        leaf.content = "b"
+        assert json.loads(app.to_json_bytes())["view"]["children"][0]["content"] == "b"
+
+    def test_hit_rate_counters(self):
+        reset_json_cache_stats()
+        app = PrefabApp(view=Column(children=[Text("a"), Text("b")]))
+        app.to_json()
+        assert json_cache_stats().hits == 0
+        app.to_json()
+        stats = json_cache_stats()
+        assert (stats.hits, stats.misses) == (1, 3)
+        assert stats.hit_rate == 0.25
+        reset_json_cache_stats()
+        assert json_cache_stats().hit_rate == 0.0
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import pytest
+from pydantic import ValidationError
+
 from prefab_ui.components.charts import (
     AreaChart,
     BarChart,
@@ -203,3 +206,52 @@ class TestChartSeries:
         assert d["dataKey"] == "val"
         assert "label" not in d
         assert "color" not in d
+
+
+class TestColumnarData:
+    COLUMNS = {"month": ["Jan", "Feb"], "desktop": [186, 305], "mobile": [80, 200]}
+
+    def test_column_arrays(self):
+        j = LineChart(data=self.COLUMNS, series=SERIES, x_axis="month").to_json()
+        assert j["data"] == self.COLUMNS
+
+    def test_columns_and_values(self):
+        data = {"columns": ["month", "desktop"], "values": [["Jan", 186]]}
+        j = BarChart(data=data, series=SERIES, x_axis="month").to_json()
+        assert j["data"] == data
+
+    def test_unequal_columns_rejected(self):
+        with pytest.raises(ValidationError, match="same length"):
+            AreaChart(data={"month": ["Jan"], "desktop": [1, 2]}, series=SERIES)
+
+    def test_short_row_rejected(self):
+        data = {"columns": ["month", "desktop"], "values": [["Jan"]]}
+        with pytest.raises(ValidationError, match="must have 2 items"):
+            ScatterChart(data=data, series=SERIES)
+
+
+class TestMaxPoints:
+    ROWS = [{"t": i, "desktop": i % 17, "mobile": -(i % 5)} for i in range(1000)]
+
+    @pytest.mark.parametrize("chart", [LineChart, AreaChart, BarChart])
+    def test_downsamples_on_serialization(self, chart):
+        c = chart(data=self.ROWS, series=SERIES, x_axis="t", max_points=50)
+        j = c.to_json()
+        assert 50 <= len(j["data"]) <= 100
+        assert j["data"][0] == self.ROWS[0]
+        assert j["data"][-1] == self.ROWS[-1]
+        assert c.data == self.ROWS
+
+    def test_not_sent_to_renderer(self):
+        j = LineChart(data=SAMPLE_DATA, series=SERIES, max_points=50).to_json()
+        assert "maxPoints" not in j
+        assert "max_points" not in j
+        assert j["data"] == SAMPLE_DATA
+
+    def test_reference_unchanged(self):
+        j = LineChart(data="{{ rows }}", series=SERIES, max_points=50).to_json()
+        assert j["data"] == "{{ rows }}"
+
+    def test_minimum(self):
+        with pytest.raises(ValidationError):
+            LineChart(data=SAMPLE_DATA, series=SERIES, max_points=2)
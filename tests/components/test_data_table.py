@@ -0,0 +1,449 @@
+"""Tests for server-driven DataTable queries (``source=`` and DataTableSource)."""
+
+from __future__ import annotations
+
+import json
+import math
+import random
+from collections.abc import Callable
+from typing import Any
+from urllib.parse import parse_qsl, urlencode
+
+import pytest
+from pydantic import ValidationError
+
+from prefab_ui.actions import SetState
+from prefab_ui.actions.fetch import Fetch
+from prefab_ui.actions.mcp import CallTool
+from prefab_ui.components import (
+    DataTable,
+    DataTableColumn,
+    DataTableIndex,
+    DataTableSource,
+)
+from prefab_ui.expr import interpolate
+
+COLUMNS = [
+    DataTableColumn(key="name", header="Name", sortable=True),
+    DataTableColumn(key="team", header="Team"),
+    DataTableColumn(key="score", header="Score", sortable=True),
+]
+
+NAMES = ["Ada", "Grace", "Alan", "Edsger", "Barbara", "Ken", "Donald", "Radia"]
+
+
+def _rows(n: int = 40) -> list[dict[str, Any]]:
+    return [
+        {
+            "name": f"{NAMES[i % len(NAMES)]} {i}",
+            "team": "core" if i % 3 else "infra",
+            "score": None if i % 7 == 6 else (i * 37) % 101,
+        }
+        for i in range(n)
+    ]
+
+
+class StandInTransport:
+    """The renderer's side of the ``source`` protocol, run in process.
+
+    Builds each query the way the DataTable wrapper does, resolves the
+    serialized ``source`` action the way ``loadActionResult`` in
+    ``renderer/src/actions.ts`` does, and hands the request to a Python
+    function standing in for the MCP host or HTTP server.  Responses go
+    through JSON, as they would over the wire.
+    """
+
+    def __init__(
+        self,
+        table: DataTable,
+        *,
+        tools: dict[str, Callable[..., Any]] | None = None,
+        routes: dict[str, Callable[..., Any]] | None = None,
+    ) -> None:
+        spec = table.to_json()
+        self.actions = spec["source"]
+        if not isinstance(self.actions, list):
+            self.actions = [self.actions]
+        self.page_size = spec["pageSize"]
+        self.tools = tools or {}
+        self.routes = routes or {}
+        self.sent: list[Any] = []
+
+    def load(
+        self,
+        page: int = 0,
+        sort: str | None = None,
+        direction: str | None = None,
+        search: str = "",
+        state: dict[str, Any] | None = None,
+    ) -> Any:
+        query = {
+            "page": page,
+            "page_size": self.page_size,
+            "sort": sort,
+            "direction": direction,
+            "search": search,
+        }
+        ctx = {**(state or {}), "$event": query}
+        result = None
+        for action in self.actions:
+            result = json.loads(json.dumps(self._send(action, query, ctx)))
+        return result
+
+    def _send(
+        self, action: dict[str, Any], query: dict[str, Any], ctx: dict[str, Any]
+    ) -> Any:
+        if action["action"] == "toolCall":
+            arguments = _resolve(action.get("arguments") or "{{ $event }}", ctx)
+            self.sent.append(arguments)
+            return self.tools[action["tool"]](**arguments)
+        assert action["action"] == "fetch"
+        url = _resolve(action["url"], ctx)
+        if "$event" not in action["url"]:
+            params = {k: v for k, v in query.items() if v is not None}
+            url += ("&" if "?" in url else "?") + urlencode(params)
+        self.sent.append(url)
+        path, _, params = url.partition("?")
+        return self.routes[path](**dict(parse_qsl(params)))
+
+
+def _resolve(value: Any, ctx: dict[str, Any]) -> Any:
+    if isinstance(value, str):
+        return interpolate(value, ctx)
+    if isinstance(value, dict):
+        return {key: _resolve(item, ctx) for key, item in value.items()}
+    return value
+
+
+class TestSourceField:
+    def test_serializes_action(self) -> None:
+        table = DataTable(columns=COLUMNS, source=CallTool("list_users"))
+        assert table.to_json()["source"] == {
+            "action": "toolCall",
+            "tool": "list_users",
+            "arguments": {},
+        }
+
+    def test_action_list(self) -> None:
+        table = DataTable(
+            columns=COLUMNS,
+            source=[SetState("loading", True), Fetch.get("/api/users")],
+        )
+        assert [a["action"] for a in table.to_json()["source"]] == [
+            "setState",
+            "fetch",
+        ]
+
+    def test_rows_and_source_conflict(self) -> None:
+        with pytest.raises(ValidationError, match="either 'rows' or 'source'"):
+            DataTable(columns=COLUMNS, rows=_rows(), source=CallTool("list_users"))
+
+
+class TestDataTableSource:
+    def test_pages(self) -> None:
+        rows = _rows(25)
+        source = DataTableSource(rows)
+        assert source.query(page=0, page_size=10) == {"rows": rows[:10], "total": 25}
+        assert source.query(page=2, page_size=10)["rows"] == rows[20:]
+        assert source.query(page=5, page_size=10) == {"rows": [], "total": 25}
+
+    def test_search_ignores_case(self) -> None:
+        result = DataTableSource(_rows()).query(search="ada", page_size=100)
+        assert result["total"] == 5
+        assert all("Ada" in row["name"] for row in result["rows"])
+
+    def test_search_only_columns(self) -> None:
+        rows = [{"name": "Ada", "secret": "core"}, {"name": "core dump"}]
+        source = DataTableSource(rows, columns=COLUMNS[:1])
+        assert source.query(search="CORE")["rows"] == [{"name": "core dump"}]
+
+    def test_sort_puts_missing_last(self) -> None:
+        source = DataTableSource(_rows())
+        for direction in ("asc", "desc"):
+            scores = [
+                row["score"]
+                for row in source.query(
+                    sort="score", direction=direction, page_size=100
+                )["rows"]
+            ]
+            present = [s for s in scores if s is not None]
+            assert present == sorted(present, reverse=direction == "desc")
+            assert scores[len(present) :] == [None] * (len(scores) - len(present))
+
+    def test_early_pages_match_full_sort(self) -> None:
+        rows = _rows(2000)
+        source = DataTableSource(rows)
+        scored = [row for row in rows if row["score"] is not None]
+        for direction in ("asc", "desc"):
+            expected = sorted(
+                scored, key=lambda row: row["score"], reverse=direction == "desc"
+            )
+            for page in (0, 3, 40):
+                result = source.query(page=page, sort="score", direction=direction)
+                assert result["rows"] == expected[page * 10 : page * 10 + 10]
+
+    def test_search_then_sort_then_page(self) -> None:
+        rows = _rows(200)
+        source = DataTableSource(rows, columns=COLUMNS)
+        result = source.query(
+            page=1, page_size=5, sort="name", direction="desc", search="infra"
+        )
+        expected = sorted(
+            (row for row in rows if row["team"] == "infra"),
+            key=lambda row: row["name"],
+            reverse=True,
+        )
+        assert result == {"rows": expected[5:10], "total": len(expected)}
+
+    def test_mixed_types_sort_as_text(self) -> None:
+        source = DataTableSource([{"v": 10}, {"v": "9"}, {"v": 2}])
+        assert [row["v"] for row in source.query(sort="v")["rows"]] == [10, 2, "9"]
+
+    def test_only_sortable_columns(self) -> None:
+        with pytest.raises(ValueError, match="Can't sort by 'team'"):
+            DataTableSource(_rows(), columns=COLUMNS).query(sort="team")
+
+    def test_bad_page(self) -> None:
+        source = DataTableSource(_rows())
+        with pytest.raises(ValueError, match="negative"):
+            source.query(page=-1)
+        with pytest.raises(ValueError, match="at least 1"):
+            source.query(page_size=0)
+
+    def test_max_page_size(self) -> None:
+        source = DataTableSource(_rows(), max_page_size=7)
+        assert len(source.query(page_size=1000)["rows"]) == 7
+
+    def test_columnar(self) -> None:
+        rows = _rows(12)
+        columns = {key: [row[key] for row in rows] for key in rows[0]}
+        result = DataTableSource(columns).query(page=1, page_size=5)
+        assert result["rows"] == rows[5:10]
+
+    def test_rejects_non_rows(self) -> None:
+        with pytest.raises(TypeError, match="sequence of rows"):
+            DataTableSource("name,team")
+
+
+class TestFrames:
+    def test_dataframe_matches_rows(self) -> None:
+        pd = pytest.importorskip("pandas")
+        rows = _rows(300)
+        frame = DataTableSource(pd.DataFrame(rows), columns=COLUMNS)
+        plain = DataTableSource(rows, columns=COLUMNS)
+        for query in (
+            {"page": 3, "page_size": 20},
+            {"sort": "score", "direction": "desc", "page_size": 50},
+            {"sort": "name", "search": "RA", "page": 1},
+        ):
+            expected = plain.query(**query)
+            result = frame.query(**query)
+            assert result["total"] == expected["total"]
+            assert [row["name"] for row in result["rows"]] == [
+                row["name"] for row in expected["rows"]
+            ]
+
+    def test_dataframe_missing_values_are_null(self) -> None:
+        pd = pytest.importorskip("pandas")
+        source = DataTableSource(pd.DataFrame(_rows(10)))
+        assert source.query(page_size=10)["rows"][6]["score"] is None
+
+    def test_dataframe_column_without_data(self) -> None:
+        pd = pytest.importorskip("pandas")
+        rows = _rows(30)
+        columns = [*COLUMNS, DataTableColumn(key="actions", header="", sortable=True)]
+        frame = DataTableSource(pd.DataFrame(rows), columns=columns)
+        plain = DataTableSource(rows, columns=columns)
+        for query in ({"search": "ra"}, {"sort": "actions"}):
+            assert frame.query(**query)["total"] == plain.query(**query)["total"]
+
+    def test_dataframe_mixed_types_sort_as_text(self) -> None:
+        pd = pytest.importorskip("pandas")
+        source = DataTableSource(pd.DataFrame({"v": [10, "9", None, 2]}))
+        rows = source.query(sort="v")["rows"]
+        assert [row["v"] for row in rows] == [10, 2, "9", None]
+
+    def test_arrow_table(self) -> None:
+        pa = pytest.importorskip("pyarrow")
+        rows = _rows(30)
+        source = DataTableSource(pa.Table.from_pylist(rows))
+        assert source.query(page=2, page_size=10)["rows"] == rows[20:]
+
+
+class TestSourceProtocol:
+    def test_tool_gets_query_as_arguments(self) -> None:
+        users = DataTableSource(_rows(), columns=COLUMNS)
+        table = DataTable(
+            columns=COLUMNS,
+            source=CallTool("list_users"),
+            paginated=True,
+            page_size=5,
+        )
+        transport = StandInTransport(table, tools={"list_users": users.query})
+
+        first = transport.load()
+        assert first == {"rows": _rows()[:5], "total": 40}
+        result = transport.load(page=1, sort="score", direction="asc", search="a")
+        assert result == users.query(1, 5, "score", "asc", "a")
+        assert transport.sent[-1] == {
+            "page": 1,
+            "page_size": 5,
+            "sort": "score",
+            "direction": "asc",
+            "search": "a",
+        }
+
+    def test_tool_with_mapped_arguments(self) -> None:
+        def search_users(team: str, offset: int, order: str | None) -> Any:
+            rows = [row for row in _rows() if row["team"] == team]
+            return {"rows": rows[offset : offset + 5], "total": len(rows), "o": order}
+
+        table = DataTable(
+            columns=COLUMNS,
+            source=CallTool(
+                "search_users",
+                arguments={
+                    "team": "{{ team }}",
+                    "offset": "{{ $event.page * $event.page_size }}",
+                    "order": "{{ $event.sort }}",
+                },
+            ),
+            page_size=5,
+        )
+        transport = StandInTransport(table, tools={"search_users": search_users})
+        result = transport.load(page=2, sort="name", state={"team": "infra"})
+        assert transport.sent == [{"team": "infra", "offset": 10, "order": "name"}]
+        assert result["total"] == 14
+        assert result["o"] == "name"
+
+    def test_fetch_gets_query_as_url_parameters(self) -> None:
+        users = DataTableSource(_rows(), columns=COLUMNS)
+
+        def route(
+            page: str, page_size: str, search: str, **sorting: str
+        ) -> dict[str, Any]:
+            return users.query(
+                int(page),
+                int(page_size),
+                sorting.get("sort"),
+                sorting.get("direction"),
+                search,
+            )
+
+        table = DataTable(columns=COLUMNS, source=Fetch.get("/api/users"))
+        transport = StandInTransport(table, routes={"/api/users": route})
+        result = transport.load(page=1, search="grace & co")
+        assert transport.sent == ["/api/users?page=1&page_size=10&search=grace+%26+co"]
+        assert result == {"rows": [], "total": 0}
+        assert transport.load(search="GRACE")["total"] == 5
+
+
+def _mixed_rows(n: int, seed: int) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    rows = []
+    for i in range(n):
+        first = rng.choice(NAMES)
+        rows.append(
+            {
+                "name": f"{first} {rng.choice(NAMES)}-{rng.randrange(50)}",
+                "team": rng.choice(["core", "infra", "data.eng", None]),
+                "score": rng.choice([None, math.nan, *range(20)]),
+                "note": f"{first.lower()}@{i}",
+            }
+        )
+    return rows
+
+
+INDEX_COLUMNS = [*COLUMNS, DataTableColumn(key="note", header="Note")]
+
+SEARCHES = ["", "a", "ad", "ada", "RADIA", "ald 1", "data.eng", "a-1", "@1", " ", "zzz"]
+
+
+def _queries(seed: int, count: int) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    return [
+        {
+            "page": rng.choice([0, 0, 1, 3, 40]),
+            "page_size": rng.choice([1, 5, 25]),
+            "sort": rng.choice([None, "name", "score"]),
+            "direction": rng.choice([None, "asc", "desc"]),
+            "search": rng.choice(SEARCHES),
+        }
+        for _ in range(count)
+    ]
+
+
+class TestDataTableIndex:
+    def test_matches_source(self) -> None:
+        rows = _mixed_rows(600, seed=1)
+        index = DataTableIndex(rows, columns=INDEX_COLUMNS)
+        source = DataTableSource(rows, columns=INDEX_COLUMNS)
+        for query in _queries(seed=2, count=400):
+            assert index.query(**query) == source.query(**query), query
+
+    def test_common_search_walks_sort_order(self) -> None:
+        rows = _mixed_rows(3000, seed=3)
+        index = DataTableIndex(rows, columns=INDEX_COLUMNS)
+        source = DataTableSource(rows, columns=INDEX_COLUMNS)
+        for direction in ("asc", "desc"):
+            query = {"sort": "score", "direction": direction, "search": "a"}
+            assert index.query(**query) == source.query(**query)
+
+    @pytest.mark.parametrize("batch", [3, 200])
+    def test_append(self, batch: int) -> None:
+        rows = _mixed_rows(500 + batch, seed=4)
+        index = DataTableIndex(rows[:500], columns=INDEX_COLUMNS)
+        index.query(search="ada")
+        assert index.append(rows[500:]) == list(range(500, 500 + batch))
+        source = DataTableSource(rows, columns=INDEX_COLUMNS)
+        for query in _queries(seed=5, count=200):
+            assert index.query(**query) == source.query(**query), query
+
+    @pytest.mark.parametrize("batch", [3, 200])
+    def test_remove(self, batch: int) -> None:
+        rows = _mixed_rows(500, seed=6)
+        index = DataTableIndex(rows, columns=INDEX_COLUMNS)
+        index.query(search="ada")
+        gone = set(random.Random(7).sample(range(500), batch))
+        index.remove(gone)
+        assert len(index) == 500 - batch
+        kept = [row for i, row in enumerate(rows) if i not in gone]
+        source = DataTableSource(kept, columns=INDEX_COLUMNS)
+        for query in _queries(seed=8, count=200):
+            assert index.query(**query) == source.query(**query), query
+
+    def test_remove_then_append(self) -> None:
+        index = DataTableIndex(columns=COLUMNS)
+        first = index.append([{"name": "Ada", "score": 1}])
+        index.remove(first)
+        assert index.append([{"name": "Grace", "score": 2}]) == [1]
+        assert index.query(search="ada") == {"rows": [], "total": 0}
+        assert index[1] == {"name": "Grace", "score": 2}
+        assert 0 not in index
+
+    def test_remove_unknown_id(self) -> None:
+        index = DataTableIndex(_rows(3), columns=COLUMNS)
+        with pytest.raises(KeyError):
+            index.remove([0, 3])
+        assert len(index) == 3
+
+    def test_mixed_types_sort_as_text(self) -> None:
+        index = DataTableIndex(
+            [{"v": 10}, {"v": 2}],
+            columns=[DataTableColumn(key="v", header="V", sortable=True)],
+        )
+        assert [row["v"] for row in index.query(sort="v")["rows"]] == [2, 10]
+        index.append([{"v": "9"}])
+        assert [row["v"] for row in index.query(sort="v")["rows"]] == [10, 2, "9"]
+
+    def test_only_sortable_columns(self) -> None:
+        with pytest.raises(ValueError, match="Can't sort by 'team'"):
+            DataTableIndex(_rows(), columns=COLUMNS).query(sort="team")
+
+    def test_dataframe(self) -> None:
+        pd = pytest.importorskip("pandas")
+        rows = _rows(100)
+        index = DataTableIndex(pd.DataFrame(rows), columns=COLUMNS)
+        source = DataTableSource(rows, columns=COLUMNS)
+        query = {"page": 2, "sort": "score", "direction": "desc", "search": "a"}
+        assert index.query(**query) == source.query(**query)
@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+import math
+import pickle
+import random
+from typing import Any
+
 import pytest
+from pydantic import ValidationError
 
-from prefab_ui.components import Histogram
+from prefab_ui import optional
+from prefab_ui.components import Histogram, HistogramSketch
 from prefab_ui.components.histogram import _compute_bins, _format_edge
 
 
@@ -206,3 +213,241 @@ class TestHistogramEdgeCases:
         assert len(h.data) == n_bins
         total = sum(row["count"] for row in h.data)
         assert total == 100
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(optional, "numpy", lambda: None)
+    return request.param
+
+
+def _gauss(n: int, seed: int) -> list[float]:
+    rng = random.Random(seed)
+    return [rng.gauss(0, 1) for _ in range(n)]
+
+
+def _counts(data: list[dict[str, Any]]) -> list[int]:
+    return [row["count"] for row in data]
+
+
+class TestBinning:
+    VALUES = _gauss(2_000, seed=3)
+    EXPECTED_17 = [
+        1,
+        4,
+        9,
+        33,
+        59,
+        110,
+        195,
+        248,
+        323,
+        316,
+        271,
+        194,
+        121,
+        67,
+        29,
+        16,
+        4,
+    ]
+
+    def test_backends_agree(self, backend: str):
+        values = [*self.VALUES, math.nan, math.inf, -math.inf]
+        assert _counts(_compute_bins(values, 17, None)) == self.EXPECTED_17
+
+    def test_explicit_edges(self, backend: str):
+        values = [-1, 0, 0.5, 1, 1.5, 2, 2, 3]
+        assert _counts(_compute_bins(values, 10, [0, 1, 2])) == [2, 4]
+
+    def test_last_bin_includes_upper_edge(self, backend: str):
+        assert _counts(_compute_bins([0, 1, 2, 3], 3, None)) == [1, 1, 2]
+
+    def test_matches_numpy(self):
+        np = pytest.importorskip("numpy")
+        rng = np.random.default_rng(0)
+        for scale in (1e-6, 1.0, 1e9):
+            values = rng.normal(size=5_000) * scale
+            for bins in (1, 7, 64):
+                expected = np.histogram(values, bins)[0].tolist()
+                assert _counts(_compute_bins(values, bins, None)) == expected
+
+
+class TestBinRules:
+    VALUES = _gauss(1_000, seed=5)
+
+    def test_sturges(self, backend: str):
+        assert len(_compute_bins(self.VALUES, "sturges", None)) == 11
+
+    def test_freedman_diaconis(self, backend: str):
+        np = pytest.importorskip("numpy")
+        expected = len(np.histogram_bin_edges(self.VALUES, "fd")) - 1
+        assert len(_compute_bins(self.VALUES, "fd", None)) == expected
+
+    def test_auto_is_the_larger(self, backend: str):
+        fd = len(_compute_bins(self.VALUES, "fd", None))
+        assert len(_compute_bins(self.VALUES, "auto", None)) == max(fd, 11)
+
+    def test_fd_without_spread_falls_back_to_sturges(self, backend: str):
+        values = [0] * 100 + [1, 2]
+        assert len(_compute_bins(values, "fd", None)) == 8
+
+
+class TestSources:
+    def test_iterator(self, backend: str):
+        h = Histogram(values=iter(range(100)), bins=4)
+        assert _counts(h.data) == [25, 25, 25, 25]
+
+    def test_chunks(self, backend: str):
+        chunks = ([i * 10 + j for j in range(10)] for i in range(10))
+        h = Histogram(values=chunks, bins=4, bin_range=(0, 100))
+        assert _counts(h.data) == [25, 25, 25, 25]
+
+    def test_bin_range_drops_outside_values(self, backend: str):
+        h = Histogram(values=[-5, 0, 1, 2, 3, 4, 50], bins=2, bin_range=(0, 4))
+        assert _counts(h.data) == [2, 3]
+        assert h.data[0]["bin"] == "0–2"
+
+    def test_bin_range_with_rule(self, backend: str):
+        h = Histogram(values=iter(range(100)), bins="sturges", bin_range=(0, 200))
+        assert len(h.data) == 8
+        assert sum(_counts(h.data)) == 100
+
+    def test_empty_iterator(self, backend: str):
+        assert Histogram(values=iter([]), bin_range=(0, 1)).data == []
+
+    def test_numpy_array(self):
+        np = pytest.importorskip("numpy")
+        h = Histogram(values=np.arange(100), bins=4)
+        assert _counts(h.data) == [25, 25, 25, 25]
+
+    def test_pandas_series(self):
+        pd = pytest.importorskip("pandas")
+        h = Histogram(values=pd.Series([1.0, None, 2.0, 3.0]), bins=2)
+        assert _counts(h.data) == [1, 2]
+
+    def test_values_held_by_reference(self):
+        values = [1, 2, 3]
+        assert Histogram(values=values).values is values
+
+    def test_rejects_non_iterable(self):
+        with pytest.raises(ValidationError):
+            Histogram(values="123")
+
+    def test_rejects_reversed_range(self):
+        with pytest.raises(ValueError, match="bin_range"):
+            Histogram(values=[1, 2], bin_range=(5, 0))
+
+
+class TestHistogramSketch:
+    def test_fixed_width_buckets(self, backend: str):
+        sketch = HistogramSketch(width=10)
+        sketch.add_many([1, 5, 12, 19, 25, -3])
+        assert sketch.count == 6
+        assert sketch.buckets == 4
+        assert (sketch.min, sketch.max) == (-3, 25)
+        assert sketch.sum == 59
+
+    def test_add_and_add_many_agree(self, backend: str):
+        values = [v * 100 for v in _gauss(5_000, seed=9)]
+        one, many = HistogramSketch(width=7), HistogramSketch(width=7)
+        for value in values:
+            one.add(value)
+        many.add_many(iter(values))
+        assert one._positive == many._positive
+        assert one.count == many.count
+
+    def test_log_buckets_relative_accuracy(self, backend: str):
+        values = [math.exp(v * 3) for v in _gauss(5_000, seed=2)]
+        sketch = HistogramSketch(relative_accuracy=0.02)
+        sketch.add_many(values)
+        for q in (0.1, 0.5, 0.9, 0.99):
+            expected = sorted(values)[round(q * (len(values) - 1))]
+            assert abs(sketch.quantile(q) - expected) <= 0.02 * expected
+
+    def test_log_negative_and_zero(self, backend: str):
+        sketch = HistogramSketch(relative_accuracy=0.01)
+        sketch.add_many([-100, -1, 0, 0, 1, 100])
+        assert sketch.buckets == 5
+        assert sketch.quantile(0) == -100
+        assert sketch.quantile(0.5) == 0
+        assert sketch.quantile(1) == 100
+
+    def test_memory_bounded_by_buckets(self, backend: str):
+        sketch = HistogramSketch(relative_accuracy=0.05)
+        for _ in range(20):
+            sketch.add_many(range(1, 1_001))
+        assert sketch.count == 20_000
+        assert sketch.buckets < 100
+
+    def test_ignores_non_finite(self, backend: str):
+        sketch = HistogramSketch(width=1)
+        sketch.add_many([1.0, math.nan, math.inf])
+        sketch.add(math.nan)
+        assert sketch.count == 1
+
+    def test_merge(self, backend: str):
+        a, b = HistogramSketch(width=5), HistogramSketch(width=5)
+        a.add_many(range(50))
+        b.add_many(range(50, 100))
+        whole = HistogramSketch(width=5)
+        whole.add_many(range(100))
+        assert a.merge(b) is a
+        assert a._positive == whole._positive
+        assert (a.count, a.min, a.max) == (100, 0, 99)
+
+    def test_merge_rejects_other_layouts(self):
+        with pytest.raises(ValueError, match="different buckets"):
+            HistogramSketch(width=5).merge(HistogramSketch(width=10))
+        with pytest.raises(ValueError, match="different buckets"):
+            HistogramSketch(width=5).merge(HistogramSketch(relative_accuracy=0.01))
+
+    def test_pickles(self):
+        sketch = HistogramSketch(relative_accuracy=0.01)
+        sketch.add_many([1, 2, 3])
+        copy = pickle.loads(pickle.dumps(sketch))
+        assert copy._positive == sketch._positive
+        assert copy.merge(sketch).count == 6
+
+    def test_empty(self):
+        sketch = HistogramSketch(width=1)
+        assert sketch.min is None
+        assert sketch.quantile(0.5) is None
+        assert Histogram(values=sketch).data == []
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {},
+            {"width": 1, "relative_accuracy": 0.1},
+            {"width": 0},
+            {"relative_accuracy": 1},
+        ],
+    )
+    def test_invalid_layout(self, kwargs: dict[str, float]):
+        with pytest.raises(ValueError):
+            HistogramSketch(**kwargs)
+
+
+class TestHistogramFromSketch:
+    def test_fixed_width_counts(self, backend: str):
+        sketch = HistogramSketch(width=1)
+        sketch.add_many([i + 0.5 for i in range(100)])
+        h = Histogram(values=sketch, bins=4)
+        assert _counts(h.data) == [25, 25, 25, 25]
+        assert h.to_json()["type"] == "BarChart"
+
+    def test_total_preserved(self, backend: str):
+        sketch = HistogramSketch(relative_accuracy=0.01)
+        sketch.add_many([math.exp(v) for v in _gauss(3_000, seed=4)])
+        for bins in (1, 10, "sturges", "fd"):
+            assert sum(_counts(Histogram(values=sketch, bins=bins).data)) == 3_000
+
+    def test_bin_edges(self, backend: str):
+        sketch = HistogramSketch(width=1)
+        sketch.add_many([0.5, 1.5, 2.5, 3.5])
+        h = Histogram(values=sketch, bin_edges=[0, 2, 4])
+        assert _counts(h.data) == [2, 2]
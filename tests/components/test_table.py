@@ -74,3 +74,8 @@ class TestDataTableComponent:
         assert j["paginated"] is True
         assert j["pageSize"] == 25
         assert len(j["rows"]) == 1
+
+    def test_data_table_columnar_rows(self):
+        rows = {"name": ["Alice", "Bob"], "email": ["a@example.com", "b@example.com"]}
+        dt = DataTable(columns=[DataTableColumn(key="name", header="Name")], rows=rows)
+        assert dt.to_json()["rows"] == rows
@@ -10,6 +10,7 @@ from prefab_ui.actions import (
     CloseOverlay,
     OpenFilePicker,
     OpenLink,
+    PatchState,
     PopState,
     SetInterval,
     SetState,
@@ -18,7 +19,7 @@ from prefab_ui.actions import (
 )
 from prefab_ui.actions.mcp import CallTool, SendMessage, UpdateContext
 from prefab_ui.components import Button, Checkbox, DropZone, Input, Slider
-from prefab_ui.rx import EVENT
+from prefab_ui.rx import EVENT, RESULT
 
 
 class TestActionSerialization:
@@ -133,6 +134,20 @@ class TestCallToolResolver:
         )
         assert j["view"]["children"][0]["onClick"]["tool"] == "explicit_name"
 
+    def test_patch_state_flag(self):
+        from prefab_ui.app import PrefabApp, ResolvedTool
+
+        def complete(todo_id: int) -> list[dict]:
+            return []
+
+        app = PrefabApp(view=Button(label="Done", on_click=CallTool(complete)))
+        j = app.to_json(
+            tool_resolver=lambda fn: ResolvedTool(name=fn.__name__, patch_state="todos")
+        )
+        assert j["view"]["onClick"]["patchState"] == "todos"
+        plain = app.to_json(tool_resolver=lambda fn: ResolvedTool(name=fn.__name__))
+        assert "patchState" not in plain["view"]["onClick"]
+
 
 class TestActionOnComponents:
     def test_button_on_click(self):
@@ -236,6 +251,7 @@ class TestActionCallbacks:
             ToggleState("k"),
             AppendState("k", 0),
             PopState("k", 0),
+            PatchState("k", []),
             ShowToast("m"),
             CloseOverlay(),
             OpenFilePicker(),
@@ -416,6 +432,27 @@ class TestPopStateSerialization:
         assert d["onSuccess"]["action"] == "showToast"
 
 
+class TestPatchStateSerialization:
+    def test_basic(self):
+        patch = [{"op": "replace", "path": "/0/done", "value": True}]
+        d = PatchState("todos", patch).model_dump(by_alias=True, exclude_none=True)
+        assert d == {"action": "patchState", "key": "todos", "patch": patch}
+
+    def test_result_patch(self):
+        a = CallTool("complete", on_success=PatchState("todos", RESULT))
+        d = a.model_dump(by_alias=True, exclude_none=True)
+        assert d["onSuccess"] == {
+            "action": "patchState",
+            "key": "todos",
+            "patch": "{{ $result }}",
+        }
+
+    def test_validates_path(self):
+        assert PatchState("todos.0", []).key == "todos.0"
+        with pytest.raises(ValueError):
+            PatchState("bad key", [])
+
+
 # ---------------------------------------------------------------------------
 # OpenFilePicker serialization
 # ---------------------------------------------------------------------------
@@ -543,6 +580,21 @@ class TestSetIntervalSerialization:
         assert "onSuccess" not in d
         assert "onError" not in d
 
+    def test_versioned_polling(self):
+        a = SetInterval(
+            5000,
+            on_tick=CallTool(
+                "metrics",
+                version_argument="version",
+                on_success=SetState("metrics", RESULT),
+            ),
+        )
+        d = a.model_dump(by_alias=True, exclude_none=True)
+        assert d["onTick"]["versionArgument"] == "version"
+        assert "versionArgument" not in CallTool("metrics").model_dump(
+            by_alias=True, exclude_none=True
+        )
+
     def test_one_shot_delay_pattern(self):
         a = SetInterval(3000, count=1, on_complete=ShowToast("Still there?"))
         d = a.model_dump(by_alias=True, exclude_none=True)
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import datetime
+import gzip
+import io
 import json
+import zlib
 
 import pytest
 
@@ -45,6 +49,41 @@ class TestPrefabAppToJson:
         assert "view" not in result
 
 
+class TestPrefabAppToJsonBytes:
+    def test_matches_to_json(self):
+        app = PrefabApp(
+            view=Column(children=[Heading(content="{{ name }}")]),
+            state={
+                "name": "Zoë",
+                "when": datetime.date(2024, 1, 2),
+                "tags": ("a", "b"),
+                "rows": [{"i": i} for i in range(100)],
+            },
+        )
+        data = app.to_json_bytes()
+        assert isinstance(data, bytes)
+        assert json.loads(data) == app.to_json()
+
+    def test_compact_utf8(self):
+        app = PrefabApp(state={"name": "Zoë"})
+        data = app.to_json_bytes()
+        assert b" " not in data
+        assert "Zoë".encode() in data
+
+    def test_escape_html(self):
+        app = PrefabApp(state={"html": "</script>"})
+        assert b"</script>" in app.to_json_bytes()
+        escaped = app.to_json_bytes(escape_html=True)
+        assert b"</" not in escaped
+        assert json.loads(escaped) == {
+            "version": PROTOCOL_VERSION,
+            "state": {"html": "</script>"},
+        }
+
+    def test_empty_app(self):
+        assert json.loads(PrefabApp().to_json_bytes()) == {"version": PROTOCOL_VERSION}
+
+
 class TestPrefabAppValidation:
     def test_reserved_state_key_rejected(self):
         with pytest.raises(ValueError, match="reserved prefix '\\$'"):
@@ -109,6 +148,96 @@ class TestPrefabAppHtml:
         assert r"<\/script>" in html
 
 
+class TestPrefabAppIterHtml:
+    def test_matches_html(self):
+        app = PrefabApp(
+            title="Dash",
+            view=Column(children=[Heading(content="{{ name }}")]),
+            state={"name": "Ünïcode", "rows": [{"i": i} for i in range(1000)]},
+            stylesheets=["https://cdn.example.com/a.css", ".x { color: red }"],
+            scripts=["https://cdn.example.com/chart.js"],
+        )
+        chunks = list(app.iter_html())
+        assert all(isinstance(c, bytes) for c in chunks)
+        assert b"".join(chunks) == app.html().encode("utf-8")
+
+    def test_matches_html_without_extras(self):
+        app = PrefabApp(view=Text(content="hi"))
+        assert b"".join(app.iter_html()) == app.html().encode("utf-8")
+
+    def test_payload_is_chunked(self):
+        app = PrefabApp(state={"rows": ["x" * 100 for _ in range(5000)]})
+        chunks = list(app.iter_html(chunk_size=4096))
+        assert len(chunks) > 10
+        assert b"".join(chunks) == app.html().encode("utf-8")
+
+    def test_escapes_script_closing_tag(self):
+        app = PrefabApp(state={"html": "</script>", "deep": [[[[[[["</b>"] * 300]]]]]]})
+        page = b"".join(app.iter_html())
+        assert page == app.html().encode("utf-8")
+        assert b"</script></script>" not in page
+
+    def test_write_html(self):
+        app = PrefabApp(view=Text(content="hi"), state={"x": 1})
+        buffer = io.BytesIO()
+        written = app.write_html(buffer)
+        assert buffer.getvalue() == app.html().encode("utf-8")
+        assert written == len(buffer.getvalue())
+
+
+class TestPrefabAppHtmlBytes:
+    def _app(self) -> PrefabApp:
+        return PrefabApp(
+            title="Dash",
+            view=Text(content="hi"),
+            state={"rows": [{"i": i, "s": "</b>"} for i in range(2000)]},
+            stylesheets=["https://cdn.example.com/a.css"],
+        )
+
+    def test_uncompressed(self):
+        app = self._app()
+        assert app.html_bytes() == app.html().encode("utf-8")
+
+    def test_gzip(self):
+        app = self._app()
+        body = app.html_bytes(encoding="gzip")
+        assert body[:2] == b"\x1f\x8b"
+        assert gzip.decompress(body) == app.html().encode("utf-8")
+
+    def test_deflate(self):
+        app = self._app()
+        body = app.html_bytes(encoding="deflate")
+        assert zlib.decompress(body) == app.html().encode("utf-8")
+
+
+class TestPrefabAppHashedAssets:
+    def test_html_references_hashed_assets(self):
+        from prefab_ui.renderer.assets import get_renderer_assets
+
+        app = PrefabApp(view=Text(content="hi"), state={"x": 1})
+        html = app.html(assets="hashed")
+        assert len(html) < 5000
+        for name in get_renderer_assets():
+            assert f"/_prefab/{name}" in html
+        assert '<script id="prefab:initial-data"' in html
+
+    def test_custom_prefix(self):
+        app = PrefabApp(view=Text(content="hi"))
+        html = app.html(assets="hashed", assets_prefix="/static/prefab")
+        assert 'src="/static/prefab/renderer.' in html
+
+    def test_stream_and_compressed_match(self):
+        app = PrefabApp(view=Text(content="hi"), stylesheets=["a.css"])
+        expected = app.html(assets="hashed").encode("utf-8")
+        assert b"".join(app.iter_html(assets="hashed")) == expected
+        body = app.html_bytes(encoding="gzip", assets="hashed")
+        assert gzip.decompress(body) == expected
+
+    def test_unknown_mode(self):
+        with pytest.raises(ValueError, match="Unknown assets mode"):
+            PrefabApp().html(assets="cdn")
+
+
 class TestPrefabAppCsp:
     def test_baseline_csp(self):
         app = PrefabApp(view=Text(content="hi"))
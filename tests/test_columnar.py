@@ -0,0 +1,65 @@
+"""Tests for the columnar row-data helpers (prefab_ui.columnar)."""
+
+from __future__ import annotations
+
+import pytest
+
+from prefab_ui.columnar import is_columns_values, to_columns, to_rows
+
+ROWS = [
+    {"month": "Jan", "desktop": 186, "mobile": 80},
+    {"month": "Feb", "desktop": 305, "mobile": None},
+]
+
+
+class TestToColumns:
+    def test_transposes(self) -> None:
+        assert to_columns(ROWS) == {
+            "month": ["Jan", "Feb"],
+            "desktop": [186, 305],
+            "mobile": [80, None],
+        }
+
+    def test_single_column(self) -> None:
+        assert to_columns([{"a": 1}, {"a": 2}]) == {"a": [1, 2]}
+
+    def test_key_order_may_differ(self) -> None:
+        assert to_columns([{"a": 1, "b": 2}, {"b": 4, "a": 3}]) == {
+            "a": [1, 3],
+            "b": [2, 4],
+        }
+
+    @pytest.mark.parametrize(
+        "rows",
+        [[], [{}, {}], [{"a": 1}, {"b": 2}], [{"a": 1}, {"a": 2, "b": 3}]],
+    )
+    def test_not_columnar(self, rows: list[dict[str, int]]) -> None:
+        assert to_columns(rows) is None
+
+
+class TestToRows:
+    def test_column_arrays(self) -> None:
+        columns = to_columns(ROWS)
+        assert columns is not None
+        assert to_rows(columns) == ROWS
+
+    def test_columns_and_values(self) -> None:
+        data = {
+            "columns": ["month", "desktop", "mobile"],
+            "values": [["Jan", 186, 80], ["Feb", 305, None]],
+        }
+        assert is_columns_values(data)
+        assert to_rows(data) == ROWS
+
+    def test_empty(self) -> None:
+        assert to_rows({}) == []
+        assert to_rows({"columns": ["a"], "values": []}) == []
+
+    def test_columns_named_columns(self) -> None:
+        # Only lists of strings and lists of lists read as columns + values.
+        data = {"columns": [1, 2], "values": [3, 4]}
+        assert not is_columns_values(data)
+        assert to_rows(data) == [
+            {"columns": 1, "values": 3},
+            {"columns": 2, "values": 4},
+        ]
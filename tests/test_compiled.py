@@ -0,0 +1,116 @@
+"""Tests for compile_view / CompiledView."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import zlib
+
+import pytest
+
+from prefab_ui import CompiledView, compile_view
+from prefab_ui.actions.mcp import CallTool
+from prefab_ui.app import PrefabApp, ResolvedTool, set_initial_state
+from prefab_ui.components import Button, Column, Heading, Text
+from prefab_ui.define import Define
+from prefab_ui.themes import Theme
+
+
+def _app(state: dict | None = None) -> PrefabApp:
+    with Define("row") as row:
+        Text("{{ name }} </b>")
+    with Column() as view:
+        Heading("{{ title }}")
+        Text("{{ count }}")
+    return PrefabApp(
+        title="Dash",
+        view=view,
+        defs=[row],
+        state=state,
+        theme=Theme(accent="blue"),
+        stylesheets=["https://cdn.example.com/a.css"],
+    )
+
+
+STATE = {"title": "Orders", "count": 3, "rows": [{"s": "</script>"}]}
+
+
+class TestCompiledView:
+    def test_json_matches_app(self):
+        compiled = CompiledView(_app())
+        assert compiled.to_json(STATE) == _app(STATE).to_json()
+
+    def test_json_bytes_match_app(self):
+        compiled = CompiledView(_app())
+        assert compiled.to_json_bytes(STATE) == _app(STATE).to_json_bytes()
+        assert compiled.to_json_bytes(STATE, escape_html=True) == _app(
+            STATE
+        ).to_json_bytes(escape_html=True)
+
+    def test_html_matches_app(self):
+        compiled = CompiledView(_app())
+        assert compiled.html(STATE) == _app(STATE).html()
+        assert compiled.html(STATE, assets="hashed") == _app(STATE).html(
+            assets="hashed"
+        )
+
+    @pytest.mark.parametrize(
+        ("encoding", "decompress"),
+        [("gzip", gzip.decompress), ("deflate", zlib.decompress)],
+    )
+    def test_compressed_html(self, encoding, decompress):
+        compiled = CompiledView(_app())
+        expected = _app(STATE).html().encode("utf-8")
+        for _ in range(2):
+            assert decompress(compiled.html_bytes(STATE, encoding=encoding)) == expected
+
+    def test_no_state(self):
+        compiled = CompiledView(PrefabApp(view=Text("hi")))
+        assert compiled.to_json() == PrefabApp(view=Text("hi")).to_json()
+        assert "state" not in json.loads(compiled.to_json_bytes())
+
+    def test_request_state_merged_over_defaults(self):
+        compiled = CompiledView(_app({"title": "Default", "count": 0}))
+        assert compiled.to_json()["state"] == {"title": "Default", "count": 0}
+        assert compiled.to_json({"count": 5})["state"] == {
+            "title": "Default",
+            "count": 5,
+        }
+
+    def test_reserved_state_key_rejected(self):
+        compiled = CompiledView(_app())
+        with pytest.raises(ValueError, match="reserved prefix"):
+            compiled.to_json_bytes({"$x": 1})
+
+    def test_view_frozen_at_compile_time(self):
+        text = Text("before")
+        compiled = CompiledView(PrefabApp(view=Column(children=[text])))
+        text.content = "after"
+        assert compiled.to_json()["view"]["children"][0]["content"] == "before"
+
+    def test_tool_resolved_at_compile_time(self):
+        def my_tool() -> None: ...
+
+        compiled = CompiledView(
+            PrefabApp(view=Button("Go", on_click=CallTool(my_tool))),
+            tool_resolver=lambda fn: ResolvedTool(name=f"srv_{fn.__name__}"),
+        )
+        assert compiled.to_json()["view"]["onClick"]["tool"] == "srv_my_tool"
+
+
+class TestCompileView:
+    def test_builder_returning_component(self):
+        @compile_view
+        def view():
+            set_initial_state(count=1)
+            with Column() as col:
+                Text("{{ count }}")
+            return col
+
+        assert isinstance(view, CompiledView)
+        assert view.to_json()["state"] == {"count": 1}
+        assert view.to_json()["view"]["children"][0]["content"] == "{{ count }}"
+
+    def test_builder_returning_app(self):
+        compiled = compile_view(_app)
+        assert compiled.to_json(STATE) == _app(STATE).to_json()
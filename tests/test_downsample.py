@@ -0,0 +1,163 @@
+"""Tests for LTTB downsampling (prefab_ui.components.charts.downsample)."""
+
+from __future__ import annotations
+
+import math
+import random
+
+import pytest
+
+from prefab_ui import optional
+from prefab_ui.components.charts import downsample as module
+from prefab_ui.components.charts.downsample import downsample, lttb
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(optional, "numpy", lambda: None)
+    return request.param
+
+
+def _wave(n: int) -> list[float]:
+    return [math.sin(i / 40) for i in range(n)]
+
+
+class TestLttb:
+    def test_keeps_endpoints_and_count(self, backend: str) -> None:
+        chosen = lttb(range(1000), _wave(1000), 50)
+        assert len(chosen) == 50
+        assert chosen[0] == 0
+        assert chosen[-1] == 999
+        assert chosen == sorted(set(chosen))
+
+    def test_short_input_unchanged(self, backend: str) -> None:
+        assert lttb(range(5), [1.0, 2.0, 3.0, 4.0, 5.0], 5) == [0, 1, 2, 3, 4]
+
+    def test_keeps_spikes(self, backend: str) -> None:
+        y = [0.0] * 10_000
+        y[1234] = 100.0
+        y[7777] = -100.0
+        chosen = lttb(range(10_000), y, 20)
+        assert 1234 in chosen
+        assert 7777 in chosen
+
+    def test_skips_missing_values(self, backend: str) -> None:
+        y = _wave(100)
+        y[10:20] = [math.nan] * 10
+        chosen = lttb(range(100), y, 10)
+        assert not any(10 <= i < 20 for i in chosen)
+
+    def test_uses_x_spacing(self, backend: str) -> None:
+        x = [i * i for i in range(200)]
+        assert lttb(x, _wave(200), 20) != lttb(range(200), _wave(200), 20)
+
+    def test_backends_agree(self) -> None:
+        pytest.importorskip("numpy")
+        rng = random.Random(7)
+        for _ in range(50):
+            n = rng.randint(4, 400)
+            x = sorted(rng.uniform(0, 100) for _ in range(n))
+            y = [rng.gauss(0, 1) if rng.random() > 0.1 else math.nan for _ in x]
+            max_points = rng.randint(3, n - 1)
+            assert lttb(x, y, max_points) == module._lttb_python(x, y, max_points)
+
+    def test_max_points_too_small(self) -> None:
+        with pytest.raises(ValueError, match="at least 3"):
+            lttb(range(10), range(10), 2)
+
+
+class TestDownsample:
+    def test_rows(self, backend: str) -> None:
+        rows = [{"t": i, "a": y} for i, y in enumerate(_wave(500))]
+        result = downsample(rows, ["a"], "t", 40)
+        assert len(result) == 40
+        assert result[0] is rows[0]
+        assert result[-1] is rows[-1]
+
+    def test_series_share_rows(self, backend: str) -> None:
+        rows = [{"t": i, "a": 0, "b": 0} for i in range(1000)]
+        rows[100]["a"] = 50
+        rows[900]["b"] = -50
+        result = downsample(rows, ["a", "b"], "t", 10)
+        kept = [row["t"] for row in result]
+        assert 100 in kept
+        assert 900 in kept
+        assert kept == sorted(kept)
+        assert len(kept) <= 20
+
+    def test_columns(self, backend: str) -> None:
+        data = {"t": list(range(300)), "a": _wave(300)}
+        result = downsample(data, ["a"], "t", 30)
+        assert len(result["t"]) == len(result["a"]) == 30
+
+    def test_columns_and_values(self, backend: str) -> None:
+        data = {
+            "columns": ["t", "a"],
+            "values": [[i, y] for i, y in enumerate(_wave(300))],
+        }
+        result = downsample(data, ["a"], "t", 30)
+        assert result["columns"] == ["t", "a"]
+        assert len(result["values"]) == 30
+
+    def test_categorical_x_uses_position(self, backend: str) -> None:
+        rows = [{"day": f"d{i}", "a": y} for i, y in enumerate(_wave(300))]
+        assert len(downsample(rows, ["a"], "day", 30)) == 30
+
+    def test_small_data_unchanged(self, backend: str) -> None:
+        rows = [{"t": 1, "a": 2}]
+        assert downsample(rows, ["a"], "t", 10) is rows
+
+    def test_unknown_series_unchanged(self, backend: str) -> None:
+        rows = [{"t": i, "a": i} for i in range(100)]
+        assert downsample(rows, ["missing"], "t", 10) is rows
+
+    def test_reference_unchanged(self, backend: str) -> None:
+        assert downsample("{{ rows }}", ["a"], "t", 10) == "{{ rows }}"
+
+
+class TestFrames:
+    def test_dataframe(self) -> None:
+        pd = pytest.importorskip("pandas")
+        df = pd.DataFrame(
+            {
+                "t": pd.date_range("2025-01-01", periods=2000, freq="h", tz="UTC"),
+                "a": _wave(2000),
+                "label": ["x"] * 2000,
+            }
+        )
+        result = downsample(df, ["a", "label"], "t", 100)
+        assert isinstance(result, pd.DataFrame)
+        assert len(result) == 100
+        assert result.index[0] == 0
+        assert result.index[-1] == 1999
+
+    def test_missing_datetime_spaces_evenly(self) -> None:
+        pd = pytest.importorskip("pandas")
+        t = pd.Series(pd.date_range("2025-01-01", periods=2000, freq="h"))
+        t[500] = pd.NaT
+        df = pd.DataFrame({"t": t, "a": _wave(2000)})
+        result = downsample(df, ["a"], "t", 100)
+        expected = downsample(df[["a"]], ["a"], None, 100)
+        assert list(result.index) == list(expected.index)
+
+    def test_non_string_labels(self) -> None:
+        pd = pytest.importorskip("pandas")
+        df = pd.DataFrame({0: range(1000), 1: _wave(1000)})
+        assert len(downsample(df, ["1"], "0", 50)) == 50
+
+    def test_record_array(self) -> None:
+        np = pytest.importorskip("numpy")
+        array = np.zeros(1000, dtype=[("t", "f8"), ("a", "f8")])
+        array["t"] = np.arange(1000)
+        array["a"] = _wave(1000)
+        assert len(downsample(array, ["a"], "t", 50)) == 50
+
+    def test_arrow_table(self) -> None:
+        pa = pytest.importorskip("pyarrow")
+        table = pa.table({"t": list(range(1000)), "a": _wave(1000)})
+        result = downsample(table, ["a"], "t", 50)
+        assert isinstance(result, pa.Table)
+        assert result.num_rows == 50
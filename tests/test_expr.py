@@ -0,0 +1,276 @@
+"""Tests for the server-side expression engine (prefab_ui.expr)."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from prefab_ui.expr import (
+    UNDEFINED,
+    Binary,
+    ExpressionError,
+    Literal,
+    Pipe,
+    evaluate,
+    fold,
+    from_rx,
+    interpolate,
+    parse,
+    sole_expression,
+    split_template,
+    unparse,
+)
+from prefab_ui.expr import Path as PathNode
+from prefab_ui.rx import ITEM, Rx
+
+CORPUS_PATH = Path(__file__).resolve().parent.parent / "schemas" / "expressions.json"
+CORPUS = json.loads(CORPUS_PATH.read_text())["cases"]
+
+
+class TestConformanceCorpus:
+    """The corpus in schemas/expressions.json is shared with the renderer tests."""
+
+    @pytest.mark.parametrize(
+        "case", CORPUS, ids=[f"{c['group']}: {c['expr']}" for c in CORPUS]
+    )
+    def test_case(self, case: dict) -> None:
+        ctx = case.get("ctx", {})
+        if case.get("error"):
+            with pytest.raises(ExpressionError):
+                evaluate(case["expr"], ctx)
+        elif case.get("undefined"):
+            assert evaluate(case["expr"], ctx) is UNDEFINED
+        else:
+            result = evaluate(case["expr"], ctx)
+            # Compare encoded JSON so 3 and 3.0 (or True and 1) don't pass
+            # for each other.
+            assert json.dumps(result) == json.dumps(case["expected"])
+
+
+class TestParse:
+    def test_ast_shape(self) -> None:
+        assert parse("a * 2 | currency") == Pipe(
+            Binary("*", parse("a"), Literal(2)), "currency", None
+        )
+
+    def test_cached_by_source(self) -> None:
+        assert parse("price * qty | currency") is parse("price * qty | currency")
+
+    def test_parse_error(self) -> None:
+        with pytest.raises(ExpressionError, match="Unexpected token"):
+            parse("a b")
+
+    def test_ast_evaluates(self) -> None:
+        node = parse("count + 1")
+        assert evaluate(node, {"count": 1}) == 2
+        assert evaluate(node, {"count": 41}) == 42
+
+    def test_long_chain(self) -> None:
+        source = " + ".join(f"v{i}" for i in range(5_000))
+        ctx = {f"v{i}": i for i in range(5_000)}
+        assert evaluate(source, ctx) == sum(range(5_000))
+
+
+class TestRxInput:
+    @pytest.mark.parametrize(
+        "expr",
+        [
+            Rx("price") * Rx("qty"),
+            (Rx("price") * Rx("qty")).currency(),
+            (Rx("score") >= 90).then("A", "B"),
+            ~Rx("done") & (Rx("count") > 0),
+            Rx("user").name.upper(),
+            Rx("items")[1].name,
+            Rx("ratio").percent(1),
+            Rx("items").join(" / "),
+            -(Rx("price") - 10),
+            Rx("name").default("anon"),
+            Rx("count").then(Rx("user").name, "none").upper(),
+            Rx("count").then(Rx("done"), 1).then("yes", "no"),
+        ],
+    )
+    def test_matches_rendered_key(self, expr: Rx) -> None:
+        ctx = {
+            "price": 12.5,
+            "qty": 3,
+            "score": 91,
+            "done": False,
+            "count": 2,
+            "user": {"name": "ford"},
+            "items": [{"name": "a"}, {"name": "b"}],
+            "ratio": 0.256,
+            "name": None,
+        }
+        assert evaluate(expr, ctx) == evaluate(expr.key, ctx)
+
+    def test_walks_tree_without_parsing(self) -> None:
+        expr = (Rx("a") + 1).round(2)
+        assert from_rx(expr) == Pipe(Binary("+", parse("a"), Literal(1)), "round", "2")
+
+    def test_forward_reference(self) -> None:
+        container: list[Rx] = []
+        expr = Rx(lambda: container[0]) * 2
+        container.append(Rx("count"))
+        assert evaluate(expr, {"count": 4}) == 8
+
+    def test_loop_item(self) -> None:
+        assert evaluate(ITEM.price.currency(), {"$item": {"price": 5}}) == "$5.00"
+
+    def test_unsupported_node_falls_back_to_key(self) -> None:
+        expr = Rx("rows")["a.b"]
+        assert from_rx(expr) == parse(expr.key)
+
+    def test_unparseable_key_raises_like_renderer(self) -> None:
+        with pytest.raises(ExpressionError):
+            from_rx(Rx("rows")[Rx("i")])
+
+
+class TestInterpolate:
+    def test_sole_template_keeps_type(self) -> None:
+        assert interpolate("{{ items }}", {"items": [1, 2]}) == [1, 2]
+        assert interpolate(" {{ n > 1 }} ", {"n": 2}) is True
+
+    def test_sole_template_undefined_kept(self) -> None:
+        assert interpolate("{{ missing }}", {}) == "{{ missing }}"
+
+    def test_sole_template_null(self) -> None:
+        assert interpolate("{{ value }}", {"value": None}) is None
+
+    def test_mixed_template(self) -> None:
+        result = interpolate(
+            "{{ name }} has {{ n }} {{ n | pluralize:'item' }}{{ missing }}",
+            {"name": "Ford", "n": 2},
+        )
+        assert result == "Ford has 2 items"
+
+    def test_invalid_expression(self) -> None:
+        assert interpolate("{{ a b }}", {}) == "{{ a b }}"
+        assert interpolate("x {{ a b }} y", {}) == "x  y"
+
+    def test_unclosed(self) -> None:
+        assert interpolate("a {{ b", {"b": 1}) == "a {{ b"
+
+    def test_no_template(self) -> None:
+        assert interpolate("plain", {}) == "plain"
+
+    def test_sole_expression(self) -> None:
+        assert sole_expression(" {{ a.b }} ") == "a.b"
+        assert sole_expression("x {{ a }}") is None
+        assert sole_expression("{{ a }}{{ b }}") is None
+
+    def test_split_template(self) -> None:
+        assert split_template("a {{ b }} c {{ d") == (["a ", " c {{ d"], ["b"])
+        assert split_template("plain") == (["plain"], [])
+
+
+class TestDates:
+    def test_offset_converted_to_utc(self) -> None:
+        assert evaluate("d | datetime", {"d": "2024-01-15T23:30:00-05:00"}) == (
+            "Jan 16, 2024, 4:30 AM"
+        )
+
+    def test_naive_shown_as_written(self) -> None:
+        assert evaluate("d | time", {"d": "2024-01-15T09:05:00"}) == "9:05 AM"
+
+    def test_time_only(self) -> None:
+        assert evaluate("t | time", {"t": "14:30"}) == "2:30 PM"
+
+    def test_date_only(self) -> None:
+        assert evaluate("d | date:short", {"d": "2024-02-01"}) == "2/1/2024"
+
+
+class TestUndefined:
+    def test_falsy_and_distinct_from_none(self) -> None:
+        assert not UNDEFINED
+        assert UNDEFINED is not None
+        assert repr(UNDEFINED) == "UNDEFINED"
+
+    def test_nullish_default(self) -> None:
+        assert evaluate("a | 'x'", {}) == "x"
+        assert evaluate("a | 'x'", {"a": None}) == "x"
+        assert evaluate("a | 'x'", {"a": 0}) == 0
+
+
+PARSEABLE = [c for c in CORPUS if not c.get("error")]
+
+
+class TestUnparse:
+    @pytest.mark.parametrize("case", PARSEABLE, ids=[c["expr"] for c in PARSEABLE])
+    def test_round_trip(self, case: dict) -> None:
+        node = parse(case["expr"])
+        assert repr(parse(unparse(node))) == repr(node)
+
+    @pytest.mark.parametrize(
+        ("node", "source"),
+        [
+            (
+                Binary("*", Binary("+", PathNode(("a",)), Literal(1)), Literal(2)),
+                "(a + 1) * 2",
+            ),
+            (
+                Binary("-", Literal(1), Binary("-", PathNode(("a",)), Literal(2))),
+                "1 - (a - 2)",
+            ),
+            (Pipe(parse("a ? b : c"), "upper", None), "(a ? b : c) | upper"),
+            (parse("a ? (b | upper) : c"), "a ? (b | upper) : c"),
+            (Literal(1e-7), "0.0000001"),
+            (Literal(-2.5), "-2.5"),
+            (Pipe(PathNode(("d",)), "date", "MMM d"), "d | date:'MMM d'"),
+        ],
+    )
+    def test_parenthesizes(self, node, source: str) -> None:
+        assert unparse(node) == source
+        assert evaluate(parse(source), {"a": 3, "b": "x", "c": "y", "d": None}) == (
+            evaluate(node, {"a": 3, "b": "x", "c": "y", "d": None})
+        )
+
+    def test_quote_in_string_rejected(self) -> None:
+        with pytest.raises(ExpressionError):
+            unparse(Literal("it's"))
+
+
+class TestFold:
+    @pytest.mark.parametrize("case", PARSEABLE, ids=[c["expr"] for c in PARSEABLE])
+    def test_same_result_with_context_as_constants(self, case: dict) -> None:
+        ctx = case.get("ctx", {})
+        node = parse(case["expr"])
+        folded = fold(node, ctx)
+        if case.get("undefined"):
+            assert evaluate(folded, ctx) is UNDEFINED
+        else:
+            assert json.dumps(evaluate(folded, ctx)) == json.dumps(case["expected"])
+
+    def test_inlines_and_folds(self) -> None:
+        node = parse("price * qty > 100 ? 'big' : 'small'")
+        assert fold(node, {"price": 30, "qty": 4}) == Literal("big")
+
+    def test_partial(self) -> None:
+        node = parse("rate * 2 + count")
+        assert unparse(fold(node, {"rate": 1.5})) == "3 + count"
+
+    def test_non_scalar_kept(self) -> None:
+        node = parse("items.length + 1")
+        assert fold(node, {"items": [1, 2]}) == Literal(3)
+        assert fold(parse("items"), {"items": [1, 2]}) == parse("items")
+
+    def test_nan_not_folded(self) -> None:
+        assert fold(parse("0 / 0")) == parse("0 / 0")
+
+    def test_dropped_branch_with_pipe_kept(self) -> None:
+        # The renderer evaluates both branches; a pipe error in the other
+        # branch would still surface, so it can't be dropped.
+        node = parse("flag ? 'a' : (x | round:200)")
+        assert type(fold(node, {"flag": True})).__name__ == "Ternary"
+        assert fold(parse("flag ? 'a' : x"), {"flag": True}) == Literal("a")
+
+    def test_short_circuit_operators(self) -> None:
+        assert fold(parse("on && name"), {"on": True}) == parse("name")
+        assert fold(parse("on && name"), {"on": 0}) == Literal(0)
+        assert fold(parse("off || name"), {"off": ""}) == parse("name")
+
+    def test_pipes_not_evaluated(self) -> None:
+        assert fold(parse("price | currency"), {"price": 2}) == Pipe(
+            Literal(2), "currency", None
+        )
@@ -0,0 +1,156 @@
+"""Tests for DataFrame, record array and Arrow table ingestion (prefab_ui.frames)."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+
+from prefab_ui.app import PrefabApp
+from prefab_ui.components import DataTable, DataTableColumn, Text
+from prefab_ui.components.charts import ChartSeries, LineChart
+from prefab_ui.frames import frame_columns, is_frame, json_fallback
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+
+SERIES = [ChartSeries(data_key="downloads")]
+
+
+def _chart(data: Any) -> dict[str, Any]:
+    return json.loads(
+        PrefabApp(view=LineChart(data=data, series=SERIES)).to_json_bytes()
+    )["view"]["data"]
+
+
+class TestPandas:
+    def test_stored_by_reference(self) -> None:
+        df = pd.DataFrame({"week": [1, 2], "downloads": [10, 20]})
+        chart = LineChart(data=df, series=SERIES)
+        assert chart.data is df
+        assert chart.to_json()["data"] == {"week": [1, 2], "downloads": [10, 20]}
+
+    def test_missing_values(self) -> None:
+        df = pd.DataFrame(
+            {
+                "downloads": [1.5, np.nan, np.inf],
+                "package": ["a", None, "c"],
+                "count": pd.array([1, None, 3], dtype="Int64"),
+            }
+        )
+        assert _chart(df) == {
+            "downloads": [1.5, None, None],
+            "package": ["a", None, "c"],
+            "count": [1, None, 3],
+        }
+
+    def test_datetimes(self) -> None:
+        df = pd.DataFrame(
+            {
+                "day": pd.to_datetime(["2025-01-06", None]),
+                "at": pd.to_datetime(["2025-01-06 10:30", "2025-01-06 11:00"]),
+                "utc": pd.to_datetime(["2025-01-06 10:30"] * 2).tz_localize(
+                    "US/Eastern"
+                ),
+            }
+        )
+        assert _chart(df) == {
+            "day": ["2025-01-06", None],
+            "at": ["2025-01-06T10:30", "2025-01-06T11:00"],
+            "utc": ["2025-01-06T15:30Z", "2025-01-06T15:30Z"],
+        }
+
+    def test_datetime_precision_per_column(self) -> None:
+        df = pd.DataFrame(
+            {
+                "mixed": pd.to_datetime(["2025-01-06 00:00:00", "2025-01-06 10:30:15"]),
+                "fraction": pd.to_datetime(
+                    ["2025-01-06 00:00:00.25", "2025-01-06 00:00:00.00"]
+                ),
+                "utc": pd.to_datetime(["2025-01-06", "2025-01-07"]).tz_localize("UTC"),
+            }
+        )
+        assert _chart(df) == {
+            "mixed": ["2025-01-06T00:00:00", "2025-01-06T10:30:15"],
+            "fraction": ["2025-01-06T00:00:00.250", "2025-01-06T00:00:00.000"],
+            "utc": ["2025-01-06T00:00Z", "2025-01-07T00:00Z"],
+        }
+
+    def test_non_string_column_names(self) -> None:
+        assert frame_columns(pd.DataFrame({0: [1], 1: [2]})) == {"0": [1], "1": [2]}
+
+    def test_duplicate_columns_rejected(self) -> None:
+        df = pd.DataFrame([[1, 2]], columns=["a", "a"])
+        with pytest.raises(ValidationError, match="unique"):
+            LineChart(data=df, series=SERIES)
+
+    def test_data_table_rows(self) -> None:
+        df = pd.DataFrame({"name": ["Ada", "Grace"]})
+        table = DataTable(columns=[DataTableColumn(key="name", header="Name")], rows=df)
+        assert table.to_json()["rows"] == {"name": ["Ada", "Grace"]}
+
+    def test_state(self) -> None:
+        df = pd.DataFrame({"x": [1.0, np.nan]})
+        app = PrefabApp(view=Text("{{ n }}"), state={"rows": df, "n": np.int64(3)})
+        expected = {"rows": {"x": [1.0, None]}, "n": 3}
+        assert app.to_json()["state"] == expected
+        assert json.loads(app.to_json_bytes())["state"] == expected
+
+    def test_cached_json_matches(self) -> None:
+        chart = LineChart(data=pd.DataFrame({"downloads": [1, 2]}), series=SERIES)
+        assert json.loads(chart._cached_json_bytes()) == chart.to_json()
+
+
+class TestNumpy:
+    def test_record_array(self) -> None:
+        records = np.rec.fromarrays(
+            [np.arange(3), np.array([1.0, np.nan, 2.0])], names="week,downloads"
+        )
+        assert _chart(records) == {"week": [0, 1, 2], "downloads": [1.0, None, 2.0]}
+
+    def test_structured_array(self) -> None:
+        array = np.array(
+            [("2025-01-06", 3)], dtype=[("week", "datetime64[D]"), ("downloads", "i8")]
+        )
+        assert _chart(array) == {"week": ["2025-01-06"], "downloads": [3]}
+
+    def test_plain_array_rejected(self) -> None:
+        assert not is_frame(np.arange(3))
+        with pytest.raises(ValidationError):
+            LineChart(data=np.arange(3), series=SERIES)
+
+    def test_fallback(self) -> None:
+        assert json_fallback(np.arange(3)) == [0, 1, 2]
+        assert json_fallback(np.float64("nan")) is None
+        assert json_fallback(np.datetime64("2025-01-06")) == "2025-01-06"
+        with pytest.raises(Exception, match="Unable to serialize"):
+            json_fallback(object())
+
+
+@pytest.fixture
+def pa() -> Any:
+    return pytest.importorskip("pyarrow")
+
+
+class TestArrow:
+    def test_table(self, pa: Any) -> None:
+        table = pa.table(
+            {
+                "week": pa.array([0, 86_400_000_000], type=pa.timestamp("us")),
+                "downloads": pa.array([1.5, None]),
+                "count": pa.array([1, None]),
+                "package": pa.array(["a", None]),
+            }
+        )
+        assert _chart(table) == {
+            "week": ["1970-01-01", "1970-01-02"],
+            "downloads": [1.5, None],
+            "count": [1, None],
+            "package": ["a", None],
+        }
+
+    def test_record_batch(self, pa: Any) -> None:
+        batch = pa.RecordBatch.from_pydict({"downloads": [1, 2]})
+        assert _chart(batch) == {"downloads": [1, 2]}
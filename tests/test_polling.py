@@ -0,0 +1,54 @@
+"""Tests for prefab_ui.polling: versioned responses for polled tools."""
+
+from __future__ import annotations
+
+from prefab_ui.polling import VersionedResult
+
+
+class TestVersionedResult:
+    def test_first_poll_gets_data(self):
+        result = VersionedResult({"cpu": 0.5})
+        assert result.respond() == {"version": result.version, "data": {"cpu": 0.5}}
+
+    def test_same_version_is_unchanged(self):
+        result = VersionedResult([1, 2, 3])
+        assert result.respond(result.version) == {"unchanged": True}
+
+    def test_stale_version_gets_data(self):
+        old = VersionedResult({"cpu": 0.5})
+        new = VersionedResult({"cpu": 0.7})
+        assert old.version != new.version
+        assert new.respond(old.version) == {
+            "version": new.version,
+            "data": {"cpu": 0.7},
+        }
+
+    def test_version_follows_content(self):
+        assert (
+            VersionedResult({"a": [1]}).version == VersionedResult({"a": [1]}).version
+        )
+        assert len(VersionedResult(None).version) == 16
+
+    def test_explicit_version(self):
+        result = VersionedResult({"cpu": 0.5}, version=42)
+        assert result.version == "42"
+        assert result.respond("42") == {"unchanged": True}
+        assert result.respond("41")["version"] == "42"
+
+    def test_callable_loaded_only_when_stale(self):
+        calls = []
+
+        def load() -> dict[str, float]:
+            calls.append(1)
+            return {"cpu": 0.5}
+
+        result = VersionedResult(load, version=7)
+        assert result.respond("7") == {"unchanged": True}
+        assert calls == []
+        assert result.respond("6")["data"] == {"cpu": 0.5}
+        assert result.respond(None)["data"] == {"cpu": 0.5}
+        assert calls == [1]
+
+    def test_callable_hashed_without_version(self):
+        result = VersionedResult(lambda: [1, 2])
+        assert result.version == VersionedResult([1, 2]).version
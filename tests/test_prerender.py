@@ -0,0 +1,259 @@
+"""Tests for server-side pre-rendering (prefab_ui.prerender)."""
+
+from __future__ import annotations
+
+import gzip
+import json
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from prefab_ui.app import PrefabApp
+from prefab_ui.components import Badge, Column, Text
+from prefab_ui.components.control_flow import Else, ForEach, If
+from prefab_ui.prerender import prerender, resolve_tree
+from prefab_ui.rx import ITEM, Rx
+
+COMPONENTS_DIR = (
+    Path(__file__).resolve().parent.parent / "schemas" / "fixtures" / "components"
+)
+FIXTURES = sorted(COMPONENTS_DIR.glob("*.json"))
+
+PROBE = "<b>Ford & Arthur</b>"
+
+_VOID_TAGS = frozenset({"input", "img", "br", "hr", "meta", "link", "source"})
+
+
+class _Markup(HTMLParser):
+    """Checks tag balance and collects tags, text and attribute values."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.stack: list[str] = []
+        self.tags: set[str] = set()
+        self.values: list[str] = []
+
+    def handle_starttag(self, tag: str, attrs: list[Any]) -> None:
+        self.tags.add(tag)
+        self.values += [value for _, value in attrs if value]
+        if tag not in _VOID_TAGS:
+            self.stack.append(tag)
+
+    def handle_startendtag(self, tag: str, attrs: list[Any]) -> None:
+        self.tags.add(tag)
+        self.values += [value for _, value in attrs if value]
+
+    def handle_endtag(self, tag: str) -> None:
+        assert self.stack and self.stack[-1] == tag, f"unbalanced </{tag}>"
+        self.stack.pop()
+
+    def handle_data(self, data: str) -> None:
+        self.values.append(data)
+
+
+def _parse(markup: str) -> _Markup:
+    parser = _Markup()
+    parser.feed(markup)
+    parser.close()
+    assert parser.stack == []
+    return parser
+
+
+class TestComponentFixtures:
+    """Every schema fixture prerenders, and its string props follow state."""
+
+    @pytest.mark.parametrize("path", FIXTURES, ids=[p.stem for p in FIXTURES])
+    def test_fixture(self, path: Path) -> None:
+        fixture = json.loads(path.read_text())
+        baseline = _parse(prerender(fixture, {}))
+
+        for key, value in fixture.items():
+            if key == "type" or not isinstance(value, str):
+                continue
+            if not any(value in rendered for rendered in baseline.values):
+                continue
+            templated = {**fixture, key: "{{ probe }}"}
+            markup = _parse(prerender(templated, {"probe": PROBE}))
+            # The state value shows up as text or an attribute value, and
+            # its markup characters are escaped rather than parsed as tags.
+            assert any(PROBE in rendered for rendered in markup.values), key
+            assert "b" not in markup.tags
+            assert not any("{{" in rendered for rendered in markup.values)
+
+    def test_fixtures_present(self) -> None:
+        assert len(FIXTURES) > 50
+
+
+class TestTemplates:
+    def test_text_interpolated(self) -> None:
+        view = {"type": "Text", "content": "{{ count * 2 }} items"}
+        assert prerender(view, {"count": 21}) == "<span>42 items</span>"
+
+    def test_sole_template_keeps_number(self) -> None:
+        view = {"type": "Text", "content": "{{ count }}"}
+        assert prerender(view, {"count": 0}) == "<span>0</span>"
+
+    def test_missing_value_left_as_written(self) -> None:
+        view = {"type": "Text", "content": "{{ missing }}"}
+        assert prerender(view, {}) == "<span>{{ missing }}</span>"
+
+    def test_css_class_from_state_is_escaped(self) -> None:
+        view = {"type": "Div", "cssClass": "{{ cls }}", "content": "x"}
+        assert prerender(view, {"cls": 'a" onclick="b'}) == (
+            '<div class="a&quot; onclick=&quot;b">x</div>'
+        )
+
+    def test_action_specs_not_interpolated(self) -> None:
+        view = {
+            "type": "Button",
+            "label": "Go",
+            "onClick": {"action": "setState", "key": "x", "value": "{{ $event }}"},
+        }
+        (resolved,) = resolve_tree(view, {})
+        assert resolved["onClick"]["value"] == "{{ $event }}"
+        table = {
+            "type": "DataTable",
+            "columns": [],
+            "source": {"action": "toolCall", "tool": "rows", "arguments": "{{ q }}"},
+        }
+        (resolved,) = resolve_tree(table, {"q": "x"})
+        assert resolved["source"]["arguments"] == "{{ q }}"
+
+    def test_let_scopes_children(self) -> None:
+        view = {
+            "type": "Column",
+            "let": {"greeting": "Hi {{ name }}"},
+            "children": [{"type": "Text", "content": "{{ greeting }}!"}],
+        }
+        assert "<span>Hi Ford!</span>" in prerender(view, {"name": "Ford"})
+
+
+class TestControlFlow:
+    def test_foreach_expands_items(self) -> None:
+        view = {
+            "type": "ForEach",
+            "key": "crew",
+            "let": {"label": "{{ $index + 1 }}. {{ $item.name }}"},
+            "children": [{"type": "Text", "content": "{{ label }}"}],
+        }
+        markup = prerender(view, {"crew": [{"name": "Ford"}, {"name": "Arthur"}]})
+        assert markup == (
+            '<div class="contents"><span>1. Ford</span><span>2. Arthur</span></div>'
+        )
+
+    def test_foreach_nested_path_and_css_class(self) -> None:
+        view = {
+            "type": "ForEach",
+            "key": "ship.crew",
+            "cssClass": "gap-2",
+            "children": [{"type": "Text", "content": "{{ $item }}"}],
+        }
+        markup = prerender(view, {"ship": {"crew": ["Zaphod"]}})
+        assert markup == '<div class="w-full gap-2"><span>Zaphod</span></div>'
+
+    def test_foreach_non_list_renders_nothing(self) -> None:
+        view = {"type": "ForEach", "key": "crew", "children": [{"type": "Text"}]}
+        assert prerender(view, {"crew": "nope"}) == ""
+
+    def test_condition_first_match(self) -> None:
+        view = {
+            "type": "Condition",
+            "cases": [
+                {
+                    "when": "{{ n > 10 }}",
+                    "children": [{"type": "Text", "content": "a"}],
+                },
+                {"when": "n > 1", "children": [{"type": "Text", "content": "b"}]},
+            ],
+            "else": [{"type": "Text", "content": "c"}],
+        }
+        assert prerender(view, {"n": 20}) == "<span>a</span>"
+        assert prerender(view, {"n": 5}) == "<span>b</span>"
+        assert prerender(view, {"n": 0}) == "<span>c</span>"
+
+    def test_condition_unparseable_falls_back_to_key(self) -> None:
+        view = {
+            "type": "Condition",
+            "cases": [{"when": "is open", "children": [{"type": "Text"}]}],
+        }
+        assert prerender(view, {"is open": True}) == "<span></span>"
+        assert prerender(view, {}) == ""
+
+    def test_if_else_components(self) -> None:
+        with Column() as view:
+            with If(Rx("count") > 1):
+                Text("many")
+            with Else():
+                Text("few")
+        json_view = view.to_json()
+        assert "<span>many</span>" in prerender(json_view, {"count": 3})
+        assert "<span>few</span>" in prerender(json_view, {"count": 1})
+
+    def test_ref_inlines_definition(self) -> None:
+        defs = {"row": {"type": "Text", "content": "{{ who }}"}}
+        view = {"$ref": "row", "let": {"who": "{{ name | upper }}"}}
+        assert prerender(view, {"name": "ford"}, defs) == "<span>FORD</span>"
+
+    def test_circular_ref_renders_nothing(self) -> None:
+        defs = {"loop": {"type": "Div", "children": [{"$ref": "loop"}]}}
+        assert prerender({"$ref": "loop"}, {}, defs) == "<div></div>"
+
+    def test_slot_renders_tree_from_state(self) -> None:
+        view = {
+            "type": "Slot",
+            "name": "panel",
+            "children": [{"type": "Text", "content": "empty"}],
+        }
+        panel = {"type": "Text", "content": "{{ title }}"}
+        assert prerender(view, {"panel": panel, "title": "Hi"}) == "<span>Hi</span>"
+        assert prerender(view, {}) == "<span>empty</span>"
+
+
+class TestPrefabAppPrerender:
+    def _app(self) -> PrefabApp:
+        with Column() as view:
+            Text("Hello {{ name }}")
+            with ForEach("crew"):
+                Badge(ITEM.name)
+        return PrefabApp(
+            view=view,
+            state={
+                "name": "<Ford>",
+                "crew": [{"name": "Arthur"}, {"name": "Trillian"}],
+            },
+        )
+
+    def _root(self, page: str) -> str:
+        start = page.index('<div id="root"')
+        start = page.index(">", start) + 1
+        return page[start : page.index("</div>\n  <script", start)]
+
+    def test_markup_in_root(self) -> None:
+        root = self._root(self._app().html(prerender=True))
+        assert "<span>Hello &lt;Ford&gt;</span>" in root
+        assert ">Arthur</span>" in root
+        assert ">Trillian</span>" in root
+        _parse(root)
+
+    def test_default_root_is_empty(self) -> None:
+        assert self._root(self._app().html()) == ""
+
+    def test_streams_match(self) -> None:
+        app = self._app()
+        page = app.html(prerender=True).encode("utf-8")
+        assert b"".join(app.iter_html(prerender=True)) == page
+        assert app.html_bytes(prerender=True) == page
+        assert gzip.decompress(app.html_bytes(encoding="gzip", prerender=True)) == page
+
+    def test_data_unchanged(self) -> None:
+        app = self._app()
+        page = app.html(prerender=True)
+        start = page.index('type="application/json">') + len('type="application/json">')
+        baked = json.loads(page[start : page.index("</script>", start)])
+        assert baked == app.to_json()
+
+    def test_no_view(self) -> None:
+        app = PrefabApp(state={"x": 1})
+        assert app.html(prerender=True) == app.html()
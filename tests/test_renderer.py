@@ -2,9 +2,32 @@
 
 from __future__ import annotations
 
+import gzip
+import os
+import zlib
+
 import pytest
 
-from prefab_ui.renderer import get_renderer_csp, get_renderer_html
+from prefab_ui import renderer
+from prefab_ui.renderer import (
+    clear_renderer_cache,
+    get_renderer_csp,
+    get_renderer_head,
+    get_renderer_head_bytes,
+    get_renderer_head_compressed,
+    get_renderer_html,
+)
+from prefab_ui.renderer.assets import (
+    get_hashed_head,
+    get_renderer_asset,
+    get_renderer_assets,
+)
+from prefab_ui.renderer.compression import (
+    adler32_combine,
+    compress_static,
+    crc32_combine,
+    splice_compressed,
+)
 
 
 class TestGetRendererHtml:
@@ -49,3 +72,163 @@ class TestGetRendererCsp:
         monkeypatch.setenv("PREFAB_RENDERER_URL", "https://assets.example.com/prefab")
         csp = get_renderer_csp()
         assert csp == {"resource_domains": ["https://assets.example.com"]}
+
+
+class TestRendererCache:
+    def test_bundle_read_once(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.delenv("PREFAB_RENDERER_URL", raising=False)
+        clear_renderer_cache()
+        calls = 0
+        original = renderer._load_assets
+
+        def counting(key: tuple[object, ...]) -> renderer._RendererAssets:
+            nonlocal calls
+            calls += 1
+            return original(key)
+
+        monkeypatch.setattr(renderer, "_load_assets", counting)
+        first = get_renderer_head()
+        get_renderer_html()
+        get_renderer_csp()
+        assert get_renderer_head() is first
+        assert calls == 1
+
+    def test_head_bytes_match_head(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.delenv("PREFAB_RENDERER_URL", raising=False)
+        head = get_renderer_head()
+        assert "<script" in head
+        assert get_renderer_head_bytes() == head.encode("utf-8")
+
+    def test_override_change_invalidates(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv("PREFAB_RENDERER_URL", "http://localhost:4173")
+        assert "localhost:4173" in get_renderer_head()
+        monkeypatch.setenv("PREFAB_RENDERER_URL", "http://localhost:5000")
+        assert "localhost:5000" in get_renderer_head()
+        assert b"localhost:5000" in get_renderer_head_bytes()
+        assert get_renderer_csp() == {"resource_domains": ["http://localhost:5000"]}
+
+    def test_bundle_change_invalidates(self, monkeypatch: pytest.MonkeyPatch, tmp_path):
+        monkeypatch.delenv("PREFAB_RENDERER_URL", raising=False)
+        bundle = tmp_path / "app.html"
+        bundle.write_text(
+            "<html><head><script>a</script></head><body></body></html>",
+            encoding="utf-8",
+        )
+        monkeypatch.setattr(renderer, "_BUNDLED_HTML", bundle)
+        assert get_renderer_head() == "<script>a</script>"
+        bundle.write_text(
+            "<html><head><script>bb</script></head><body></body></html>",
+            encoding="utf-8",
+        )
+        os.utime(bundle, ns=(0, 0))
+        assert get_renderer_head() == "<script>bb</script>"
+
+    def test_csp_result_is_a_fresh_dict(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv("PREFAB_RENDERER_URL", "http://localhost:4173")
+        csp = get_renderer_csp()
+        csp["resource_domains"].append("https://evil.example.com")
+        csp["connect_domains"] = ["x"]
+        assert get_renderer_csp() == {"resource_domains": ["http://localhost:4173"]}
+
+
+class TestCompression:
+    def test_crc32_combine(self):
+        a, b = b"hello " * 100, b"world" * 37
+        combined = crc32_combine(zlib.crc32(a), zlib.crc32(b), len(b))
+        assert combined == zlib.crc32(a + b)
+
+    def test_adler32_combine(self):
+        a, b = b"x" * 70_000, b"abc" * 12_345
+        combined = adler32_combine(zlib.adler32(a), zlib.adler32(b), len(b))
+        assert combined == zlib.adler32(a + b)
+
+    @pytest.mark.parametrize("encoding", ["gzip", "deflate"])
+    def test_splice_round_trip(self, encoding: str):
+        static = compress_static(b"<script>renderer</script>" * 500)
+        parts = [b"<title>hi</title>", static, [b"<body>", b'{"x":1}', b"</body>"]]
+        body = splice_compressed(parts, encoding)
+        expected = (
+            b"<title>hi</title>"
+            + b"<script>renderer</script>" * 500
+            + b'<body>{"x":1}</body>'
+        )
+        wbits = 31 if encoding == "gzip" else 15
+        # A single zlib call decodes the whole thing: one member, one stream.
+        assert zlib.decompress(body, wbits) == expected
+
+    def test_static_segments_back_to_back(self):
+        first = compress_static(b"a" * 1000)
+        second = compress_static(b"b" * 1000)
+        body = splice_compressed([first, second, first], "gzip")
+        assert gzip.decompress(body) == b"a" * 1000 + b"b" * 1000 + b"a" * 1000
+
+    def test_empty_parts(self):
+        assert gzip.decompress(splice_compressed([], "gzip")) == b""
+        body = splice_compressed([b"", compress_static(b""), b""], "deflate")
+        assert zlib.decompress(body) == b""
+
+    def test_unknown_encoding(self):
+        with pytest.raises(ValueError, match="Unsupported encoding"):
+            splice_compressed([b"x"], "br")
+
+    def test_renderer_head_compressed_once(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv("PREFAB_RENDERER_URL", "http://localhost:4173")
+        segment = get_renderer_head_compressed()
+        assert get_renderer_head_compressed() is segment
+        # Segments end on a full flush, not a final block.
+        inflated = zlib.decompressobj(-15).decompress(segment.deflated)
+        assert inflated == get_renderer_head_bytes()
+
+
+_MINI_BUNDLE = (
+    "<html><head><title>Prefab</title>"
+    '<script type="module" crossorigin>let s="<head></head>";<\\/script></script>'
+    '<style rel="stylesheet" crossorigin>body{margin:0}</style>'
+    "</head><body></body></html>"
+)
+
+
+class TestHashedAssets:
+    def test_splits_script_and_style(self, monkeypatch: pytest.MonkeyPatch, tmp_path):
+        bundle = tmp_path / "app.html"
+        bundle.write_text(_MINI_BUNDLE, encoding="utf-8")
+        monkeypatch.setattr(renderer, "_BUNDLED_HTML", bundle)
+        assets = get_renderer_assets()
+        by_suffix = {name.rsplit(".", 1)[1]: a for name, a in assets.items()}
+        assert by_suffix["js"].content == b'let s="<head></head>";<\\/script>'
+        assert by_suffix["js"].content_type.startswith("text/javascript")
+        assert by_suffix["css"].content == b"body{margin:0}"
+        assert by_suffix["css"].content_type.startswith("text/css")
+
+    def test_names_are_content_hashed(self, monkeypatch: pytest.MonkeyPatch, tmp_path):
+        bundle = tmp_path / "app.html"
+        bundle.write_text(_MINI_BUNDLE, encoding="utf-8")
+        monkeypatch.setattr(renderer, "_BUNDLED_HTML", bundle)
+        before = set(get_renderer_assets())
+        bundle.write_text(_MINI_BUNDLE.replace("margin:0", "margin:1"), "utf-8")
+        os.utime(bundle, ns=(0, 0))
+        after = set(get_renderer_assets())
+        # Only the CSS changed, so only its name changes.
+        assert len(before & after) == 1
+        assert len(after) == 2
+
+    def test_lookup_and_etag(self):
+        for name, asset in get_renderer_assets().items():
+            assert get_renderer_asset(name) is asset
+            assert asset.etag.strip('"') in name
+        assert get_renderer_asset("renderer.0000.js") is None
+
+    def test_bundle_assets_are_whole(self):
+        assets = get_renderer_assets()
+        js = next(a for n, a in assets.items() if n.endswith(".js"))
+        css = next(a for n, a in assets.items() if n.endswith(".css"))
+        assert len(js.content) > 100_000
+        assert b"</script>" not in js.content
+        assert b"</style>" not in css.content
+        assert b"tailwindcss" in css.content
+
+    def test_hashed_head_references_assets(self):
+        head = get_hashed_head("https://cdn.example.com/static/")
+        for name in get_renderer_assets():
+            assert f"https://cdn.example.com/static/{name}" in head
+        assert len(head) < 1000
@@ -267,6 +267,14 @@ class TestTernary:
         result = Rx("cond").then(Rx("a"), Rx("b"))
         assert result.key == "cond ? a : b"
 
+    def test_pipe_on_ternary(self) -> None:
+        result = Rx("a").then(Rx("b"), Rx("c")).upper()
+        assert result.key == "(a ? b : c) | upper"
+
+    def test_ternary_condition(self) -> None:
+        result = Rx("a").then(Rx("b"), Rx("c")).then("yes", "no")
+        assert result.key == "(a ? b : c) ? 'yes' : 'no'"
+
 
 # ── Pipes ────────────────────────────────────────────────────────────
 
@@ -527,6 +535,37 @@ class TestDeferredResolution:
         assert b.to_json()["disabled"] == "{{ !enabled }}"
 
 
+# ── Key memoization ──────────────────────────────────────────────────
+
+
+class TestKeyMemoization:
+    def test_key_computed_once(self) -> None:
+        expr = (Rx("a") + Rx("b")) * 2
+        assert expr.key is expr.key
+
+    def test_shared_subexpression_reused(self) -> None:
+        total = Rx("price") * Rx("qty")
+        first = total.key
+        expr = (total > 100).then(total.currency(), "small")
+        assert expr.key == ("price * qty > 100 ? (price * qty | currency) : 'small'")
+        assert total.key is first
+
+    def test_forward_ref_not_cached(self) -> None:
+        container = [Rx("before")]
+        expr = Rx(lambda: container[0]) + 1
+        assert expr.key == "before + 1"
+        container[0] = Rx("after")
+        assert expr.key == "after + 1"
+
+    def test_deep_chain_no_recursion_error(self) -> None:
+        expr = Rx("v0")
+        for i in range(1, 5_000):
+            expr = expr + Rx(f"v{i}")
+        key = expr.key
+        assert key.startswith("v0 + v1 + v2")
+        assert key.endswith("+ v4999")
+
+
 # ── RxStr type alias ────────────────────────────────────────────────
 
 
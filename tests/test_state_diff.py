@@ -0,0 +1,200 @@
+"""Tests for prefab_ui.state: JSON Patch diffs between state values."""
+
+from __future__ import annotations
+
+import copy
+import json
+import random
+from typing import Any
+
+import pytest
+
+from prefab_ui.state import apply_patch, diff
+
+
+def _todos(n: int) -> list[dict[str, Any]]:
+    return [{"id": i, "title": f"todo {i}", "done": False} for i in range(n)]
+
+
+def _edited(rng: random.Random, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """A copy of ``items`` with a few random inserts, removals, moves and edits."""
+    items = copy.deepcopy(items)
+    if rng.random() < 0.2:
+        rng.shuffle(items)
+    for _ in range(rng.randrange(4)):
+        choice = rng.random()
+        if choice < 0.3 and items:
+            del items[rng.randrange(len(items))]
+        elif choice < 0.6:
+            new = {"id": rng.randrange(100, 200), "title": "new", "done": False}
+            items.insert(rng.randrange(len(items) + 1), new)
+        elif items:
+            items.insert(
+                rng.randrange(len(items)), items.pop(rng.randrange(len(items)))
+            )
+        if items and rng.random() < 0.3:
+            items[rng.randrange(len(items))]["done"] = True
+    return items
+
+
+class TestDiff:
+    def test_equal_values(self):
+        assert diff({"a": [1, {"b": 2}]}, {"a": [1, {"b": 2}]}) == []
+
+    def test_object_keys(self):
+        old = {"name": "Ada", "title": "Countess", "age": 36}
+        new = {"name": "Ada", "age": 37, "born": 1815}
+        assert diff(old, new) == [
+            {"op": "remove", "path": "/title"},
+            {"op": "replace", "path": "/age", "value": 37},
+            {"op": "add", "path": "/born", "value": 1815},
+        ]
+
+    def test_nested_paths(self):
+        old = {"user": {"tags": ["a"]}}
+        new = {"user": {"tags": ["a", "b"]}}
+        assert diff(old, new) == [{"op": "add", "path": "/user/tags/1", "value": "b"}]
+
+    def test_escapes_keys(self):
+        assert diff({}, {"a/b~c": 1}) == [{"op": "add", "path": "/a~1b~0c", "value": 1}]
+
+    def test_scalar_and_type_changes(self):
+        assert diff(1, 2) == [{"op": "replace", "path": "", "value": 2}]
+        assert diff({"a": [1]}, {"a": {"b": 1}}) == [
+            {"op": "replace", "path": "/a", "value": {"b": 1}}
+        ]
+
+    def test_keyed_insert_is_one_add(self):
+        old = _todos(1000)
+        new = copy.deepcopy(old)
+        new.insert(500, {"id": -1, "title": "new", "done": False})
+        assert diff(old, new) == [
+            {"op": "add", "path": "/500", "value": new[500]},
+        ]
+
+    def test_keyed_remove_is_one_remove(self):
+        old = _todos(1000)
+        new = [todo for todo in old if todo["id"] != 123]
+        assert diff(old, new) == [{"op": "remove", "path": "/123"}]
+
+    def test_keyed_move_is_one_move(self):
+        old = _todos(1000)
+        new = copy.deepcopy(old)
+        new.append(new.pop(0))
+        assert diff(old, new) == [{"op": "move", "from": "/0", "path": "/999"}]
+
+    def test_moved_item_edited_in_place(self):
+        old = _todos(10)
+        new = copy.deepcopy(old)
+        new.insert(2, new.pop(7))
+        new[2]["done"] = True
+        assert diff(old, new) == [
+            {"op": "move", "from": "/7", "path": "/2"},
+            {"op": "replace", "path": "/2/done", "value": True},
+        ]
+
+    def test_custom_key(self):
+        old = [{"sku": "a", "n": 1}, {"sku": "b", "n": 2}, {"sku": "c", "n": 3}]
+        new = [old[2], old[0], old[1]]
+        assert diff(old, new, key="sku") == [{"op": "move", "from": "/2", "path": "/0"}]
+
+    def test_unique_scalars_matched_by_value(self):
+        old = ["a", "b", "c", "d", "e"]
+        assert diff(old, ["a", "c", "d", "e", "b"]) == [
+            {"op": "move", "from": "/1", "path": "/4"}
+        ]
+
+    def test_unkeyed_list_skips_common_ends(self):
+        old = [[i] for i in range(8)]
+        assert diff(old, [*old[:2], [9], *old[2:]]) == [
+            {"op": "add", "path": "/2", "value": [9]}
+        ]
+        assert diff(old, [*old[:1], *old[3:]]) == [
+            {"op": "remove", "path": "/1"},
+            {"op": "remove", "path": "/1"},
+        ]
+
+    def test_duplicate_keys_compared_by_position(self):
+        old = [{"id": 1, "v": 0}, {"id": 1, "v": 1}, {"id": 2, "v": 2}]
+        new = [{"id": 1, "v": 0}, {"id": 1, "v": 5}, {"id": 2, "v": 2}]
+        assert diff(old, new) == [{"op": "replace", "path": "/1/v", "value": 5}]
+
+    def test_mostly_changed_list_replaced(self):
+        old = _todos(10)
+        new = list(reversed(old))
+        assert diff(old, new) == [{"op": "replace", "path": "", "value": new}]
+
+    def test_patch_grows_with_the_change(self):
+        old = _todos(10_000)
+        new = copy.deepcopy(old)
+        new[5000]["done"] = True
+        del new[9000]
+        new.insert(10, {"id": -1, "title": "new", "done": False})
+        patch = diff(old, new)
+        assert len(patch) == 3
+        assert len(json.dumps(patch)) < 200
+
+    def test_many_edits_on_long_list(self):
+        rng = random.Random(0)
+        old = _todos(5000)
+        new = copy.deepcopy(old)
+        for _ in range(300):
+            a, b = rng.randrange(5000), rng.randrange(5000)
+            new[a], new[b] = new[b], new[a]
+        for i in range(300):
+            new.insert(rng.randrange(len(new) + 1), {"id": -1 - i, "done": True})
+        patch = diff(old, new)
+        assert {op["op"] for op in patch} == {"move", "add"}
+        assert apply_patch(old, patch) == new
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_round_trip(self, seed: int):
+        rng = random.Random(seed)
+        for _ in range(50):
+            old = {"todos": _edited(rng, _todos(rng.randrange(12))), "n": 1}
+            new = {"todos": _edited(rng, old["todos"]), "tags": ["x", "y"]}
+            before = copy.deepcopy(old)
+            assert apply_patch(old, diff(old, new)) == new
+            assert old == before
+
+
+class TestApplyPatch:
+    def test_operations(self):
+        patch = [
+            {"op": "remove", "path": "/1"},
+            {"op": "add", "path": "/-", "value": {"id": 3}},
+            {"op": "replace", "path": "/0/id", "value": 9},
+            {"op": "move", "from": "/2", "path": "/0"},
+        ]
+        assert apply_patch([{"id": 0}, {"id": 1}, {"id": 2}], patch) == [
+            {"id": 3},
+            {"id": 9},
+            {"id": 2},
+        ]
+
+    def test_copies_only_what_it_edits(self):
+        old = _todos(3)
+        new = apply_patch(old, [{"op": "replace", "path": "/1/done", "value": True}])
+        assert old == _todos(3)
+        assert new[1]["done"] is True
+        assert new[0] is old[0]
+        assert new[1] is not old[1]
+
+    def test_replace_root(self):
+        assert apply_patch([1], [{"op": "replace", "path": "", "value": [2]}]) == [2]
+
+    @pytest.mark.parametrize(
+        "operation",
+        [
+            {"op": "remove", "path": "/5"},
+            {"op": "replace", "path": "/missing", "value": 1},
+            {"op": "add", "path": "/0/x/y", "value": 1},
+            {"op": "move", "from": "/0", "path": "/0/x"},
+            {"op": "remove", "path": ""},
+            {"op": "copy", "from": "/0", "path": "/1"},
+            {"op": "add", "path": "no-slash", "value": 1},
+        ],
+    )
+    def test_invalid_operations(self, operation: dict[str, Any]):
+        with pytest.raises(ValueError):
+            apply_patch([{"x": 1}], [operation])
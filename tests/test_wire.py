@@ -0,0 +1,693 @@
+"""Tests for the wire-format transforms (prefab_ui.wire)."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from prefab_ui.actions import SetState, ToggleState
+from prefab_ui.app import PrefabApp
+from prefab_ui.components import (
+    Badge,
+    Button,
+    Column,
+    DataTable,
+    DataTableColumn,
+    Input,
+    Row,
+    Select,
+    SelectOption,
+    Text,
+)
+from prefab_ui.components.charts import BarChart, ChartSeries, LineChart
+from prefab_ui.components.control_flow import Elif, Else, ForEach, If
+from prefab_ui.expr import ExpressionError, evaluate, parse
+from prefab_ui.prerender import prerender
+from prefab_ui.rx import ITEM, Rx
+from prefab_ui.wire import (
+    affected_nodes,
+    affects,
+    columnar,
+    decode_expression,
+    dependencies,
+    encode_expression,
+    expand_strings,
+    intern_strings,
+    optimize,
+    parse_expressions,
+)
+
+COMPONENTS_DIR = (
+    Path(__file__).resolve().parent.parent / "schemas" / "fixtures" / "components"
+)
+FIXTURES = sorted(COMPONENTS_DIR.glob("*.json"))
+CORPUS = json.loads((COMPONENTS_DIR.parent.parent / "expressions.json").read_text())[
+    "cases"
+]
+
+
+def _render(envelope: dict[str, Any]) -> str:
+    return prerender(envelope["view"], envelope.get("state"), envelope.get("defs"))
+
+
+def _texts(node: Any) -> list[str]:
+    if isinstance(node, list):
+        return [t for child in node for t in _texts(child)]
+    if not isinstance(node, dict):
+        return []
+    own = [node["content"]] if isinstance(node.get("content"), str) else []
+    return own + _texts(node.get("children", []))
+
+
+class TestOptimize:
+    def _app(self, **state: Any) -> PrefabApp:
+        with Column() as view:
+            Text("Hello {{ user.name | upper }}, {{ count * 2 }} items")
+            with If(Rx("mode") == "admin"):
+                Text("admin")
+            with Elif(Rx("count") > 100):
+                Text("lots")
+            with Else():
+                Text("normal")
+            Badge("{{ price * qty | currency }}")
+            Input(name="qty")
+            Button("Add", on_click=SetState("count", Rx("count") + 1))
+            with ForEach("rows"):
+                Text("{{ $item.label }} of {{ title }}")
+        defaults = {
+            "user": {"name": "ford"},
+            "count": 3,
+            "mode": "admin",
+            "price": 2.5,
+            "qty": 1,
+            "title": "T",
+            "rows": [{"label": "a"}, {"label": "b"}],
+        }
+        return PrefabApp(view=view, state={**defaults, **state})
+
+    @pytest.mark.parametrize(
+        "state",
+        [{}, {"mode": "user"}, {"mode": "user", "count": 500}, {"title": None}],
+    )
+    def test_renders_the_same(self, state: dict[str, Any]) -> None:
+        envelope = self._app(**state).to_json()
+        assert _render(optimize(envelope)) == _render(envelope)
+
+    def test_constants_inlined(self) -> None:
+        optimized = self._app().to_json(optimize=True)
+        texts = _texts(optimized["view"])
+        assert "Hello {{ 'ford' | upper }}, {{ count * 2 }} items" in texts
+        assert "{{ $item.label }} of T" in texts
+        assert "lots" not in texts and "normal" not in texts
+
+    def test_written_keys_kept(self) -> None:
+        optimized = self._app().to_json(optimize=True)
+        # count is written by SetState and qty by the Input; rows is still
+        # read by the ForEach.
+        assert optimized["state"] == {
+            "count": 3,
+            "qty": 1,
+            "rows": [{"label": "a"}, {"label": "b"}],
+        }
+
+    def test_input_not_modified(self) -> None:
+        app = self._app()
+        envelope = app.to_json()
+        before = repr(envelope)
+        optimize(envelope)
+        assert repr(envelope) == before
+        assert app.to_json() == envelope
+
+    def test_sole_template_keeps_type(self) -> None:
+        envelope = {
+            "view": {"type": "Button", "label": "Go", "disabled": "{{ locked }}"},
+            "state": {"locked": True},
+        }
+        assert optimize(envelope)["view"]["disabled"] is True
+
+    @pytest.mark.parametrize(
+        "action",
+        [
+            {"action": "patchState", "key": "count", "patch": []},
+            {"action": "toolCall", "tool": "bump", "patchState": "count"},
+        ],
+    )
+    def test_patched_keys_kept(self, action: dict[str, Any]) -> None:
+        envelope = {
+            "view": {"type": "Button", "label": "{{ count }}", "onClick": action},
+            "state": {"count": 1},
+        }
+        assert optimize(envelope) == envelope
+
+    def test_source_action_kept(self) -> None:
+        source = {"action": "toolCall", "tool": "rows", "arguments": {"q": "{{ q }}"}}
+        envelope = {
+            "view": {"type": "DataTable", "columns": [], "source": source},
+            "state": {"q": "x"},
+        }
+        assert optimize(envelope)["view"]["source"] == source
+
+    def test_toggle_and_let_names_not_inlined(self) -> None:
+        with Column(let={"title": "{{ heading }}"}) as view:
+            Text("{{ title }} / {{ open }}")
+            Button("Toggle", on_click=ToggleState("open"))
+        envelope = PrefabApp(
+            view=view, state={"title": "state", "open": False, "heading": "H"}
+        ).to_json()
+        optimized = optimize(envelope)
+        assert _texts(optimized["view"]) == ["{{ title }} / {{ open }}"]
+        assert _render(optimized) == _render(envelope)
+
+    def test_templated_write_disables(self) -> None:
+        envelope = {
+            "view": {
+                "type": "Button",
+                "label": "{{ a }}",
+                "onClick": {"action": "setState", "key": "{{ target }}", "value": 1},
+            },
+            "state": {"a": "x", "target": "a"},
+        }
+        assert optimize(envelope) is envelope
+
+    def test_unnamed_control_protects_auto_names(self) -> None:
+        envelope = {
+            "view": {
+                "type": "Column",
+                "children": [
+                    {"type": "Slider"},
+                    {"type": "Text", "content": "{{ slider_1 }} {{ other }}"},
+                ],
+            },
+            "state": {"slider_1": 5, "other": 1},
+        }
+        assert _texts(optimize(envelope)["view"]) == ["{{ slider_1 }} 1"]
+
+    def test_condition_at_root_keeps_single_node(self) -> None:
+        envelope = {
+            "view": {
+                "type": "Condition",
+                "cases": [
+                    {"when": "{{ n > 1 }}", "children": [{"type": "Text"}]},
+                    {"when": "live", "children": [{"type": "Badge"}]},
+                ],
+                "else": [{"type": "Separator"}],
+            },
+            "state": {"n": 0},
+        }
+        view = optimize(envelope)["view"]
+        assert view["cases"] == [{"when": "live", "children": [{"type": "Badge"}]}]
+        assert view["else"] == [{"type": "Separator"}]
+
+    def test_condition_known_true_becomes_else(self) -> None:
+        envelope = {
+            "view": {
+                "type": "Condition",
+                "cases": [
+                    {"when": "live", "children": [{"type": "Badge"}]},
+                    {"when": "n == 0", "children": [{"type": "Text"}]},
+                ],
+                "else": [{"type": "Separator"}],
+            },
+            "state": {"n": 0},
+        }
+        view = optimize(envelope)["view"]
+        assert view["cases"] == [{"when": "live", "children": [{"type": "Badge"}]}]
+        assert view["else"] == [{"type": "Text"}]
+
+    def test_condition_in_select_left_alone(self) -> None:
+        with Select(name="pick") as select:
+            SelectOption("A", value="a")
+            with If(Rx("extra")):
+                SelectOption("B", value="b")
+        envelope = PrefabApp(view=select, state={"extra": True}).to_json()
+        children = optimize(envelope)["view"]["children"]
+        assert [c["type"] for c in children] == ["SelectOption", "Condition"]
+
+    def test_inlined_text_cannot_form_template(self) -> None:
+        envelope = {
+            "view": {"type": "Text", "content": "{{ a }}{{ b }} {{ c }}"},
+            "state": {"a": "{", "b": "{", "c": "}}"},
+        }
+        optimized = optimize(envelope)
+        assert optimized["view"]["content"] == "{{ a }}{{ b }} {{ c }}"
+
+    def test_unrepresentable_values_left(self) -> None:
+        envelope = {
+            "view": {"type": "Text", "content": "{{ quote }} {{ items }}"},
+            "state": {"quote": "it's", "items": [1]},
+        }
+        optimized = optimize(envelope)
+        assert optimized["view"]["content"] == "{{ quote }} {{ items }}"
+        assert optimized["state"] == envelope["state"]
+
+    def test_foreach_over_constant_list(self) -> None:
+        with Column() as view:
+            with ForEach("crew"):
+                Text(ITEM.name)
+        envelope = PrefabApp(view=view, state={"crew": [{"name": "Ford"}]}).to_json()
+        optimized = optimize(envelope)
+        assert optimized["state"] == {"crew": [{"name": "Ford"}]}
+        assert _render(optimized) == _render(envelope)
+
+
+def _reads(table: dict[str, Any], pointer: str = "") -> set[str]:
+    return {table["paths"][i] for i in table["view"].get(pointer, [])}
+
+
+class TestDependencies:
+    @pytest.mark.parametrize("path", FIXTURES, ids=[p.stem for p in FIXTURES])
+    def test_fixture_props(self, path: Path) -> None:
+        fixture = json.loads(path.read_text())
+        table = dependencies({"view": fixture})
+        assert all(
+            pointer == "" or pointer.startswith("/") for pointer in table["view"]
+        )
+        for key, value in fixture.items():
+            if key in ("type", "name", "let") or not isinstance(value, str):
+                continue
+            templated = {**fixture, key: "{{ probe.value | upper }}"}
+            reads = _reads(dependencies({"view": templated}))
+            assert "probe.value" in reads, key
+
+    @pytest.mark.parametrize("path", FIXTURES, ids=[p.stem for p in FIXTURES])
+    def test_fixture_static(self, path: Path) -> None:
+        # Plain fixtures read no state other than their own control's value.
+        fixture = json.loads(path.read_text())
+        table = dependencies({"view": fixture})
+        name = fixture.get("name")
+        assert set(table["paths"]) <= ({name} if isinstance(name, str) else set())
+
+    def _app(self) -> PrefabApp:
+        with Column() as view:
+            Text("{{ count * 2 }} items")
+            with ForEach("rows", let={"label": "{{ $item.name | upper }}"}):
+                Text("{{ $index }}. {{ label }}")
+                Badge("{{ $item.tag.text }}")
+            with If(Rx("mode") == "admin"):
+                Text("admin of {{ team.name }}")
+            with Else():
+                Text("guest")
+            Input(name="query")
+            Text("static")
+        return PrefabApp(
+            view=view,
+            state={
+                "count": 1,
+                "rows": [{"name": "ford", "tag": {"text": "a"}, "extra": 1}],
+                "mode": "admin",
+                "team": {"name": "Heart of Gold", "size": 4},
+                "query": "q",
+                "unused": 0,
+            },
+        )
+
+    def test_table(self) -> None:
+        table = self._app().to_json(dependencies=True)["dependencies"]
+        assert _reads(table, "/children/0") == {"count"}
+        assert _reads(table, "/children/1") == {"rows"}
+        assert _reads(table, "/children/1/children/0") == {"rows", "rows.*.name"}
+        assert _reads(table, "/children/1/children/1") == {"rows.*.tag.text"}
+        assert _reads(table, "/children/2") == {"mode"}
+        assert _reads(table, "/children/2/cases/0/children/0") == {"team.name"}
+        assert "/children/2/else/0" not in table["view"]
+        assert _reads(table, "/children/3") == {"query"}
+        assert "/children/4" not in table["view"]
+        assert len(table["paths"]) == len(set(table["paths"]))
+
+    @pytest.mark.parametrize(
+        ("key", "value"),
+        [
+            ("count", 5),
+            ("rows", []),
+            ("rows", [{"name": "zaphod", "tag": {"text": "a"}, "extra": 1}]),
+            ("rows", [{"name": "ford", "tag": {"text": "b"}, "extra": 1}]),
+            ("rows", [{"name": "ford", "tag": {"text": "a"}, "extra": 2}]),
+            ("mode", "user"),
+            ("team", {"name": "Heart of Gold", "size": 5}),
+            ("team", {"name": "Vogon", "size": 4}),
+            ("unused", 1),
+        ],
+    )
+    def test_unaffected_nodes_render_the_same(self, key: str, value: Any) -> None:
+        app = self._app()
+        envelope = app.to_json(dependencies=True)
+        before = _render(envelope)
+        after = _render({**envelope, "state": {**envelope["state"], key: value}})
+        changed_paths = _changed(envelope["state"][key], value, key)
+        hit = affected_nodes(envelope["dependencies"], changed_paths)
+        # Every visible change is covered; a ForEach reports its whole list.
+        assert before == after or hit
+        if key == "unused":
+            assert not hit
+
+    def test_let_alias_keeps_path(self) -> None:
+        view = {
+            "type": "Column",
+            "let": {"ship": "{{ fleet.flagship }}", "n": "{{ count + 1 }}"},
+            "children": [{"type": "Text", "content": "{{ ship.name }} {{ n }}"}],
+        }
+        table = dependencies({"view": view})
+        assert _reads(table, "/children/0") == {"fleet.flagship.name", "count"}
+        assert table["view"].get("") is None
+
+    def test_nested_foreach(self) -> None:
+        view = {
+            "type": "ForEach",
+            "key": "groups",
+            "children": [
+                {
+                    "type": "ForEach",
+                    "key": "$item.members",
+                    "children": [{"type": "Text", "content": "{{ $item.name }}"}],
+                }
+            ],
+        }
+        table = dependencies({"view": view})
+        assert _reads(table, "/children/0") == {"groups.*.members"}
+        assert _reads(table, "/children/0/children/0") == {"groups.*.members.*.name"}
+
+    def test_dynamic_keys_read_everything(self) -> None:
+        view = {
+            "type": "Column",
+            "children": [
+                {"type": "Slot", "name": "{{ panel }}"},
+                {
+                    "type": "ForEach",
+                    "key": "{{ source }}",
+                    "children": [{"type": "Text", "content": "{{ $item }}"}],
+                },
+            ],
+        }
+        table = dependencies({"view": view})
+        assert _reads(table, "/children/0") == {"*"}
+        assert _reads(table, "/children/1") == {"*"}
+        assert affected_nodes(table, ["anything"]) == {
+            "/children/0",
+            "/children/1",
+            "/children/1/children/0",
+        }
+
+    def test_actions_and_event_names_ignored(self) -> None:
+        view = {
+            "type": "Button",
+            "label": "{{ $event }}",
+            "onClick": {"action": "setState", "key": "x", "value": "{{ y }}"},
+        }
+        assert dependencies({"view": view})["view"] == {}
+        table = {
+            "type": "DataTable",
+            "columns": [],
+            "source": {
+                "action": "toolCall",
+                "tool": "rows",
+                "arguments": {"q": "{{ q }}"},
+            },
+        }
+        assert dependencies({"view": table})["view"] == {}
+
+    def test_condition_fallback_reads_key(self) -> None:
+        view = {
+            "type": "Condition",
+            "cases": [{"when": "is open", "children": [{"type": "Text"}]}],
+        }
+        assert _reads(dependencies({"view": view})) == {"is open"}
+
+    def test_defs_and_refs(self) -> None:
+        envelope = {
+            "view": {"$ref": "row", "let": {"who": "{{ user.name }}"}},
+            "defs": {"row": {"type": "Text", "content": "{{ who }} {{ title }}"}},
+        }
+        table = dependencies(envelope)
+        assert _reads(table) == {"user.name"}
+        (indices,) = table["defs"]["row"].values()
+        assert {table["paths"][i] for i in indices} == {"who", "title"}
+
+    def test_default_to_json_unchanged(self) -> None:
+        app = self._app()
+        assert "dependencies" not in app.to_json()
+        assert "dependencies" not in PrefabApp(state={"a": 1}).to_json(
+            dependencies=True
+        )
+
+
+class TestAffects:
+    @pytest.mark.parametrize(
+        ("path", "written", "expected"),
+        [
+            ("rows", "rows", True),
+            ("rows.*.name", "rows", True),
+            ("rows", "rows.0.name", True),
+            ("rows.*.name", "rows.3.name", True),
+            ("rows.*.name", "rows.3.tag", False),
+            ("row", "rows", False),
+            ("*", "anything", True),
+        ],
+    )
+    def test_affects(self, path: str, written: str, expected: bool) -> None:
+        assert affects(path, written) is expected
+
+
+class TestInternStrings:
+    CLASSES = "flex items-center justify-between gap-2 rounded-md"
+
+    def _app(self, rows: int = 50) -> PrefabApp:
+        with Column() as view:
+            for i in range(rows):
+                with Row(css_class=self.CLASSES):
+                    Text(f"row {i}")
+                    Badge("{{ $item.price | currency }}", variant="secondary")
+        return PrefabApp(view=view, state={"theme_class": self.CLASSES})
+
+    def test_round_trip(self) -> None:
+        app = self._app()
+        plain = app.to_json()
+        interned = app.to_json(intern_strings=True)
+        assert interned["version"] == "0.3"
+        assert self.CLASSES in interned["strings"]
+        assert expand_strings(interned) == {**plain, "version": "0.3"}
+
+    def test_smaller(self) -> None:
+        app = self._app()
+        plain = json.dumps(app.to_json(), separators=(",", ":"))
+        interned = json.dumps(app.to_json(intern_strings=True), separators=(",", ":"))
+        assert len(interned) < len(plain) * 0.8
+
+    def test_references(self) -> None:
+        interned = self._app().to_json(intern_strings=True)
+        index = interned["strings"].index(self.CLASSES)
+        assert interned["view"]["children"][0]["cssClass"] == {"$str": index}
+        assert interned["state"] == {"theme_class": {"$str": index}}
+        # Short strings and object keys stay inline.
+        assert interned["view"]["children"][0]["type"] == "Row"
+
+    def test_unchanged_without_repeats(self) -> None:
+        envelope = PrefabApp(view=Text(self.CLASSES)).to_json()
+        assert intern_strings(envelope) is envelope
+        assert expand_strings(envelope) is envelope
+
+    def test_only_profitable_strings(self) -> None:
+        # Eight-character strings seen twice cost more as references.
+        envelope = {"view": {"type": "Text", "content": "abcdefgh", "id": "abcdefgh"}}
+        assert intern_strings(envelope) is envelope
+
+    def test_existing_reference_shape_left_alone(self) -> None:
+        envelope = self._app().to_json()
+        envelope["state"] = {"data": {"$str": 0}}
+        assert intern_strings(envelope) is envelope
+
+    @pytest.mark.parametrize("ref", [5, -1, "0", True])
+    def test_invalid_reference(self, ref: Any) -> None:
+        envelope = {
+            "strings": ["a"],
+            "view": {"type": "Text", "content": {"$str": ref}},
+        }
+        with pytest.raises(ValueError, match="Invalid string reference"):
+            expand_strings(envelope)
+
+    def test_prerender_matches(self) -> None:
+        app = self._app()
+        assert _render(expand_strings(app.to_json(intern_strings=True))) == _render(
+            app.to_json()
+        )
+
+
+class TestParseExpressions:
+    def _app(self) -> PrefabApp:
+        with Column() as view:
+            Text("Total: {{ $item.price * $item.qty | currency }}")
+            Text("{{ user.name | upper }} ({{ count + 1 }})")
+            Text("{{ user.name | upper }}")
+            with If("count > 3"):
+                Text("many")
+        return PrefabApp(view=view, state={"count": 1, "user": {"name": "ada"}})
+
+    @pytest.mark.parametrize(
+        "case",
+        [c for c in CORPUS if not c.get("error")],
+        ids=lambda c: f"{c['group']}: {c['expr']}",
+    )
+    def test_round_trip(self, case: dict[str, Any]) -> None:
+        node = parse(case["expr"])
+        tree = json.loads(json.dumps(encode_expression(node)))
+        assert decode_expression(tree) == node
+        ctx = case.get("ctx", {})
+        assert repr(evaluate(decode_expression(tree), ctx)) == repr(evaluate(node, ctx))
+
+    @pytest.mark.parametrize(
+        "source, tree",
+        [
+            ("42", 42),
+            ("'hi'", "hi"),
+            ("user.name", [".", "user", "name"]),
+            ("!done", ["!", [".", "done"]]),
+            ("-x", ["-", [".", "x"]]),
+            ("a + b * 2", ["+", [".", "a"], ["*", [".", "b"], 2]]),
+            ("ok ? 'y' : 'n'", ["?", [".", "ok"], "y", "n"]),
+            ("x | round:2", ["|", [".", "x"], "round", "2"]),
+            ("name | 'anon'", ["??", [".", "name"], "anon"]),
+        ],
+    )
+    def test_encoding(self, source: str, tree: Any) -> None:
+        assert encode_expression(parse(source)) == tree
+
+    def test_table(self) -> None:
+        envelope = self._app().to_json(parse_expressions=True)
+        assert envelope["version"] == "0.3"
+        assert envelope["expressions"] == {
+            "$item.price * $item.qty | currency": [
+                "|",
+                ["*", [".", "$item", "price"], [".", "$item", "qty"]],
+                "currency",
+            ],
+            "user.name | upper": ["|", [".", "user", "name"], "upper"],
+            "count + 1": ["+", [".", "count"], 1],
+            "count > 3": [">", [".", "count"], 3],
+        }
+
+    def test_templates_kept(self) -> None:
+        app = self._app()
+        envelope = app.to_json(parse_expressions=True)
+        plain = app.to_json()
+        assert {k: v for k, v in envelope.items() if k != "expressions"} == {
+            **plain,
+            "version": "0.3",
+        }
+
+    def test_unparseable_left_out(self) -> None:
+        envelope = PrefabApp(view=Text("{{ a b }} and {{ c }}")).to_json()
+        assert parse_expressions(envelope)["expressions"] == {"c": [".", "c"]}
+
+    def test_braceless_condition(self) -> None:
+        envelope = {
+            "view": {
+                "type": "Condition",
+                "cases": [{"when": " ready ", "children": []}],
+            }
+        }
+        assert parse_expressions(envelope)["expressions"] == {"ready": [".", "ready"]}
+
+    def test_unchanged_without_expressions(self) -> None:
+        envelope = PrefabApp(view=Text("plain")).to_json()
+        assert parse_expressions(envelope) is envelope
+
+    def test_state_not_scanned(self) -> None:
+        app = PrefabApp(view=Text("{{ note }}"), state={"note": "{{ raw }}"})
+        table = parse_expressions(app.to_json())["expressions"]
+        assert table == {"note": [".", "note"]}
+
+    def test_with_intern_strings(self) -> None:
+        app = self._app()
+        envelope = app.to_json(parse_expressions=True, intern_strings=True)
+        assert expand_strings(envelope) == app.to_json(parse_expressions=True)
+
+    def test_non_finite_literal(self) -> None:
+        with pytest.raises(ExpressionError):
+            encode_expression(parse("1e999"))
+
+    @pytest.mark.parametrize(
+        "tree",
+        [[], ["."], [".", 1], ["%", 1, 2], ["?", 1, 2], ["|", 1, 2], {"a": 1}],
+    )
+    def test_invalid_tree(self, tree: Any) -> None:
+        with pytest.raises(ExpressionError):
+            decode_expression(tree)
+
+
+class TestColumnar:
+    ROWS = [{"month": "Jan", "sales": 10}, {"month": "Feb", "sales": 20}]
+
+    def _app(self) -> PrefabApp:
+        series = [ChartSeries(data_key="sales")]
+        with Column() as view:
+            LineChart(data=self.ROWS, series=series, x_axis="month")
+            BarChart(data="{{ rows }}", series=series, x_axis="month")
+            DataTable(
+                columns=[DataTableColumn(key="month", header="Month")],
+                rows=self.ROWS,
+            )
+        return PrefabApp(view=view, state={"rows": self.ROWS})
+
+    def test_inline_rows_converted(self) -> None:
+        envelope = self._app().to_json(columnar=True)
+        assert envelope["version"] == "0.3"
+        chart, bound, table = envelope["view"]["children"]
+        assert chart["data"] == {"month": ["Jan", "Feb"], "sales": [10, 20]}
+        assert table["rows"] == {"month": ["Jan", "Feb"], "sales": [10, 20]}
+        # State-bound data and the state itself stay as rows.
+        assert bound["data"] == "{{ rows }}"
+        assert envelope["state"] == {"rows": self.ROWS}
+
+    def test_defs_converted(self) -> None:
+        envelope = {
+            "view": {"type": "Column"},
+            "defs": {"chart": {"type": "LineChart", "data": self.ROWS}},
+        }
+        assert columnar(envelope)["defs"]["chart"]["data"] == {
+            "month": ["Jan", "Feb"],
+            "sales": [10, 20],
+        }
+
+    @pytest.mark.parametrize(
+        "rows",
+        [
+            [{"month": "Jan", "sales": 10}],
+            [{"month": "Jan", "sales": 10}, {"month": "Feb"}],
+            {"month": ["Jan"], "sales": [10]},
+        ],
+    )
+    def test_unchanged(self, rows: Any) -> None:
+        envelope = {"view": {"type": "LineChart", "data": rows}}
+        assert columnar(envelope) is envelope
+
+    def test_other_props_untouched(self) -> None:
+        envelope = {"view": {"type": "Text", "data": self.ROWS}}
+        assert columnar(envelope) is envelope
+
+    def test_smaller(self) -> None:
+        rows = [{"week": i, "downloads": i * 7} for i in range(1_000)]
+        app = PrefabApp(
+            view=LineChart(data=rows, series=[ChartSeries(data_key="downloads")])
+        )
+        plain = json.dumps(app.to_json(), separators=(",", ":"))
+        packed = json.dumps(app.to_json(columnar=True), separators=(",", ":"))
+        assert len(packed) < len(plain) * 0.6
+
+
+def _changed(old: Any, new: Any, path: str) -> list[str]:
+    """The deepest state paths that differ between ``old`` and ``new``."""
+    if isinstance(old, dict) and isinstance(new, dict) and old.keys() == new.keys():
+        return [
+            changed
+            for key in old
+            for changed in _changed(old[key], new[key], f"{path}.{key}")
+        ]
+    if isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        return [
+            changed
+            for index, (a, b) in enumerate(zip(old, new, strict=True))
+            for changed in _changed(a, b, f"{path}.{index}")
+        ]
+    return [] if old == new else [path]